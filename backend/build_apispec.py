@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Resume Runner API Spec Builder
+Generates the OpenAPI (Swagger 2.0) spec from the YAML in the route
+docstrings, checks it against the registered Flask URL map and writes it to
+backend/apidocs/apispec.json, which the server serves as a static file.
+Rerun it after changing a route or its docstring; --check (used in CI and by
+the test suite) fails if the committed spec is stale.
+
+Usage:
+    python backend/build_apispec.py
+    python backend/build_apispec.py --check
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Set
+
+import server
+
+HTTP_METHODS = {'get', 'put', 'post', 'delete', 'options', 'head', 'patch'}
+
+# flasgger settings; only the builder imports flasgger
+swagger_config = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": 'apispec',
+            "route": '/apispec.json',
+            "rule_filter": lambda rule: True,  # all in
+            "model_filter": lambda tag: True,  # all in
+        }
+    ],
+}
+
+# No "host": Swagger UI then calls the API on whichever host served the docs
+swagger_template = {
+    "swagger": "2.0",
+    "info": {
+        "title": "Resume Runner API",
+        "description": "API for tracking job applications and resume versions",
+        "version": "1.0.0",
+        "contact": {
+            "name": "Resume Runner",
+        }
+    },
+    "basePath": "/api",
+    "schemes": ["http"],
+    "consumes": ["application/json"],
+    "produces": ["application/json"],
+}
+
+
+def generate_spec(app) -> dict:
+    """Parse the route docstrings of ``app`` into a spec, without mounting flasgger on it"""
+    from flasgger import Swagger
+
+    swagger = Swagger(config=swagger_config, template=swagger_template)
+    swagger.app = app
+    with app.test_request_context():
+        spec = swagger.get_apispecs('apispec')
+    return json.loads(json.dumps(spec))
+
+
+def render(spec: dict) -> bytes:
+    """Serialise ``spec`` stably, so regenerating an unchanged API gives identical bytes"""
+    return (json.dumps(spec, indent=2, sort_keys=True, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def spec_path(rule: str) -> str:
+    """Turn a Werkzeug rule (``/companies/<int:company_id>``) into a spec path (``/companies/{company_id}``)"""
+    return re.sub(r'<(?:[^<>:]+:)?([^<>]+)>', r'{\1}', rule)
+
+
+def routed_operations(app, base_path: str, documented_only: bool = False) -> Dict[str, Set[str]]:
+    """Methods of every rule under ``base_path`` by spec path (optionally only views with a YAML docstring)"""
+    operations: Dict[str, Set[str]] = {}
+    for rule in app.url_map.iter_rules():
+        if not rule.rule.startswith(base_path + '/'):
+            continue
+        doc = app.view_functions[rule.endpoint].__doc__ or ''
+        if documented_only and '\n    ---' not in doc:
+            continue
+        methods = {method.lower() for method in rule.methods} - {'head', 'options'}
+        operations.setdefault(spec_path(rule.rule[len(base_path):]), set()).update(methods)
+    return operations
+
+
+def check_spec(spec: dict, app) -> List[str]:
+    """Problems that make ``spec`` disagree with the URL map of ``app`` (empty when it matches)"""
+    base_path = spec.get('basePath', '')
+    routed = routed_operations(app, base_path)
+    problems = []
+    for path, operations in sorted(spec['paths'].items()):
+        for method in sorted(HTTP_METHODS & set(operations)):
+            if method not in routed.get(path, ()):
+                problems.append(f"{method.upper()} {base_path}{path} is documented but has no route")
+    for path, methods in sorted(routed_operations(app, base_path, documented_only=True).items()):
+        for method in sorted(methods - set(spec['paths'].get(path, {}))):
+            problems.append(f"{method.upper()} {base_path}{path} has a YAML docstring but is missing from the spec")
+    return problems
+
+
+def main() -> int:
+    if sys.flags.optimize >= 2:
+        print("❌ Docstrings are stripped under python -OO / PYTHONOPTIMIZE=2; run without it")
+        return 1
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--check', action='store_true',
+                        help='fail if the committed spec is stale instead of writing it')
+    parser.add_argument('--output', default=server.API_SPEC_PATH,
+                        help='where to write the spec (default backend/apidocs/apispec.json)')
+    args = parser.parse_args()
+
+    spec = generate_spec(server.app)
+    problems = check_spec(spec, server.app)
+    for problem in problems:
+        print(f"❌ {problem}")
+    if problems:
+        return 1
+
+    body = render(spec)
+    operations = sum(len(HTTP_METHODS & set(item)) for item in spec['paths'].values())
+    if args.check:
+        try:
+            with open(args.output, 'rb') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != body:
+            print(f"❌ {args.output} is out of date; run: python backend/build_apispec.py")
+            return 1
+        print(f"✅ {args.output} is up to date ({operations} operations)")
+        return 0
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'wb') as f:
+        f.write(body)
+    print(f"📚 Wrote {operations} operations across {len(spec['paths'])} paths to {args.output} "
+          f"({len(body):,} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
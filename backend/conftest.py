@@ -2,7 +2,7 @@
 Pytest configuration and shared fixtures for Resume Runner backend tests
 """
 import os
-import shutil
+import sqlite3
 import sys
 from importlib import import_module, reload
 from pathlib import Path
@@ -25,7 +25,15 @@ def _copy_template_db(destination: Path) -> None:
             f"Test database template not found at {TEST_DB_TEMPLATE}. "
             "Run 'python database/create_database.py' to create it."
         )
-    shutil.copyfile(TEST_DB_TEMPLATE, destination)
+    # The template may run in WAL mode, so copy through the backup API to
+    # include pages that have not been checkpointed into the main file yet.
+    source = sqlite3.connect(TEST_DB_TEMPLATE)
+    target = sqlite3.connect(destination)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
 
 
 @pytest.fixture
@@ -150,7 +158,7 @@ def flask_app(test_db_path, mock_s3_helper):
     else:
         server_module = import_module('server')
 
-    server_module.db = ResumeRunnerDB(test_db_path)
+    server_module.create_app(database=ResumeRunnerDB(test_db_path))
     server_module.app.config['TESTING'] = True
 
     try:
@@ -0,0 +1,88 @@
+"""
+Resume Runner production server configuration (gunicorn)
+Run from the repository root with: gunicorn --config backend/gunicorn.conf.py
+
+Every setting can be tuned through the environment:
+    BACKEND_PORT / PORT        port to bind (default 5001)
+    WEB_CONCURRENCY            worker processes (default: CPU count, 2-8)
+    GUNICORN_THREADS           threads per worker (default 8, each open event stream holds one)
+    GUNICORN_MAX_REQUESTS      requests before a worker is recycled (default 10000, 0 = never)
+    GUNICORN_TIMEOUT           seconds before a stuck worker is killed (default 60)
+    GUNICORN_GRACEFUL_TIMEOUT  seconds workers get to finish on restart (default 30)
+    GUNICORN_PRELOAD           import the app once in the master (default 1)
+    GUNICORN_ACCESS_LOG        access log path (default stdout, empty disables it)
+
+SIGHUP reloads the configuration and replaces workers gracefully; SIGTERM
+lets in-flight requests finish before exiting. Nothing reads docstrings at
+runtime (the API spec is prebuilt by build_apispec.py), so PYTHONOPTIMIZE=2
+can be set to keep them out of worker memory.
+"""
+
+import multiprocessing
+import os
+import sys
+
+chdir = os.path.dirname(os.path.abspath(__file__))
+wsgi_app = 'server:create_app()'
+
+bind = f"0.0.0.0:{os.getenv('BACKEND_PORT', os.getenv('PORT', '5001'))}"
+
+# SQLite serialises writers, so a handful of processes is plenty; threads
+# cover concurrent reads. Every open /api/events/stream connection (one per
+# browser tab running the app) holds one of its worker's threads for as long
+# as the tab stays open, so a few tabs can leave a worker with no thread for
+# ordinary requests. Set GUNICORN_THREADS to at least the number of tabs you
+# expect per worker plus a few for requests.
+workers = int(os.getenv('WEB_CONCURRENCY', min(max(multiprocessing.cpu_count(), 2), 8)))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Recycle workers now and then (jittered so they don't all restart together).
+# A retiring gthread worker resets connections it accepted but hadn't started
+# on, so keep this high enough that recycling stays rare.
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '10000'))
+max_requests_jitter = max_requests // 10
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = 5
+
+preload_app = os.getenv('GUNICORN_PRELOAD', '1') == '1'
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-') or None  # empty disables it
+errorlog = '-'
+
+
+def _server_module():
+    import server
+    return server
+
+
+def pre_fork(arbiter, worker):
+    """Master: drop pooled SQLite connections (left by preload) before forking"""
+    if preload_app:
+        _server_module().db.prepare_fork()
+
+
+def post_fork(arbiter, worker):
+    """Worker: give the db and s3 singletons process-local connections"""
+    if preload_app:
+        server = _server_module()
+        server.db.after_fork()
+        server.s3.after_fork()
+
+
+def worker_exit(arbiter, worker):
+    """Worker: close this process's connections on a graceful exit.
+
+    No checkpoint here: a TRUNCATE checkpoint would hold the write lock while
+    it waits on readers in the other workers, stalling their writes on every
+    recycle. on_exit checkpoints once when the whole server stops.
+    """
+    server = sys.modules.get('server')
+    if server is not None and server.db is not None:
+        server.db.close(checkpoint=False)
+
+
+def on_exit(arbiter):
+    """Master: checkpoint the WAL into the database file once every worker has gone"""
+    server = _server_module()
+    (server.db or server.ResumeRunnerDB()).close()
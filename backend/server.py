@@ -4,23 +4,43 @@ Resume Runner Flask Backend Server
 Provides REST API endpoints for the Resume Runner application
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, make_response, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.test import EnvironBuilder
 from flask_cors import CORS
-from flasgger import Swagger
 import sys
 import os
 import json
+import hashlib
+import importlib.util
+import gzip
+import io
 import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
 from datetime import datetime, date
+from decimal import Decimal
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env'))
 
 # Add parent directory to path to import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.db_helper import ResumeRunnerDB
+from database.db_helper import IMPORT_ENTITIES, ResumeRunnerDB, encode_export, read_import_rows
 from s3_helper import S3Helper
 
 # Configure logging to both console and file
@@ -50,49 +70,364 @@ logger.addHandler(file_handler)
 # Create app-specific logger
 app_logger = logging.getLogger('resume_runner')
 
+
+def json_default(value):
+    """Encode what the JSON encoders can't by themselves: dates as ISO 8601, Decimals as strings"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson when it is installed.
+
+    Falls back to the stdlib encoder otherwise, or for values orjson
+    rejects (integers beyond 64 bits). Either way dates come out as ISO 8601
+    rather than Flask's HTTP dates, Decimals as strings, and dict keys in
+    insertion order, so responses are the same whichever encoder ran.
+    """
+
+    sort_keys = False
+    default = staticmethod(json_default)
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def _encode(self, obj, newline: bool = False) -> bytes:
+        option = self.ORJSON_OPTIONS | (orjson.OPT_APPEND_NEWLINE if newline else 0)
+        try:
+            return orjson.dumps(obj, default=json_default, option=option)
+        except orjson.JSONEncodeError:
+            return (super().dumps(obj) + ('\n' if newline else '')).encode()
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        body = self._encode(self._prepare_response_obj(args, kwargs), newline=True)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 CORS(app)  # Enable CORS for React frontend
 
-# Initialize Swagger
-swagger_config = {
-    "headers": [],
-    "specs": [
-        {
-            "endpoint": 'apispec',
-            "route": '/apispec.json',
-            "rule_filter": lambda rule: True,  # all in
-            "model_filter": lambda tag: True,  # all in
-        }
-    ],
-    "static_url_path": "/flasgger_static",
-    "swagger_ui": True,
-    "specs_route": "/docs/"
-}
+backend_port = int(os.getenv('BACKEND_PORT', os.getenv('PORT', '5001')))
 
-swagger_template = {
-    "swagger": "2.0",
-    "info": {
-        "title": "Resume Runner API",
-        "description": "API for tracking job applications and resume versions",
-        "version": "1.0.0",
-        "contact": {
-            "name": "Resume Runner",
-        }
-    },
-    "basePath": "/api",
-    "schemes": ["http"],
-    "consumes": ["application/json"],
-    "produces": ["application/json"],
-}
+# Database and S3 helpers, set up by create_app()
+db: Optional[ResumeRunnerDB] = None
+s3: Optional[S3Helper] = None
 
-backend_port = int(os.getenv('BACKEND_PORT', os.getenv('PORT', '5001')))
-swagger_template['host'] = f"localhost:{backend_port}"
 
-swagger = Swagger(app, config=swagger_config, template=swagger_template)
+def create_app(database: Optional[ResumeRunnerDB] = None, storage: Optional[S3Helper] = None,
+               docs: Optional[bool] = None) -> Flask:
+    """Finish setting up ``app`` and return it (gunicorn loads ``server:create_app()``).
+
+    Importing this module only registers routes. This opens the database
+    (or adopts ``database``), creates the S3 helper with its bucket check
+    running on a background thread, and mounts the prebuilt API docs at
+    /docs/ unless ``docs`` (default: the API_DOCS environment variable, on)
+    is off. Calling it again keeps whatever is already set up.
+    """
+    global db, s3
+    if database is not None or db is None:
+        db = database or ResumeRunnerDB()
+    if storage is not None or s3 is None:
+        s3 = storage or S3Helper(verify=False)
+        s3.start_background_check()
+    if docs is None:
+        docs = os.getenv('API_DOCS', '1') == '1'
+    if docs and 'api_docs' not in app.view_functions:
+        mount_api_docs()
+    return app
+
+
+def wants_page() -> bool:
+    """True when the client asked for keyset pagination"""
+    return 'limit' in request.args or 'after' in request.args
+
+
+def requested_fields() -> Optional[List[str]]:
+    """Parse the comma-separated ``fields`` query parameter (None when absent)"""
+    fields = request.args.get('fields')
+    if fields is None:
+        return None
+    return [name.strip() for name in fields.split(',') if name.strip()]
+
+
+def requested_expand() -> List[str]:
+    """Parse the comma-separated ``expand`` query parameter (relation paths such as ``resume.tags``)"""
+    return [path.strip() for path in request.args.get('expand', '').split(',') if path.strip()]
+
+
+def conditional(*tables: str):
+    """Serve a GET endpoint with a strong ETag built from the change counters of ``tables``.
+
+    ``tables`` must list every table the response reads. A request whose
+    If-None-Match still matches gets a 304 without running the view, and so
+    does one whose compressed body is already in ``compression_cache``.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = db.get_table_versions()
+            if any(table not in versions for table in tables):
+                return view(*args, **kwargs)
+
+            signature = '|'.join([request.full_path, date.today().isoformat(),
+                                  *(f"{table}={versions[table]}" for table in tables)])
+            etag = hashlib.blake2b(signature.encode(), digest_size=12).hexdigest()
+            # Compressed representations carry the coding as a suffix
+            matched = next((tag for tag in [etag, *(f"{etag}-{coding}" for coding in COMPRESSORS)]
+                            if request.if_none_match.contains(tag)), None)
+            coding = accepted_coding()
+            cached = compression_cache.get((etag, coding)) if coding and not matched else None
+            if matched:
+                response = app.response_class(status=304)
+                response.set_etag(matched)
+            elif cached:
+                mimetype, body = cached
+                response = app.response_class(body, mimetype=mimetype)
+                response.headers['Content-Encoding'] = coding
+                response.set_etag(f"{etag}-{coding}")
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
+
+
+# Response compression: JSON and text bodies of at least COMPRESSION_MIN_BYTES
+# are compressed with the best coding the client accepts (brotli when it is
+# installed, then gzip). Compressed bodies of ETagged responses are kept in a
+# byte-bounded LRU keyed by (ETag, coding): the ETag moves whenever the data
+# does, so while it holds @conditional answers from the cache without
+# rebuilding or recompressing the payload.
+COMPRESSION_MIN_BYTES = int(os.getenv('COMPRESSION_MIN_BYTES', '1024'))
+COMPRESSION_CACHE_BYTES = int(os.getenv('COMPRESSION_CACHE_BYTES', str(32 * 1024 * 1024)))
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/plain', 'text/csv', 'application/x-ndjson')
+
+COMPRESSORS = {}
+if brotli is not None:
+    COMPRESSORS['br'] = lambda data: brotli.compress(data, quality=5)
+COMPRESSORS['gzip'] = lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def accepted_coding() -> Optional[str]:
+    """The content coding to compress with, preferring the client's highest quality value"""
+    return request.accept_encodings.best_match(list(COMPRESSORS))
+
+
+class CompressionCache:
+    """Thread-safe LRU of (mimetype, compressed body) pairs, bounded by total body size"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, mimetype: str, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self._entries[key] = (mimetype, body)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+compression_cache = CompressionCache(COMPRESSION_CACHE_BYTES)
+
+
+@app.after_request
+def compress_response(response):
+    """Compress large JSON/text responses for clients that send Accept-Encoding"""
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or 'Content-Encoding' in response.headers):
+        return response
+    coding = accepted_coding()
+    if coding is None:
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_BYTES:
+        return response
+
+    # @conditional serves cache hits itself, so anything reaching here is compressed afresh
+    body = COMPRESSORS[coding](data)
+    etag, weak = response.get_etag()
+    if etag:
+        compression_cache.put((etag, coding), response.mimetype, body)
+    response.set_data(body)
+    response.headers['Content-Encoding'] = coding
+    if etag:
+        response.set_etag(f"{etag}-{coding}", weak)
+    return response
+
+
+# API docs: /apispec.json is the OpenAPI spec that build_apispec.py generates
+# from the route docstrings (and checks against the URL map), and /docs/ is a
+# static Swagger UI page for it. create_app() reads, hashes and compresses
+# both once, so under gunicorn's preload workers inherit them ready to serve.
+API_DOCS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'apidocs')
+API_SPEC_PATH = os.path.join(API_DOCS_DIR, 'apispec.json')
+
+
+class StaticAsset:
+    """A file served from memory with a content-hash ETag, precompressed in every coding in COMPRESSORS"""
+
+    def __init__(self, path: str, mimetype: str, build=None):
+        self.path = path
+        self.mimetype = mimetype
+        self.build = build
+        self.etag: Optional[str] = None
+        self.bodies: dict = {}
+        self._lock = threading.Lock()
+
+    def load(self, allow_build: bool = True) -> bool:
+        """Read the file once (or, when it is missing, make the body with ``build``); False if neither worked"""
+        if self.etag is not None:
+            return True
+        with self._lock:
+            if self.etag is not None:
+                return True
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as f:
+                    body = f.read()
+            elif allow_build and self.build is not None:
+                body = self.build()
+            else:
+                return False
+            self.bodies = {None: body}
+            if len(body) >= COMPRESSION_MIN_BYTES:
+                self.bodies.update((coding, compress(body)) for coding, compress in COMPRESSORS.items())
+            self.etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+            return True
+
+    def response(self):
+        if not self.load():
+            return jsonify({'error': f"{os.path.basename(self.path)} has not been built"}), 404
+        coding = accepted_coding() if len(self.bodies) > 1 else None
+        etag = f"{self.etag}-{coding}" if coding else self.etag
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(self.bodies[coding], mimetype=self.mimetype)
+            if coding:
+                response.headers['Content-Encoding'] = coding
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+def build_api_spec() -> bytes:
+    """Generate the spec on first request when apidocs/apispec.json hasn't been built"""
+    app_logger.warning("%s is missing; generating it from the route docstrings "
+                       "(run python backend/build_apispec.py)", API_SPEC_PATH)
+    import build_apispec
+    return build_apispec.render(build_apispec.generate_spec(app))
+
+
+api_spec = StaticAsset(API_SPEC_PATH, 'application/json', build=build_api_spec)
+api_docs_page = StaticAsset(os.path.join(API_DOCS_DIR, 'index.html'), 'text/html')
+
+
+def swagger_ui_dir() -> Optional[str]:
+    """The Swagger UI bundle that ships with flasgger, located without importing flasgger"""
+    spec = importlib.util.find_spec('flasgger')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(spec.submodule_search_locations[0], 'ui3', 'static')
+
+
+def mount_api_docs():
+    """Route /apispec.json, /docs/ and the Swagger UI assets, loading the prebuilt files now"""
+    api_spec.load(allow_build=False)
+    api_docs_page.load()
+    ui_dir = swagger_ui_dir()
+
+    def swagger_ui_static(filename):
+        if ui_dir is None:
+            return jsonify({'error': 'Swagger UI assets need flasgger installed'}), 404
+        return send_from_directory(ui_dir, filename)
+
+    app.add_url_rule('/apispec.json', 'api_spec', api_spec.response)
+    app.add_url_rule('/docs/', 'api_docs', api_docs_page.response)
+    app.add_url_rule('/docs/static/<path:filename>', 'swagger_ui_static', swagger_ui_static)
+
+
+def paginated_response(entity: str, key: str, **filters):
+    """Return one page of ``entity`` under ``key`` with the cursor for the next page"""
+    try:
+        page = db.list_page(
+            entity,
+            limit=request.args.get('limit', type=int),
+            after=request.args.get('after'),
+            fields=requested_fields(),
+            **filters
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({key: page['items'], 'next_cursor': page['next_cursor'], 'limit': page['limit']})
+
+
+def application_filters() -> Dict[str, Optional[str]]:
+    """The ``status``/``q`` filters of the applications list (blank values are ignored)"""
+    return {
+        'status': request.args.get('status', '').strip() or None,
+        'search': request.args.get('q', '').strip() or None,
+    }
+
+
+def event_summaries_response(entity: str):
+    """Return the event summaries of ``entity`` for the ``ids``/``recent`` query parameters"""
+    try:
+        ids = request.args.get('ids')
+        if ids is not None:
+            ids = [int(value) for value in ids.split(',') if value.strip()]
+        summaries = db.get_event_summaries(entity, ids=ids, recent=request.args.get('recent', 3, type=int))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'summaries': summaries})
 
-# Initialize database and S3 helpers
-db = ResumeRunnerDB()
-s3 = S3Helper()
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -128,11 +463,21 @@ def health_check():
 
 # Company endpoints
 @app.route('/api/companies', methods=['GET'])
+@conditional('companies', 'job_postings', 'applications')
 def get_companies():
     """Get all companies with activity metrics
     ---
     tags:
       - Companies
+    parameters:
+      - in: query
+        name: limit
+        description: Page size; enables keyset pagination (max 500)
+        type: integer
+      - in: query
+        name: after
+        description: Opaque cursor from the previous page's next_cursor
+        type: string
     responses:
       200:
         description: List of companies with hiring metrics
@@ -162,6 +507,8 @@ def get_companies():
         description: Server error
     """
     try:
+        if wants_page():
+            return paginated_response('companies', 'companies')
         companies = db.get_company_activity()
         return jsonify({'companies': companies})
     except Exception as e:
@@ -222,12 +569,16 @@ def create_company():
 
 @app.route('/api/companies/<int:company_id>', methods=['GET'])
 def get_company(company_id):
-    """Get company by ID"""
+    """Get company by ID (pass expand=events,job_postings,applications,recruiters to embed related data)"""
     try:
-        company = db.get_company(company_id)
-        if not company:
-            return jsonify({'error': 'Company not found'}), 404
+        with db.snapshot():
+            company = db.get_company(company_id)
+            if not company:
+                return jsonify({'error': 'Company not found'}), 404
+            db.expand('companies', [company], requested_expand())
         return jsonify({'company': company})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -291,17 +642,47 @@ def get_company_stats(company_id):
 
 @app.route('/api/companies/<int:company_id>/details', methods=['GET'])
 def get_company_details(company_id):
-    """Get detailed company information"""
+    """Get detailed company information (accepts expand= like /api/companies/<id>)"""
     try:
-        company = db.get_company_details(company_id)
-        if not company:
-            return jsonify({'error': 'Company not found'}), 404
+        with db.snapshot():
+            company = db.get_company_details(company_id)
+            if not company:
+                return jsonify({'error': 'Company not found'}), 404
+            db.expand('companies', [company], requested_expand())
         return jsonify({'company': company})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/companies/event-summaries', methods=['GET'])
+def get_company_event_summaries():
+    """Get event summaries for every company (or just ``ids``) in one call
+    ---
+    tags:
+      - Companies
+    parameters:
+      - in: query
+        name: ids
+        type: string
+        description: Comma-separated company ids (default all)
+      - in: query
+        name: recent
+        type: integer
+        default: 3
+        description: Latest events to include per company (max 10)
+    responses:
+      200:
+        description: Event count, next follow-up, latest event and recent events per company with events
+      400:
+        description: Invalid ids
+    """
+    return event_summaries_response('companies')
+
+
 @app.route('/api/companies/<int:company_id>/events', methods=['GET'])
+@conditional('company_events')
 def get_company_events(company_id):
     """Get timeline events for a company"""
     try:
@@ -371,25 +752,76 @@ def delete_company_event(event_id):
 
 
 @app.route('/api/companies/search', methods=['GET'])
+@conditional('companies')
 def search_companies():
-    """Search companies by name"""
+    """Search companies by name, tolerating typos
+    ---
+    tags:
+      - Companies
+    parameters:
+      - in: query
+        name: name
+        description: Full or partial company name
+        required: true
+        type: string
+      - in: query
+        name: limit
+        type: integer
+        default: 10
+      - in: query
+        name: fuzzy
+        description: Also return similarly spelled names when too few contain the query
+        type: boolean
+        default: true
+    responses:
+      200:
+        description: Best matching company and the ranked matches
+        schema:
+          type: object
+          properties:
+            company:
+              type: object
+            matches:
+              type: array
+              items:
+                type: object
+                properties:
+                  id:
+                    type: integer
+                  name:
+                    type: string
+                  score:
+                    type: number
+                  match:
+                    type: string
+                    enum: [exact, prefix, substring, fuzzy]
+    """
     try:
-        name = request.args.get('name', '')
+        name = request.args.get('name', '').strip()
         if not name:
             return jsonify({'error': 'Name parameter required'}), 400
 
-        company = db.find_company_by_name(name)
-        return jsonify({'company': company})
+        matches = db.match_names(
+            name, kinds=['company'],
+            limit=request.args.get('limit', 10, type=int),
+            fuzzy=request.args.get('fuzzy', 'true').lower() != 'false'
+        )
+        company = db.get_company(matches[0]['id']) if matches and matches[0]['match'] != 'fuzzy' else None
+        return jsonify({'company': company, 'matches': matches})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Resume version endpoints
 @app.route('/api/resume-versions', methods=['GET'])
+@conditional('resume_versions')
 def get_resume_versions():
-    """Get all resume versions"""
+    """Get all resume versions (pass limit/after for keyset pagination, fields= to pick columns)"""
     try:
+        if wants_page():
+            return paginated_response('resume_versions', 'resume_versions')
+
         print(f"🔍 [DEBUG] Fetching all resume versions")
-        versions = db.list_resume_versions()
+        versions = db.list_resume_versions(fields=requested_fields())
         print(f"🔍 [DEBUG] Found {len(versions)} resume versions")
 
         for i, version in enumerate(versions):
@@ -399,6 +831,8 @@ def get_resume_versions():
                   f"filename='{version.get('filename')}'")
 
         return jsonify({'resume_versions': versions})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"❌ [ERROR] Error fetching resume versions: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -510,12 +944,16 @@ def create_resume_version():
 
 @app.route('/api/resume-versions/<int:version_id>', methods=['GET'])
 def get_resume_version(version_id):
-    """Get resume version by ID"""
+    """Get resume version by ID (pass fields= to narrow the response, expand=tags to embed tags)"""
     try:
-        version = db.get_resume_version(version_id)
-        if not version:
-            return jsonify({'error': 'Resume version not found'}), 404
+        with db.snapshot():
+            version = db.get_resume_version(version_id, fields=requested_fields())
+            if not version:
+                return jsonify({'error': 'Resume version not found'}), 404
+            db.expand('resume_versions', [version], requested_expand())
         return jsonify({'resume_version': version})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -635,6 +1073,7 @@ def update_resume_version(version_id):
         return jsonify({'error': str(e)}), 400
 
 @app.route('/api/resume-versions/success-metrics', methods=['GET'])
+@conditional('resume_versions', 'applications')
 def get_resume_success_metrics():
     """Get success metrics for all resume versions"""
     try:
@@ -645,18 +1084,13 @@ def get_resume_success_metrics():
 
 # Recruiter endpoints
 @app.route('/api/recruiters', methods=['GET'])
+@conditional('recruiters', 'resume_versions')
 def get_recruiters():
-    """Get all recruiters"""
+    """Get all recruiters (pass limit/after for keyset pagination)"""
     try:
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT r.*, rv.version_name as current_resume_version
-                FROM recruiters r
-                LEFT JOIN resume_versions rv ON r.current_resume_version_id = rv.id
-                ORDER BY r.last_contact_date DESC NULLS LAST
-            """)
-            recruiters = [dict(row) for row in cursor.fetchall()]
+        if wants_page():
+            return paginated_response('recruiters', 'recruiters')
+        recruiters = db.list_recruiters()
         return jsonify({'recruiters': recruiters})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -674,12 +1108,16 @@ def create_recruiter():
 
 @app.route('/api/recruiters/<int:recruiter_id>', methods=['GET'])
 def get_recruiter(recruiter_id):
-    """Get recruiter by ID"""
+    """Get recruiter by ID (pass expand=events,applications,current_resume to embed related data)"""
     try:
-        recruiter = db.get_recruiter(recruiter_id)
-        if not recruiter:
-            return jsonify({'error': 'Recruiter not found'}), 404
+        with db.snapshot():
+            recruiter = db.get_recruiter(recruiter_id)
+            if not recruiter:
+                return jsonify({'error': 'Recruiter not found'}), 404
+            db.expand('recruiters', [recruiter], requested_expand())
         return jsonify({'recruiter': recruiter})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -751,7 +1189,33 @@ def add_recruiter_communication(recruiter_id):
         return jsonify({'error': str(e)}), 400
 
 
+@app.route('/api/recruiters/event-summaries', methods=['GET'])
+def get_recruiter_event_summaries():
+    """Get event summaries for every recruiter (or just ``ids``) in one call
+    ---
+    tags:
+      - Recruiters
+    parameters:
+      - in: query
+        name: ids
+        type: string
+        description: Comma-separated recruiter ids (default all)
+      - in: query
+        name: recent
+        type: integer
+        default: 3
+        description: Latest events to include per recruiter (max 10)
+    responses:
+      200:
+        description: Event count, next follow-up, latest event and recent events per recruiter with events
+      400:
+        description: Invalid ids
+    """
+    return event_summaries_response('recruiters')
+
+
 @app.route('/api/recruiters/<int:recruiter_id>/events', methods=['GET'])
+@conditional('recruiter_events')
 def get_recruiter_events(recruiter_id):
     """Get timeline events for a recruiter"""
     try:
@@ -821,6 +1285,7 @@ def delete_recruiter_event(event_id):
 
 
 @app.route('/api/recruiters/dashboard', methods=['GET'])
+@conditional('recruiters', 'applications', 'companies', 'recruiter_events')
 def get_recruiter_dashboard():
     """Get recruiter dashboard with metrics"""
     try:
@@ -837,10 +1302,13 @@ def get_recruiter_dashboard():
 
 # Manager endpoints
 @app.route('/api/managers', methods=['GET'])
+@conditional('managers', 'companies')
 def get_managers():
-    """Get all managers, optionally filtered by company"""
+    """Get all managers, optionally filtered by company (pass limit/after for keyset pagination)"""
     try:
         company_id = request.args.get('company_id', type=int)
+        if wants_page():
+            return paginated_response('managers', 'managers', company_id=company_id)
         managers = db.get_managers(company_id=company_id)
         return jsonify({'managers': managers})
     except Exception as e:
@@ -1018,18 +1486,14 @@ def remove_company_recruiter(company_id, recruiter_id):
 
 # Job posting endpoints
 @app.route('/api/job-postings', methods=['GET'])
+@conditional('job_postings', 'companies')
 def get_job_postings():
-    """Get all job postings"""
+    """Get all job postings (pass limit/after for keyset pagination)"""
     try:
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT jp.*, c.name as company_name
-                FROM job_postings jp
-                JOIN companies c ON jp.company_id = c.id
-                ORDER BY jp.date_posted DESC
-            """)
-            postings = [dict(row) for row in cursor.fetchall()]
+        if wants_page():
+            return paginated_response('job_postings', 'job_postings',
+                                      company_id=request.args.get('company_id', type=int))
+        postings = db.list_job_postings()
         return jsonify({'job_postings': postings})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1066,11 +1530,31 @@ def create_job_posting():
 
 # Application endpoints
 @app.route('/api/applications', methods=['GET'])
+@conditional('applications', 'companies', 'resume_versions', 'recruiters', 'job_postings')
 def get_applications():
-    """Get all applications"""
+    """Get all active applications.
+
+    Pass limit/after for keyset pagination, fields= to pick columns, and with
+    pagination status= and q= (company or position substring) to filter.
+    """
     try:
-        applications = db.get_active_applications()
+        if wants_page():
+            return paginated_response('applications', 'applications', **application_filters())
+        applications = db.get_active_applications(fields=requested_fields())
         return jsonify({'applications': applications})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/applications/stats', methods=['GET'])
+@conditional('applications', 'companies')
+def get_application_stats():
+    """Count the active applications matching the status= and q= list filters"""
+    try:
+        return jsonify({'stats': db.get_application_stats(**application_filters())})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1120,12 +1604,20 @@ def create_application():
 
 @app.route('/api/applications/<int:app_id>', methods=['GET'])
 def get_application(app_id):
-    """Get application details for interview prep"""
+    """Get application details for interview prep.
+
+    Pass fields= to narrow the response, and expand= to embed related data
+    (timeline, company, resume, recruiter, job_posting; nested as resume.tags).
+    """
     try:
-        application = db.get_application_details(app_id)
-        if not application:
-            return jsonify({'error': 'Application not found'}), 404
+        with db.snapshot():
+            application = db.get_application_details(app_id, fields=requested_fields())
+            if not application:
+                return jsonify({'error': 'Application not found'}), 404
+            db.expand('applications', [application], requested_expand())
         return jsonify({'application': application})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -1269,6 +1761,7 @@ def search_applications():
 
 # Application timeline endpoints
 @app.route('/api/applications/<int:application_id>/timeline', methods=['GET'])
+@conditional('application_events')
 def get_application_timeline(application_id):
     """Get application timeline/events"""
     try:
@@ -1367,47 +1860,17 @@ def list_s3_files():
 
 # Dashboard/Analytics endpoints
 @app.route('/api/dashboard/stats', methods=['GET'])
+@conditional('applications', 'companies', 'resume_versions')
 def get_dashboard_stats():
     """Get overview statistics for dashboard"""
     try:
-        with db.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Get basic counts
-            cursor.execute("SELECT COUNT(*) FROM applications")
-            total_applications = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM applications WHERE status IN ('phone_screen', 'interview', 'offer')")
-            interviews = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM applications WHERE status = 'offer'")
-            offers = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM companies")
-            companies_tracked = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM resume_versions")
-            resume_versions = cursor.fetchone()[0]
-
-            # Calculate success rates
-            interview_rate = (interviews / total_applications * 100) if total_applications > 0 else 0
-            offer_rate = (offers / total_applications * 100) if total_applications > 0 else 0
-
-        stats = {
-            'total_applications': total_applications,
-            'interviews': interviews,
-            'offers': offers,
-            'companies_tracked': companies_tracked,
-            'resume_versions': resume_versions,
-            'interview_rate': round(interview_rate, 1),
-            'offer_rate': round(offer_rate, 1)
-        }
-
+        stats = db.get_dashboard_stats()
         return jsonify({'stats': stats})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/dashboard/recent-activity', methods=['GET'])
+@conditional('applications', 'companies')
 def get_recent_activity():
     """Get recent applications and status updates"""
     try:
@@ -1430,6 +1893,7 @@ def get_recent_activity():
 
 # Tag endpoints
 @app.route('/api/tags', methods=['GET'])
+@conditional('tags')
 def get_tags():
     """Get all tags
     ---
@@ -1625,16 +2089,21 @@ def remove_resume_tag(version_id, tag_id):
 
 # Resume search endpoints
 @app.route('/api/resume-versions/search', methods=['GET'])
+@conditional('resume_versions', 'resume_tags', 'tags')
 def search_resumes_by_tags():
     """Search resume versions by tags
     ---
     tags:
       - Resume Search
     parameters:
+      - in: query
+        name: q
+        description: Tag expression using AND, OR, NOT and parentheses; tags side by side are ANDed and names with spaces go in "quotes". Takes precedence over tags/match_all
+        type: string
+        example: "Python AND (AWS OR GCP) AND NOT Junior"
       - in: query
         name: tags
         description: Comma-separated tag names
-        required: true
         type: string
         example: "MorePython,Management"
       - in: query
@@ -1644,7 +2113,7 @@ def search_resumes_by_tags():
         default: false
     responses:
       200:
-        description: List of matching resume versions
+        description: List of matching resume versions, newest first
         schema:
           type: object
           properties:
@@ -1652,13 +2121,19 @@ def search_resumes_by_tags():
               type: array
               items:
                 type: object
+      400:
+        description: Missing or malformed query
     """
     try:
+        query = request.args.get('q', '').strip()
+        if query:
+            return jsonify({'resumes': db.search_resumes_by_tag_query(query)})
+
         tags_param = request.args.get('tags', '')
         match_all = request.args.get('match_all', 'false').lower() == 'true'
 
         if not tags_param:
-            return jsonify({'error': 'tags parameter is required'}), 400
+            return jsonify({'error': 'q or tags parameter is required'}), 400
 
         tag_names = [tag.strip() for tag in tags_param.split(',') if tag.strip()]
         if not tag_names:
@@ -1666,18 +2141,447 @@ def search_resumes_by_tags():
 
         resumes = db.search_resumes_by_tags(tag_names, match_all)
         return jsonify({'resumes': resumes})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Full-text search
+@app.route('/api/search', methods=['GET'])
+@conditional('resume_versions', 'applications', 'job_postings', 'companies', 'recruiters',
+             'company_events', 'recruiter_events', 'application_events')
+def search():
+    """Full-text search across resumes, applications, job postings, companies, recruiters and events
+    ---
+    tags:
+      - Search
+    parameters:
+      - in: query
+        name: q
+        description: Words and "quoted phrases" that must all match; end a word with * to match a prefix
+        required: true
+        type: string
+        example: 'python "machine learning"'
+      - in: query
+        name: kind
+        description: Comma-separated kinds to search (resume, application, job_posting, company, recruiter, company_event, recruiter_event, application_event)
+        type: string
+      - in: query
+        name: limit
+        type: integer
+        default: 50
+      - in: query
+        name: after
+        description: Cursor from the previous page's next_cursor
+        type: string
+    responses:
+      200:
+        description: Matches ranked by relevance, with highlighted snippets
+        schema:
+          type: object
+          properties:
+            results:
+              type: array
+              items:
+                type: object
+            next_cursor:
+              type: string
+      400:
+        description: Empty query, unknown kind or invalid cursor
+    """
+    try:
+        kinds = request.args.get('kind')
+        page = db.search(
+            request.args.get('q', ''),
+            kinds=[kind.strip() for kind in kinds.split(',') if kind.strip()] if kinds else None,
+            limit=request.args.get('limit', type=int),
+            after=request.args.get('after'),
+        )
+        return jsonify({'results': page['items'], 'next_cursor': page['next_cursor'], 'limit': page['limit']})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Bulk import
+IMPORT_CONTENT_TYPES = {
+    'text/csv': 'csv',
+    'application/x-ndjson': 'jsonl',
+    'application/jsonl': 'jsonl',
+    'application/json-lines': 'jsonl',
+}
+
+
+@app.route('/api/import/<entity>', methods=['POST'])
+def bulk_import(entity):
+    """Stream a CSV or JSON Lines file of companies, recruiters or applications into the database
+    ---
+    tags:
+      - Import
+    consumes:
+      - text/csv
+      - application/x-ndjson
+    parameters:
+      - in: path
+        name: entity
+        required: true
+        type: string
+        enum: [companies, recruiters, applications]
+      - in: query
+        name: format
+        description: csv or jsonl; defaults from the Content-Type
+        type: string
+      - in: query
+        name: create_missing
+        description: Create companies and recruiters that applications name but the database lacks
+        type: boolean
+        default: true
+      - in: body
+        name: body
+        description: One row per line, columns named as in the table; applications may name their company and recruiter instead of giving ids
+        schema:
+          type: string
+    responses:
+      200:
+        description: Import summary with per-line errors for the rows that were not imported
+      400:
+        description: Unknown entity or format
+    """
+    try:
+        if entity not in IMPORT_ENTITIES:
+            return jsonify({'error': f"Unknown import entity: {entity}. Use one of: {', '.join(IMPORT_ENTITIES)}"}), 400
+        fmt = request.args.get('format') or IMPORT_CONTENT_TYPES.get(request.mimetype)
+        if fmt is None:
+            return jsonify({'error': 'Send text/csv or application/x-ndjson, or pass format=csv|jsonl'}), 400
+        rows = read_import_rows(io.TextIOWrapper(request.stream, encoding='utf-8-sig', newline=''), fmt)
+        summary = db.bulk_import(entity, rows,
+                                 create_missing=request.args.get('create_missing', 'true').lower() != 'false')
+        return jsonify(summary)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Export
+EXPORT_MIMETYPES = {'jsonl': 'application/x-ndjson', 'csv': 'text/csv'}
+
+
+@app.route('/api/export/<entity>', methods=['GET'])
+def export_entity(entity):
+    """Stream every row of a table as JSON Lines or CSV
+    ---
+    tags:
+      - Export
+    produces:
+      - application/x-ndjson
+      - text/csv
+    parameters:
+      - in: path
+        name: entity
+        required: true
+        type: string
+        description: Table to export, e.g. companies, recruiters, applications, application_events
+      - in: query
+        name: format
+        type: string
+        enum: [jsonl, csv]
+        default: jsonl
+      - in: query
+        name: "<column>"
+        description: Any other parameter filters on that column, e.g. company_id=3&status=applied
+        type: string
+    responses:
+      200:
+        description: Rows in table order, gzip-encoded when the client accepts it
+      400:
+        description: Unknown entity, format or filter column
+    """
+    try:
+        fmt = request.args.get('format', 'jsonl')
+        if fmt not in EXPORT_MIMETYPES:
+            return jsonify({'error': f"Unknown export format: {fmt}. Use one of: {', '.join(EXPORT_MIMETYPES)}"}), 400
+        filters = {name: value for name, value in request.args.items() if name != 'format'}
+        columns, rows = db.export_rows(entity, filters)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+    compress = 'gzip' in request.accept_encodings
+    response = app.response_class(encode_export(columns, rows, fmt, compress=compress),
+                                  mimetype=EXPORT_MIMETYPES[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename="{entity}.{fmt}"'
+    response.headers['Vary'] = 'Accept-Encoding'
+    if compress:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+# Change feed
+@app.route('/api/changes', methods=['GET'])
+def get_changes():
+    """Changes made after a sequence number, for incremental sync
+    ---
+    tags:
+      - Changes
+    parameters:
+      - in: query
+        name: since
+        type: integer
+        description: Last seq the client has applied (omit to get the current cursor)
+      - in: query
+        name: limit
+        type: integer
+        default: 500
+        description: Maximum changes to return (max 5000)
+      - in: query
+        name: entity
+        type: string
+        description: Comma-separated tables to include (default all)
+    responses:
+      200:
+        description: changes [{seq, entity, id, operation, changed_at}], next_since, has_more and latest
+      400:
+        description: Invalid since or limit
+      410:
+        description: since predates the retained history; reload in full and resume from next_since
+    """
+    since = request.args.get('since')
+    try:
+        since = int(since) if since is not None else None
+        entities = [name.strip() for name in request.args.get('entity', '').split(',') if name.strip()]
+        feed = db.get_changes(since, limit=request.args.get('limit', type=int), entities=entities or None)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if feed['reset']:
+        return jsonify({**feed, 'error': 'Change history since this point has been discarded'}), 410
+    return jsonify(feed)
+
+
+# Seconds between keep-alive comments on an idle /api/events/stream
+EVENT_STREAM_HEARTBEAT = 15
+
+
+@app.route('/api/events/stream', methods=['GET'])
+def stream_events():
+    """Server-Sent Events stream of cache invalidations
+    ---
+    tags:
+      - Changes
+    produces:
+      - text/event-stream
+    parameters:
+      - in: header
+        name: Last-Event-ID
+        type: integer
+        description: Change-log seq to resume from (sent by EventSource on reconnect)
+      - in: query
+        name: since
+        type: integer
+        description: Same as Last-Event-ID, for clients that can't set headers
+    responses:
+      200:
+        description: |
+          An ``invalidate`` event ({seq, changes: {entity: [ids]}}) per batch
+          of committed writes, ``reset`` ({seq}) when the client must reload
+          everything, and a comment every 15s while idle. Each event's id is
+          the seq to resume from.
+      400:
+        description: Invalid since
+    """
+    since = request.headers.get('Last-Event-ID') or request.args.get('since')
+    try:
+        since = int(since) if since else None
+    except ValueError:
+        return jsonify({'error': 'since must be an integer'}), 400
+    subscription = db.change_feed().subscribe(since)
+
+    def stream():
+        try:
+            yield 'retry: 3000\n\n'
+            while not subscription.closed:
+                messages = subscription.get(timeout=EVENT_STREAM_HEARTBEAT)
+                if not messages:
+                    yield ': heartbeat\n\n'
+                for message in messages:
+                    event = 'reset' if message.get('reset') else 'invalidate'
+                    yield f"id: {message['seq']}\nevent: {event}\ndata: {json.dumps(message)}\n\n"
+        finally:
+            subscription.close()
+
+    response = app.response_class(stream(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# Dropdown options
+def options_response(name: str):
+    """Return the ``name`` option list, narrowed by the ``q`` prefix and ``limit`` parameters"""
+    try:
+        options = db.get_options(name, prefix=request.args.get('q'),
+                                 limit=request.args.get('limit', type=int))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'options': options})
+
+
+@app.route('/api/options/companies', methods=['GET'])
+@conditional('companies')
+def get_company_options():
+    """Company dropdown options: id and label (name)
+    ---
+    tags:
+      - Options
+    parameters:
+      - in: query
+        name: q
+        type: string
+        description: Case-insensitive label prefix
+      - in: query
+        name: limit
+        type: integer
+        description: Maximum options to return (default 1000, at most 5000)
+    responses:
+      200:
+        description: Options in label order
+    """
+    return options_response('companies')
+
+
+@app.route('/api/options/recruiters', methods=['GET'])
+@conditional('recruiters')
+def get_recruiter_options():
+    """Recruiter dropdown options: id, label (name) and company (accepts q= and limit=)"""
+    return options_response('recruiters')
+
+
+@app.route('/api/options/resume-versions', methods=['GET'])
+@conditional('resume_versions')
+def get_resume_version_options():
+    """Resume version dropdown options: id, label (version_name), is_master and created_at (accepts q= and limit=)"""
+    return options_response('resume-versions')
+
+
+@app.route('/api/options/managers', methods=['GET'])
+@conditional('managers')
+def get_manager_options():
+    """Manager dropdown options: id, label (name), position_title and company_id (accepts q= and limit=)"""
+    return options_response('managers')
+
+
+@app.route('/api/options/tags', methods=['GET'])
+@conditional('tags')
+def get_tag_options():
+    """Tag dropdown options: id, label (name) and color (accepts q= and limit=)"""
+    return options_response('tags')
+
+
+# Batch requests
+BATCH_MAX_REQUESTS = 50
+# Streaming endpoints never finish inside a batch (or only after draining a
+# whole export), so they can't be sub-requests
+BATCH_EXCLUDED_PATHS = ('/api/batch', '/api/events/stream', '/api/export/')
+
+
+@app.route('/api/batch', methods=['POST'])
+def batch():
+    """Run several API requests in one round trip
+    ---
+    tags:
+      - Batch
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          properties:
+            requests:
+              type: array
+              description: Sub-requests, run in order
+              items:
+                type: object
+                properties:
+                  method:
+                    type: string
+                    default: GET
+                  path:
+                    type: string
+                    example: /api/recruiters/1/managers
+                  body:
+                    type: object
+                  headers:
+                    type: object
+                    description: e.g. If-None-Match
+    responses:
+      200:
+        description: One {status, body} entry per sub-request (plus etag where the endpoint sets one)
+      400:
+        description: Malformed batch
+    """
+    data = request.get_json(silent=True) or {}
+    requests_ = data.get('requests')
+    if not isinstance(requests_, list) or not requests_:
+        return jsonify({'error': 'requests must be a non-empty list'}), 400
+    if len(requests_) > BATCH_MAX_REQUESTS:
+        return jsonify({'error': f'At most {BATCH_MAX_REQUESTS} requests per batch'}), 400
+    for sub in requests_:
+        path = sub.get('path') if isinstance(sub, dict) else None
+        if not isinstance(path, str) or not path.startswith('/api/'):
+            return jsonify({'error': 'Each request needs a path under /api/'}), 400
+        if path.split('?')[0].startswith(BATCH_EXCLUDED_PATHS):
+            return jsonify({'error': f'{path} cannot run inside a batch (batches, event streams and exports)'}), 400
+
+    read_only = all(str(sub.get('method', 'GET')).upper() in ('GET', 'HEAD') for sub in requests_)
+    responses = []
+    # Every sub-request checks out this same pooled connection, so they all
+    # read one snapshot; each one that fails is rolled back on its own
+    with db.get_connection() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN" if read_only else "BEGIN IMMEDIATE")
+        for index, sub in enumerate(requests_):
+            builder = EnvironBuilder(
+                path=sub['path'],
+                method=str(sub.get('method', 'GET')).upper(),
+                json=sub.get('body'),
+                # Sub-responses are decoded into the batch body, so never compress them
+                headers={name: value for name, value in (sub.get('headers') or {}).items()
+                         if name.lower() != 'accept-encoding'},
+            )
+            conn.execute(f"SAVEPOINT batch_{index}")
+            with app.request_context(builder.get_environ()):
+                response = app.full_dispatch_request()
+            if response.is_streamed:
+                # Never drain a stream here: it would hold the batch's
+                # transaction open until the stream ends, if it ever does
+                response.close()
+                response = make_response(jsonify({'error': f"{sub['path']} streams its response "
+                                                           "and cannot run inside a batch"}), 400)
+            if response.status_code >= 400:
+                conn.execute(f"ROLLBACK TO batch_{index}")
+            conn.execute(f"RELEASE batch_{index}")
+
+            body = response.get_data(as_text=True)
+            entry = {'status': response.status_code,
+                     'body': json.loads(body) if response.is_json and body else body or None}
+            if response.headers.get('ETag'):
+                entry['etag'] = response.headers['ETag']
+            responses.append(entry)
+    return jsonify({'responses': responses})
+
+
 @app.route('/api/resume-versions/with-tags', methods=['GET'])
+@conditional('resume_versions', 'resume_tags', 'tags')
 def get_resume_versions_with_tags():
-    """Get all resume versions with their tags"""
+    """Get all resume versions with their tags (pass fields= to pick columns)"""
     try:
         print(f"🔍 [DEBUG] Fetching resume versions with tags...")
-        resumes = db.get_resume_versions_with_tags()
+        resumes = db.get_resume_versions_with_tags(fields=requested_fields())
         print(f"🔍 [DEBUG] Found {len(resumes) if resumes else 0} resume versions")
         print(f"🔍 [DEBUG] Sample resume data: {resumes[0] if resumes else 'None'}")
         return jsonify({'resume_versions': resumes})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"❌ [ERROR] Error in get_resume_versions_with_tags: {str(e)}")
         print(f"❌ [ERROR] Exception type: {type(e).__name__}")
@@ -1686,10 +2590,12 @@ def get_resume_versions_with_tags():
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
+    create_app()
     print("🚀 Starting Resume Runner Backend Server...")
     print(f"📊 Database: {db.db_path}")
     print(f"☁️  S3 Status: {s3.get_bucket_info()['status']}")
     print(f"🌐 API available at: http://localhost:{backend_port}")
     print(f"📚 API Documentation: http://localhost:{backend_port}/docs/")
+    print("💡 Development server only; for production run: gunicorn --config backend/gunicorn.conf.py")
 
-    app.run(debug=True, host='0.0.0.0', port=backend_port)
+    app.run(debug=os.getenv('FLASK_DEBUG', '1') == '1', host='0.0.0.0', port=backend_port)
@@ -303,3 +303,442 @@ def test_delete_application(client, populated_db):
     # Verify it's gone
     response = client.get(f'/api/applications/{app_id}')
     assert response.status_code == 404
+
+def test_list_endpoints_paginate(client, populated_db):
+    """Test keyset pagination on list endpoints"""
+    db = populated_db['db']
+    for i in range(4):
+        db.add_company(name=f'Cursor Co {i}')
+
+    seen = []
+    url = '/api/companies?limit=2'
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert len(data['companies']) <= 2
+        seen.extend(company['name'] for company in data['companies'])
+        url = f"/api/companies?limit=2&after={data['next_cursor']}" if data['next_cursor'] else None
+
+    assert len(seen) == len(set(seen))
+    assert {f'Cursor Co {i}' for i in range(4)} <= set(seen)
+
+    for endpoint, key in [('/api/applications', 'applications'), ('/api/recruiters', 'recruiters'),
+                          ('/api/job-postings', 'job_postings'), ('/api/resume-versions', 'resume_versions'),
+                          ('/api/managers', 'managers')]:
+        response = client.get(f'{endpoint}?limit=1')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert key in data and 'next_cursor' in data
+
+    response = client.get('/api/companies?after=garbage')
+    assert response.status_code == 400
+
+
+def test_applications_filter_on_server(client, populated_db):
+    """Test that status/q filter the application pages and the stats match them"""
+    db = populated_db['db']
+    for i in range(3):
+        app_id = db.add_application(company_id=populated_db['company_id'], position_title=f'Server Filter {i}')
+        if i:
+            db.update_application_status(app_id, 'phone_screen')
+
+    response = client.get('/api/applications?limit=1&q=server%20filter&status=phone_screen')
+    data = json.loads(response.data)
+    assert len(data['applications']) == 1
+    assert data['applications'][0]['status'] == 'phone_screen'
+    assert data['next_cursor']
+
+    response = client.get(f"/api/applications?limit=1&q=server%20filter&status=phone_screen&after={data['next_cursor']}")
+    data = json.loads(response.data)
+    assert len(data['applications']) == 1
+    assert data['next_cursor'] is None
+
+    response = client.get('/api/applications/stats?q=server%20filter')
+    assert response.status_code == 200
+    stats = json.loads(response.data)['stats']
+    assert stats['total_applications'] == 3
+    assert stats['interviews'] == 2
+
+    response = client.get('/api/applications/stats?q=server%20filter&status=applied')
+    assert json.loads(response.data)['stats']['total_applications'] == 1
+
+
+def test_sparse_fieldsets(client, populated_db):
+    """Test fields= on list and detail endpoints"""
+    response = client.get('/api/resume-versions')
+    data = json.loads(response.data)
+    assert 'content_text' not in data['resume_versions'][0]
+
+    response = client.get('/api/resume-versions?fields=version_name,content_text')
+    data = json.loads(response.data)
+    assert set(data['resume_versions'][0]) == {'id', 'version_name', 'content_text'}
+
+    response = client.get(f"/api/resume-versions/{populated_db['resume_id']}")
+    assert 'content_text' in json.loads(response.data)['resume_version']
+
+    response = client.get('/api/applications?fields=bogus')
+    assert response.status_code == 400
+
+
+def test_dashboard_stats(client, populated_db):
+    """Test dashboard stats endpoint"""
+    response = client.get('/api/dashboard/stats')
+    assert response.status_code == 200
+    stats = json.loads(response.data)['stats']
+    assert stats['resume_versions'] >= 1
+
+    populated_db['db'].add_application(company_id=populated_db['company_id'], position_title='Role')
+    response = client.get('/api/dashboard/stats')
+    assert json.loads(response.data)['stats']['total_applications'] == stats['total_applications'] + 1
+
+
+def test_conditional_get(client, populated_db):
+    """Test ETag / If-None-Match handling on polled endpoints"""
+    response = client.get('/api/companies')
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    response = client.get('/api/companies', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+    tags_etag = client.get('/api/tags').headers['ETag']
+    client.post('/api/companies', json={'name': 'Fresh ETag Co'})
+
+    response = client.get('/api/companies', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert client.get('/api/tags', headers={'If-None-Match': tags_etag}).status_code == 304
+
+    # Different query strings are different representations
+    assert client.get('/api/companies?limit=1').headers['ETag'] != response.headers['ETag']
+
+
+def test_search(client, populated_db):
+    """Test full-text search"""
+    response = client.get('/api/search?q=data%20science')
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['results'][0]['kind'] == 'resume'
+    assert data['results'][0]['id'] == populated_db['resume_id']
+    assert '<mark>' in data['results'][0]['title']
+    assert data['next_cursor'] is None
+
+    response = client.get('/api/search?q=remote&kind=company,recruiter')
+    assert [r['kind'] for r in json.loads(response.data)['results']] == ['company']
+
+    assert client.get('/api/search').status_code == 400
+    assert client.get('/api/search?q=data&kind=memo').status_code == 400
+
+
+def test_search_companies(client, populated_db):
+    """Test ranked, typo-tolerant company lookup"""
+    response = client.get('/api/companies/search?name=test%20company')
+    data = json.loads(response.data)
+    assert response.status_code == 200
+    assert data['company']['id'] == populated_db['company_id']
+    assert data['matches'][0]['match'] == 'prefix'
+
+    data = json.loads(client.get('/api/companies/search?name=Tset%20Company%20Inc').data)
+    assert data['company'] is None
+    assert data['matches'][0]['id'] == populated_db['company_id']
+    assert data['matches'][0]['match'] == 'fuzzy'
+
+    assert client.get('/api/companies/search').status_code == 400
+
+    response = client.get('/api/applications/search?company=company%20inc')
+    assert response.status_code == 200
+
+
+def test_search_resumes_by_tag_query(client, populated_db):
+    """Test tag expression search on /api/resume-versions/search"""
+    db = populated_db['db']
+    resume_id = populated_db['resume_id']
+    db.set_resume_tags(resume_id, [db.add_tag('Python'), db.add_tag('AWS')])
+
+    response = client.get('/api/resume-versions/search?q=python%20AND%20NOT%20(gcp%20OR%20junior)')
+    assert response.status_code == 200
+    assert [r['id'] for r in json.loads(response.data)['resumes']] == [resume_id]
+
+    response = client.get('/api/resume-versions/search?tags=aws,gcp&match_all=true')
+    assert json.loads(response.data)['resumes'] == []
+
+    assert client.get('/api/resume-versions/search?q=python%20AND').status_code == 400
+    assert client.get('/api/resume-versions/search').status_code == 400
+
+
+def test_bulk_import(client, populated_db):
+    """Test streaming an application CSV through /api/import"""
+    data = "company,position_title,application_date\nTest Company Inc.,Imported Role,2024-05-01\n,No Company,\n"
+    response = client.post('/api/import/applications', data=data, content_type='text/csv')
+    assert response.status_code == 200
+    summary = json.loads(response.data)
+    assert summary['inserted'] == 1
+    assert summary['errors'][0]['line'] == 3
+
+    response = client.post('/api/import/companies?format=jsonl', data='{"name": "Jsonl Co"}\n')
+    assert json.loads(response.data)['inserted'] == 1
+
+    assert client.post('/api/import/applications', data=data, content_type='text/plain').status_code == 400
+    assert client.post('/api/import/tags', data=data, content_type='text/csv').status_code == 400
+
+
+def test_export(client, populated_db):
+    """Test streaming exports, with gzip when accepted"""
+    import gzip
+
+    response = client.get('/api/export/companies')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [row['id'] for row in rows] == [populated_db['company_id']]
+
+    response = client.get(f"/api/export/recruiters?format=csv&id={populated_db['recruiter_id']}",
+                          headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert len(gzip.decompress(response.data).decode().splitlines()) == 2
+
+    assert client.get('/api/export/table_versions').status_code == 400
+    assert client.get('/api/export/companies?format=xml').status_code == 400
+    assert client.get('/api/export/companies?colour=red').status_code == 400
+
+
+
+def test_batch(client, populated_db):
+    """Test running several requests, reads and writes, in one batch"""
+    response = client.post('/api/batch', json={'requests': [
+        {'method': 'POST', 'path': '/api/companies', 'body': {'name': 'Batch Co'}},
+        {'path': '/api/companies'},
+        {'method': 'POST', 'path': '/api/companies', 'body': {'name': 'Batch Co'}},
+        {'path': '/api/companies/999999'},
+    ]})
+    assert response.status_code == 200
+    created, companies, duplicate, missing = json.loads(response.data)['responses']
+    assert created['status'] == 201
+    # Later requests see earlier writes
+    assert 'Batch Co' in [c['name'] for c in companies['body']['companies']]
+    assert 'etag' in companies
+    assert duplicate['status'] >= 400
+    assert missing['status'] == 404
+    # A failed request doesn't undo the rest of the batch
+    names = [c['name'] for c in json.loads(client.get('/api/companies').data)['companies']]
+    assert names.count('Batch Co') == 1
+
+    cached = client.post('/api/batch', json={'requests': [
+        {'path': '/api/companies', 'headers': {'If-None-Match': companies['etag']}}]})
+    assert json.loads(cached.data)['responses'][0]['status'] == 304
+
+    assert client.post('/api/batch', json={'requests': []}).status_code == 400
+    assert client.post('/api/batch', json={'requests': [{'path': '/api/batch'}]}).status_code == 400
+    assert client.post('/api/batch', json={'requests': [{'path': 'http://example.com/'}]}).status_code == 400
+
+
+def test_batch_rejects_streams(client, populated_db, monkeypatch):
+    """Test streaming endpoints are refused instead of drained inside a batch"""
+    import itertools
+    import server
+
+    for path in ('/api/events/stream', '/api/events/stream?since=0', '/api/export/companies?format=csv'):
+        response = client.post('/api/batch', json={'requests': [{'path': '/api/companies'}, {'path': path}]})
+        assert response.status_code == 400
+
+    # Any other endpoint that streams gets a 400 entry; the stream is never read
+    endless = server.app.response_class(itertools.repeat('data: x\n\n'), mimetype='text/event-stream')
+    monkeypatch.setitem(server.app.view_functions, 'get_companies', lambda: endless)
+    response = client.post('/api/batch', json={'requests': [
+        {'method': 'POST', 'path': '/api/companies', 'body': {'name': 'Streamed Co'}},
+        {'path': '/api/companies'},
+    ]})
+    created, streamed = json.loads(response.data)['responses']
+    assert created['status'] == 201
+    assert streamed['status'] == 400 and 'stream' in streamed['body']['error']
+
+
+def test_expand(client, populated_db):
+    """Test embedding related data in detail responses"""
+    db = populated_db['db']
+    app_id = db.add_application(company_id=populated_db['company_id'], position_title='Engineer',
+                                resume_version_id=populated_db['resume_id'])
+    db.add_application_event(app_id, 'interview', '2024-05-01', 'Onsite')
+
+    response = client.get(f'/api/applications/{app_id}?expand=timeline,company,resume.tags,recruiter')
+    assert response.status_code == 200
+    application = json.loads(response.data)['application']
+    assert application['company']['id'] == populated_db['company_id']
+    assert application['resume']['tags'] == []
+    assert application['timeline'][0]['title'] == 'Onsite'
+    assert application['recruiter'] is None
+
+    response = client.get(f"/api/companies/{populated_db['company_id']}?expand=events,applications.timeline")
+    company = json.loads(response.data)['company']
+    assert company['events'] == []
+    assert company['applications'][0]['timeline'][0]['title'] == 'Onsite'
+
+    response = client.get(f"/api/recruiters/{populated_db['recruiter_id']}?expand=events,current_resume")
+    assert json.loads(response.data)['recruiter']['events'] == []
+
+    assert client.get(f'/api/applications/{app_id}?expand=owner').status_code == 400
+    assert client.get(f'/api/applications/{app_id}?fields=position_title&expand=company').status_code == 400
+
+
+def test_event_summaries(client, populated_db):
+    """Test event summaries for the company and recruiter list pages"""
+    db = populated_db['db']
+    db.add_recruiter_event(populated_db['recruiter_id'], 'Intro call', event_date='2024-05-01')
+
+    response = client.get('/api/recruiters/event-summaries')
+    assert response.status_code == 200
+    [summary] = json.loads(response.data)['summaries']
+    assert summary['recruiter_id'] == populated_db['recruiter_id']
+    assert summary['latest_event']['title'] == 'Intro call'
+
+    response = client.get(f"/api/companies/event-summaries?ids={populated_db['company_id']}")
+    assert json.loads(response.data)['summaries'] == []
+    assert client.get('/api/companies/event-summaries?ids=a,b').status_code == 400
+
+
+def test_options(client, populated_db):
+    """Test dropdown option endpoints with prefix filtering and ETags"""
+    response = client.get('/api/options/companies?q=test')
+    assert response.status_code == 200
+    assert json.loads(response.data)['options'] == [{'id': populated_db['company_id'], 'label': 'Test Company Inc.'}]
+    assert client.get('/api/options/companies?q=test',
+                      headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+    for name in ('recruiters', 'resume-versions', 'managers', 'tags'):
+        assert client.get(f'/api/options/{name}?limit=5').status_code == 200
+
+
+def test_changes(client, populated_db):
+    """Test incremental sync through /api/changes"""
+    cursor = json.loads(client.get('/api/changes').data)['next_since']
+    client.post('/api/companies', json={'name': 'Synced Co'})
+
+    feed = json.loads(client.get(f'/api/changes?since={cursor}&entity=companies').data)
+    assert [(c['entity'], c['operation']) for c in feed['changes']] == [('companies', 'insert')]
+
+    db = populated_db['db']
+    with db.get_connection() as conn:
+        conn.execute("UPDATE change_log SET changed_at = datetime('now', '-60 days')")
+    db.compact_change_log(retention_days=30)
+    response = client.get(f'/api/changes?since={cursor}')
+    assert response.status_code == 410
+    assert json.loads(response.data)['reset']
+    assert client.get('/api/changes?since=abc').status_code == 400
+
+
+def test_event_stream(client, populated_db):
+    """Test /api/events/stream pushes an invalidate event after a write"""
+    response = client.get('/api/events/stream', buffered=False)
+    assert response.mimetype == 'text/event-stream'
+    chunks = iter(response.response)
+    assert next(chunks).startswith(b'retry:')
+
+    client.post('/api/companies', json={'name': 'Streamed Co'})
+    event = next(chunks).decode()
+    assert 'event: invalidate' in event
+    data = json.loads(event.split('data: ')[1])
+    assert 'companies' in data['changes']
+    assert event.startswith(f"id: {data['seq']}\n")
+    response.close()
+
+    assert client.get('/api/events/stream?since=abc').status_code == 400
+
+
+def test_json_provider(flask_app, monkeypatch):
+    """Test responses encode dates, Decimals and int keys the same with or without orjson"""
+    import server
+    from datetime import date, datetime
+    from decimal import Decimal
+
+    payload = {'day': date(2024, 1, 2), 'at': datetime(2024, 1, 2, 3, 4, 5), 'amount': Decimal('1.50'),
+               'by_id': {1: 'a'}, 'big': 2 ** 70}
+    expected = {'day': '2024-01-02', 'at': '2024-01-02T03:04:05', 'amount': '1.50',
+                'by_id': {'1': 'a'}, 'big': 2 ** 70}
+    with flask_app.test_request_context():
+        fast = server.jsonify(payload)
+        monkeypatch.setattr(server, 'orjson', None)
+        slow = server.jsonify(payload)
+    assert json.loads(fast.data) == json.loads(slow.data) == expected
+    assert fast.mimetype == 'application/json' and fast.data.endswith(b'\n')
+    assert flask_app.json.loads(b'{"a": [1, 2]}') == {'a': [1, 2]}
+
+
+def test_compression(client, populated_db, monkeypatch):
+    """Test gzip negotiation, the compressed-body cache and encoding-specific ETags"""
+    import gzip
+    import server
+    monkeypatch.setattr(server, 'COMPRESSION_MIN_BYTES', 64)
+    server.compression_cache.clear()
+
+    plain = client.get('/api/companies')
+    assert 'Content-Encoding' not in plain.headers
+    assert 'Accept-Encoding' in plain.headers['Vary']
+
+    response = client.get('/api/companies', headers={'Accept-Encoding': 'gzip, deflate'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data) == plain.data
+    assert response.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+
+    hits = server.compression_cache.hits
+    again = client.get('/api/companies', headers={'Accept-Encoding': 'gzip'})
+    assert again.data == response.data and server.compression_cache.hits == hits + 1
+    cached = client.get('/api/companies', headers={'Accept-Encoding': 'gzip',
+                                                   'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304 and cached.headers['ETag'] == response.headers['ETag']
+
+    assert 'Content-Encoding' not in client.get('/api/companies', headers={'Accept-Encoding': 'identity'}).headers
+    batch = client.post('/api/batch', json={'requests': [
+        {'path': '/api/companies', 'headers': {'Accept-Encoding': 'gzip'}}]})
+    assert json.loads(batch.data)['responses'][0]['body'] == json.loads(plain.data)
+
+
+def test_lazy_startup(flask_app):
+    """Test importing server leaves boto3, flasgger and the database alone until create_app()"""
+    import os
+    import subprocess
+    import sys
+    import server
+
+    code = ("import sys, server; "
+            "assert server.db is None and server.s3 is None; "
+            "assert 'boto3' not in sys.modules and 'flasgger' not in sys.modules")
+    env = {**os.environ, 'DATABASE_PATH': '/nonexistent/resume_runner.db'}
+    subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(server.__file__), env=env, check=True)
+
+    db = server.db
+    assert server.create_app() is flask_app and server.db is db
+
+
+def test_api_docs(client, flask_app):
+    """Test the committed OpenAPI spec matches the URL map and is served prebuilt with an ETag"""
+    import gzip
+    import build_apispec
+    import server
+
+    spec = build_apispec.generate_spec(flask_app)
+    assert build_apispec.check_spec(spec, flask_app) == []
+    with open(server.API_SPEC_PATH, 'rb') as f:
+        assert f.read() == build_apispec.render(spec), "apispec.json is stale; run python backend/build_apispec.py"
+
+    drifted = {**spec, 'paths': {**spec['paths'], '/gone': {'get': {}}}}
+    del drifted['paths']['/health']
+    assert build_apispec.check_spec(drifted, flask_app) == [
+        'GET /api/gone is documented but has no route',
+        'GET /api/health has a YAML docstring but is missing from the spec',
+    ]
+
+    response = client.get('/apispec.json', headers={'Accept-Encoding': 'identity'})
+    assert response.status_code == 200 and json.loads(response.data) == spec
+    compressed = client.get('/apispec.json', headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed.data) == response.data
+    assert compressed.headers['ETag'] == response.headers['ETag'][:-1] + '-gzip"'
+    cached = client.get('/apispec.json', headers={'Accept-Encoding': 'gzip', 'If-None-Match': compressed.headers['ETag']})
+    assert cached.status_code == 304
+
+    docs = client.get('/docs/')
+    assert docs.status_code == 200 and b"url: '/apispec.json'" in docs.data
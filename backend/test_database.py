@@ -3,6 +3,7 @@ Tests for database operations in Resume Runner
 """
 import pytest
 import json
+import os
 import sqlite3
 from datetime import datetime, date
 
@@ -462,3 +463,1125 @@ class TestDatabaseIntegrity:
         resume2 = temp_db.get_resume_version(resume_id2)
         assert resume1['is_master'] == True
         assert resume2['is_master'] == True
+
+
+class TestConnectionPool:
+    """Test pooled connection management"""
+
+    def test_sequential_calls_reuse_one_connection(self, populated_db):
+        """Test that back-to-back helper calls share a single pooled connection"""
+        db = populated_db['db']
+
+        for _ in range(10):
+            db.get_company(populated_db['company_id'])
+
+        stats = db.pool_stats()
+        assert stats['open'] == 1
+        assert stats['in_use'] == 0
+        assert stats['checkouts'] >= 10
+
+    def test_nested_checkout_reuses_thread_connection(self, temp_db):
+        """Test that a thread re-entering get_connection gets the same connection"""
+        with temp_db.get_connection() as outer:
+            with temp_db.get_connection() as inner:
+                assert inner is outer
+
+        assert temp_db.pool_stats()['reentrant_checkouts'] == 1
+
+    def test_rollback_on_error(self, temp_db, sample_company_data):
+        """Test that a failing block rolls back instead of committing"""
+        with pytest.raises(RuntimeError):
+            with temp_db.get_connection() as conn:
+                conn.execute("INSERT INTO companies (name) VALUES (?)", ('Rolled Back Co',))
+                raise RuntimeError('boom')
+
+        assert temp_db.find_company_by_name('Rolled Back Co') is None
+
+    def test_pool_is_bounded_and_waits(self, test_db_path):
+        """Test that checkouts beyond max_size wait and then time out"""
+        import threading
+        from database.db_helper import ResumeRunnerDB, PoolTimeoutError
+
+        db = ResumeRunnerDB(test_db_path, pool_size=1)
+        db.pool.timeout = 0.05
+        holding = threading.Event()
+        release = threading.Event()
+
+        def hold_connection():
+            with db.get_connection():
+                holding.set()
+                release.wait(2)
+
+        holder = threading.Thread(target=hold_connection)
+        holder.start()
+        holding.wait(2)
+
+        with pytest.raises(PoolTimeoutError):
+            db.get_all_tags()
+
+        release.set()
+        holder.join()
+        assert db.get_all_tags() is not None
+
+        stats = db.pool_stats()
+        assert stats['open'] == 1
+        assert stats['waits'] >= 1
+        assert stats['timeouts'] == 1
+
+    def test_unhealthy_idle_connection_is_replaced(self, temp_db):
+        """Test that a broken idle connection is discarded on checkout"""
+        temp_db.pool.health_check_interval = 0
+        with temp_db.get_connection() as conn:
+            broken = conn
+        broken.close()
+
+        with temp_db.get_connection() as conn:
+            assert conn is not broken
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+        assert temp_db.pool_stats()['discarded'] == 1
+
+    def test_close_releases_connections(self, temp_db):
+        """Test that closing the pool closes idle connections and rejects checkouts"""
+        temp_db.get_all_tags()
+        temp_db.close()
+
+        assert temp_db.pool_stats()['open'] == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            temp_db.get_all_tags()
+
+    def test_close_without_checkpoint_keeps_wal(self, temp_db, sample_company_data):
+        """Test that checkpoint=False leaves the WAL to whoever closes last"""
+        from database.db_helper import ResumeRunnerDB
+
+        other = ResumeRunnerDB(temp_db.db_path)  # another worker, still running
+        other.get_all_tags()
+        temp_db.checkpoint('TRUNCATE')
+        temp_db.add_company(**sample_company_data)
+        wal = temp_db.db_path + '-wal'
+
+        temp_db.close(checkpoint=False)
+        assert os.path.getsize(wal) > 0
+
+        other.close()
+        assert not os.path.exists(wal) or os.path.getsize(wal) == 0
+
+
+class TestPragmaProfiles:
+    """Test SQLite PRAGMA profile configuration"""
+
+    def test_default_profile_enables_wal(self, temp_db):
+        """Test that the default profile switches the database to WAL"""
+        pragmas = temp_db.get_pragmas()
+
+        assert pragmas['journal_mode'] == 'wal'
+        assert pragmas['synchronous'] == 1  # NORMAL
+        assert pragmas['temp_store'] == 2  # MEMORY
+        assert pragmas['busy_timeout'] == temp_db.pragmas['busy_timeout']
+        assert pragmas['cache_size'] == temp_db.pragmas['cache_size']
+
+    def test_legacy_profile(self, test_db_path):
+        """Test that the legacy profile keeps the rollback journal"""
+        from database.db_helper import ResumeRunnerDB
+
+        db = ResumeRunnerDB(test_db_path, pragma_profile='legacy')
+        pragmas = db.get_pragmas()
+
+        assert pragmas['journal_mode'] == 'delete'
+        assert pragmas['synchronous'] == 2  # FULL
+
+    def test_env_overrides(self, monkeypatch):
+        """Test that DATABASE_PRAGMA_* variables override profile values"""
+        from database.db_helper import load_pragma_profile
+
+        monkeypatch.setenv('DATABASE_PRAGMA_PROFILE', 'throughput')
+        monkeypatch.setenv('DATABASE_PRAGMA_MMAP_SIZE', '1048576')
+        monkeypatch.setenv('DATABASE_PRAGMA_SYNCHRONOUS', 'full')
+
+        pragmas = load_pragma_profile()
+        assert pragmas['mmap_size'] == 1048576
+        assert pragmas['synchronous'] == 'FULL'
+        assert pragmas['journal_mode'] == 'WAL'
+
+    def test_invalid_profile_values(self, monkeypatch):
+        """Test that unknown profiles and bad values are rejected"""
+        from database.db_helper import load_pragma_profile
+
+        with pytest.raises(ValueError):
+            load_pragma_profile('turbo')
+
+        monkeypatch.setenv('DATABASE_PRAGMA_JOURNAL_MODE', 'sideways')
+        with pytest.raises(ValueError):
+            load_pragma_profile('balanced')
+
+    def test_checkpoint(self, temp_db, sample_company_data):
+        """Test that a TRUNCATE checkpoint empties the WAL"""
+        temp_db.add_company(**sample_company_data)
+
+        result = temp_db.checkpoint('TRUNCATE')
+        assert result['busy'] == 0
+        assert result['log_frames'] == 0
+
+        with pytest.raises(ValueError):
+            temp_db.checkpoint('SOMETIMES')
+
+
+class TestKeysetPagination:
+    """Test cursor-based list pagination"""
+
+    def _walk(self, db, entity, limit, **filters):
+        items, after, pages = [], None, 0
+        while True:
+            page = db.list_page(entity, limit=limit, after=after, **filters)
+            items.extend(page['items'])
+            pages += 1
+            after = page['next_cursor']
+            if after is None:
+                return items, pages
+
+    def test_pages_cover_list_without_duplicates(self, temp_db):
+        """Test that walking every page returns each company exactly once, in order"""
+        for i in range(7):
+            temp_db.add_company(name=f'Paged Co {i}')
+
+        items, pages = self._walk(temp_db, 'companies', limit=3)
+        names = [item['name'] for item in items]
+
+        assert pages >= 3
+        assert len(names) == len(set(names))
+        assert names == sorted(names)
+        assert {f'Paged Co {i}' for i in range(7)} <= set(names)
+
+    def test_descending_ties_and_nulls(self, temp_db):
+        """Test that equal and missing sort keys page stably (NULLs last)"""
+        for i in range(4):
+            recruiter_id = temp_db.add_recruiter(name=f'Recruiter {i}')
+            if i < 2:
+                temp_db.update_recruiter_resume(recruiter_id, None)  # same last_contact_date
+
+        items, _ = self._walk(temp_db, 'recruiters', limit=1)
+        dates = [item['last_contact_date'] for item in items]
+
+        assert len(items) == len({item['id'] for item in items})
+        assert dates[-1] is None
+        assert dates[0] is not None
+
+    def test_filters_and_active_applications(self, populated_db, sample_application_data):
+        """Test page filters and that closed applications are excluded"""
+        db = populated_db['db']
+        sample_application_data['company_id'] = populated_db['company_id']
+        open_id = db.add_application(**sample_application_data)
+        closed_id = db.add_application(**sample_application_data)
+        db.update_application_status(closed_id, 'rejected')
+
+        ids = [item['id'] for item in db.list_page('applications', limit=50)['items']]
+        assert open_id in ids
+        assert closed_id not in ids
+
+        db.add_manager(name='Scoped Manager', company_id=populated_db['company_id'])
+        managers = db.list_page('managers', company_id=populated_db['company_id'])['items']
+        assert [m['name'] for m in managers] == ['Scoped Manager']
+
+    def test_status_search_and_stats(self, populated_db, sample_application_data):
+        """Test that status/search narrow every page and the stats count all matches"""
+        db = populated_db['db']
+        sample_application_data['company_id'] = populated_db['company_id']
+        for i in range(5):
+            app_id = db.add_application(**{**sample_application_data, 'position_title': f'Filter Engineer {i}'})
+            if i % 2:
+                db.update_application_status(app_id, 'interview')
+        db.add_application(**{**sample_application_data, 'position_title': '100% Remote_Role'})
+
+        items, pages = self._walk(db, 'applications', limit=1, search='filter eng', status='interview')
+        assert pages == 2
+        assert sorted(item['position_title'] for item in items) == ['Filter Engineer 1', 'Filter Engineer 3']
+
+        company = db.get_company_details(populated_db['company_id'])['name']
+        everything, _ = self._walk(db, 'applications', limit=50)
+        by_company, _ = self._walk(db, 'applications', limit=50, search=company.upper())
+        assert len(by_company) == len(everything)
+
+        # LIKE wildcards in the search are matched literally
+        assert [item['position_title'] for item in db.list_page('applications', search='0% R')['items']] == \
+            ['100% Remote_Role']
+        assert db.list_page('applications', search='r_e')['items'] == []
+
+        stats = db.get_application_stats(search='filter eng')
+        assert stats['total_applications'] == 5
+        assert stats['interviews'] == 2
+        assert stats['interview_rate'] == 40.0
+        assert db.get_application_stats(search='no such role')['total_applications'] == 0
+        with pytest.raises(ValueError):
+            db.list_page('companies', search='Co')
+
+    def test_invalid_cursor_and_filter(self, temp_db):
+        """Test that malformed or foreign cursors are rejected"""
+        cursor = temp_db.list_page('companies', limit=1)['next_cursor']
+
+        with pytest.raises(ValueError):
+            temp_db.list_page('companies', after='not-a-cursor')
+        if cursor:
+            with pytest.raises(ValueError):
+                temp_db.list_page('recruiters', after=cursor)
+        with pytest.raises(ValueError):
+            temp_db.list_page('companies', industry='AI')
+
+    def test_page_query_uses_index(self, temp_db):
+        """Test that deep pages seek through an index instead of scanning"""
+        from database.db_helper import PAGINATED_LISTS
+
+        with temp_db.get_connection() as conn:
+            for entity, spec in PAGINATED_LISTS.items():
+                op = '<' if spec['descending'] else '>'
+                key = spec['sort_key']
+                plan = conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT id, {key} FROM {spec['table']} "
+                    f"WHERE {spec.get('where') or '1'} AND {key} {op}= ? AND ({key} {op} ? OR id {op} ?) "
+                    f"ORDER BY {key}, id LIMIT 10",
+                    ('m', 'm', 1)
+                ).fetchall()
+                detail = ' '.join(row[-1] for row in plan)
+                assert 'USING' in detail and 'INDEX' in detail, (entity, detail)
+
+
+class TestSparseFieldsets:
+    """Test fields= projections on list and detail queries"""
+
+    def test_lists_leave_out_large_text(self, populated_db):
+        """Test that default list shapes skip content_text and job_posting_text"""
+        db = populated_db['db']
+        db.add_application(company_id=populated_db['company_id'], position_title='Engineer',
+                           resume_version_id=populated_db['resume_id'],
+                           job_posting_text='x' * 2000)
+
+        versions = db.list_resume_versions()
+        assert versions and 'content_text' not in versions[0]
+        assert 'version_name' in versions[0]
+
+        tagged = db.get_resume_versions_with_tags()
+        assert tagged and 'content_text' not in tagged[0] and 'tags' in tagged[0]
+
+        applications = db.get_active_applications()
+        assert 'job_posting_text' not in applications[0]
+        assert len(applications[0]['job_posting_excerpt']) == 500
+
+        page = db.list_page('applications', limit=5)
+        assert 'job_posting_text' not in page['items'][0]
+
+    def test_explicit_fields_and_star(self, populated_db):
+        """Test that requested fields narrow the SELECT and * restores every column"""
+        db = populated_db['db']
+
+        versions = db.list_resume_versions(fields=['version_name'])
+        assert set(versions[0]) == {'id', 'version_name'}
+
+        versions = db.list_resume_versions(fields=['*'])
+        assert versions[0]['content_text']
+
+        version = db.get_resume_version(populated_db['resume_id'])
+        assert version['content_text']
+        version = db.get_resume_version(populated_db['resume_id'], fields=['skills_emphasized'])
+        assert set(version) == {'id', 'skills_emphasized'}
+        assert isinstance(version['skills_emphasized'], list)
+
+    def test_detail_fields(self, populated_db):
+        """Test narrowing application details, including joined columns"""
+        db = populated_db['db']
+        app_id = db.add_application(company_id=populated_db['company_id'], position_title='Engineer',
+                                    resume_version_id=populated_db['resume_id'])
+
+        details = db.get_application_details(app_id)
+        assert 'resume_content' in details and 'company_name' in details
+
+        details = db.get_application_details(app_id, fields=['company_name', 'status'])
+        assert set(details) == {'id', 'company_name', 'status'}
+
+    def test_unknown_field_rejected(self, populated_db):
+        """Test that unknown field names raise ValueError instead of reaching SQL"""
+        db = populated_db['db']
+        with pytest.raises(ValueError):
+            db.list_resume_versions(fields=['version_name', 'id; DROP TABLE companies'])
+        with pytest.raises(ValueError):
+            db.list_page('companies', fields=['name'])
+
+
+class TestCompanyActivitySummary:
+    """Test the trigger-maintained company_activity_summary table"""
+
+    def test_counts_do_not_multiply(self, temp_db):
+        """Test that postings and applications are counted independently"""
+        company_id = temp_db.add_company(name='Summary Co')
+        temp_db.add_job_posting(company_id=company_id, title='Role A', salary_min=100000,
+                                is_remote=True, date_posted='2024-01-01')
+        temp_db.add_job_posting(company_id=company_id, title='Role B', salary_min=120000,
+                                date_posted='2024-02-01')
+        for i in range(3):
+            temp_db.add_application(company_id=company_id, position_title=f'Role {i}')
+
+        activity = next(a for a in temp_db.get_company_activity() if a['id'] == company_id)
+        assert activity['total_jobs_posted'] == 2
+        assert activity['applications_sent'] == 3
+        assert activity['remote_jobs'] == 1
+        assert activity['avg_salary_min'] == 110000
+        assert activity['last_job_posted'] == '2024-02-01'
+
+        details = temp_db.get_company_details(company_id)
+        assert details['applications_sent'] == 3
+
+    def test_updates_and_deletes_stay_consistent(self, temp_db):
+        """Test that moves, edits and deletes keep the summary in step with the base tables"""
+        first = temp_db.add_company(name='Summary First')
+        second = temp_db.add_company(name='Summary Second')
+        posting_id = temp_db.add_job_posting(company_id=first, title='Moving Role', salary_max=150000,
+                                             date_posted='2024-03-01')
+        app_id = temp_db.add_application(company_id=first, position_title='Moving Role')
+
+        with temp_db.get_connection() as conn:
+            conn.execute("UPDATE job_postings SET company_id = ?, date_posted = '2024-04-01' WHERE id = ?",
+                         (second, posting_id))
+        temp_db.update_application(app_id, company_id=second)
+        assert not any(temp_db.check_summaries().values())
+
+        temp_db.delete_application(app_id)
+        with temp_db.get_connection() as conn:
+            conn.execute("DELETE FROM job_postings WHERE id = ?", (posting_id,))
+        assert not any(temp_db.check_summaries().values())
+
+        activity = {a['id']: a for a in temp_db.get_company_activity()}
+        assert activity[second]['total_jobs_posted'] == 0
+        assert activity[second]['last_job_posted'] is None
+
+    def test_check_and_rebuild(self, temp_db):
+        """Test that drift is reported by key and repaired by a rebuild"""
+        company_id = temp_db.add_company(name='Drifting Co')
+        with temp_db.get_connection() as conn:
+            conn.execute("UPDATE company_activity_summary SET applications_sent = 99 WHERE company_id = ?",
+                         (company_id,))
+
+        assert temp_db.check_summaries()['company_activity_summary'] == [company_id]
+        assert temp_db.rebuild_summaries()['company_activity_summary'] >= 1
+        assert not any(temp_db.check_summaries().values())
+
+
+class TestSuccessCounters:
+    """Test the incrementally maintained resume and recruiter counters"""
+
+    def test_counters_follow_application_changes(self, populated_db):
+        """Test counters and success_rate through add, status, resume and delete changes"""
+        db = populated_db['db']
+        resume_id, recruiter_id = populated_db['resume_id'], populated_db['recruiter_id']
+        other_resume = db.add_resume_version(filename='other.pdf', version_name='Other', content_text='text')
+
+        app_ids = [
+            db.add_application(company_id=populated_db['company_id'], position_title=f'Role {i}',
+                               resume_version_id=resume_id, recruiter_id=recruiter_id)
+            for i in range(4)
+        ]
+        db.update_application_status(app_ids[0], 'interview')
+        db.update_application_status(app_ids[1], 'offer')
+
+        metrics = {m['id']: m for m in db.get_resume_success_metrics()}
+        assert metrics[resume_id]['total_applications'] == 4
+        assert metrics[resume_id]['interviews'] == 2
+        assert metrics[resume_id]['offers'] == 1
+        assert metrics[resume_id]['interview_rate'] == 50.0
+        assert db.get_resume_version(resume_id)['success_rate'] == 50.0
+
+        db.update_application_resume(app_ids[1], other_resume)
+        db.delete_application(app_ids[2])
+
+        metrics = {m['id']: m for m in db.get_resume_success_metrics()}
+        assert metrics[resume_id]['total_applications'] == 2
+        assert metrics[other_resume]['offers'] == 1
+        assert db.get_resume_version(other_resume)['success_rate'] == 100.0
+
+        recruiter = next(r for r in db.get_recruiter_dashboard() if r['id'] == recruiter_id)
+        assert recruiter['total_applications'] == 3
+        assert recruiter['successful_applications'] == 2
+        assert recruiter['success_rate'] == round(2 * 100 / 3, 2)
+        assert not any(db.check_summaries().values())
+
+    def test_rebuild_restores_success_rate(self, populated_db):
+        """Test that a rebuild recomputes counters and the success_rate columns"""
+        db = populated_db['db']
+        db.add_application(company_id=populated_db['company_id'], position_title='Role',
+                           resume_version_id=populated_db['resume_id'])
+        with db.get_connection() as conn:
+            conn.execute("UPDATE resume_success_summary SET total_applications = 0")
+            conn.execute("UPDATE resume_versions SET success_rate = 42")
+
+        assert db.check_summaries()['resume_success_summary'] == [populated_db['resume_id']]
+        db.rebuild_summaries(['resume_success_summary'])
+        assert not any(db.check_summaries().values())
+        assert db.get_resume_version(populated_db['resume_id'])['success_rate'] == 0
+
+
+class TestRecruiterDashboardSummary:
+    """Test the materialized recruiter dashboard"""
+
+    def test_recent_applications_bounded_and_structured(self, populated_db):
+        """Test that only the 5 newest applications are kept, as dicts"""
+        db = populated_db['db']
+        recruiter_id = populated_db['recruiter_id']
+        for day in range(1, 9):
+            db.add_application(company_id=populated_db['company_id'], position_title=f'Role {day}',
+                               recruiter_id=recruiter_id, application_date=f'2024-01-0{day}')
+
+        recruiter = next(r for r in db.get_recruiter_dashboard() if r['id'] == recruiter_id)
+        recent = recruiter['recent_applications']
+        assert [a['position_title'] for a in recent] == [f'Role {day}' for day in range(8, 3, -1)]
+        assert recent[0]['company_name'] == 'Test Company Inc.'
+        assert recruiter['total_applications'] == 8
+
+        db.update_company(populated_db['company_id'], name='Renamed Inc.')
+        recruiter = next(r for r in db.get_recruiter_dashboard() if r['id'] == recruiter_id)
+        assert recruiter['recent_applications'][0]['company_name'] == 'Renamed Inc.'
+        assert not any(db.check_summaries().values())
+
+    def test_events_drive_last_communication(self, temp_db):
+        """Test that recruiter events move last_communication and the dashboard order"""
+        quiet = temp_db.add_recruiter(name='Quiet Recruiter')
+        busy = temp_db.add_recruiter(name='Busy Recruiter')
+        event_id = temp_db.add_recruiter_event(busy, title='Intro call', event_date='2999-01-01')
+
+        dashboard = temp_db.get_recruiter_dashboard()
+        assert dashboard[0]['id'] == busy
+        assert dashboard[0]['last_communication'] == '2999-01-01'
+        assert next(r for r in dashboard if r['id'] == quiet)['recent_applications'] == []
+
+        temp_db.delete_recruiter_event(event_id)
+        dashboard = {r['id']: r for r in temp_db.get_recruiter_dashboard()}
+        assert dashboard[busy]['last_communication'] != '2999-01-01'
+        assert not any(temp_db.check_summaries().values())
+
+
+class TestDashboardStats:
+    """Test the cached, snapshot-consistent dashboard stats"""
+
+    def test_stats_values(self, populated_db):
+        """Test dashboard counts and rates"""
+        db = populated_db['db']
+        app_id = db.add_application(company_id=populated_db['company_id'], position_title='Role')
+        db.add_application(company_id=populated_db['company_id'], position_title='Other Role')
+        db.update_application_status(app_id, 'offer')
+
+        stats = db.get_dashboard_stats()
+        assert stats['total_applications'] == 2
+        assert stats['interviews'] == 1
+        assert stats['offers'] == 1
+        assert stats['interview_rate'] == 50.0
+        assert stats['companies_tracked'] >= 1
+        assert stats['resume_versions'] >= 1
+
+    def test_cache_reused_until_write(self, temp_db):
+        """Test that repeated loads hit the cache and writes invalidate it"""
+        first = temp_db.get_dashboard_stats()
+        generation = temp_db.data_generation()
+        assert temp_db.get_dashboard_stats() == first
+        assert temp_db.data_generation() == generation
+
+        temp_db.add_company(name='Cache Buster')
+        assert temp_db.data_generation() > generation
+        assert temp_db.get_dashboard_stats()['companies_tracked'] == first['companies_tracked'] + 1
+
+    def test_external_write_invalidates(self, temp_db):
+        """Test that commits from another connection are picked up via data_version"""
+        before = temp_db.get_dashboard_stats()['companies_tracked']
+
+        conn = sqlite3.connect(temp_db.db_path)
+        conn.execute("INSERT INTO companies (name) VALUES ('Written Elsewhere')")
+        conn.commit()
+        conn.close()
+
+        assert temp_db.get_dashboard_stats()['companies_tracked'] == before + 1
+
+
+class TestTableVersions:
+    """Test the per-table change counters behind ETags"""
+
+    def test_writes_bump_only_their_table(self, temp_db):
+        """Test that a write moves its own counter and leaves the others alone"""
+        before = temp_db.get_table_versions()
+        temp_db.add_company(name='Versioned Co')
+        after = temp_db.get_table_versions()
+
+        assert after['companies'] > before['companies']
+        assert after['tags'] == before['tags']
+        assert after['applications'] == before['applications']
+
+
+class TestFullTextSearch:
+    """Test the trigger-maintained FTS5 search index"""
+
+    def test_ranked_results_with_snippets(self, populated_db):
+        """Test that matches come back ranked, highlighted and escaped"""
+        db = populated_db['db']
+        db.add_application(company_id=populated_db['company_id'], position_title='Data Engineer',
+                           job_posting_text='Build <streaming> pipelines for data science teams')
+        db.add_company_event(populated_db['company_id'], title='Coffee chat',
+                             description='Talked about data science hiring')
+
+        results = db.search('data science')['items']
+        assert {r['kind'] for r in results} == {'resume', 'application', 'company_event'}
+        assert results[0]['kind'] == 'resume'  # title match outranks body matches
+        assert [r['score'] for r in results] == sorted((r['score'] for r in results), reverse=True)
+
+        application = next(r for r in results if r['kind'] == 'application')
+        assert application['parent_id'] == populated_db['company_id']
+        assert '&lt;streaming&gt;' in application['snippet']
+        assert '<mark>data</mark> <mark>science</mark>' in application['snippet']
+
+        assert [r['kind'] for r in db.search('science', kinds=['company_event'])['items']] == ['company_event']
+        assert db.search('"science data"')['items'] == []
+        assert db.search('scien*')['items']
+
+    def test_triggers_keep_index_current(self, populated_db):
+        """Test that inserts, updates and deletes are reflected immediately"""
+        db = populated_db['db']
+        company_id = populated_db['company_id']
+        assert db.search('zeppelin')['items'] == []
+
+        db.update_company(company_id, notes='Builds zeppelin fleets')
+        assert [(r['kind'], r['id']) for r in db.search('zeppelin')['items']] == [('company', company_id)]
+
+        db.update_company(company_id, notes='Builds boats')
+        assert db.search('zeppelin')['items'] == []
+
+        app_id = db.add_application(company_id=company_id, position_title='Zeppelin Pilot')
+        assert db.search('zeppelin')['items'][0]['id'] == app_id
+        db.delete_application(app_id)
+        assert db.search('zeppelin')['items'] == []
+        assert not any(db.check_summaries().values())
+
+    def test_pagination(self, temp_db):
+        """Test that cursors walk every match exactly once"""
+        for i in range(7):
+            temp_db.add_company(name=f'Widget Maker {i}', notes='widget ' * (i + 1))
+
+        seen, after = [], None
+        while True:
+            page = temp_db.search('widget', limit=3, after=after)
+            seen.extend(r['id'] for r in page['items'])
+            after = page['next_cursor']
+            if after is None:
+                break
+        assert len(seen) == len(set(seen)) == 7
+
+    def test_invalid_input(self, temp_db):
+        """Test that empty queries, unknown kinds and bad cursors raise ValueError"""
+        for kwargs in [{'query': '   '}, {'query': '*** ()'}, {'query': 'x', 'kinds': ['memo']},
+                       {'query': 'x', 'after': 'garbage'}]:
+            with pytest.raises(ValueError):
+                temp_db.search(**kwargs)
+        # FTS5 operators in the input are searched for, not interpreted
+        assert temp_db.search('NEAR( OR "unbalanced')['items'] == []
+
+
+class TestNameIndex:
+    """Test the trigram name index behind fuzzy lookups"""
+
+    def test_ranking(self, temp_db):
+        """Test exact, prefix and substring matches rank ahead of fuzzy ones"""
+        for name in ['Amazon Web Services', 'Amazon', 'Big Amazon Fan Club', 'Amazing Labs']:
+            temp_db.add_company(name=name)
+
+        matches = temp_db.match_names('amazon')
+        assert [(m['name'], m['match']) for m in matches[:3]] == [
+            ('Amazon', 'exact'), ('Amazon Web Services', 'prefix'), ('Big Amazon Fan Club', 'substring')]
+        assert temp_db.find_company_by_name('amazon')['name'] == 'Amazon'
+        assert temp_db.find_company_by_name('Web Serv')['name'] == 'Amazon Web Services'
+
+        typo = temp_db.match_names('Amazn Web Servces')
+        assert typo[0]['name'] == 'Amazon Web Services'
+        assert typo[0]['match'] == 'fuzzy'
+        assert temp_db.match_names('Amazn Web Servces', fuzzy=False) == []
+        assert temp_db.match_names('qqqqqq') == []
+
+    def test_kinds_and_maintenance(self, temp_db):
+        """Test recruiters and managers are indexed and renames are picked up"""
+        company_id = temp_db.add_company(name='Initech')
+        recruiter_id = temp_db.add_recruiter(name='Jennifer Smith')
+        manager_id = temp_db.add_manager(name='Bill Lumbergh', company_id=company_id)
+
+        assert [(m['kind'], m['id']) for m in temp_db.match_names('Jenifer Smth')] == [('recruiter', recruiter_id)]
+        assert temp_db.match_names('lumbergh', kinds=['manager'])[0]['id'] == manager_id
+        assert temp_db.match_names('lumbergh', kinds=['company']) == []
+
+        temp_db.update_company(company_id, name='Initrode')
+        assert temp_db.find_company_by_name('Initech') is None
+        assert temp_db.find_company_by_name('initrode')['id'] == company_id
+        assert not any(temp_db.check_summaries().values())
+
+        with pytest.raises(ValueError):
+            temp_db.match_names('  ')
+        with pytest.raises(ValueError):
+            temp_db.match_names('x', kinds=['vendor'])
+
+
+class TestTagIndex:
+    """Test the in-process tag index behind resume tag searches"""
+
+    def test_queries(self, temp_db, sample_resume_data):
+        """Test AND, OR and NOT expressions return resumes newest first"""
+        tags = {name: temp_db.add_tag(name) for name in ['Python', 'AWS', 'GCP', 'Junior', 'Data Science']}
+        resumes = {}
+        for name, tagged in [('py-aws', ['Python', 'AWS']), ('py-gcp-junior', ['Python', 'GCP', 'Junior']),
+                             ('gcp', ['GCP', 'Data Science']), ('py-gcp', ['Python', 'GCP'])]:
+            resumes[name] = temp_db.add_resume_version(**dict(sample_resume_data, version_name=name))
+            temp_db.set_resume_tags(resumes[name], [tags[tag] for tag in tagged])
+
+        def names(query):
+            return [r['version_name'] for r in temp_db.search_resumes_by_tag_query(query)]
+
+        assert names('python AND (aws OR gcp) AND NOT junior') == ['py-gcp', 'py-aws']
+        assert names('gcp not python') == ['gcp']
+        assert names('"data science" OR junior') == ['gcp', 'py-gcp-junior']
+        assert names('NOT (python OR gcp)') == []
+        assert names('cobol') == []
+        assert [r['version_name'] for r in temp_db.search_resumes_by_tags(['AWS', 'Junior'])] == \
+            ['py-gcp-junior', 'py-aws']
+        assert [r['version_name'] for r in temp_db.search_resumes_by_tags(['python', 'gcp'], match_all=True)] == \
+            ['py-gcp', 'py-gcp-junior']
+
+        for bad in ['', 'python AND', '(aws', 'aws)', 'OR gcp']:
+            with pytest.raises(ValueError):
+                temp_db.search_resumes_by_tag_query(bad)
+
+    def test_maintenance(self, temp_db, test_db_path, sample_resume_data):
+        """Test tag writes update the index and outside writes trigger a rebuild"""
+        from database.db_helper import ResumeRunnerDB
+
+        resume_id = temp_db.add_resume_version(**sample_resume_data)
+        python = temp_db.add_tag('Python')
+        aws = temp_db.add_tag('AWS')
+
+        def ids(query):
+            return [r['id'] for r in temp_db.search_resumes_by_tag_query(query)]
+
+        assert ids('python') == []
+        temp_db.add_resume_tag(resume_id, python)
+        versions = temp_db.tag_index.versions
+        assert ids('python') == [resume_id]
+        assert temp_db.tag_index.versions == versions  # updated in place, no rebuild
+
+        temp_db.set_resume_tags(resume_id, [aws])
+        assert ids('python') == [] and ids('aws') == [resume_id]
+        temp_db.remove_resume_tag(resume_id, aws)
+        assert ids('aws') == []
+
+        temp_db.add_resume_tag(resume_id, aws)
+        temp_db.delete_tag(aws)
+        assert ids('aws') == []
+
+        # Another process (here, another instance) tags the resume
+        other = ResumeRunnerDB(test_db_path)
+        other.add_resume_tag(resume_id, python)
+        other.close()
+        assert ids('python') == [resume_id]
+
+
+class TestBulkImport:
+    """Test streaming CSV / JSON Lines imports"""
+
+    def test_applications_csv(self, populated_db):
+        """Test names are resolved or created, bad rows reported and summaries kept in step"""
+        import io
+        from database.db_helper import read_import_rows
+
+        db = populated_db['db']
+        data = (
+            "company,recruiter,position_title,application_date,status,salary_min,is_remote,notes\n"
+            "test company inc.,Jane Agent,Data Engineer,2024-03-01,interview,120000,yes,Imported\n"
+            "Brand New Co,,ML Engineer,,applied,,no,\n"
+            "Brand New Co,,,2024-03-02,,,,\n"
+            "Brand New Co,,Analyst,2024-13-40,,,,\n"
+            "Brand New Co,,Analyst,2024-03-03,,lots,,\n"
+        )
+        summary = db.bulk_import('applications', read_import_rows(io.StringIO(data), 'csv'), chunk_size=2)
+
+        assert summary['rows'] == 5
+        assert summary['inserted'] == 2
+        assert summary['created'] == {'companies': 1, 'recruiters': 1}
+        assert [error['line'] for error in summary['errors']] == [4, 5, 6]
+        assert 'position_title' in summary['errors'][0]['error']
+
+        imported = db.search_applications_by_company('test company')
+        assert [a['position_title'] for a in imported] == ['Data Engineer']
+        application = db.get_application_details(imported[0]['id'])
+        assert application['status'] == 'interview'
+        assert application['is_remote'] == 1
+        assert application['outcome_notes'] == 'Imported'
+        assert db.search('imported')['items'][0]['id'] == imported[0]['id']
+        assert db.find_company_by_name('Brand New Co') is not None
+        assert not any(db.check_summaries().values())
+
+    def test_jsonl_and_errors(self, temp_db):
+        """Test JSON Lines companies are deduplicated and unknown names can be refused"""
+        import io
+        from database.db_helper import read_import_rows
+
+        temp_db.add_company(name='Existing Co')
+        data = '{"name": "existing co"}\n{"name": "Fresh Co", "industry": "Robotics"}\nnot json\n[1]\n{"nombre": "x"}\n'
+        summary = temp_db.bulk_import('companies', read_import_rows(io.StringIO(data), 'jsonl'))
+        assert (summary['inserted'], summary['skipped'], summary['failed']) == (1, 1, 3)
+        assert temp_db.find_company_by_name('Fresh Co')['industry'] == 'Robotics'
+
+        rows = read_import_rows(io.StringIO('{"company": "Nowhere", "position_title": "Dev"}\n'), 'jsonl')
+        summary = temp_db.bulk_import('applications', rows, create_missing=False)
+        assert summary['errors'] == [{'line': 1, 'error': 'Unknown company: Nowhere'}]
+
+        with pytest.raises(ValueError):
+            temp_db.bulk_import('tags', [])
+        with pytest.raises(ValueError):
+            read_import_rows(io.StringIO(''), 'xml')
+
+    def test_deferred_triggers_are_guarded(self, temp_db):
+        """Test every insert trigger on a deferred table is listed in ``deferred`` and checks import_guard"""
+        from database.db_helper import IMPORT_ENTITIES
+
+        with temp_db.get_connection() as conn:
+            for entity, spec in IMPORT_ENTITIES.items():
+                if not spec.get('deferred'):
+                    continue
+                triggers = {row['name']: row['sql'] for row in conn.execute(
+                    "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ?", (spec['table'],))
+                    if 'AFTER INSERT ON' in row['sql'].upper()}
+                assert set(triggers) == set(spec['deferred']), entity
+                for name, sql in triggers.items():
+                    assert f"import_guard WHERE table_name = '{spec['table']}'" in sql, name
+                assert conn.execute("SELECT COUNT(*) FROM import_guard").fetchone()[0] == 0
+
+    def test_failed_rows_leave_nothing_behind(self, temp_db):
+        """Test names are only created, and cached, for rows that are actually inserted"""
+        import io
+        from database.db_helper import read_import_rows
+
+        data = (
+            '{"company": "Ghost Co", "recruiter": "Ghost Agent", "position_title": "Dev", "job_posting_id": 999999}\n'
+            '{"company": "Real Co", "position_title": "Dev"}\n'
+            '{"company": "ghost co", "position_title": "Ops"}\n'
+        )
+        summary = temp_db.bulk_import('applications', read_import_rows(io.StringIO(data), 'jsonl'))
+        assert (summary['inserted'], summary['failed']) == (2, 1)
+        assert summary['created'] == {'companies': 2, 'recruiters': 0}
+        assert temp_db.find_company_by_name('Ghost Co') is not None
+        with temp_db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM companies WHERE name LIKE 'ghost co'").fetchone()[0] == 1
+            assert conn.execute("SELECT COUNT(*) FROM recruiters WHERE name = 'Ghost Agent'").fetchone()[0] == 0
+            assert conn.execute("SELECT COUNT(*) FROM change_log WHERE entity = 'applications'").fetchone()[0] == 2
+            conn.execute("""
+                CREATE TRIGGER test_reject_company BEFORE INSERT ON companies WHEN NEW.name = 'Bad Co'
+                BEGIN SELECT RAISE(ABORT, 'rejected'); END
+            """)
+        assert not any(temp_db.check_summaries().values())
+
+        # A name whose insert failed is tried again, not treated as existing
+        data = '{"name": "Bad Co"}\n{"name": "Good Co"}\n{"name": "Bad Co"}\n{"name": "good co"}\n'
+        summary = temp_db.bulk_import('companies', read_import_rows(io.StringIO(data), 'jsonl'))
+        assert (summary['inserted'], summary['skipped'], summary['failed']) == (1, 1, 2)
+        assert [error['line'] for error in summary['errors']] == [1, 3]
+
+
+class TestExport:
+    """Test streaming table exports"""
+
+    def test_formats_and_filters(self, populated_db):
+        """Test JSON Lines, CSV and gzip output and column filters"""
+        import csv
+        import gzip
+        import io
+        from database.db_helper import encode_export
+
+        db = populated_db['db']
+        db.add_application(company_id=populated_db['company_id'], position_title='Exported, "quoted"')
+        other = db.add_application(company_id=populated_db['company_id'], position_title='Other')
+        db.update_application_status(other, 'rejected')
+
+        columns, rows = db.export_rows('applications', {'status': 'applied'})
+        lines = b''.join(encode_export(columns, rows, 'jsonl')).decode().splitlines()
+        assert [json.loads(line)['position_title'] for line in lines] == ['Exported, "quoted"']
+
+        columns, rows = db.export_rows('applications')
+        data = gzip.decompress(b''.join(encode_export(columns, rows, 'csv', compress=True))).decode()
+        exported = list(csv.DictReader(io.StringIO(data)))
+        assert [row['position_title'] for row in exported] == ['Exported, "quoted"', 'Other']
+        assert exported[0]['company_id'] == str(populated_db['company_id'])
+
+        with pytest.raises(ValueError):
+            db.export_rows('sqlite_master')
+        with pytest.raises(ValueError):
+            db.export_rows('applications', {'nope': 1})
+        with pytest.raises(ValueError):
+            encode_export(columns, [], 'xml')
+
+    def test_flat_memory(self, temp_db):
+        """Test exporting stays within a fixed memory budget however large the table"""
+        import tracemalloc
+        from database.db_helper import encode_export
+
+        rows = ({'company': f"Company {i % 50}", 'position_title': f"Role {i}", 'job_posting_text': 'x' * 1000}
+                for i in range(10000))
+        assert temp_db.bulk_import('applications', enumerate(rows, 1))['inserted'] == 10000
+
+        tracemalloc.start()
+        try:
+            exported = 0
+            for fmt in ('jsonl', 'csv'):
+                columns, rows = temp_db.export_rows('applications')
+                for piece in encode_export(columns, rows, fmt):
+                    exported += len(piece)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # About 2 MB whether the table holds a thousand rows or a million
+        assert exported > 20 * 1024 * 1024
+        assert peak < 4 * 1024 * 1024
+
+
+class TestExpand:
+    """Test embedding related resources with expand="""
+
+    def test_one_query_per_relation(self, populated_db):
+        """Test that relations load for every record at once, nested paths included"""
+        db = populated_db['db']
+        tag_id = db.add_tag('python')
+        db.add_resume_tag(populated_db['resume_id'], tag_id)
+        app_ids = [db.add_application(company_id=populated_db['company_id'], position_title=f"Role {i}",
+                                      resume_version_id=populated_db['resume_id'],
+                                      recruiter_id=populated_db['recruiter_id'] if i % 2 else None)
+                   for i in range(20)]
+        db.add_application_event(app_ids[0], 'interview', '2024-05-01', 'Onsite')
+        applications = [db.get_application_details(app_id) for app_id in app_ids]
+
+        statements = []
+        with db.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            db.expand('applications', applications, ['timeline', 'company', 'resume.tags', 'recruiter'])
+            conn.set_trace_callback(None)
+
+        assert len([sql for sql in statements if 'SELECT' in sql]) == 5
+        assert applications[0]['company']['name'] == 'Test Company Inc.'
+        assert [event['title'] for event in applications[0]['timeline']] == ['Onsite']
+        assert applications[1]['timeline'] == []
+        assert applications[5]['resume']['tags'][0]['name'] == 'python'
+        assert applications[5]['recruiter']['id'] == populated_db['recruiter_id']
+        assert applications[4]['recruiter'] is None
+
+    def test_unknown_relation(self, populated_db):
+        """Test that unknown or unreachable relations are rejected"""
+        db = populated_db['db']
+        company = db.get_company(populated_db['company_id'])
+        with pytest.raises(ValueError):
+            db.expand('companies', [company], ['owner'])
+        with pytest.raises(ValueError):
+            db.expand('companies', [company], ['events.tags'])
+        with pytest.raises(ValueError):
+            db.expand('applications', [{'id': 1}], ['company'])
+
+
+class TestEventSummaries:
+    """Test batched company/recruiter event summaries"""
+
+    def test_company_summaries(self, populated_db):
+        """Test counts, latest events and next follow-ups from one query"""
+        from datetime import date, timedelta
+
+        db = populated_db['db']
+        company_id = populated_db['company_id']
+        other_id = db.add_company(name='Other Co')
+        db.add_company(name='Quiet Co')
+        soon = (date.today() + timedelta(days=3)).isoformat()
+        db.add_company_event(company_id, 'Old call', event_date='2024-01-01',
+                             follow_up_required=True, follow_up_date='2024-01-05')
+        db.add_company_event(company_id, 'Latest call', event_date='2024-03-01',
+                             follow_up_required=True, follow_up_date=soon)
+        for day in range(1, 6):
+            db.add_company_event(other_id, f'Note {day}', event_date=f'2024-02-0{day}')
+
+        summaries = {s['company_id']: s for s in db.get_event_summaries('companies', recent=3)}
+        assert set(summaries) == {company_id, other_id}
+        assert summaries[company_id]['event_count'] == 2
+        assert summaries[company_id]['latest_event']['title'] == 'Latest call'
+        assert summaries[company_id]['next_follow_up'] == soon
+        assert summaries[other_id]['next_follow_up'] is None
+        assert [e['title'] for e in summaries[other_id]['recent_events']] == ['Note 5', 'Note 4', 'Note 3']
+        assert summaries[other_id]['event_count'] == 5
+
+        assert [s['company_id'] for s in db.get_event_summaries('companies', ids=[other_id])] == [other_id]
+        assert db.get_event_summaries('companies', ids=[]) == []
+        with pytest.raises(ValueError):
+            db.get_event_summaries('applications')
+
+
+class TestOptionLists:
+    """Test lightweight dropdown option lists"""
+
+    def test_options_and_prefix(self, populated_db):
+        """Test label ordering, case-insensitive prefixes and the covering index"""
+        db = populated_db['db']
+        for name in ('beta Labs', 'Alpha Co', 'alphabet Inc'):
+            db.add_company(name=name)
+
+        options = db.get_options('companies')
+        assert [o['label'] for o in options] == ['Alpha Co', 'alphabet Inc', 'beta Labs', 'Test Company Inc.']
+        assert set(options[0]) == {'id', 'label'}
+        assert [o['label'] for o in db.get_options('companies', prefix='ALPHA')] == ['Alpha Co', 'alphabet Inc']
+        assert [o['label'] for o in db.get_options('companies', prefix='alpha', limit=1)] == ['Alpha Co']
+        assert db.get_options('companies', prefix='zzz') == []
+
+        [resume] = db.get_options('resume-versions')
+        assert set(resume) == {'id', 'label', 'is_master', 'created_at'}
+
+        with db.get_connection() as conn:
+            plan = ' '.join(row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id, name FROM companies "
+                "WHERE name >= ? COLLATE NOCASE AND name < ? COLLATE NOCASE ORDER BY name COLLATE NOCASE",
+                ('a', 'b')))
+        assert 'COVERING INDEX idx_companies_name_options' in plan
+
+        with pytest.raises(ValueError):
+            db.get_options('applications')
+
+    def test_options_are_capped(self, populated_db, monkeypatch):
+        """Test the default and maximum number of options returned"""
+        from database import db_helper
+
+        db = populated_db['db']
+        for i in range(4):
+            db.add_company(name=f'Capped Co {i}')
+        monkeypatch.setattr(db_helper, 'OPTION_LIST_SIZE', 2)
+        monkeypatch.setattr(db_helper, 'OPTION_LIST_MAX_SIZE', 3)
+
+        assert len(db.get_options('companies', prefix='capped')) == 2
+        assert len(db.get_options('companies', prefix='capped', limit=10)) == 3
+        assert len(db.get_options('companies', limit=0)) == 1
+
+
+class TestChangeLog:
+    """Test the trigger-populated change log"""
+
+    def test_changes_are_recorded_in_order(self, populated_db):
+        """Test inserts, updates and deletes (including cascades) land in the log"""
+        db = populated_db['db']
+        start = db.get_changes()['next_since']
+
+        app_id = db.add_application(company_id=populated_db['company_id'], position_title='Engineer')
+        db.update_application_status(app_id, 'interview')
+        event_id = db.add_company_event(populated_db['company_id'], 'Call')
+        db.delete_company_event(event_id)
+
+        feed = db.get_changes(start)
+        changes = [(c['entity'], c['id'], c['operation']) for c in feed['changes']]
+        assert ('applications', app_id, 'insert') in changes
+        assert ('applications', app_id, 'update') in changes
+        assert changes[-2:] == [('company_events', event_id, 'insert'), ('company_events', event_id, 'delete')]
+        assert [c['seq'] for c in feed['changes']] == sorted(c['seq'] for c in feed['changes'])
+        assert feed['next_since'] == feed['latest'] == feed['changes'][-1]['seq']
+
+        page = db.get_changes(start, limit=1)
+        assert page['has_more'] and page['next_since'] == feed['changes'][0]['seq']
+        assert {c['entity'] for c in db.get_changes(start, entities=['company_events'])['changes']} == \
+            {'company_events'}
+        assert db.get_changes(feed['latest'])['changes'] == []
+
+    def test_compaction_and_retention(self, populated_db):
+        """Test compaction keeps the newest change per row and retention raises the floor"""
+        db = populated_db['db']
+        start = db.get_changes()['next_since']
+        app_id = db.add_application(company_id=populated_db['company_id'], position_title='Engineer')
+        for status in ('phone_screen', 'interview'):
+            db.update_application_status(app_id, status)
+
+        result = db.compact_change_log(retention_days=None)
+        assert result['compacted'] > 0
+        [change] = [c for c in db.get_changes(start)['changes'] if c['entity'] == 'applications']
+        assert change['operation'] == 'update'
+
+        with db.get_connection() as conn:
+            conn.execute("UPDATE change_log SET changed_at = datetime('now', '-60 days')")
+        db.add_company_event(populated_db['company_id'], 'Fresh')
+        result = db.compact_change_log(retention_days=30)
+        assert result['remaining'] == 1
+        assert db.get_changes(start)['reset']
+        assert not db.get_changes(result['floor'])['reset']
+        assert db.get_changes(result['floor'])['changes'][0]['entity'] == 'company_events'
+
+
+class TestChangeFeed:
+    """Test the change feed behind the SSE stream"""
+
+    def test_subscribers_get_grouped_changes(self, populated_db):
+        """Test a committed write reaches a subscriber without waiting for the poll interval"""
+        db = populated_db['db']
+        feed = db.change_feed()
+        feed.poll_interval = 30
+        subscription = feed.subscribe()
+        start = db.get_changes()['next_since']
+
+        app_id = db.add_application(company_id=populated_db['company_id'], position_title='Engineer')
+        messages = subscription.get(timeout=5)
+        while not messages or 'applications' not in messages[-1]['changes']:
+            messages += subscription.get(timeout=5)
+        assert app_id in messages[-1]['changes']['applications']
+        assert messages[-1]['seq'] > start
+
+        replay = feed.subscribe(since=start).get(timeout=0)
+        assert app_id in [i for message in replay for i in message['changes'].get('applications', [])]
+        subscription.close()
+        assert subscription not in feed._subscribers
+        db.close()
+
+    def test_replay_beyond_one_page_is_reset(self, populated_db, monkeypatch):
+        """Test a listener more than one change-log page behind gets one reset, not a replay"""
+        from database import db_helper
+
+        db = populated_db['db']
+        feed = db.change_feed()
+        start = db.get_changes()['next_since']
+        for i in range(3):
+            db.add_tag(name=f'Replay {i}')
+        feed.subscribe().close()  # starts the feed at the newest seq
+
+        monkeypatch.setattr(db_helper, 'CHANGE_LOG_MAX_PAGE_SIZE', 2)
+        assert feed.subscribe(since=start).get(timeout=0) == [{'seq': feed._since, 'reset': True}]
+
+        [message] = feed.subscribe(since=start + 1).get(timeout=0)
+        assert message['seq'] == feed._since
+        assert len(message['changes']['tags']) == 2
+        db.close()
+
+    def test_slow_subscriber_is_reset(self, populated_db):
+        """Test a full buffer collapses into a single reset message"""
+        db = populated_db['db']
+        subscription = db.change_feed().subscribe()
+        subscription.buffer_size = 2
+        for seq in range(1, 5):
+            subscription.push({'seq': seq, 'changes': {'tags': [seq]}})
+        assert subscription.get(timeout=0) == [{'seq': 3, 'reset': True}, {'seq': 4, 'changes': {'tags': [4]}}]
+        db.close()
+        assert subscription.closed
+
+
+class TestForkSafety:
+    """Test the hooks a pre-forking server calls around fork()"""
+
+    def test_worker_uses_its_own_connections(self, temp_db):
+        """Test a forked child writes through a fresh pool while the parent keeps working"""
+        temp_db.get_options('companies')
+        temp_db.prepare_fork()
+        assert temp_db.pool.stats()['open'] == 0
+
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                inherited = temp_db.pool
+                temp_db.after_fork()
+                temp_db.add_company(name='Forked Co')
+                status = 0 if temp_db.pool is not inherited else 1
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert [option['label'] for option in temp_db.get_options('companies', prefix='Forked')] == ['Forked Co']
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+API docs cost benchmark
+Compares what the docs cost a worker when flasgger builds /apispec.json from
+the route docstrings at runtime (as the server used to) against serving the
+prebuilt backend/apidocs/apispec.json: startup, first and repeat requests for
+the spec, and Python memory allocated by the docs. Each case runs in a fresh
+interpreter.
+
+Usage: python benchmarks/bench_api_docs.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from bench_utils import create_benchmark_db, print_table
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+
+# Each case prints {"startup", "first", "repeat" (ms), "kib"} as JSON.
+# "runtime flasgger" mounts a Swagger instance the way create_app() did
+# before the spec was prebuilt, with app.debug on as start-dev.sh runs it
+# (flasgger caches the spec only when debug is off).
+CASE_CODE = '''
+import json, sys, time, tracemalloc
+import server
+tracemalloc.start()
+start = time.perf_counter()
+if MODE == 'runtime':
+    from flasgger import Swagger
+    import build_apispec
+    app = server.create_app(docs=False)
+    app.debug = DEBUG
+    Swagger(app, config={**build_apispec.swagger_config, 'specs_route': '/docs/'},
+            template=build_apispec.swagger_template)
+else:
+    app = server.create_app()
+startup = (time.perf_counter() - start) * 1000
+client = app.test_client()
+start = time.perf_counter()
+assert client.get('/apispec.json', headers={'Accept-Encoding': 'gzip'}).status_code == 200
+first = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+for _ in range(50):
+    client.get('/apispec.json', headers={'Accept-Encoding': 'gzip'})
+repeat = (time.perf_counter() - start) * 1000 / 50
+kib = tracemalloc.get_traced_memory()[0] / 1024
+sys.stderr.write(json.dumps({'startup': startup, 'first': first, 'repeat': repeat, 'kib': kib}))
+'''
+
+CASES = [
+    ('runtime flasgger (debug)', {'MODE': 'runtime', 'DEBUG': True}),
+    ('runtime flasgger (cached)', {'MODE': 'runtime', 'DEBUG': False}),
+    ('prebuilt apispec.json', {'MODE': 'prebuilt', 'DEBUG': False}),
+]
+
+
+def run_case(settings: dict, env: dict) -> dict:
+    code = ''.join(f"{name} = {value!r}\n" for name, value in settings.items()) + CASE_CODE
+    result = subprocess.run([sys.executable, '-c', code], cwd=BACKEND_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=100)
+    env = {**os.environ, 'DATABASE_PATH': db_path, 'S3_BUCKET_NAME': 'your-resume-runner-bucket'}
+    rows = []
+    try:
+        for label, settings in CASES:
+            runs = [run_case(settings, env) for _ in range(args.runs)]
+            rows.append([label, *(statistics.median(run[key] for run in runs)
+                                  for key in ('startup', 'first', 'repeat', 'kib'))])
+    finally:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    print_table(f"API docs per worker, median of {args.runs} fresh interpreters",
+                ['docs', 'startup ms', 'first spec ms', 'repeat spec ms', 'allocated KiB'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Batch request benchmark
+Times the requests RecruiterForm and ApplicationForm make on load against a
+real threaded server, fanned out one request at a time, fanned out over six
+parallel connections (as a browser does), and as a single POST /api/batch.
+Also times a write followed by the refetch it triggers, which can't be
+parallelised. A per-request delay stands in for network round-trip time.
+
+Usage: python benchmarks/bench_batch.py [--rtt-ms N] [--iterations N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import make_server
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet, time_calls
+
+PAGES = {
+    'RecruiterForm': ['/api/companies', '/api/managers',
+                      '/api/recruiters/1/managers', '/api/recruiters/1/companies'],
+    'ApplicationForm': ['/api/companies', '/api/resume-versions', '/api/recruiters'],
+}
+WRITE = {'method': 'POST', 'path': '/api/companies/1/events', 'body': {'title': 'Benchmark note'}}
+REFRESH = '/api/companies/1/events'
+BROWSER_CONNECTIONS = 6
+
+
+def request(base: str, path: str, rtt: float, data: bytes = None):
+    time.sleep(rtt)
+    req = urllib.request.Request(base + path, data=data,
+                                 headers={'Content-Type': 'application/json'} if data else {})
+    try:
+        with urllib.request.urlopen(req) as response:
+            return response.read()
+    except urllib.error.HTTPError as error:
+        return error.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=2000)
+    parser.add_argument('--rtt-ms', type=float, default=20.0)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=args.applications)
+    try:
+        server = load_server(db_path)
+        httpd = make_server('127.0.0.1', 0, server.app, threaded=True)
+        logging.getLogger('werkzeug').setLevel(logging.ERROR)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{httpd.server_port}"
+        pool = ThreadPoolExecutor(BROWSER_CONNECTIONS)
+
+        rows = []
+        with quiet():
+            for rtt_ms in sorted({0.0, args.rtt_ms}):
+                rtt = rtt_ms / 1000
+                for page, paths in PAGES.items():
+                    body = json.dumps({'requests': [{'path': path} for path in paths]}).encode()
+                    sequential = time_calls(lambda: [request(base, path, rtt) for path in paths],
+                                            args.iterations)
+                    parallel = time_calls(lambda: list(pool.map(lambda path: request(base, path, rtt), paths)),
+                                          args.iterations)
+                    batched = time_calls(lambda: request(base, '/api/batch', rtt, body), args.iterations)
+                    rows.append([page, len(paths), rtt_ms, sequential['p50_ms'], parallel['p50_ms'],
+                                 batched['p50_ms'], batched['p95_ms']])
+
+                write_body = json.dumps(WRITE['body']).encode()
+                body = json.dumps({'requests': [WRITE, {'path': REFRESH}]}).encode()
+                sequential = time_calls(lambda: (request(base, WRITE['path'], rtt, write_body),
+                                                 request(base, REFRESH, rtt)), args.iterations)
+                batched = time_calls(lambda: request(base, '/api/batch', rtt, body), args.iterations)
+                rows.append(['write + refetch', 2, rtt_ms, sequential['p50_ms'], '-',
+                             batched['p50_ms'], batched['p95_ms']])
+
+        pool.shutdown()
+        httpd.shutdown()
+        server.db.close()
+    finally:
+        os.remove(db_path)
+
+    print_table(
+        "Page-load latency (p50 ms unless noted)",
+        ['page', 'requests', 'rtt ms', 'sequential', f'parallel ({BROWSER_CONNECTIONS} conns)',
+         '/api/batch', '/api/batch p95'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Bulk import benchmark
+Times db.bulk_import() streaming CSV and JSON Lines applications (companies
+and recruiters resolved by name, missing ones created) against one
+add_application() call per row, the way imports worked before.
+
+Usage: python benchmarks/bench_bulk_import.py [--rows N] [--companies N]
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from bench_utils import STATUSES, create_benchmark_db, print_table
+from database.db_helper import ResumeRunnerDB, read_import_rows
+
+TITLES = ['Data Engineer', 'Backend Engineer', 'ML Engineer', 'Platform Engineer', 'Analytics Lead',
+          'Staff Engineer', 'Engineering Manager', 'Site Reliability Engineer']
+
+
+def generate_rows(count: int, companies: int, seed: int = 3):
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=3 * 365)
+    for i in range(count):
+        yield {
+            'company': f"Import Company {rng.randrange(companies)}",
+            'recruiter': f"Import Recruiter {rng.randrange(companies // 4 or 1)}" if rng.random() < 0.4 else '',
+            'position_title': rng.choice(TITLES),
+            'application_date': (start + timedelta(days=rng.randrange(3 * 365))).isoformat(),
+            'status': rng.choice(STATUSES),
+            'application_source': rng.choice(['linkedin', 'referral', 'company site', 'recruiter']),
+            'job_location': rng.choice(['Remote', 'New York, NY', 'Austin, TX', 'Berlin']),
+            'salary_min': str(rng.randrange(80, 180) * 1000),
+            'is_remote': rng.choice(['true', 'false']),
+            'notes': f"Imported row {i}",
+        }
+
+
+def as_csv(rows) -> str:
+    rows = list(rows)
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def as_jsonl(rows) -> str:
+    return ''.join(json.dumps({k: v for k, v in row.items() if v != ''}) + '\n' for row in rows)
+
+
+def timed_import(db_path: str, entity: str, text: str, fmt: str):
+    db = ResumeRunnerDB(db_path)
+    try:
+        start = time.perf_counter()
+        summary = db.bulk_import(entity, read_import_rows(io.StringIO(text), fmt))
+        return summary, time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--baseline-rows', type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = []
+    for label, fmt, text in [('CSV', 'csv', as_csv(generate_rows(args.rows, args.companies))),
+                             ('JSON Lines', 'jsonl', as_jsonl(generate_rows(args.rows, args.companies)))]:
+        db_path = create_benchmark_db(companies=50, recruiters=20, resumes=5, job_postings=0,
+                                      applications=0, events_per_entity=0)
+        try:
+            summary, seconds = timed_import(db_path, 'applications', text, fmt)
+        finally:
+            os.remove(db_path)
+        assert summary['failed'] == 0, summary['errors'][:5]
+        rows.append([f"bulk_import ({label})", summary['inserted'], round(seconds, 2),
+                     f"{summary['inserted'] / seconds:,.0f}"])
+
+    db_path = create_benchmark_db(companies=50, recruiters=20, resumes=5, job_postings=0,
+                                  applications=0, events_per_entity=0)
+    try:
+        db = ResumeRunnerDB(db_path)
+        company_ids = {}
+        start = time.perf_counter()
+        for row in generate_rows(args.baseline_rows, args.companies):
+            # What a client had to do per row: look the company up (or create it), then POST
+            if row['company'] not in company_ids:
+                found = db.match_names(row['company'], kinds=['company'], limit=1, fuzzy=False)
+                company_ids[row['company']] = found[0]['id'] if found and found[0]['match'] == 'exact' \
+                    else db.add_company(name=row['company'])
+            app_id = db.add_application(company_id=company_ids[row['company']], position_title=row['position_title'],
+                                        application_date=row['application_date'],
+                                        application_source=row['application_source'],
+                                        job_location=row['job_location'], salary_min=row['salary_min'],
+                                        is_remote=row['is_remote'], notes=row['notes'])
+            db.get_application_details(app_id)
+        seconds = time.perf_counter() - start
+        db.close()
+    finally:
+        os.remove(db_path)
+    rows.append(['add_application per row', args.baseline_rows, round(seconds, 2),
+                 f"{args.baseline_rows / seconds:,.0f}"])
+
+    print_table(
+        f"Application import ({args.companies:,} companies named in the file)",
+        ['method', 'rows', 'seconds', 'rows/s'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
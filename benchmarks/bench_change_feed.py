@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Change feed benchmark
+Measures how long a committed write takes to reach tabs subscribed to the
+change feed behind /api/events/stream, for writes made in-process (pushed
+immediately) and by another process (picked up through PRAGMA data_version),
+against the average staleness of tabs polling on an interval instead.
+
+Usage: python benchmarks/bench_change_feed.py [--subscribers N] [--writes N]
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import threading
+import time
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet
+
+
+def deliver(db, write, subscribers: int, writes: int):
+    """Time from each write's commit until every subscriber has its message (ms)"""
+    feed = db.change_feed()
+    subscriptions = [feed.subscribe() for _ in range(subscribers)]
+    latencies = []
+    for i in range(writes):
+        done = threading.Barrier(subscribers + 1)
+
+        def wait(subscription):
+            while not subscription.get(timeout=5):
+                pass
+            done.wait()
+
+        threads = [threading.Thread(target=wait, args=(subscription,)) for subscription in subscriptions]
+        for thread in threads:
+            thread.start()
+        start = time.perf_counter()
+        write(i)
+        done.wait()
+        latencies.append((time.perf_counter() - start) * 1000)
+        for thread in threads:
+            thread.join()
+    for subscription in subscriptions:
+        subscription.close()
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--subscribers', type=int, default=20)
+    parser.add_argument('--writes', type=int, default=50)
+    parser.add_argument('--poll-seconds', type=float, default=15.0,
+                        help='polling interval the feed replaces')
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db()
+    try:
+        server = load_server(db_path)
+        db = server.db
+        other = sqlite3.connect(db_path)
+
+        def local_write(i):
+            db.add_company_event(1, f"Note {i}")
+
+        def external_write(i):
+            other.execute("INSERT INTO company_events (company_id, title) VALUES (1, ?)", (f"External {i}",))
+            other.commit()
+
+        with quiet():
+            local = deliver(db, local_write, args.subscribers, args.writes)
+            external = deliver(db, external_write, args.subscribers, max(1, args.writes // 5))
+        other.close()
+        db.close()
+    finally:
+        os.remove(db_path)
+
+    print_table(
+        f"Write-to-tab latency, {args.subscribers} subscribers",
+        ['source', 'p50 ms', 'p95 ms'],
+        [['in-process write (feed)', *local],
+         ['other process (feed, data_version poll)', *external],
+         [f'polling every {args.poll_seconds:g}s (mean staleness)', args.poll_seconds * 500, '-']]
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Company activity benchmark
+Times the companies list against the old company_activity aggregate view
+(job_postings and applications both joined onto companies) and the
+trigger-maintained company_activity_summary, at growing application volumes.
+Also reports the write overhead the triggers add to add_application.
+
+Usage: python benchmarks/bench_company_activity.py [--companies N] [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+LEGACY_VIEW_QUERY = """
+    SELECT c.id, c.name, c.website, c.industry, c.company_size, c.headquarters,
+           c.is_remote_friendly, c.updated_at, c.notes, c.linkedin_url,
+           COUNT(jp.id) as total_jobs_posted,
+           COUNT(a.id) as applications_sent,
+           MAX(jp.date_posted) as last_job_posted,
+           AVG(jp.salary_min) as avg_salary_min,
+           AVG(jp.salary_max) as avg_salary_max,
+           COUNT(CASE WHEN jp.is_remote = 1 THEN 1 END) as remote_jobs
+    FROM companies c
+    LEFT JOIN job_postings jp ON c.id = jp.company_id
+    LEFT JOIN applications a ON c.id = a.company_id
+    GROUP BY c.id, c.name, c.website, c.industry, c.company_size, c.headquarters,
+             c.is_remote_friendly, c.updated_at, c.notes, c.linkedin_url
+"""
+
+
+def legacy_activity(db: ResumeRunnerDB):
+    with db.get_connection() as conn:
+        return conn.execute(LEGACY_VIEW_QUERY).fetchall()
+
+
+def drop_triggers(db: ResumeRunnerDB):
+    with db.get_connection() as conn:
+        names = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_company_activity_%'")]
+        for name in names:
+            conn.execute(f"DROP TRIGGER {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--companies', type=int, default=200)
+    parser.add_argument('--iterations', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    for applications in [1000, 10000, 50000]:
+        db_path = create_benchmark_db(companies=args.companies, applications=applications,
+                                      job_postings=applications // 10, text_words=20)
+        try:
+            db = ResumeRunnerDB(db_path)
+            legacy = time_calls(lambda: legacy_activity(db), args.iterations, warmup=1)
+            summary = time_calls(db.get_company_activity, args.iterations * 20)
+            rows.append([f"{applications:,}", legacy['p50_ms'], summary['p50_ms']])
+
+            if applications == 50000:
+                insert = lambda: db.add_application(company_id=1, position_title='Benchmark Role')
+                with_triggers = time_calls(insert, 500)
+                drop_triggers(db)
+                without_triggers = time_calls(insert, 500)
+            db.close()
+        finally:
+            os.remove(db_path)
+
+    print_table(
+        f"GET /api/companies query ({args.companies} companies)",
+        ['applications', 'legacy view p50 ms', 'summary table p50 ms'],
+        rows
+    )
+    print_table(
+        "add_application write cost",
+        ['triggers', 'p50 ms', 'p95 ms'],
+        [['off', without_triggers['p50_ms'], without_triggers['p95_ms']],
+         ['on', with_triggers['p50_ms'], with_triggers['p95_ms']]]
+    )
+
+
+if __name__ == '__main__':
+    main()
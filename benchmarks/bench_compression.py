@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark
+Measures bytes on the wire and server time per request for the largest JSON
+endpoints at several dataset sizes: uncompressed, compressed on every request
+(cache cleared), and served from the compressed-body cache.
+
+Usage: python benchmarks/bench_compression.py [--sizes 1000,5000,20000] [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet, time_calls
+
+ENDPOINTS = ['/api/resume-versions/with-tags', '/api/applications', '/api/recruiters/dashboard']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1000,5000,20000', help='comma-separated application counts')
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for size in [int(value) for value in args.sizes.split(',')]:
+        db_path = create_benchmark_db(companies=max(200, size // 10), recruiters=max(100, size // 20),
+                                      resumes=max(20, size // 50), applications=size)
+        try:
+            server = load_server(db_path)
+            client = server.app.test_client()
+            with quiet():
+                for url in ENDPOINTS:
+                    plain = time_calls(lambda: client.get(url), args.iterations)
+                    row = [size, url, len(client.get(url).data) // 1024, plain['p50_ms']]
+                    for coding in server.COMPRESSORS:
+                        headers = {'Accept-Encoding': coding}
+
+                        def cold():
+                            server.compression_cache.clear()
+                            return client.get(url, headers=headers)
+
+                        compressed = time_calls(cold, args.iterations)
+                        cached = time_calls(lambda: client.get(url, headers=headers), args.iterations)
+                        row += [len(client.get(url, headers=headers).data) // 1024,
+                                compressed['p50_ms'], cached['p50_ms']]
+                    rows.append(row)
+            server.db.close()
+        finally:
+            os.remove(db_path)
+
+    codings = list(server.COMPRESSORS)
+    print_table(
+        "Response size (KiB) and server time per request (p50 ms)",
+        ['applications', 'endpoint', 'plain KiB', 'plain ms',
+         *[column for coding in codings for column in (f'{coding} KiB', f'{coding} ms', f'{coding} cached ms')]],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
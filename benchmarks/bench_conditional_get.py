@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Conditional GET benchmark
+Replays a react-query style refetch pattern (every endpoint on the page is
+refetched on each window focus, with an occasional write in between) with
+and without If-None-Match, and reports bytes sent and server CPU time.
+
+Usage: python benchmarks/bench_conditional_get.py [--focus-events N] [--write-every N]
+"""
+
+import argparse
+import os
+import time
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet
+
+POLLED = [
+    '/api/companies',
+    '/api/tags',
+    '/api/dashboard/stats',
+    '/api/dashboard/recent-activity',
+    '/api/applications',
+    '/api/recruiters/dashboard',
+    '/api/companies/1/events',
+]
+
+
+def replay(client, focus_events: int, write_every: int, conditional: bool):
+    etags = {}
+    sent = responses_304 = 0
+    cpu_start = time.process_time()
+    for event in range(focus_events):
+        if write_every and event and event % write_every == 0:
+            client.post('/api/companies/1/events', json={'title': f'Note {event}'})
+        for url in POLLED:
+            headers = {'If-None-Match': etags[url]} if conditional and url in etags else {}
+            response = client.get(url, headers=headers)
+            sent += len(response.data)
+            if response.status_code == 304:
+                responses_304 += 1
+            elif response.headers.get('ETag'):
+                etags[url] = response.headers['ETag']
+    return sent, responses_304, time.process_time() - cpu_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=2000)
+    parser.add_argument('--focus-events', type=int, default=100)
+    parser.add_argument('--write-every', type=int, default=10)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=args.applications, text_words=100)
+    try:
+        server = load_server(db_path)
+        client = server.app.test_client()
+
+        rows = []
+        with quiet():
+            for label, conditional in [('unconditional', False), ('If-None-Match', True)]:
+                sent, not_modified, cpu = replay(client, args.focus_events, args.write_every, conditional)
+                rows.append([label, f"{sent / 1024 / 1024:,.1f}", not_modified, f"{cpu:.2f}"])
+
+        print_table(
+            f"{args.focus_events} focus refetches of {len(POLLED)} endpoints, "
+            f"one write every {args.write_every}",
+            ['client', 'MiB sent', '304s', 'server CPU s'],
+            rows
+        )
+        server.db.close()
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
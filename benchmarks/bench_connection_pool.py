@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Connection pool benchmark
+Compares per-call latency of ResumeRunnerDB helpers using the legacy
+connect-per-call strategy against the pooled connection manager.
+
+Usage: python benchmarks/bench_connection_pool.py [--iterations N] [--threads N]
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+
+class LegacyResumeRunnerDB(ResumeRunnerDB):
+    """Reproduces the old behaviour: a brand-new connection for every call"""
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+
+def run_threaded(db: ResumeRunnerDB, threads: int, calls_per_thread: int) -> float:
+    """Return total calls per second with ``threads`` workers hitting get_company"""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset):
+        barrier.wait()
+        for i in range(calls_per_thread):
+            db.get_company(1 + (offset + i) % 100)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * calls_per_thread / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=2000)
+    try:
+        legacy = LegacyResumeRunnerDB(db_path)
+        pooled = ResumeRunnerDB(db_path)
+
+        rows = []
+        for label, call in [
+            ('get_company', lambda db: db.get_company(1)),
+            ('get_all_tags', lambda db: db.get_all_tags()),
+            ('get_application_details', lambda db: db.get_application_details(1)),
+        ]:
+            before = time_calls(lambda: call(legacy), args.iterations)
+            after = time_calls(lambda: call(pooled), args.iterations)
+            rows.append([label, before['p50_ms'], after['p50_ms'], before['p95_ms'], after['p95_ms'],
+                         f"{before['mean_ms'] / after['mean_ms']:.1f}x"])
+
+        print_table(
+            f"Per-call latency ({args.iterations} calls, single thread)",
+            ['call', 'legacy p50', 'pooled p50', 'legacy p95', 'pooled p95', 'speedup'],
+            rows
+        )
+
+        calls = max(1, args.iterations // args.threads)
+        legacy_rate = run_threaded(legacy, args.threads, calls)
+        pooled_rate = run_threaded(pooled, args.threads, calls)
+        print_table(
+            f"Throughput with {args.threads} threads",
+            ['strategy', 'calls/sec'],
+            [['legacy', f"{legacy_rate:,.0f}"], ['pooled', f"{pooled_rate:,.0f}"]]
+        )
+
+        print(f"\n🔌 Pool stats: {pooled.pool_stats()}")
+        pooled.close()
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Dashboard stats benchmark
+Compares the old /api/dashboard/stats queries (five COUNT(*)s, each in its
+own implicit transaction) with get_dashboard_stats, both on a cache miss
+(one read snapshot) and served from the generation-checked cache. Also
+times the rejected single-scan aggregate for reference.
+
+Usage: python benchmarks/bench_dashboard_stats.py [--applications N] [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+
+def legacy_stats(db: ResumeRunnerDB):
+    with db.get_connection() as conn:
+        return [
+            conn.execute(sql).fetchone()[0] for sql in [
+                "SELECT COUNT(*) FROM applications",
+                "SELECT COUNT(*) FROM applications WHERE status IN ('phone_screen', 'interview', 'offer')",
+                "SELECT COUNT(*) FROM applications WHERE status = 'offer'",
+                "SELECT COUNT(*) FROM companies",
+                "SELECT COUNT(*) FROM resume_versions",
+            ]
+        ]
+
+
+def single_scan_stats(db: ResumeRunnerDB):
+    with db.get_connection() as conn:
+        return conn.execute("""
+            SELECT COUNT(*),
+                   SUM(status IN ('phone_screen', 'interview', 'offer')),
+                   SUM(status = 'offer'),
+                   (SELECT COUNT(*) FROM companies),
+                   (SELECT COUNT(*) FROM resume_versions)
+            FROM applications
+        """).fetchone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=200000)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=args.applications, job_postings=args.applications // 10,
+                                  text_words=50)
+    try:
+        db = ResumeRunnerDB(db_path)
+
+        def uncached():
+            db._cache.clear()
+            return db.get_dashboard_stats()
+
+        legacy = time_calls(lambda: legacy_stats(db), args.iterations)
+        scan = time_calls(lambda: single_scan_stats(db), args.iterations)
+        miss = time_calls(uncached, args.iterations)
+        cached = time_calls(db.get_dashboard_stats, args.iterations * 20)
+
+        print_table(
+            f"Dashboard stats ({args.applications:,} applications)",
+            ['strategy', 'p50 ms', 'p95 ms'],
+            [['five COUNT(*) queries', legacy['p50_ms'], legacy['p95_ms']],
+             ['single-scan aggregate', scan['p50_ms'], scan['p95_ms']],
+             ['snapshot, cache miss', miss['p50_ms'], miss['p95_ms']],
+             ['snapshot, cache hit', cached['p50_ms'], cached['p95_ms']]]
+        )
+        db.close()
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Event summary benchmark
+Times what the Companies and Recruiters pages spend on their per-card event
+summaries with 1k entities: one GET /api/<entity>/<id>/events per card
+against a single GET /api/<entity>/event-summaries, plus the summary query
+with and without its timeline-order index.
+
+Usage: python benchmarks/bench_event_summaries.py [--entities N] [--events N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet, time_calls
+
+INDEXES = {
+    'companies': ('idx_company_events_company_recent',
+                  "company_events(company_id, event_date DESC, created_at DESC)"),
+    'recruiters': ('idx_recruiter_events_recruiter_recent',
+                   "recruiter_events(recruiter_id, event_date DESC, created_at DESC)"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--entities', type=int, default=1000)
+    parser.add_argument('--events', type=int, default=10, help='events per company/recruiter')
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(companies=args.entities, recruiters=args.entities, applications=0,
+                                  job_postings=0, events_per_entity=args.events)
+    try:
+        server = load_server(db_path)
+        client = server.app.test_client()
+        db = server.db
+
+        rows = []
+        with quiet():
+            for entity, (index, definition) in INDEXES.items():
+                ids = range(1, args.entities + 1)
+                per_card = time_calls(lambda: [client.get(f'/api/{entity}/{entity_id}/events') for entity_id in ids],
+                                      max(1, args.iterations // 10), warmup=1)
+                batched = time_calls(lambda: client.get(f'/api/{entity}/event-summaries'), args.iterations)
+                indexed = time_calls(lambda: db.get_event_summaries(entity), args.iterations)
+                with db.get_connection() as conn:
+                    conn.execute(f"DROP INDEX {index}")
+                unindexed = time_calls(lambda: db.get_event_summaries(entity), args.iterations)
+                with db.get_connection() as conn:
+                    conn.execute(f"CREATE INDEX {index} ON {definition}")
+                rows.append([entity, len(ids), per_card['mean_ms'], batched['p50_ms'],
+                             unindexed['p50_ms'], indexed['p50_ms']])
+        db.close()
+    finally:
+        os.remove(db_path)
+
+    print_table(
+        f"Event summaries for every card ({args.events} events each)",
+        ['page', 'cards', 'per-card GETs ms', 'event-summaries GET p50 ms',
+         'query p50 ms (no index)', 'query p50 ms (index)'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Sparse fieldset benchmark
+Compares response size and latency of the list endpoints with every column
+(fields=*, the old shape) against the default list shapes that leave out
+content_text and job_posting_text.
+
+Usage: python benchmarks/bench_fieldsets.py [--applications N] [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet, time_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=2000)
+    parser.add_argument('--resumes', type=int, default=50)
+    parser.add_argument('--iterations', type=int, default=30)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=args.applications, resumes=args.resumes,
+                                  job_postings=args.applications // 5, text_words=600)
+    try:
+        server = load_server(db_path)
+        client = server.app.test_client()
+
+        rows = []
+        for url in ['/api/applications', '/api/resume-versions', '/api/resume-versions/with-tags']:
+            with quiet():
+                full = client.get(f'{url}?fields=*')
+                sparse = client.get(url)
+                before = time_calls(lambda: client.get(f'{url}?fields=*'), args.iterations)
+                after = time_calls(lambda: client.get(url), args.iterations)
+            rows.append([url, f"{len(full.data) / 1024:,.0f}", f"{len(sparse.data) / 1024:,.0f}",
+                         before['p50_ms'], after['p50_ms']])
+
+        print_table(
+            f"List payloads ({args.applications:,} applications, {args.resumes} resumes)",
+            ['endpoint', 'all cols KiB', 'default KiB', 'all cols p50 ms', 'default p50 ms'],
+            rows
+        )
+        server.db.close()
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
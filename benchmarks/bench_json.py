@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+JSON serialization benchmark
+Times how long the list endpoints spend encoding their responses with the
+stdlib encoder and with orjson (FastJSONProvider in backend/server.py), and
+the whole request in each mode.
+
+Usage: python benchmarks/bench_json.py [--applications N] [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet, time_calls
+
+ENDPOINTS = [
+    '/api/companies',
+    '/api/applications',
+    '/api/resume-versions',
+    '/api/recruiters',
+    '/api/companies/event-summaries',
+    '/api/dashboard/stats',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=5000)
+    parser.add_argument('--iterations', type=int, default=30)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(companies=1000, recruiters=500, resumes=200, applications=args.applications,
+                                  events_per_entity=3)
+    try:
+        server = load_server(db_path)
+        app = server.app
+        client = app.test_client()
+        if server.orjson is None:
+            raise SystemExit("orjson is not installed; pip install orjson to compare")
+
+        rows = []
+        with quiet(), app.app_context():
+            for url in ENDPOINTS:
+                payload = client.get(url).get_json()
+                fast_encode = time_calls(lambda: app.json.response(payload), args.iterations)
+                fast_request = time_calls(lambda: client.get(url), args.iterations)
+                orjson, server.orjson = server.orjson, None
+                slow_encode = time_calls(lambda: app.json.response(payload), args.iterations)
+                slow_request = time_calls(lambda: client.get(url), args.iterations)
+                server.orjson = orjson
+                rows.append([url, len(client.get(url).data) // 1024,
+                             slow_encode['p50_ms'], fast_encode['p50_ms'],
+                             slow_request['p50_ms'], fast_request['p50_ms']])
+        server.db.close()
+    finally:
+        os.remove(db_path)
+
+    print_table(
+        "Response encoding, stdlib json vs orjson (p50 ms)",
+        ['endpoint', 'KiB', 'encode stdlib', 'encode orjson', 'request stdlib', 'request orjson'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Name lookup benchmark
+Times company/recruiter/manager name lookups through the trigram name_index
+(substring and fuzzy) against the old LOWER(name) LIKE '%term%' scan, with
+tens of thousands of contacts.
+
+Usage: python benchmarks/bench_name_lookup.py [--contacts N] [--iterations N]
+"""
+
+import argparse
+import os
+import random
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+SYLLABLES = ('ba be bi bo ca co da de di do fa fe ga go ha ka ke ki ko la le li lo lu ma me mi mo '
+             'na ne ni no pa pe ra re ri ro sa se so ta te ti to va ve vi za zo ex ix ar or en an').split()
+SUFFIXES = ['Technologies', 'Systems', 'Labs', 'Software', 'Analytics', 'Health', 'Capital',
+            'Consulting', 'Group', 'Robotics', 'Cloud', 'Media', 'Logistics', 'Energy']
+FIRST_NAMES = ['James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda',
+               'William', 'Elizabeth', 'David', 'Barbara', 'Priya', 'Wei', 'Ahmed', 'Olga']
+
+
+def legacy_find(db: ResumeRunnerDB, name: str):
+    with db.get_connection() as conn:
+        return conn.execute("SELECT * FROM companies WHERE LOWER(name) LIKE LOWER(?) LIMIT 1",
+                            (f"%{name}%",)).fetchone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--contacts', type=int, default=50000)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    word = lambda: ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+    companies = list(dict.fromkeys(f"{word()} {rng.choice(SUFFIXES)}" for _ in range(args.contacts // 2)))
+    people = [f"{rng.choice(FIRST_NAMES)} {word()}" for _ in range(args.contacts // 2)]
+
+    db_path = create_benchmark_db(companies=1, recruiters=1, resumes=1, job_postings=0,
+                                  applications=0, events_per_entity=0)
+    try:
+        db = ResumeRunnerDB(db_path)
+        with db.get_connection() as conn:
+            conn.executemany("INSERT INTO companies (name) VALUES (?)", [(n,) for n in companies])
+            conn.executemany("INSERT INTO recruiters (name) VALUES (?)", [(n,) for n in people[::2]])
+            conn.executemany("INSERT INTO managers (name) VALUES (?)", [(n,) for n in people[1::2]])
+
+        target, person = companies[len(companies) // 3], people[len(people) // 3]
+        cases = [
+            ('exact company', target, ['company']),
+            ('company prefix', target[:6], ['company']),
+            ('company suffix word', target.split()[1], ['company']),
+            ('company typo', target[:3] + target[4:], ['company']),
+            ('person typo', person.replace('a', 'e', 1)[:-1], None),
+            ('no match', 'Qwxyzzy Holdings', None),
+        ]
+
+        rows = []
+        for label, query, kinds in cases:
+            best = db.match_names(query, kinds=kinds)
+            new = time_calls(lambda: db.match_names(query, kinds=kinds), args.iterations)
+            legacy = time_calls(lambda: legacy_find(db, query), max(10, args.iterations // 10))
+            rows.append([label, query, best[0]['name'] if best else '-', best[0]['match'] if best else '-',
+                         legacy['p50_ms'], new['p50_ms'], new['p95_ms']])
+        db.close()
+    finally:
+        os.remove(db_path)
+
+    print_table(
+        f"Name lookup ({args.contacts:,} contacts, limit 10)",
+        ['case', 'query', 'best match', 'match', 'LIKE scan p50 ms', 'name_index p50 ms', 'p95 ms'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
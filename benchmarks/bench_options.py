@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Dropdown option benchmark
+Times the calls the forms made to fill their dropdowns (the full list
+endpoints) against the /api/options/* lists, reporting latency and payload
+size, plus a prefix-filtered lookup.
+
+Usage: python benchmarks/bench_options.py [--companies N] [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, load_server, print_table, quiet, time_calls
+
+LISTS = [
+    ('companies', '/api/companies', '/api/options/companies'),
+    ('recruiters', '/api/recruiters', '/api/options/recruiters'),
+    ('resume versions', '/api/resume-versions', '/api/options/resume-versions'),
+    ('managers', '/api/managers', '/api/options/managers'),
+    ('tags', '/api/tags', '/api/options/tags'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--iterations', type=int, default=30)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(companies=args.companies, recruiters=args.companies // 2, resumes=200,
+                                  applications=args.companies * 5, text_words=300)
+    try:
+        server = load_server(db_path)
+        client = server.app.test_client()
+        with server.db.get_connection() as conn:
+            conn.executemany("INSERT INTO managers (name, company_id) VALUES (?, ?)",
+                             [(f"Manager {i}", i % args.companies + 1) for i in range(args.companies)])
+            conn.executemany("INSERT INTO tags (name) VALUES (?)", [(f"tag-{i}",) for i in range(100)])
+
+        rows = []
+        with quiet():
+            for label, full_url, options_url in LISTS:
+                full = time_calls(lambda: client.get(full_url), args.iterations)
+                options = time_calls(lambda: client.get(options_url), args.iterations)
+                rows.append([label, len(client.get(full_url).data) // 1024, full['p50_ms'],
+                             len(client.get(options_url).data) // 1024, options['p50_ms'], options['p95_ms']])
+            prefix = time_calls(lambda: client.get('/api/options/companies?q=co&limit=20'), args.iterations)
+        server.db.close()
+    finally:
+        os.remove(db_path)
+
+    print_table(
+        "Dropdown lists: full endpoint vs /api/options",
+        ['list', 'full KiB', 'full p50 ms', 'options KiB', 'options p50 ms', 'options p95 ms'],
+        rows
+    )
+    print(f"\nPrefix lookup (q=co, limit 20): p50 {prefix['p50_ms']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination benchmark
+Shows that page latency stays flat with depth for the cursor-based list
+pages, compared to an equivalent LIMIT/OFFSET query.
+
+Usage: python benchmarks/bench_pagination.py [--applications N] [--limit N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+
+def offset_page(db: ResumeRunnerDB, offset: int, limit: int):
+    with db.get_connection() as conn:
+        return conn.execute(
+            "SELECT * FROM active_applications ORDER BY application_date DESC, id DESC LIMIT ? OFFSET ?",
+            (limit, offset)
+        ).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=50000)
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=args.applications, job_postings=args.applications // 10,
+                                  text_words=50)
+    try:
+        db = ResumeRunnerDB(db_path)
+
+        # Walk the list once to collect the cursor at each depth
+        cursors = {0: None}
+        after, depth = None, 0
+        targets = [10, 100, 400]
+        while targets:
+            page = db.list_page('applications', limit=args.limit, after=after)
+            after = page['next_cursor']
+            depth += 1
+            if after is None:
+                break
+            if depth == targets[0]:
+                cursors[depth] = after
+                targets.pop(0)
+
+        rows = []
+        for depth, cursor in cursors.items():
+            keyset = time_calls(lambda: db.list_page('applications', limit=args.limit, after=cursor),
+                                args.iterations)
+            offset = time_calls(lambda: offset_page(db, depth * args.limit, args.limit), args.iterations)
+            rows.append([depth, keyset['p50_ms'], offset['p50_ms']])
+
+        print_table(
+            f"Active applications page latency ({args.applications:,} rows, {args.limit} per page)",
+            ['page #', 'keyset p50 ms', 'offset p50 ms'],
+            rows
+        )
+        db.close()
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
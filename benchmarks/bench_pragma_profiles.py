@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+PRAGMA profile benchmark
+Runs a mixed read/write workload (dashboard-style reads against
+add_application / add_company_event writes) on a synthetic dataset once per
+profile and reports reads/sec, writes/sec and lock errors.
+
+Usage: python benchmarks/bench_pragma_profiles.py [--applications N] [--seconds S]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from bench_utils import create_benchmark_db, print_table
+from database.db_helper import PRAGMA_PROFILES, ResumeRunnerDB
+
+
+def read_dashboard(db: ResumeRunnerDB, rng: random.Random):
+    with db.get_connection() as conn:
+        conn.execute("SELECT COUNT(*) FROM applications WHERE status = 'offer'").fetchone()
+        conn.execute("""
+            SELECT a.id, a.position_title, a.status, c.name
+            FROM applications a JOIN companies c ON a.company_id = c.id
+            ORDER BY a.application_date DESC LIMIT 10
+        """).fetchall()
+    db.get_application_details(rng.randint(1, 1000))
+
+
+def write_activity(db: ResumeRunnerDB, rng: random.Random, companies: int):
+    company_id = rng.randint(1, companies)
+    if rng.random() < 0.5:
+        db.add_application(company_id=company_id, position_title='Benchmark Role',
+                           job_posting_text='benchmark ' * 200)
+    else:
+        db.add_company_event(company_id=company_id, title='Benchmark event')
+
+
+def run_profile(db_path: str, profile: str, readers: int, writers: int, seconds: float, companies: int):
+    db = ResumeRunnerDB(db_path, pool_size=readers + writers, pragma_profile=profile)
+    counts = {'reads': 0, 'writes': 0, 'errors': 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def loop(kind, seed):
+        rng = random.Random(seed)
+        while not stop.is_set():
+            try:
+                if kind == 'reads':
+                    read_dashboard(db, rng)
+                else:
+                    write_activity(db, rng, companies)
+                key = kind
+            except sqlite3.OperationalError:
+                key = 'errors'
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=loop, args=('reads', n)) for n in range(readers)]
+    threads += [threading.Thread(target=loop, args=('writes', 100 + n)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    db.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--applications', type=int, default=50000)
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"🏗️  Building synthetic dataset ({args.applications:,} applications)...")
+    template = create_benchmark_db(companies=args.companies, applications=args.applications,
+                                   job_postings=args.applications // 5, recruiters=500)
+    workdir = tempfile.mkdtemp(prefix='resume_runner_pragmas_')
+    try:
+        rows = []
+        for profile in PRAGMA_PROFILES:
+            db_path = os.path.join(workdir, f'{profile}.db')
+            shutil.copyfile(template, db_path)
+            counts = run_profile(db_path, profile, args.readers, args.writers, args.seconds, args.companies)
+            rows.append([profile, f"{counts['reads'] / args.seconds:,.0f}",
+                         f"{counts['writes'] / args.seconds:,.0f}", counts['errors']])
+
+        print_table(
+            f"Mixed workload: {args.readers} readers / {args.writers} writers for {args.seconds:.0f}s",
+            ['profile', 'reads/sec', 'writes/sec', 'lock errors'],
+            rows
+        )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        os.remove(template)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Recruiter dashboard benchmark
+Compares the old recruiter_dashboard view (an unbounded GROUP_CONCAT of every
+application, sorted on each call) with the materialized dashboard as the
+per-recruiter history grows. Reports latency and JSON payload size.
+
+Usage: python benchmarks/bench_recruiter_dashboard.py [--recruiters N] [--iterations N]
+"""
+
+import argparse
+import json
+import os
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+LEGACY_DASHBOARD_QUERY = """
+    SELECT r.*,
+           COUNT(DISTINCT a.id) as total_applications,
+           COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END) as successful_applications,
+           MAX(a.application_date) as last_application_date,
+           r.last_contact_date as last_communication,
+           GROUP_CONCAT(
+               CASE WHEN a.application_date IS NOT NULL
+               THEN c.name || '|' || a.position_title || '|' || a.application_date || '|' || a.status
+               END, '; '
+           ) as recent_applications
+    FROM recruiters r
+    LEFT JOIN applications a ON r.id = a.recruiter_id
+    LEFT JOIN companies c ON a.company_id = c.id
+    GROUP BY r.id
+    ORDER BY last_communication DESC NULLS LAST
+"""
+
+
+def legacy_dashboard(db: ResumeRunnerDB):
+    with db.get_connection() as conn:
+        return [dict(row) for row in conn.execute(LEGACY_DASHBOARD_QUERY).fetchall()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--recruiters', type=int, default=100)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for applications in [1000, 10000, 50000]:
+        db_path = create_benchmark_db(recruiters=args.recruiters, applications=applications, text_words=20)
+        try:
+            db = ResumeRunnerDB(db_path)
+            legacy = time_calls(lambda: legacy_dashboard(db), args.iterations)
+            materialized = time_calls(db.get_recruiter_dashboard, args.iterations)
+            legacy_bytes = len(json.dumps(legacy_dashboard(db), default=str))
+            materialized_bytes = len(json.dumps(db.get_recruiter_dashboard(), default=str))
+            rows.append([f"{applications:,}", legacy['p50_ms'], materialized['p50_ms'],
+                         f"{legacy_bytes / 1024:,.0f}", f"{materialized_bytes / 1024:,.0f}"])
+
+            if applications == 50000:
+                insert = time_calls(lambda: db.add_application(company_id=1, position_title='Benchmark Role',
+                                                               recruiter_id=1), 500)
+            db.close()
+        finally:
+            os.remove(db_path)
+
+    print_table(
+        f"GET /api/recruiters/dashboard ({args.recruiters} recruiters, ~60% of applications via a recruiter)",
+        ['applications', 'legacy p50 ms', 'materialized p50 ms', 'legacy KiB', 'materialized KiB'],
+        rows
+    )
+    print(f"\n✍️  add_application with all summary triggers: p50 {insert['p50_ms']:.3f} ms, "
+          f"p95 {insert['p95_ms']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
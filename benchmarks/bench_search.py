@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Full-text search benchmark
+Times db.search() (FTS5, bm25 ranking, snippets, one page) against a LIKE
+scan over the same documents, on a database of ~100k searchable documents.
+Also reports the index size, a full rebuild, and the write overhead the
+search triggers add to add_application.
+
+Usage: python benchmarks/bench_search.py [--documents N] [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+QUERIES = [
+    ('rare word', '00042'),
+    ('phrase', '"machine learning"'),
+    ('two words', 'kubernetes leadership'),
+    ('prefix', 'observ*'),
+    ('common word', 'python'),
+]
+
+
+def like_search(db: ResumeRunnerDB, query: str):
+    """The pre-FTS way: substring scan of every document, first 50 hits, unranked"""
+    terms = [term.strip('"*') for term in query.split('"') if term.strip()] if '"' in query else \
+        [term.rstrip('*') for term in query.split()]
+    where = ' AND '.join("(title LIKE ? OR body LIKE ?)" for _ in terms)
+    params = [value for term in terms for value in (f"%{term}%", f"%{term}%")]
+    with db.get_connection() as conn:
+        return conn.execute(f"SELECT kind, entity_id FROM search_documents WHERE {where} LIMIT 50",
+                            params).fetchall()
+
+
+def drop_triggers(db: ResumeRunnerDB):
+    with db.get_connection() as conn:
+        names = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_search_%'")]
+        for name in names:
+            conn.execute(f"DROP TRIGGER {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--documents', type=int, default=100000)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    # Applications make up most of the corpus, as they do in practice
+    applications = int(args.documents * 0.8)
+    db_path = create_benchmark_db(companies=args.documents // 50, recruiters=args.documents // 100,
+                                  resumes=50, job_postings=args.documents // 10,
+                                  applications=applications, text_words=120)
+    try:
+        db = ResumeRunnerDB(db_path)
+        with db.get_connection() as conn:
+            documents = conn.execute("SELECT COUNT(*) FROM search_index").fetchone()[0]
+            index_pages = conn.execute(
+                "SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name LIKE 'search_index%'").fetchone()[0]
+        print(f"📚 {documents:,} documents, index {index_pages / 2**20:.1f} MiB")
+
+        rows = []
+        for label, query in QUERIES:
+            hits = len(db.search(query, limit=500)['items'])
+            fts = time_calls(lambda: db.search(query, limit=20), args.iterations)
+            like = time_calls(lambda: like_search(db, query), max(3, args.iterations // 5), warmup=1)
+            rows.append([label, query, hits, like['p50_ms'], fts['p50_ms'], fts['p95_ms']])
+
+        first = db.search('python', limit=20)
+        deep = time_calls(lambda: db.search('python', limit=20, after=first['next_cursor']), args.iterations)
+
+        rebuild = time_calls(lambda: db.rebuild_summaries(['search_index']), 1, warmup=0)
+
+        insert = lambda: db.add_application(company_id=1, position_title='Benchmark Role',
+                                            job_posting_text='benchmark ' * 120)
+        with_triggers = time_calls(insert, 300)
+        drop_triggers(db)
+        without_triggers = time_calls(insert, 300)
+        db.close()
+    finally:
+        os.remove(db_path)
+
+    print_table(
+        f"Search latency ({documents:,} documents, 20 results)",
+        ['query', 'q', 'matches (≤500)', 'LIKE scan p50 ms', 'FTS5 p50 ms', 'FTS5 p95 ms'],
+        rows
+    )
+    print(f"\nSecond page of 'python': p50 {deep['p50_ms']:.3f} ms")
+    print(f"Full index rebuild: {rebuild['mean_ms'] / 1000:.2f} s")
+    print_table(
+        "add_application write cost",
+        ['search triggers', 'p50 ms', 'p95 ms'],
+        [['off', without_triggers['p50_ms'], without_triggers['p95_ms']],
+         ['on', with_triggers['p50_ms'], with_triggers['p95_ms']]]
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Backend startup benchmark
+Times a cold start (fresh interpreter, `import server`, `create_app()`) with
+and without the API docs, against a bare interpreter, and summarises
+`python -X importtime` for the import by top-level package. Target: under
+300 ms.
+
+Usage: python benchmarks/bench_startup.py [--runs N] [--top N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from bench_utils import create_benchmark_db, print_table
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+TARGET_MS = 300
+CASES = [
+    ('python -c pass', 'pass', {}),
+    ('import server', 'import server', {}),
+    ('create_app(), no docs', 'import server; server.create_app()', {'API_DOCS': '0'}),
+    ('create_app(), with docs', 'import server; server.create_app()', {'API_DOCS': '1'}),
+]
+
+
+def cold_start(code: str, env: dict, runs: int):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=BACKEND_DIR, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), min(times)
+
+
+def import_profile(env: dict):
+    """Cumulative import time (ms) per top-level package imported by ``server``"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import server; server.create_app()'],
+                            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+    packages = defaultdict(float)
+    imported_server = False
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if name.strip() == 'server':
+            imported_server = True
+            continue
+        # A module is listed after everything it imported: before the server
+        # line, depth 1 is what server imports directly; after it, depth 0 is
+        # what create_app() imports lazily
+        if depth == (0 if imported_server else 1):
+            packages[name.strip().split('.')[0]] += int(cumulative) / 1000
+    return sorted(packages.items(), key=lambda item: -item[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=12)
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=100)
+    env = {**os.environ, 'DATABASE_PATH': db_path, 'S3_BUCKET_NAME': 'your-resume-runner-bucket'}
+    try:
+        rows = []
+        for label, code, extra in CASES:
+            median, best = cold_start(code, {**env, **extra}, args.runs)
+            rows.append([label, median, best, 'yes' if median < TARGET_MS else 'no'])
+        imports = import_profile({**env, 'API_DOCS': '0'})
+    finally:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    print_table(f"Cold start, {args.runs} runs (target {TARGET_MS} ms)",
+                ['step', 'median ms', 'best ms', f'< {TARGET_MS} ms'], rows)
+    print_table("Import time by package under `import server` (-X importtime, cumulative ms)",
+                ['package', 'ms'], [list(item) for item in imports[:args.top]])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Success counter benchmark
+Times the resume success metrics and recruiter dashboard reads against the
+old aggregate views (which rescanned applications on every call) at growing
+application volumes, and the write overhead the counter triggers add.
+
+Usage: python benchmarks/bench_success_counters.py [--iterations N]
+"""
+
+import argparse
+import os
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+LEGACY_METRICS_QUERY = """
+    SELECT rv.id, rv.version_name, rv.skills_emphasized,
+           COUNT(a.id) as total_applications,
+           COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END) as interviews,
+           COUNT(CASE WHEN a.status = 'offer' THEN 1 END) as offers,
+           ROUND(COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END) * 100.0 /
+                 NULLIF(COUNT(a.id), 0), 2) as interview_rate
+    FROM resume_versions rv
+    LEFT JOIN applications a ON rv.id = a.resume_version_id
+    GROUP BY rv.id, rv.version_name, rv.skills_emphasized
+"""
+
+LEGACY_RECRUITER_QUERY = """
+    SELECT r.id, r.name, COUNT(DISTINCT a.id) as total_applications,
+           COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END) as successful_applications,
+           MAX(a.application_date) as last_application_date
+    FROM recruiters r
+    LEFT JOIN applications a ON r.id = a.recruiter_id
+    GROUP BY r.id, r.name
+"""
+
+COUNTS_QUERY = """
+    SELECT r.id, r.name, s.total_applications, s.interviews, s.last_application_date
+    FROM recruiters r
+    LEFT JOIN recruiter_success_summary s ON s.recruiter_id = r.id
+"""
+
+
+def run(db: ResumeRunnerDB, sql: str):
+    with db.get_connection() as conn:
+        return conn.execute(sql).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for applications in [1000, 10000, 50000]:
+        db_path = create_benchmark_db(applications=applications, text_words=20)
+        try:
+            db = ResumeRunnerDB(db_path)
+            rows.append([
+                f"{applications:,}",
+                time_calls(lambda: run(db, LEGACY_METRICS_QUERY), args.iterations)['p50_ms'],
+                time_calls(db.get_resume_success_metrics, args.iterations)['p50_ms'],
+                time_calls(lambda: run(db, LEGACY_RECRUITER_QUERY), args.iterations)['p50_ms'],
+                time_calls(lambda: run(db, COUNTS_QUERY), args.iterations)['p50_ms'],
+            ])
+
+            if applications == 50000:
+                app_ids = iter(range(1, applications + 1))
+                status = lambda: db.update_application_status(next(app_ids), 'interview')
+                with_triggers = time_calls(status, 500)
+                with db.get_connection() as conn:
+                    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' "
+                                                "AND name LIKE 'trg_%_success_%'").fetchall():
+                        conn.execute(f"DROP TRIGGER {name}")
+                without_triggers = time_calls(status, 500)
+            db.close()
+        finally:
+            os.remove(db_path)
+
+    print_table(
+        "Read latency p50 ms (20 resumes, 100 recruiters)",
+        ['applications', 'legacy metrics', 'counter metrics', 'legacy recruiter counts', 'counter recruiter counts'],
+        rows
+    )
+    print_table(
+        "update_application_status write cost",
+        ['triggers', 'p50 ms', 'p95 ms'],
+        [['off', without_triggers['p50_ms'], without_triggers['p95_ms']],
+         ['on', with_triggers['p50_ms'], with_triggers['p95_ms']]]
+    )
+
+
+if __name__ == '__main__':
+    main()
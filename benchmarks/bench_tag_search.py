@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tag search benchmark
+Times resume tag searches through the in-process TagIndex (bitset AND/OR/NOT)
+against the old join + GROUP BY query, and the cost of keeping the index
+current on add_resume_tag.
+
+Usage: python benchmarks/bench_tag_search.py [--resumes N] [--tags N] [--iterations N]
+"""
+
+import argparse
+import os
+import random
+
+from bench_utils import create_benchmark_db, print_table, time_calls
+from database.db_helper import ResumeRunnerDB
+
+
+def legacy_search(db: ResumeRunnerDB, tag_names, match_all: bool):
+    """The pre-index query"""
+    placeholders = ', '.join('?' for _ in tag_names)
+    having = "HAVING COUNT(DISTINCT t.id) = ?" if match_all else ""
+    params = [name.lower() for name in tag_names] + ([len(tag_names)] if match_all else [])
+    with db.get_connection() as conn:
+        return conn.execute(f"""
+            SELECT DISTINCT rv.* FROM resume_versions rv
+            JOIN resume_tags rt ON rv.id = rt.resume_version_id
+            JOIN tags t ON rt.tag_id = t.id
+            WHERE LOWER(t.name) IN ({placeholders})
+            GROUP BY rv.id
+            {having}
+            ORDER BY rv.created_at DESC
+        """, params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--resumes', type=int, default=5000)
+    parser.add_argument('--tags', type=int, default=200)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    db_path = create_benchmark_db(companies=1, recruiters=1, resumes=args.resumes, job_postings=0,
+                                  applications=0, events_per_entity=0)
+    try:
+        db = ResumeRunnerDB(db_path)
+        with db.get_connection() as conn:
+            conn.executemany("INSERT INTO tags (name) VALUES (?)", [(f"tag{i}",) for i in range(args.tags)])
+            resume_ids = [row[0] for row in conn.execute("SELECT id FROM resume_versions")]
+            tag_ids = [row[0] for row in conn.execute("SELECT id FROM tags")]
+            # A few popular tags and a long tail, like real tagging
+            weights = [1 / (rank + 1) for rank in range(len(tag_ids))]
+            pairs = {(resume_id, tag_id) for resume_id in resume_ids
+                     for tag_id in rng.choices(tag_ids, weights, k=6)}
+            conn.executemany("INSERT INTO resume_tags (resume_version_id, tag_id) VALUES (?, ?)", sorted(pairs))
+
+        build = time_calls(lambda: db.rebuild_tag_index(), 5, warmup=1)
+
+        cases = [
+            ('one popular tag', ['tag0'], False, 'tag0'),
+            ('any of three', ['tag1', 'tag5', 'tag50'], False, 'tag1 OR tag5 OR tag50'),
+            ('all of two', ['tag0', 'tag1'], True, 'tag0 AND tag1'),
+            ('and / or / not', None, None, 'tag0 AND (tag2 OR tag3) AND NOT tag1'),
+        ]
+        rows = []
+        for label, tag_names, match_all, query in cases:
+            hits = len(db.search_resumes_by_tag_query(query))
+            legacy = time_calls(lambda: legacy_search(db, tag_names, match_all), args.iterations) \
+                if tag_names else None
+            indexed = time_calls(lambda: db.search_resumes_by_tag_query(query), args.iterations)
+            index = db.tag_index
+            match_only = time_calls(lambda: index.resume_ids_in(index.evaluate(query)), args.iterations)
+            rows.append([label, query, hits, legacy['p50_ms'] if legacy else '-',
+                         match_only['p50_ms'], indexed['p50_ms'], indexed['p95_ms']])
+
+        tag_writes = iter((resume_id, tag_id) for resume_id in resume_ids for tag_id in tag_ids
+                          if (resume_id, tag_id) not in pairs)
+        write = time_calls(lambda: db.add_resume_tag(*next(tag_writes)), 300)
+        db.close()
+    finally:
+        os.remove(db_path)
+
+    print(f"🏷️  Index build: {build['p50_ms']:.1f} ms ({args.resumes:,} resumes, {len(pairs):,} tag assignments)")
+    print_table(
+        f"Tag search ({args.resumes:,} resumes, {args.tags} tags)",
+        ['case', 'query', 'matches', 'SQL p50 ms', 'bitset match p50 ms', 'with rows p50 ms', 'p95 ms'],
+        rows
+    )
+    print(f"\nadd_resume_tag with index upkeep: p50 {write['p50_ms']:.3f} ms, p95 {write['p95_ms']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
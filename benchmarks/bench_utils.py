@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for Resume Runner benchmarks
+Builds synthetic databases from the checked-in schema and times callables
+"""
+
+import contextlib
+import importlib
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'backend'))
+
+SCHEMA_PATH = REPO_ROOT / 'schema' / 'init_db.sql'
+
+STATUSES = ['applied', 'applied', 'applied', 'phone_screen', 'interview', 'offer', 'rejected', 'withdrawn']
+WORDS = (
+    'python sql aws docker kubernetes react data pipeline analytics machine learning '
+    'platform backend frontend distributed systems api design leadership mentoring '
+    'observability testing streaming spark airflow terraform security compliance'
+).split()
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def create_benchmark_db(path: Optional[str] = None, companies: int = 200, resumes: int = 20,
+                        recruiters: int = 100, job_postings: int = 1000, applications: int = 5000,
+                        events_per_entity: int = 3, text_words: int = 300, seed: int = 42) -> str:
+    """Create a database from schema/init_db.sql filled with synthetic rows"""
+    if path is None:
+        handle, path = tempfile.mkstemp(prefix='resume_runner_bench_', suffix='.db')
+        os.close(handle)
+        os.remove(path)
+
+    rng = random.Random(seed)
+    today = date.today()
+
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA_PATH.read_text())
+
+    conn.executemany(
+        "INSERT INTO companies (name, website, industry, headquarters, is_remote_friendly, notes) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [(f"Company {i:05d}", f"https://company{i}.example.com", rng.choice(['Fintech', 'Cloud', 'Retail']),
+          'Remote', rng.randint(0, 1), _paragraph(rng, 20)) for i in range(1, companies + 1)]
+    )
+    conn.executemany(
+        "INSERT INTO resume_versions (filename, version_name, content_text, target_roles, word_count) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [(f"resume_{i}.pdf", f"Resume v{i}", _paragraph(rng, text_words), 'Engineer', text_words)
+         for i in range(1, resumes + 1)]
+    )
+    conn.executemany(
+        "INSERT INTO recruiters (name, email, company, relationship_status, last_contact_date, notes) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [(f"Recruiter {i:05d}", f"recruiter{i}@agency.example.com", f"Agency {i % 25}",
+          rng.choice(['new', 'active', 'cold']), (today - timedelta(days=rng.randint(0, 365))).isoformat(),
+          _paragraph(rng, 15)) for i in range(1, recruiters + 1)]
+    )
+    conn.executemany(
+        "INSERT INTO job_postings (company_id, title, description, salary_min, salary_max, is_remote, date_posted) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(rng.randint(1, companies), f"Engineer {i}", _paragraph(rng, text_words // 2),
+          100000, 150000, rng.randint(0, 1), (today - timedelta(days=rng.randint(0, 365))).isoformat())
+         for i in range(1, job_postings + 1)]
+    )
+    conn.executemany(
+        "INSERT INTO applications (company_id, job_posting_id, recruiter_id, resume_version_id, position_title, "
+        "application_date, status, job_posting_text, outcome_notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [(rng.randint(1, companies), rng.randint(1, job_postings) if job_postings else None,
+          rng.randint(1, recruiters) if recruiters and rng.random() < 0.6 else None,
+          rng.randint(1, resumes) if resumes else None, f"Position {i}",
+          (today - timedelta(days=rng.randint(0, 720))).isoformat(), rng.choice(STATUSES),
+          _paragraph(rng, text_words), _paragraph(rng, 10)) for i in range(1, applications + 1)]
+    )
+    conn.executemany(
+        "INSERT INTO company_events (company_id, title, description, event_date) VALUES (?, ?, ?, ?)",
+        [(c, f"Event {n}", _paragraph(rng, 10), (today - timedelta(days=rng.randint(0, 365))).isoformat())
+         for c in range(1, companies + 1) for n in range(events_per_entity)]
+    )
+    conn.executemany(
+        "INSERT INTO recruiter_events (recruiter_id, title, description, event_date) VALUES (?, ?, ?, ?)",
+        [(r, f"Event {n}", _paragraph(rng, 10), (today - timedelta(days=rng.randint(0, 365))).isoformat())
+         for r in range(1, recruiters + 1) for n in range(events_per_entity)]
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def load_server(db_path: str) -> ModuleType:
+    """Import backend/server.py against ``db_path`` with S3 stubbed out"""
+    os.environ['DATABASE_PATH'] = db_path
+    os.environ['S3_BUCKET_NAME'] = 'your-resume-runner-bucket'
+    with quiet():
+        if 'server' in sys.modules:
+            server = importlib.reload(sys.modules['server'])
+        else:
+            server = importlib.import_module('server')
+        server.create_app(docs=False)
+        return server
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Silence the backend's debug prints while timing"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def time_calls(fn: Callable[[], object], iterations: int = 200, warmup: int = 5) -> Dict[str, float]:
+    """Call ``fn`` repeatedly and return latency statistics in milliseconds"""
+    for _ in range(warmup):
+        fn()
+
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        'mean_ms': statistics.fmean(samples),
+        'p50_ms': samples[len(samples) // 2],
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'iterations': iterations,
+    }
+
+
+def print_table(title: str, headers: List[str], rows: List[List[object]]):
+    """Print a simple aligned results table"""
+    def fmt(value):
+        return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+    cells = [[fmt(v) for v in row] for row in rows]
+    widths = [max(len(h), *(len(r[i]) for r in cells)) if cells else len(h) for i, h in enumerate(headers)]
+
+    print(f"\n📊 {title}")
+    print('  '.join(h.ljust(w) for h, w in zip(headers, widths)))
+    print('  '.join('-' * w for w in widths))
+    for row in cells:
+        print('  '.join(v.ljust(w) for v, w in zip(row, widths)))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+WSGI server throughput benchmark
+Runs the same request mix against `python backend/server.py` (Werkzeug's debug
+server with the reloader, as start-dev.sh does) and against gunicorn with
+backend/gunicorn.conf.py, from several concurrent client processes, and
+reports throughput and latency for each.
+
+Usage: python benchmarks/bench_wsgi.py [--clients N] [--seconds N] [--workers N]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from bench_utils import create_benchmark_db, print_table
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+READS = ['/api/companies', '/api/applications?limit=50', '/api/dashboard/stats',
+         '/api/options/companies?q=co', '/api/recruiters/dashboard']
+WRITE = ('/api/companies/1/events', {'title': 'Benchmark note'})
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start(command, env, port):
+    process = subprocess.Popen(command, cwd=REPO_ROOT, env=env, start_new_session=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health").read()
+            return process
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    stop(process)
+    raise RuntimeError(f"{command[1]} did not start on port {port}")
+
+
+def stop(process):
+    os.killpg(process.pid, signal.SIGTERM)
+    process.wait(timeout=30)
+
+
+def client(args):
+    """Issue requests until the deadline; one write per ``write_every`` requests"""
+    base, deadline, write_every, offset = args
+    latencies, errors, i = [], 0, offset
+    while time.monotonic() < deadline:
+        if write_every and i % write_every == 0:
+            path, body = WRITE
+            request = urllib.request.Request(base + path, data=json.dumps(body).encode(),
+                                             headers={'Content-Type': 'application/json'})
+        else:
+            request = urllib.request.Request(base + READS[i % len(READS)])
+        start_time = time.perf_counter()
+        try:
+            urllib.request.urlopen(request).read()
+            latencies.append((time.perf_counter() - start_time) * 1000)
+        except (urllib.error.URLError, ConnectionError):
+            errors += 1
+        i += 1
+    return latencies, errors
+
+
+def load(port, clients, seconds, write_every):
+    base = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + seconds
+    with multiprocessing.Pool(clients) as pool:
+        results = pool.map(client, [(base, deadline, write_every, offset) for offset in range(clients)])
+    latencies = sorted(latency for result in results for latency in result[0])
+    errors = sum(result[1] for result in results)
+    if not latencies:
+        return [0, '-', '-', errors]
+    return [round(len(latencies) / seconds, 1), latencies[len(latencies) // 2],
+            latencies[int(len(latencies) * 0.95) - 1], errors]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn worker processes')
+    parser.add_argument('--write-every', type=int, default=10, help='one write per N requests (0 = reads only)')
+    args = parser.parse_args()
+
+    db_path = create_benchmark_db(applications=5000)
+    env = {**os.environ, 'DATABASE_PATH': db_path, 'S3_BUCKET_NAME': 'your-resume-runner-bucket',
+           'WEB_CONCURRENCY': str(args.workers), 'GUNICORN_ACCESS_LOG': ''}
+    servers = [
+        ('debug server (python server.py)', [sys.executable, 'backend/server.py'], {'FLASK_DEBUG': '1'}),
+        (f'gunicorn ({args.workers} workers)',
+         [sys.executable, '-m', 'gunicorn', '--config', 'backend/gunicorn.conf.py'], {}),
+    ]
+
+    rows = []
+    try:
+        for label, command, extra in servers:
+            port = free_port()
+            process = start(command, {**env, **extra, 'BACKEND_PORT': str(port)}, port)
+            try:
+                rows.append([label, *load(port, args.clients, args.seconds, args.write_every)])
+            finally:
+                stop(process)
+    finally:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    print_table(
+        f"{args.clients} concurrent clients for {args.seconds:g}s, 1 write per {args.write_every} requests",
+        ['server', 'req/s', 'p50 ms', 'p95 ms', 'errors'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
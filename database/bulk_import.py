@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Resume Runner Bulk Import
+Streams a CSV or JSON Lines file of companies, recruiters or applications
+into the database in batched transactions, reporting rows it could not
+import by line number.
+
+Usage:
+    python database/bulk_import.py applications history.csv
+    python database/bulk_import.py companies companies.jsonl
+    python database/bulk_import.py applications - --format jsonl < export.jsonl
+"""
+
+import argparse
+import io
+import sys
+import time
+
+from db_helper import IMPORT_CHUNK_SIZE, IMPORT_ENTITIES, IMPORT_FORMATS, ResumeRunnerDB, read_import_rows
+
+EXTENSIONS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('entity', choices=list(IMPORT_ENTITIES))
+    parser.add_argument('file', help="CSV or JSON Lines file, or - for stdin")
+    parser.add_argument('--format', choices=IMPORT_FORMATS, help='defaults from the file extension')
+    parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE, help='rows per transaction')
+    parser.add_argument('--no-create', action='store_true',
+                        help='fail rows naming an unknown company or recruiter instead of creating it')
+    parser.add_argument('--db', help='database path (defaults to DATABASE_PATH)')
+    args = parser.parse_args()
+
+    fmt = args.format or next((f for ext, f in EXTENSIONS.items() if args.file.lower().endswith(ext)), None)
+    if fmt is None:
+        parser.error('cannot tell the format from the file name; pass --format')
+
+    stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig', newline='') if args.file == '-' \
+        else open(args.file, encoding='utf-8-sig', newline='')
+    db = ResumeRunnerDB(args.db)
+    try:
+        start = time.perf_counter()
+        summary = db.bulk_import(args.entity, read_import_rows(stream, fmt), chunk_size=args.chunk_size,
+                                 create_missing=not args.no_create)
+        seconds = time.perf_counter() - start
+    finally:
+        db.close()
+        stream.close()
+
+    print(f"📥 {args.entity}: {summary['inserted']:,} of {summary['rows']:,} row(s) imported in {seconds:.2f}s "
+          f"({summary['rows'] / seconds if seconds else 0:,.0f} rows/s)")
+    if summary['skipped']:
+        print(f"⏭️  {summary['skipped']:,} already present")
+    for table, created in summary['created'].items():
+        if created:
+            print(f"➕ created {created:,} {table}")
+    for error in summary['errors'][:20]:
+        print(f"❌ line {error['line']}: {error['error']}")
+    if summary['failed'] > 20:
+        print(f"❌ ... {summary['failed'] - 20:,} more")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Resume Runner Change Log Compaction
+Keeps only the newest change_log row per entity and drops history older
+than the retention window. Clients syncing from before the window are told
+to reload in full. Safe to run from cron while the app is serving.
+
+Usage:
+    python database/compact_change_log.py
+    python database/compact_change_log.py --retention-days 7
+"""
+
+import argparse
+import sys
+
+from db_helper import CHANGE_LOG_RETENTION_DAYS, ResumeRunnerDB
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--retention-days', type=int, default=CHANGE_LOG_RETENTION_DAYS,
+                        help=f'history to keep (default {CHANGE_LOG_RETENTION_DAYS} days)')
+    parser.add_argument('--keep-all', action='store_true', help='compact only; expire nothing')
+    parser.add_argument('--db', help='database path (defaults to DATABASE_PATH)')
+    args = parser.parse_args()
+
+    db = ResumeRunnerDB(args.db)
+    try:
+        result = db.compact_change_log(None if args.keep_all else args.retention_days)
+    finally:
+        db.close()
+
+    print(f"🧹 Compacted {result['compacted']:,} superseded changes, expired {result['expired']:,}; "
+          f"{result['remaining']:,} remain, clients can resume from seq {result['floor']:,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,19 +5,1345 @@ Provides easy-to-use functions for database operations
 """
 
 import sqlite3
+import base64
+import csv
+import html
+import io
 import json
 import os
+import re
+import threading
+import time
+import zlib
+from contextlib import contextmanager
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+
+# Named PRAGMA profiles; pick one with DATABASE_PRAGMA_PROFILE and override
+# single settings with DATABASE_PRAGMA_<NAME> (e.g. DATABASE_PRAGMA_MMAP_SIZE)
+PRAGMA_PROFILES = {
+    # SQLite defaults: rollback journal, every write blocks readers
+    'legacy': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'busy_timeout': 5000,
+    },
+    # WAL so readers never wait on writers; durable across application crashes
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'cache_size': -16000,          # KiB when negative (~16 MB per connection)
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 1000,    # pages
+        'journal_size_limit': 64 * 1024 * 1024,
+    },
+    # Larger caches and memory map for big datasets on machines with RAM to spare
+    'throughput': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 10000,
+        'cache_size': -64000,
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 4000,
+        'journal_size_limit': 128 * 1024 * 1024,
+    },
+}
+
+DEFAULT_PRAGMA_PROFILE = 'balanced'
+
+_PRAGMA_CHOICES = {
+    'journal_mode': {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'},
+    'synchronous': {'OFF', 'NORMAL', 'FULL', 'EXTRA'},
+    'temp_store': {'DEFAULT', 'FILE', 'MEMORY'},
+}
+_INTEGER_PRAGMAS = {'busy_timeout', 'cache_size', 'mmap_size', 'wal_autocheckpoint', 'journal_size_limit'}
+
+
+def load_pragma_profile(name: Optional[str] = None) -> Dict[str, Any]:
+    """Resolve a PRAGMA profile by name, applying DATABASE_PRAGMA_* overrides"""
+    if name is None:
+        name = os.getenv('DATABASE_PRAGMA_PROFILE', DEFAULT_PRAGMA_PROFILE)
+    if name not in PRAGMA_PROFILES:
+        raise ValueError(f"Unknown pragma profile '{name}'. Choose from: {', '.join(PRAGMA_PROFILES)}")
+
+    pragmas = dict(PRAGMA_PROFILES[name])
+    for pragma in _INTEGER_PRAGMAS | set(_PRAGMA_CHOICES):
+        override = os.getenv(f'DATABASE_PRAGMA_{pragma.upper()}')
+        if override not in (None, ''):
+            pragmas[pragma] = override
+
+    for pragma, value in pragmas.items():
+        if pragma in _INTEGER_PRAGMAS:
+            try:
+                pragmas[pragma] = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"PRAGMA {pragma} must be an integer, got {value!r}")
+        elif str(value).upper() not in _PRAGMA_CHOICES[pragma]:
+            raise ValueError(f"Invalid value {value!r} for PRAGMA {pragma}")
+        else:
+            pragmas[pragma] = str(value).upper()
+    return pragmas
+
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Raised when no pooled connection becomes available before the timeout"""
+
+
+class ConnectionPool:
+    """Bounded, thread-aware pool of SQLite connections.
+
+    A thread that re-enters ``connection()`` while it already holds a
+    connection gets that same connection back, so nested helper calls share
+    one transaction. Idle connections are health-checked before reuse once
+    they have been sitting longer than ``health_check_interval`` seconds.
+
+    The pool also keeps a write generation for in-process caches: it moves
+    when a checkout changes rows, and when ``generation()`` sees through
+    ``PRAGMA data_version`` that another connection or process committed.
+    ``wait_for_write()`` blocks until it moves.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], max_size: int = 5,
+                 timeout: float = 30.0, health_check_interval: float = 30.0):
+        self._connect = connect
+        self.max_size = max(1, int(max_size))
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._idle: List[tuple] = []  # (connection, last_released_at), used LIFO
+        self._open = 0
+        self._closed = False
+        self._generation = 0
+        self._writes = threading.Condition()
+        self._data_versions: Dict[sqlite3.Connection, int] = {}
+        self._stats = {
+            'checkouts': 0,
+            'reentrant_checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'created': 0,
+            'discarded': 0,
+        }
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection, committing on success and rolling back on error"""
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            with self._cond:
+                self._stats['reentrant_checkouts'] += 1
+            changes = held.total_changes
+            try:
+                yield held
+            finally:
+                # Let caches see writes made inside a longer-lived outer checkout
+                if held.total_changes != changes:
+                    self._advance()
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        changes = conn.total_changes
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            self._local.conn = None
+            if conn.total_changes != changes:
+                self._advance()
+            self._release(conn)
+
+    def generation(self, conn: sqlite3.Connection) -> int:
+        """Return the write generation, first folding in commits ``conn`` has not seen yet.
+
+        ``PRAGMA data_version`` only moves for commits made by *other*
+        connections, and each connection has its own value, so each one is
+        compared with what that same connection reported last time. A change,
+        or a connection asked for the first time, advances the generation.
+        That may invalidate a cache needlessly but never leaves one stale.
+        """
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        with self._cond:
+            if self._data_versions.get(conn) == version:
+                return self._generation
+            self._data_versions[conn] = version
+        return self._advance()
+
+    def wait_for_write(self, generation: int, timeout: float) -> int:
+        """Block until the generation moves past ``generation`` (or ``timeout`` seconds pass) and return it.
+
+        Only writes made through this pool wake the caller early; commits
+        from other processes show up the next time ``generation()`` runs.
+        """
+        with self._writes:
+            self._writes.wait_for(lambda: self._generation != generation or self._closed, timeout)
+            return self._generation
+
+    def _advance(self) -> int:
+        with self._cond:
+            self._generation += 1
+            generation = self._generation
+        with self._writes:
+            self._writes.notify_all()
+        return generation
+
+    def _acquire(self) -> sqlite3.Connection:
+        conn = None
+        last_used = None
+        deadline = None
+
+        with self._cond:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed")
+            self._stats['checkouts'] += 1
+
+            while True:
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._open < self.max_size:
+                    self._open += 1
+                    break
+
+                if deadline is None:
+                    self._stats['waits'] += 1
+                    deadline = time.monotonic() + self.timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available after {self.timeout}s "
+                        f"(pool size {self.max_size})"
+                    )
+                self._cond.wait(remaining)
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed")
+
+        if conn is not None:
+            if time.monotonic() - last_used < self.health_check_interval or self._is_healthy(conn):
+                return conn
+            self._discard(conn, reopen=True)
+
+        try:
+            conn = self._connect()
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._stats['created'] += 1
+        return conn
+
+    def _release(self, conn: sqlite3.Connection):
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                self._discard(conn)
+                return
+
+        with self._cond:
+            if not self._closed:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+                return
+            self._open -= 1
+            self._data_versions.pop(conn, None)
+        conn.close()
+
+    def _discard(self, conn: sqlite3.Connection, reopen: bool = False):
+        """Close a broken connection; keep its slot when a replacement follows"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._cond:
+            self._data_versions.pop(conn, None)
+            self._stats['discarded'] += 1
+            if not reopen:
+                self._open -= 1
+                self._cond.notify()
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        """Return checkout counters and current open/idle/in-use connection counts"""
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                **self._stats,
+                'open': self._open,
+                'idle': idle,
+                'in_use': self._open - idle,
+                'max_size': self.max_size,
+            }
+
+    def close_idle(self):
+        """Close the idle connections, leaving the pool open to create new ones"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            for conn, _ in idle:
+                self._data_versions.pop(conn, None)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            conn.close()
+
+    def close(self):
+        """Close idle connections now and checked-out ones as they are returned"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._data_versions.clear()
+            self._cond.notify_all()
+        with self._writes:
+            self._writes.notify_all()
+        for conn, _ in idle:
+            conn.close()
+
+
+SCHEMA_DIR = Path(__file__).parent.parent / 'schema'
+
+# Idempotent upgrade scripts from schema/, applied in order to databases
+# created before they existed. Applied names are recorded in schema_extensions.
+SCHEMA_EXTENSIONS = [
+    'add_pagination_indexes.sql',
+    'add_company_activity_summary.sql',
+    'add_success_counters.sql',
+    'add_recruiter_dashboard_summary.sql',
+    'add_table_versions.sql',
+    'add_search_index.sql',
+    'add_name_index.sql',
+    'add_event_summary_indexes.sql',
+    'add_option_indexes.sql',
+    'add_change_log.sql',
+    'add_import_guard.sql',
+]
+
+# Trigger-maintained summary tables. ``query`` recomputes every row from the
+# base tables, in the table's column order (or in ``columns`` order, when
+# given); rebuild_summaries() reloads a table from it (then runs any ``sync``
+# statements that copy values back onto base tables) and check_summaries()
+# diffs the two.
+SUMMARY_TABLES = {
+    'company_activity_summary': {
+        'key': 'company_id',
+        'query': """
+            SELECT
+                c.id,
+                COALESCE(jp.total_jobs_posted, 0),
+                COALESCE(a.applications_sent, 0),
+                jp.last_job_posted,
+                COALESCE(jp.salary_min_total, 0),
+                COALESCE(jp.salary_min_count, 0),
+                COALESCE(jp.salary_max_total, 0),
+                COALESCE(jp.salary_max_count, 0),
+                COALESCE(jp.remote_jobs, 0)
+            FROM companies c
+            LEFT JOIN (
+                SELECT company_id,
+                       COUNT(*) AS total_jobs_posted,
+                       MAX(date_posted) AS last_job_posted,
+                       TOTAL(salary_min) AS salary_min_total,
+                       COUNT(salary_min) AS salary_min_count,
+                       TOTAL(salary_max) AS salary_max_total,
+                       COUNT(salary_max) AS salary_max_count,
+                       SUM(is_remote = 1) AS remote_jobs
+                FROM job_postings
+                GROUP BY company_id
+            ) jp ON jp.company_id = c.id
+            LEFT JOIN (
+                SELECT company_id, COUNT(*) AS applications_sent
+                FROM applications
+                GROUP BY company_id
+            ) a ON a.company_id = c.id
+        """,
+    },
+    'resume_success_summary': {
+        'key': 'resume_version_id',
+        'query': """
+            SELECT
+                rv.id,
+                COUNT(a.id),
+                COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END),
+                COUNT(CASE WHEN a.status = 'offer' THEN 1 END)
+            FROM resume_versions rv
+            LEFT JOIN applications a ON a.resume_version_id = rv.id
+            GROUP BY rv.id
+        """,
+        'sync': """
+            UPDATE resume_versions SET success_rate = COALESCE((
+                SELECT ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2)
+                FROM resume_success_summary WHERE resume_version_id = resume_versions.id
+            ), 0)
+        """,
+    },
+    'recruiter_success_summary': {
+        'key': 'recruiter_id',
+        'query': """
+            SELECT
+                r.id,
+                COUNT(a.id),
+                COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END),
+                COUNT(CASE WHEN a.status = 'offer' THEN 1 END),
+                MAX(a.application_date)
+            FROM recruiters r
+            LEFT JOIN applications a ON a.recruiter_id = r.id
+            GROUP BY r.id
+        """,
+        'sync': """
+            UPDATE recruiters SET success_rate = COALESCE((
+                SELECT ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2)
+                FROM recruiter_success_summary WHERE recruiter_id = recruiters.id
+            ), 0)
+        """,
+    },
+    'recruiter_dashboard_summary': {
+        'key': 'recruiter_id',
+        'query': "SELECT * FROM recruiter_dashboard_source",
+    },
+    'search_index': {
+        'key': 'rowid',
+        'columns': ['rowid', 'kind', 'entity_id', 'parent_id', 'title', 'body'],
+        'query': "SELECT * FROM search_documents",
+    },
+    'name_index': {
+        'key': 'rowid',
+        'columns': ['rowid', 'kind', 'entity_id', 'name'],
+        'query': "SELECT * FROM name_documents",
+    },
+    'name_trigram_counts': {
+        'key': 'trigram',
+        'query': """
+            SELECT substr(lower(d.name), o.n, 3), COUNT(DISTINCT d.doc_id)
+            FROM name_documents d
+            JOIN name_trigram_offsets o ON o.n <= length(d.name) - 2
+            GROUP BY 1
+        """,
+    },
+}
+
+# Column catalogs for ``fields=`` projections. Every column of ``table`` is
+# selectable, plus the computed ``extra`` expressions (which win over a table
+# column of the same name). ``heavy`` columns are left out of default list
+# shapes and have to be requested by name, or with ``*``.
+FIELDSETS = {
+    'resume_versions': {
+        'table': 'resume_versions',
+        'heavy': {'content_text'},
+    },
+    'resume_versions_with_tags': {
+        'table': 'resume_versions',
+        'alias': 'rv',
+        'extra': {
+            'tags': "GROUP_CONCAT(t.name, ', ')",
+            'tag_count': "COUNT(t.id)",
+        },
+        'heavy': {'content_text'},
+    },
+    'applications': {
+        'table': 'active_applications',
+        'extra': {'job_posting_excerpt': "substr(job_posting_text, 1, 500)"},
+        'heavy': {'job_posting_text'},
+    },
+    'application_details': {
+        'table': 'applications',
+        'alias': 'a',
+        'extra': {
+            'company_name': "c.name",
+            'company_website': "c.website",
+            'resume_version': "rv.version_name",
+            'resume_content': "rv.content_text",
+            'resume_skills': "rv.skills_emphasized",
+            'job_description': "jp.description",
+            'salary_min': "COALESCE(a.salary_min, jp.salary_min)",
+            'salary_max': "COALESCE(a.salary_max, jp.salary_max)",
+            'is_remote': "COALESCE(a.is_remote, jp.is_remote)",
+            'recruiter_name': "r.name",
+            'recruiter_email': "r.email",
+        },
+        'heavy': {'job_posting_text', 'resume_content', 'job_description'},
+    },
+}
+
+# Related resources for ``expand=`` on detail endpoints, per resource. Each
+# relation loads for a whole batch of parent rows in one query: ``key`` is the
+# parent column the relation hangs off, and ``query`` selects the related rows
+# for the keys in ``{keys}``, tagging each with the key it belongs to as
+# ``_parent``. ``many`` relations embed a list, the rest one object (or None).
+# ``resource`` names the entry that nested paths (``resume.tags``) expand from.
+EXPANSIONS = {
+    'applications': {
+        'company': {
+            'key': 'company_id',
+            'resource': 'companies',
+            'query': "SELECT id AS _parent, * FROM companies WHERE id IN ({keys})",
+        },
+        'resume': {
+            'key': 'resume_version_id',
+            'resource': 'resume_versions',
+            'query': "SELECT id AS _parent, * FROM resume_versions WHERE id IN ({keys})",
+            'json_fields': ['skills_emphasized'],
+        },
+        'recruiter': {
+            'key': 'recruiter_id',
+            'resource': 'recruiters',
+            'query': "SELECT id AS _parent, * FROM recruiters WHERE id IN ({keys})",
+        },
+        'job_posting': {
+            'key': 'job_posting_id',
+            'query': "SELECT id AS _parent, * FROM job_postings WHERE id IN ({keys})",
+        },
+        'timeline': {
+            'key': 'id',
+            'many': True,
+            'query': """
+                SELECT application_id AS _parent, * FROM application_events
+                WHERE application_id IN ({keys})
+                ORDER BY event_date DESC, created_at DESC
+            """,
+        },
+    },
+    'companies': {
+        'events': {
+            'key': 'id',
+            'many': True,
+            'query': """
+                SELECT company_id AS _parent, * FROM company_events
+                WHERE company_id IN ({keys})
+                ORDER BY event_date DESC, created_at DESC
+            """,
+        },
+        'job_postings': {
+            'key': 'id',
+            'many': True,
+            'query': """
+                SELECT jp.company_id AS _parent, jp.*,
+                       COUNT(a.id) as applications_count,
+                       GROUP_CONCAT(DISTINCT a.status) as application_statuses
+                FROM job_postings jp
+                LEFT JOIN applications a ON jp.id = a.job_posting_id
+                WHERE jp.company_id IN ({keys})
+                GROUP BY jp.id
+                ORDER BY jp.date_posted DESC
+            """,
+        },
+        'applications': {
+            'key': 'id',
+            'many': True,
+            'resource': 'applications',
+            'query': """
+                SELECT a.company_id AS _parent, a.*, rv.version_name as resume_used,
+                       r.name as recruiter_name, jp.title as job_posting_title
+                FROM applications a
+                LEFT JOIN resume_versions rv ON a.resume_version_id = rv.id
+                LEFT JOIN recruiters r ON a.recruiter_id = r.id
+                LEFT JOIN job_postings jp ON a.job_posting_id = jp.id
+                WHERE a.company_id IN ({keys})
+                ORDER BY a.application_date DESC
+            """,
+        },
+        'recruiters': {
+            'key': 'id',
+            'many': True,
+            'query': """
+                SELECT cr.company_id AS _parent, cr.*, r.name as recruiter_name,
+                       r.email as recruiter_email, r.phone as recruiter_phone,
+                       r.linkedin_url as recruiter_linkedin,
+                       r.specialties as recruiter_specialties, r.relationship_status
+                FROM company_recruiters cr
+                JOIN recruiters r ON cr.recruiter_id = r.id
+                WHERE cr.company_id IN ({keys}) AND cr.is_active = 1
+                ORDER BY cr.start_date DESC
+            """,
+        },
+    },
+    'recruiters': {
+        'current_resume': {
+            'key': 'current_resume_version_id',
+            'resource': 'resume_versions',
+            'query': "SELECT id AS _parent, * FROM resume_versions WHERE id IN ({keys})",
+            'json_fields': ['skills_emphasized'],
+        },
+        'events': {
+            'key': 'id',
+            'many': True,
+            'query': """
+                SELECT recruiter_id AS _parent, * FROM recruiter_events
+                WHERE recruiter_id IN ({keys})
+                ORDER BY event_date DESC, created_at DESC
+            """,
+        },
+        'applications': {
+            'key': 'id',
+            'many': True,
+            'resource': 'applications',
+            'query': """
+                SELECT recruiter_id AS _parent, * FROM applications
+                WHERE recruiter_id IN ({keys})
+                ORDER BY application_date DESC
+            """,
+        },
+    },
+    'resume_versions': {
+        'tags': {
+            'key': 'id',
+            'many': True,
+            'query': """
+                SELECT rt.resume_version_id AS _parent, t.* FROM tags t
+                JOIN resume_tags rt ON t.id = rt.tag_id
+                WHERE rt.resume_version_id IN ({keys})
+                ORDER BY t.name
+            """,
+        },
+    },
+}
+EXPAND_CHUNK_SIZE = 500
+
+# Per-entity timeline summaries for list pages: the events table, and the
+# column that links an event to its company or recruiter.
+EVENT_SUMMARIES = {
+    'companies': {'table': 'company_events', 'parent': 'company_id'},
+    'recruiters': {'table': 'recruiter_events', 'parent': 'recruiter_id'},
+}
+MAX_RECENT_EVENTS = 10
+
+# Dropdown option lists. Each option is the row id, its ``label`` column and
+# the few ``extra`` columns a form shows beside it, in label order, read from
+# the covering indexes in schema/add_option_indexes.sql.
+OPTION_LISTS = {
+    'companies': {'table': 'companies', 'label': 'name'},
+    'recruiters': {'table': 'recruiters', 'label': 'name', 'extra': ['company']},
+    'resume-versions': {'table': 'resume_versions', 'label': 'version_name',
+                        'extra': ['is_master', 'created_at']},
+    'managers': {'table': 'managers', 'label': 'name', 'extra': ['position_title', 'company_id']},
+    'tags': {'table': 'tags', 'label': 'name', 'extra': ['color']},
+}
+# get_options() returns at most OPTION_LIST_SIZE options unless a limit (up
+# to OPTION_LIST_MAX_SIZE) is given
+OPTION_LIST_SIZE = 1000
+OPTION_LIST_MAX_SIZE = 5000
+
+
+# Change log (schema/add_change_log.sql): page sizes for get_changes() and
+# how long compact_change_log() keeps history by default
+CHANGE_LOG_PAGE_SIZE = 500
+CHANGE_LOG_MAX_PAGE_SIZE = 5000
+CHANGE_LOG_RETENTION_DAYS = 30
+# ChangeFeed: how often to look for commits from other processes (seconds)
+# and how many undelivered messages a subscriber may queue before it is reset
+CHANGE_FEED_POLL_INTERVAL = 1.0
+CHANGE_FEED_BUFFER_SIZE = 256
+
+# Sorts after any character, closing a prefix range
+PREFIX_END = chr(0x10FFFF)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Keyset pagination for list endpoints. A page of ids is read from ``table``
+# through an index on ``sort_key`` (``id`` breaks ties, and is the rowid
+# every index already carries), then just those rows are loaded from
+# ``source``, or from a ``fieldset`` projection. Page cost stays flat however
+# deep the cursor is. ``filters`` name the columns a page may be narrowed
+# to by equality, and ``search`` the case-insensitive substring match behind
+# the ``search`` argument (each ``?`` takes the pattern).
+PAGINATED_LISTS = {
+    'applications': {
+        'table': 'applications',
+        'sort_key': 'application_date',
+        'descending': True,
+        'where': "status NOT IN ('rejected', 'withdrawn', 'offer')",
+        'filters': {'status'},
+        'search': "(position_title LIKE ? ESCAPE '\\' OR company_id IN "
+                  "(SELECT id FROM companies WHERE name LIKE ? ESCAPE '\\'))",
+        'fieldset': 'applications',
+    },
+    'companies': {
+        'table': 'companies',
+        'sort_key': 'name',
+        'descending': False,
+        'source': "SELECT * FROM company_activity",
+    },
+    'recruiters': {
+        'table': 'recruiters',
+        'sort_key': "COALESCE(last_contact_date, '')",
+        'descending': True,
+        'source': """
+            SELECT r.*, rv.version_name as current_resume_version
+            FROM recruiters r
+            LEFT JOIN resume_versions rv ON r.current_resume_version_id = rv.id
+        """,
+    },
+    'job_postings': {
+        'table': 'job_postings',
+        'sort_key': "COALESCE(date_posted, '')",
+        'descending': True,
+        'filters': {'company_id'},
+        'source': """
+            SELECT jp.*, c.name as company_name
+            FROM job_postings jp
+            JOIN companies c ON jp.company_id = c.id
+        """,
+    },
+    'resume_versions': {
+        'table': 'resume_versions',
+        'sort_key': "COALESCE(created_at, '')",
+        'descending': True,
+        'fieldset': 'resume_versions',
+        'json_fields': ['skills_emphasized'],
+    },
+    'managers': {
+        'table': 'managers',
+        'sort_key': 'name',
+        'descending': False,
+        'filters': {'company_id'},
+        'source': """
+            SELECT m.*, c.name as company_name
+            FROM managers m
+            LEFT JOIN companies c ON m.company_id = c.id
+        """,
+    },
+}
+
+
+# Document kinds in search_index (see schema/add_search_index.sql)
+SEARCH_KINDS = (
+    'resume', 'application', 'job_posting', 'company', 'recruiter',
+    'company_event', 'recruiter_event', 'application_event',
+)
+
+# snippet()/highlight() wrap matches in these, so the surrounding text can be
+# HTML-escaped before they are turned into <mark> tags
+_MATCH_START, _MATCH_END = '\x02', '\x03'
+
+
+def build_match_query(text: str) -> str:
+    """Turn free text into an FTS5 MATCH expression.
+
+    Every word and "quoted phrase" has to match; a trailing ``*`` on a word
+    makes it a prefix search. Terms are quoted, so FTS5 operators and
+    punctuation in the input are searched for rather than interpreted.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text or ''):
+        prefix = bool(word) and word.endswith('*')
+        term = phrase or word.rstrip('*')
+        if not re.search(r'\w', term):
+            continue
+        terms.append('"' + term.replace('"', '""') + '"' + ('*' if prefix else ''))
+    if not terms:
+        raise ValueError("Search query is empty")
+    return ' '.join(terms)
+
+
+def _marked(text: Optional[str]) -> Optional[str]:
+    """HTML-escape snippet text and turn the match markers into <mark> tags"""
+    if text is None:
+        return None
+    return html.escape(text).replace(_MATCH_START, '<mark>').replace(_MATCH_END, '</mark>')
+
+
+# Entity kinds in name_index (see schema/add_name_index.sql)
+NAME_KINDS = ('company', 'recruiter', 'manager')
+
+# Fuzzy name matches need at least this trigram similarity (Jaccard) to the
+# query. Candidates are the names containing the query's rarest trigrams, taken
+# rarest first until they cover about FUZZY_CANDIDATE_BUDGET names: a typo only
+# breaks the trigrams around it, and the rare ones are what identify a name.
+FUZZY_MIN_SIMILARITY = 0.3
+FUZZY_CANDIDATE_BUDGET = 100
+
+# Bulk import (see ResumeRunnerDB.bulk_import). ``references`` lets a row
+# name a company or recruiter instead of giving its id; ``aliases`` maps
+# the field names the API accepts onto columns; ``unique`` rows that already
+# exist are skipped rather than inserted again. ``deferred`` names the per-row
+# insert triggers that skip themselves while the table is in import_guard
+# (schema/add_import_guard.sql), each with the statements that then apply
+# the same change to every row inserted after id :after in one pass. Every
+# insert trigger on a table with ``deferred`` must be listed and guarded
+# (TestBulkImport checks); other tables' triggers keep firing per row.
+IMPORT_ENTITIES = {
+    'companies': {'table': 'companies', 'unique': 'name'},
+    'recruiters': {'table': 'recruiters'},
+    'applications': {
+        'table': 'applications',
+        'references': {
+            'company': ('company_id', 'companies'),
+            'company_name': ('company_id', 'companies'),
+            'recruiter': ('recruiter_id', 'recruiters'),
+            'recruiter_name': ('recruiter_id', 'recruiters'),
+        },
+        'aliases': {'notes': 'outcome_notes'},
+        'defaults': {'application_date': lambda: date.today().isoformat()},
+        'deferred': {
+            'trg_applications_version_insert': [
+                "UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications'",
+            ],
+            'trg_applications_change_insert': ['''
+                INSERT INTO change_log (entity, entity_id, operation)
+                SELECT 'applications', id, 'insert' FROM applications WHERE id > :after ORDER BY id
+            '''],
+            'trg_search_application_insert': ["""
+                INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+                SELECT * FROM search_documents WHERE kind = 'application' AND entity_id > :after
+            """],
+            'trg_company_activity_application_insert': ["""
+                INSERT INTO company_activity_summary (company_id, applications_sent)
+                SELECT company_id, COUNT(*) FROM applications
+                WHERE id > :after AND company_id IS NOT NULL
+                GROUP BY company_id
+                ON CONFLICT (company_id) DO UPDATE SET applications_sent = applications_sent + excluded.applications_sent
+            """],
+            'trg_resume_success_application_insert': ["""
+                INSERT INTO resume_success_summary (resume_version_id, total_applications, interviews, offers)
+                SELECT resume_version_id, COUNT(*),
+                       SUM(status IN ('phone_screen', 'interview', 'offer')), SUM(status = 'offer')
+                FROM applications
+                WHERE id > :after AND resume_version_id IS NOT NULL
+                GROUP BY resume_version_id
+                ON CONFLICT (resume_version_id) DO UPDATE SET
+                    total_applications = total_applications + excluded.total_applications,
+                    interviews = interviews + excluded.interviews,
+                    offers = offers + excluded.offers
+            """, """
+                UPDATE resume_versions SET success_rate = (
+                    SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+                    FROM resume_success_summary WHERE resume_version_id = resume_versions.id
+                ) WHERE id IN (SELECT resume_version_id FROM applications WHERE id > :after)
+            """],
+            'trg_recruiter_success_application_insert': ["""
+                INSERT INTO recruiter_success_summary
+                    (recruiter_id, total_applications, interviews, offers, last_application_date)
+                SELECT recruiter_id, COUNT(*),
+                       SUM(status IN ('phone_screen', 'interview', 'offer')), SUM(status = 'offer'),
+                       MAX(application_date)
+                FROM applications
+                WHERE id > :after AND recruiter_id IS NOT NULL
+                GROUP BY recruiter_id
+                ON CONFLICT (recruiter_id) DO UPDATE SET
+                    total_applications = total_applications + excluded.total_applications,
+                    interviews = interviews + excluded.interviews,
+                    offers = offers + excluded.offers,
+                    last_application_date = CASE
+                        WHEN last_application_date IS NULL OR excluded.last_application_date > last_application_date
+                        THEN excluded.last_application_date ELSE last_application_date END
+            """, """
+                UPDATE recruiters SET success_rate = (
+                    SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+                    FROM recruiter_success_summary WHERE recruiter_id = recruiters.id
+                ) WHERE id IN (SELECT recruiter_id FROM applications WHERE id > :after)
+            """],
+            'trg_recruiter_dashboard_application_insert': ["""
+                INSERT OR REPLACE INTO recruiter_dashboard_summary
+                SELECT * FROM recruiter_dashboard_source
+                WHERE recruiter_id IN (SELECT recruiter_id FROM applications WHERE id > :after)
+            """],
+        },
+    },
+}
+IMPORT_FORMATS = ('csv', 'jsonl')
+IMPORT_CHUNK_SIZE = 5000
+IMPORT_MAX_ERRORS = 1000
+
+# Tables /api/export and database/export_data.py can stream, in an order
+# that keeps referenced rows ahead of the rows referring to them. Tables
+# this database does not have are left out.
+EXPORT_ENTITIES = (
+    'companies', 'resume_versions', 'recruiters', 'managers', 'tags', 'job_postings',
+    'applications', 'resume_tags', 'company_recruiters', 'recruiter_managers',
+    'recruiter_resume_history', 'application_events', 'company_events', 'recruiter_events',
+    'recruiter_communications', 'communications',
+)
+EXPORT_FORMATS = ('jsonl', 'csv')
+EXPORT_BATCH_SIZE = 500           # rows fetched from the cursor at a time
+EXPORT_FLUSH_BYTES = 64 * 1024    # output is yielded in pieces about this size
+
+
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+def _trigrams(text: str) -> set:
+    """Character trigrams, lowercased like SQLite's lower() so they line up with name_trigram_counts"""
+    text = text.translate(_ASCII_LOWER)
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _similarity(trigrams: set, name: str) -> float:
+    """Jaccard similarity between a query's trigrams and those of ``name``"""
+    other = _trigrams(name)
+    shared = len(trigrams & other)
+    return round(shared / (len(trigrams) + len(other) - shared), 4) if trigrams or other else 0.0
+
+
+def _fts_string(text: str) -> str:
+    """Quote ``text`` as a single FTS5 string (a substring, for trigram tables)"""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def read_import_rows(stream: Iterable[str], fmt: str) -> Iterator[tuple]:
+    """Read ``(line, row)`` pairs from a CSV or JSON Lines text stream, lazily.
+
+    CSV rows are dicts keyed by the header row, without the empty cells. A
+    line that cannot be read comes through as a ValueError in place of the
+    row, so it is reported against its line like any other bad row.
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Unknown import format: {fmt}. Use one of: {', '.join(IMPORT_FORMATS)}")
+
+    def csv_rows():
+        reader = csv.reader(stream)
+        header = [name.strip() for name in next(reader, [])]
+        for values in reader:
+            if not any(values):
+                continue
+            if len(values) != len(header):
+                yield reader.line_num, ValueError(f"Expected {len(header)} fields, found {len(values)}")
+                continue
+            yield reader.line_num, {name: value for name, value in zip(header, values) if value != ''}
+
+    def jsonl_rows():
+        for line, text in enumerate(stream, 1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError as e:
+                yield line, ValueError(f"Invalid JSON: {e}")
+                continue
+            yield line, row if isinstance(row, dict) else ValueError("Expected a JSON object")
+
+    return csv_rows() if fmt == 'csv' else jsonl_rows()
+
+
+def _import_int(value: Any) -> int:
+    if isinstance(value, str):
+        return int(value.strip())
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"not an integer: {value}")
+    return int(value)
+
+
+def _import_bool(value: Any) -> int:
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text not in ('true', '1', 'yes', 'y', 'false', '0', 'no', 'n'):
+            raise ValueError(f"not a boolean: {value}")
+        return 1 if text in ('true', '1', 'yes', 'y') else 0
+    return 1 if value else 0
+
+
+def _import_date(value: Any) -> str:
+    return date.fromisoformat(str(value).strip()).isoformat()
+
+
+def _import_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value) if isinstance(value, (list, dict)) else str(value)
+
+
+def _import_converter(declared_type: str) -> Callable[[Any], Any]:
+    """Pick the value converter for a column from its declared type"""
+    declared = (declared_type or '').upper()
+    if 'INT' in declared:
+        return _import_int
+    if 'BOOL' in declared:
+        return _import_bool
+    if any(name in declared for name in ('REAL', 'FLOA', 'DOUB')):
+        return float
+    if declared == 'DATE':
+        return _import_date
+    return _import_text
+
+
+def encode_export(columns: List[str], rows: Iterable[tuple], fmt: str,
+                  compress: bool = False) -> Iterator[bytes]:
+    """Encode rows as JSON Lines or CSV (with a header), optionally gzipped.
+
+    Output comes out in pieces of about EXPORT_FLUSH_BYTES as the rows are
+    read, so memory use does not depend on how many rows there are.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Use one of: {', '.join(EXPORT_FORMATS)}")
+
+    def pieces():
+        buffer = io.StringIO()
+        if fmt == 'csv':
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            write = writer.writerow
+        else:
+            write = lambda row: buffer.write(json.dumps(dict(zip(columns, row)), default=str) + '\n')
+        for row in rows:
+            write(row)
+            if buffer.tell() >= EXPORT_FLUSH_BYTES:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    if not compress:
+        return (piece for piece in pieces() if piece)
+
+    def gzipped():
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for piece in pieces():
+            data = compressor.compress(piece)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    return gzipped()
+
+
+def encode_cursor(entity: str, values: List[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    payload = json.dumps([entity, *values], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(entity: str, cursor: str) -> List[Any]:
+    """Decode a cursor produced by encode_cursor for the same list"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(payload, list) or len(payload) != 3 or payload[0] != entity:
+        raise ValueError("Invalid cursor")
+    return payload[1:]
+
+
+class TagIndex:
+    """In-process inverted index from tag to the resumes carrying it.
+
+    Resume sets are Python ints used as bitsets. Bit ``i`` stands for the
+    ``i``-th resume in newest-first order, so reading a result's set bits
+    from the lowest up yields resumes already in display order. ``versions``
+    holds the table_versions counters the index reflects; when they no longer
+    match the database, another writer got there first and the index is
+    rebuilt.
+    """
+
+    TABLES = ('resume_versions', 'resume_tags', 'tags')
+    _TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.versions: Optional[tuple] = None
+        self.resume_ids: List[int] = []       # bit position -> resume id
+        self.positions: Dict[int, int] = {}   # resume id -> bit position
+        self.everything = 0
+        self.tag_bits: Dict[int, int] = {}    # tag id -> resume bitset
+        self.tag_names: Dict[int, str] = {}   # tag id -> lowercased name
+
+    @classmethod
+    def read_versions(cls, conn: sqlite3.Connection) -> tuple:
+        """The table_versions counters of the tables the index is built from"""
+        rows = dict(conn.execute(
+            f"SELECT table_name, version FROM table_versions WHERE table_name IN ({', '.join('?' for _ in cls.TABLES)})",
+            cls.TABLES
+        ).fetchall())
+        return tuple(rows.get(table) for table in cls.TABLES)
+
+    def build(self, conn: sqlite3.Connection):
+        """Load every resume and tag assignment from ``conn``"""
+        self.resume_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM resume_versions ORDER BY created_at DESC, id DESC")]
+        self.positions = {resume_id: bit for bit, resume_id in enumerate(self.resume_ids)}
+        self.everything = (1 << len(self.resume_ids)) - 1
+        self.tag_names = {tag_id: name.lower() for tag_id, name in conn.execute("SELECT id, name FROM tags")}
+        self.tag_bits = dict.fromkeys(self.tag_names, 0)
+        for resume_id, tag_id in conn.execute("SELECT resume_version_id, tag_id FROM resume_tags"):
+            if tag_id in self.tag_bits and resume_id in self.positions:
+                self.tag_bits[tag_id] |= 1 << self.positions[resume_id]
+
+    def tag(self, resume_id: int, tag_id: int):
+        if resume_id not in self.positions or tag_id not in self.tag_bits:
+            self.versions = None
+            return
+        self.tag_bits[tag_id] |= 1 << self.positions[resume_id]
+
+    def untag(self, resume_id: int, tag_id: int):
+        if resume_id in self.positions and tag_id in self.tag_bits:
+            self.tag_bits[tag_id] &= ~(1 << self.positions[resume_id])
+
+    def drop_tag(self, tag_id: int):
+        self.tag_bits.pop(tag_id, None)
+        self.tag_names.pop(tag_id, None)
+
+    def resumes_tagged(self, name: str) -> int:
+        """Bitset of resumes carrying the tag called ``name`` (case insensitive)"""
+        name = name.lower()
+        bits = 0
+        for tag_id, tag_name in self.tag_names.items():
+            if tag_name == name:
+                bits |= self.tag_bits[tag_id]
+        return bits
+
+    def resume_ids_in(self, bits: int) -> List[int]:
+        """Resume ids of a bitset, newest first"""
+        ids = []
+        while bits:
+            lowest = bits & -bits
+            ids.append(self.resume_ids[lowest.bit_length() - 1])
+            bits ^= lowest
+        return ids
+
+    def evaluate(self, query: str) -> int:
+        """Evaluate a tag query such as ``python AND (aws OR gcp) AND NOT junior``.
+
+        AND binds tighter than OR, NOT applies to the term after it, and terms
+        side by side are ANDed. Keywords are case insensitive; quote tag names
+        that contain spaces, parentheses or a keyword.
+        """
+        tokens = []
+        position = 0
+        query = query.strip()
+        while position < len(query):
+            match = self._TOKEN.match(query, position)
+            if not match or match.end() == position:
+                raise ValueError(f"Invalid tag query near: {query[position:]}")
+            position = match.end()
+            opening, closing, quoted, word = match.groups()
+            if opening or closing:
+                tokens.append((opening or closing, None))
+            elif quoted is not None:
+                tokens.append(('TAG', quoted))
+            elif word.upper() in ('AND', 'OR', 'NOT'):
+                tokens.append((word.upper(), None))
+            else:
+                tokens.append(('TAG', word))
+        if not tokens:
+            raise ValueError("Tag query is empty")
+
+        def peek():
+            return tokens[0][0] if tokens else None
+
+        def expression() -> int:
+            bits = term()
+            while peek() == 'OR':
+                tokens.pop(0)
+                bits |= term()
+            return bits
+
+        def term() -> int:
+            bits = factor()
+            while peek() in ('AND', 'NOT', 'TAG', '('):
+                if peek() == 'AND':
+                    tokens.pop(0)
+                bits &= factor()
+            return bits
+
+        def factor() -> int:
+            if not tokens:
+                raise ValueError("Tag query ends unexpectedly")
+            kind, value = tokens.pop(0)
+            if kind == 'NOT':
+                return self.everything & ~factor()
+            if kind == '(':
+                bits = expression()
+                if peek() != ')':
+                    raise ValueError("Unbalanced parentheses in tag query")
+                tokens.pop(0)
+                return bits
+            if kind == 'TAG':
+                return self.resumes_tagged(value)
+            raise ValueError(f"Unexpected {kind} in tag query")
+
+        bits = expression()
+        if tokens:
+            raise ValueError(f"Unexpected {tokens[0][0]} in tag query")
+        return bits
+
+
+class ChangeSubscription:
+    """One listener's bounded queue of change-feed messages.
+
+    A message is ``{'seq': n, 'changes': {entity: [ids]}}``, or
+    ``{'seq': n, 'reset': True}`` when the listener fell more than
+    ``buffer_size`` messages behind (or asked to resume from history that
+    has been compacted away) and has to reload everything. Either way
+    ``seq`` is the change-log position to resume from.
+    """
+
+    def __init__(self, feed: 'ChangeFeed', buffer_size: int):
+        self.feed = feed
+        self.buffer_size = max(1, int(buffer_size))
+        self.closed = False
+        self._cond = threading.Condition()
+        self._messages: List[Dict[str, Any]] = []
+
+    def push(self, message: Dict[str, Any]):
+        with self._cond:
+            if len(self._messages) >= self.buffer_size:
+                message = {'seq': message['seq'], 'reset': True}
+                self._messages.clear()
+            self._messages.append(message)
+            self._cond.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Take every queued message, waiting up to ``timeout`` seconds for one (empty on timeout)"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._messages or self.closed, timeout)
+            messages, self._messages = self._messages, []
+            return messages
+
+    def close(self):
+        self.feed.unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class ChangeFeed:
+    """Pushes change-log entries to live subscribers (``/api/events/stream``).
+
+    A single background thread tails ``change_log``. It wakes as soon as a
+    checkout in this process commits a write, and every ``poll_interval``
+    seconds otherwise, when ``PRAGMA data_version`` tells it whether another
+    process committed in the meantime. Each batch it reads becomes one
+    message, grouped by entity, pushed to every subscription. The thread
+    starts with the first subscriber.
+    """
+
+    def __init__(self, db: 'ResumeRunnerDB', poll_interval: float = CHANGE_FEED_POLL_INTERVAL,
+                 buffer_size: int = CHANGE_FEED_BUFFER_SIZE):
+        self.db = db
+        self.poll_interval = poll_interval
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._subscribers: set = set()
+        self._since: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @staticmethod
+    def message(feed: Dict[str, Any]) -> Dict[str, Any]:
+        """Group a ``get_changes()`` page into a feed message"""
+        changes: Dict[str, List[int]] = {}
+        for change in feed['changes']:
+            ids = changes.setdefault(change['entity'], [])
+            if change['id'] not in ids:
+                ids.append(change['id'])
+        return {'seq': feed['next_since'], 'changes': changes}
+
+    def subscribe(self, since: Optional[int] = None) -> ChangeSubscription:
+        """Start listening; with ``since``, first replay what was logged after that seq.
+
+        The replay is at most one change-log page, read before taking the
+        lock so publishing never waits on it. A listener further behind than
+        that gets a single reset instead.
+        """
+        subscription = ChangeSubscription(self, self.buffer_size)
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Change feed is closed")
+            if self._thread is None:
+                self._since = self.db.get_changes()['next_since']
+                self._thread = threading.Thread(target=self._run, name='change-feed', daemon=True)
+                self._thread.start()
+            behind = since is not None and since < self._since
+
+        feed = self.db.get_changes(since, limit=CHANGE_LOG_MAX_PAGE_SIZE) if behind else None
+
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Change feed is closed")
+            if feed is not None and since < self._since:
+                # The feed may have moved on while the page was read
+                if feed['reset'] or feed['next_since'] < self._since:
+                    subscription.push({'seq': self._since, 'reset': True})
+                else:
+                    feed['changes'] = [change for change in feed['changes'] if change['seq'] <= self._since]
+                    feed['next_since'] = self._since
+                    subscription.push(self.message(feed))
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def _run(self):
+        seen = None
+        while not self._closed:
+            try:
+                with self.db.get_connection() as conn:
+                    generation = self.db.pool.generation(conn)
+                if generation != seen:
+                    seen = generation
+                    self._publish()
+            except sqlite3.Error as e:
+                if self._closed:
+                    return
+                print(f"❌ [ERROR] DB: Change feed could not read the change log: {str(e)}")
+                seen = None
+                time.sleep(self.poll_interval)
+                continue
+            self.db.pool.wait_for_write(seen, self.poll_interval)
+
+    def _publish(self):
+        """Push everything logged since the last batch; only the feed thread moves ``_since``"""
+        while True:
+            feed = self.db.get_changes(self._since, limit=CHANGE_LOG_MAX_PAGE_SIZE)
+            if feed['reset']:
+                message = {'seq': feed['next_since'], 'reset': True}
+            elif feed['changes']:
+                message = self.message(feed)
+            else:
+                return
+            with self._lock:
+                self._since = message['seq']
+                for subscription in self._subscribers:
+                    subscription.push(message)
+            if not feed['has_more']:
+                return
+
+    def close(self):
+        """Stop the feed thread and end every subscription"""
+        with self._lock:
+            self._closed = True
+            subscribers, self._subscribers = self._subscribers, set()
+        for subscription in subscribers:
+            subscription.close()
+
+
 class ResumeRunnerDB:
-    def __init__(self, db_path: Optional[str] = None):
-        """Initialize database connection"""
+    def __init__(self, db_path: Optional[str] = None, pool_size: Optional[int] = None,
+                 pragma_profile: Optional[str] = None):
+        """Initialize database connection pool"""
         if db_path is None:
             db_path = os.getenv('DATABASE_PATH', 'database/resume_runner.db')
 
@@ -29,18 +1355,354 @@ class ResumeRunnerDB:
         self.db_path = str(db_path)
         self.ensure_db_exists()
 
+        self.pragmas = load_pragma_profile(pragma_profile)
+        self._set_journal_mode()
+        self.apply_schema_extensions()
+        self._fieldset_columns: Dict[str, Dict[str, str]] = {}
+        self._cache: Dict[str, tuple] = {}  # key -> (generation, value)
+        self.tag_index = TagIndex()
+        self._change_feed: Optional[ChangeFeed] = None
+        self._change_feed_lock = threading.Lock()
+
+        if pool_size is None:
+            pool_size = int(os.getenv('DATABASE_POOL_SIZE', '5'))
+        self.pool = ConnectionPool(
+            self._open_connection,
+            max_size=pool_size,
+            timeout=float(os.getenv('DATABASE_POOL_TIMEOUT', '30')),
+        )
+        self._inherited_pools: List[ConnectionPool] = []
+        self._current_tag_index()
+
     def ensure_db_exists(self):
         """Ensure database file exists"""
         if not os.path.exists(self.db_path):
             raise FileNotFoundError(f"Database not found at {self.db_path}. Run create_database.py first.")
 
-    def get_connection(self):
-        """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
+    def _set_journal_mode(self):
+        """Switch the journal mode once; it is stored in the database file itself"""
+        journal_mode = self.pragmas.get('journal_mode')
+        if not journal_mode:
+            return
+        conn = sqlite3.connect(self.db_path, timeout=self.pragmas.get('busy_timeout', 5000) / 1000)
+        try:
+            conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        finally:
+            conn.close()
+
+    def apply_schema_extensions(self):
+        """Apply any schema/ upgrade scripts this database has not seen yet"""
+        conn = sqlite3.connect(self.db_path, timeout=self.pragmas.get('busy_timeout', 5000) / 1000)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS schema_extensions (
+                    name TEXT PRIMARY KEY,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            applied = {row[0] for row in conn.execute("SELECT name FROM schema_extensions")}
+            for name in SCHEMA_EXTENSIONS:
+                if name in applied:
+                    continue
+                script = (SCHEMA_DIR / name).read_text()
+                conn.executescript(f"BEGIN;\n{script}\nINSERT OR IGNORE INTO schema_extensions (name) VALUES ('{name}');\nCOMMIT;")
+        finally:
+            conn.close()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection configured for pooled use"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row  # Enable dict-like access
         conn.execute("PRAGMA foreign_keys = ON")
+        for pragma, value in self.pragmas.items():
+            if pragma != 'journal_mode':
+                conn.execute(f"PRAGMA {pragma} = {value}")
         return conn
 
+    def get_connection(self):
+        """Check out a pooled connection for use in a ``with`` block.
+
+        The transaction is committed when the block exits cleanly and rolled
+        back on error; the connection then goes back to the pool.
+        """
+        return self.pool.connection()
+
+    def select_fields(self, conn: sqlite3.Connection, fieldset: str,
+                      fields: Optional[List[str]] = None, detail: bool = False) -> str:
+        """Build the SELECT column list for a ``fields=`` projection.
+
+        With no fields, list shapes leave out the fieldset's heavy columns and
+        detail shapes include everything. ``*`` selects every column; ``id`` is
+        always included.
+        """
+        spec = FIELDSETS[fieldset]
+        columns = self._fieldset_columns.get(fieldset)
+        if columns is None:
+            prefix = f"{spec['alias']}." if spec.get('alias') else ''
+            columns = {
+                row[1]: f"{prefix}{row[1]}"
+                for row in conn.execute(f"PRAGMA table_info({spec['table']})")
+            }
+            columns.update(spec.get('extra', {}))
+            self._fieldset_columns[fieldset] = columns
+
+        if fields is None:
+            chosen = [name for name in columns if detail or name not in spec.get('heavy', ())]
+        elif '*' in fields:
+            chosen = list(columns)
+        else:
+            unknown = [name for name in fields if name not in columns]
+            if unknown:
+                raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+            chosen = ['id'] + [name for name in dict.fromkeys(fields) if name != 'id']
+
+        return ', '.join(f"{columns[name]} AS {name}" for name in chosen)
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Hold one read transaction, so every helper call in the block sees the same data"""
+        with self.get_connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            yield conn
+
+    @staticmethod
+    def parse_expand(paths: Iterable[str], resource: str) -> Dict[str, Dict]:
+        """Turn ``expand=`` paths (``timeline``, ``resume.tags``) into a relation tree.
+
+        Raises ValueError naming the first relation ``resource`` doesn't have.
+        """
+        tree: Dict[str, Dict] = {}
+        for path in paths:
+            node, current = tree, resource
+            for name in path.split('.'):
+                relation = EXPANSIONS.get(current, {}).get(name)
+                if relation is None:
+                    raise ValueError(f"Unknown expansion '{path}' for {resource}")
+                node = node.setdefault(name, {})
+                current = relation.get('resource')
+        return tree
+
+    def expand(self, resource: str, records: List[Dict], paths: Iterable[str]) -> List[Dict]:
+        """Embed the related resources named by ``paths`` into ``records`` (in place).
+
+        Each relation costs one query for the whole batch of records, however
+        many there are, and nested paths expand the loaded rows the same way.
+        """
+        tree = self.parse_expand(paths, resource)
+        if tree and records:
+            with self.snapshot() as conn:
+                self._expand(conn, resource, records, tree)
+        return records
+
+    def _expand(self, conn: sqlite3.Connection, resource: str, records: List[Dict], tree: Dict[str, Dict]):
+        for name, subtree in tree.items():
+            relation = EXPANSIONS[resource][name]
+            key = relation['key']
+            if any(key not in record for record in records):
+                raise ValueError(f"expand={name} needs the {key} field")
+
+            keys = list(dict.fromkeys(record[key] for record in records if record[key] is not None))
+            related: Dict[Any, List[Dict]] = {}
+            for start in range(0, len(keys), EXPAND_CHUNK_SIZE):
+                chunk = keys[start:start + EXPAND_CHUNK_SIZE]
+                query = relation['query'].format(keys=', '.join('?' * len(chunk)))
+                for row in conn.execute(query, chunk):
+                    item = dict(row)
+                    parent = item.pop('_parent')
+                    for field in relation.get('json_fields', ()):
+                        if item.get(field):
+                            item[field] = json.loads(item[field])
+                    related.setdefault(parent, []).append(item)
+
+            for record in records:
+                items = related.get(record[key], [])
+                record[name] = items if relation.get('many') else (items[0] if items else None)
+
+            if subtree:
+                children = [item for items in related.values() for item in items]
+                self._expand(conn, relation['resource'], children, subtree)
+
+    def data_generation(self) -> int:
+        """Counter that moves whenever the database may have changed"""
+        with self.get_connection() as conn:
+            return self.pool.generation(conn)
+
+    def get_table_versions(self) -> Dict[str, int]:
+        """Get the per-table change counters (cached until the database changes)"""
+        return self._cached('table_versions', lambda conn: dict(
+            conn.execute("SELECT table_name, version FROM table_versions").fetchall()
+        ))
+
+    def _cached(self, key: str, compute: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Return ``compute(conn)`` from the in-process cache while the write generation holds.
+
+        On a miss, ``compute`` runs inside a read transaction, so every query it
+        makes sees the same snapshot.
+        """
+        with self.get_connection() as conn:
+            generation = self.pool.generation(conn)
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] == generation:
+                return hit[1]
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            value = compute(conn)
+            self._cache[key] = (generation, value)
+            return value
+
+    def _current_tag_index(self) -> TagIndex:
+        """Return the tag index, rebuilding it first if another writer changed its tables"""
+        versions = self.get_table_versions()
+        current = tuple(versions.get(table) for table in TagIndex.TABLES)
+        index = self.tag_index
+        with index.lock:
+            if index.versions != current:
+                with self.get_connection() as conn:
+                    if not conn.in_transaction:
+                        conn.execute("BEGIN")
+                    index.build(conn)
+                    index.versions = TagIndex.read_versions(conn)
+        return index
+
+    def rebuild_tag_index(self) -> TagIndex:
+        """Reload the tag index from the database"""
+        with self.tag_index.lock:
+            self.tag_index.versions = None
+            return self._current_tag_index()
+
+    @contextmanager
+    def _tag_index_write(self) -> Iterator[tuple]:
+        """Run a tag write and keep the tag index in step with it.
+
+        Yields ``(conn, index)``; ``index`` is None when the index was already
+        stale, in which case the next search rebuilds it instead. The index is
+        held locked until the write has committed.
+        """
+        index = self.tag_index
+        with index.lock:
+            try:
+                with self.get_connection() as conn:
+                    if not conn.in_transaction:
+                        conn.execute("BEGIN IMMEDIATE")
+                    current = index.versions is not None and index.versions == TagIndex.read_versions(conn)
+                    yield conn, index if current else None
+                    after = TagIndex.read_versions(conn) if current and index.versions is not None else None
+                index.versions = after
+            except BaseException:
+                index.versions = None
+                raise
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Get connection pool counters"""
+        return self.pool.stats()
+
+    def get_pragmas(self) -> Dict[str, Any]:
+        """Read back the effective PRAGMA values from a pooled connection"""
+        with self.get_connection() as conn:
+            return {
+                pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+                for pragma in ['journal_mode', *self.pragmas.keys() - {'journal_mode'}]
+            }
+
+    def checkpoint(self, mode: str = 'PASSIVE') -> Dict[str, int]:
+        """Run a WAL checkpoint (PASSIVE, FULL, RESTART or TRUNCATE)"""
+        mode = mode.upper()
+        if mode not in {'PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'}:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        with self.get_connection() as conn:
+            busy, log_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return {'busy': busy, 'log_frames': log_frames, 'checkpointed_frames': checkpointed}
+
+    def rebuild_summaries(self, names: Optional[List[str]] = None) -> Dict[str, int]:
+        """Recompute summary tables from the base tables; returns rows written per table"""
+        written = {}
+        with self.get_connection() as conn:
+            for name in names or SUMMARY_TABLES:
+                spec = SUMMARY_TABLES[name]
+                columns = f"({', '.join(spec['columns'])})" if spec.get('columns') else ''
+                conn.execute(f"DELETE FROM {name}")
+                written[name] = conn.execute(f"INSERT INTO {name} {columns} {spec['query']}").rowcount
+                if spec.get('sync'):
+                    conn.execute(spec['sync'])
+        return written
+
+    def check_summaries(self, names: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+        """Compare summary tables against a fresh recompute.
+
+        Returns the keys of rows that are missing, stale or left over, per table;
+        an empty list means the table is consistent.
+        """
+        drift = {}
+        with self.get_connection() as conn:
+            for name in names or SUMMARY_TABLES:
+                spec = SUMMARY_TABLES[name]
+                key = spec['key']
+                columns = ', '.join(spec.get('columns') or
+                                    [row[1] for row in conn.execute(f"PRAGMA table_info({name})")])
+                rows = conn.execute(f"""
+                    WITH expected({columns}) AS ({spec['query']})
+                    SELECT {key} FROM (SELECT {columns} FROM {name} EXCEPT SELECT {columns} FROM expected)
+                    UNION
+                    SELECT {key} FROM (SELECT {columns} FROM expected EXCEPT SELECT {columns} FROM {name})
+                """).fetchall()
+                drift[name] = sorted(row[0] for row in rows)
+        return drift
+
+    def prepare_fork(self):
+        """Close this process's idle connections so a child forked next inherits none.
+
+        Called in a pre-forking server's master before each worker is forked.
+        The pool stays usable and reopens connections on demand.
+        """
+        self.pool.close_idle()
+
+    def after_fork(self):
+        """Reset per-process state in a freshly forked worker.
+
+        SQLite connections must not be used on both sides of a fork, so the
+        worker starts an empty pool of its own. Any connection it did inherit
+        is kept referenced rather than closed, since closing it here could
+        checkpoint or remove the WAL the parent is still using. Locks and the
+        change-feed thread don't survive a fork either, so those are rebuilt.
+        """
+        inherited = self.pool
+        self._inherited_pools.append(inherited)
+        self.pool = ConnectionPool(
+            self._open_connection,
+            max_size=inherited.max_size,
+            timeout=inherited.timeout,
+            health_check_interval=inherited.health_check_interval,
+        )
+        self._cache = {}
+        self.tag_index = TagIndex()
+        self._change_feed = None
+        self._change_feed_lock = threading.Lock()
+
+    def change_feed(self) -> ChangeFeed:
+        """The shared ChangeFeed for this database, created on first use"""
+        with self._change_feed_lock:
+            if self._change_feed is None:
+                self._change_feed = ChangeFeed(self)
+            return self._change_feed
+
+    def close(self, checkpoint: bool = True):
+        """Close all pooled connections, first checkpointing the WAL back into the main file.
+
+        The TRUNCATE checkpoint takes the write lock and waits for every reader,
+        in any process, for up to busy_timeout. A process that shares the
+        database with others still running (a pre-forking server's worker)
+        passes ``checkpoint=False`` and leaves it to the last one out.
+        """
+        if self._change_feed is not None:
+            self._change_feed.close()
+        if checkpoint and self.pragmas.get('journal_mode') == 'WAL':
+            try:
+                self.checkpoint('TRUNCATE')
+            except sqlite3.Error:
+                pass
+        self.pool.close()
+
     # Company operations
     def add_company(self, name: str, website: str = None, industry: str = None,
                    company_size: str = None, headquarters: str = None,
@@ -116,16 +1778,11 @@ class ResumeRunnerDB:
             return dict(row) if row else None
 
     def find_company_by_name(self, name: str) -> Optional[Dict]:
-        """Find company by name (case insensitive)"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            search_term = f"%{name}%"
-            cursor.execute(
-                "SELECT * FROM companies WHERE LOWER(name) LIKE LOWER(?) LIMIT 1",
-                (search_term,)
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        """Find company by name (case insensitive): an exact match, else the shortest containing ``name``"""
+        if not name or not name.strip():
+            return None
+        matches = self.match_names(name, kinds=['company'], limit=1, fuzzy=False)
+        return self.get_company(matches[0]['id']) if matches else None
 
     def add_company_event(self, company_id: int, title: str, event_type: str = 'note',
                           event_date: date = None, description: str = None,
@@ -231,29 +1888,31 @@ class ResumeRunnerDB:
             """, (filename, version_name, content_text, s3_key, editable_s3_key, editable_filename,
                   skills_json, target_roles, is_master, description, word_count, version_id))
 
-    def get_resume_version(self, version_id: int) -> Optional[Dict]:
-        """Get resume version by ID"""
+    def get_resume_version(self, version_id: int, fields: Optional[List[str]] = None) -> Optional[Dict]:
+        """Get resume version by ID, optionally narrowed to ``fields``"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM resume_versions WHERE id = ?", (version_id,))
+            columns = self.select_fields(conn, 'resume_versions', fields, detail=True)
+            cursor.execute(f"SELECT {columns} FROM resume_versions WHERE id = ?", (version_id,))
             row = cursor.fetchone()
             if row:
                 result = dict(row)
-                if result['skills_emphasized']:
+                if result.get('skills_emphasized'):
                     result['skills_emphasized'] = json.loads(result['skills_emphasized'])
                 return result
             return None
 
-    def list_resume_versions(self) -> List[Dict]:
-        """List all resume versions"""
+    def list_resume_versions(self, fields: Optional[List[str]] = None) -> List[Dict]:
+        """List all resume versions (without content_text unless requested)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM resume_versions ORDER BY created_at DESC")
+            columns = self.select_fields(conn, 'resume_versions', fields)
+            cursor.execute(f"SELECT {columns} FROM resume_versions ORDER BY created_at DESC")
             rows = cursor.fetchall()
             results = []
             for row in rows:
                 result = dict(row)
-                if result['skills_emphasized']:
+                if result.get('skills_emphasized'):
                     result['skills_emphasized'] = json.loads(result['skills_emphasized'])
                 results.append(result)
             return results
@@ -502,13 +2161,34 @@ class ResumeRunnerDB:
             cursor.execute("DELETE FROM recruiter_events WHERE id = ?", (event_id,))
             return cursor.rowcount > 0
 
-    def get_recruiter_dashboard(self) -> List[Dict]:
-        """Get recruiter dashboard with metrics"""
+    def list_recruiters(self) -> List[Dict]:
+        """List all recruiters with their current resume version name"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM recruiter_dashboard ORDER BY last_communication DESC NULLS LAST")
+            cursor.execute("""
+                SELECT r.*, rv.version_name as current_resume_version
+                FROM recruiters r
+                LEFT JOIN resume_versions rv ON r.current_resume_version_id = rv.id
+                ORDER BY r.last_contact_date DESC NULLS LAST
+            """)
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_recruiter_dashboard(self) -> List[Dict]:
+        """Get recruiter dashboard with metrics.
+
+        Reads the materialized recruiter_dashboard_summary; recent_applications
+        is a list of the recruiter's 5 most recent applications.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM recruiter_dashboard ORDER BY last_communication DESC")
+            results = []
+            for row in cursor.fetchall():
+                result = dict(row)
+                result['recent_applications'] = json.loads(result['recent_applications'])
+                results.append(result)
+            return results
+
     # Manager operations
     def add_manager(self, name: str, email: str = None, phone: str = None,
                    phone_secondary: str = None, linkedin_url: str = None,
@@ -977,12 +2657,593 @@ class ResumeRunnerDB:
             deleted = cursor.rowcount > 0
             return deleted
 
+    def bulk_import(self, entity: str, rows: Iterable[tuple], chunk_size: int = IMPORT_CHUNK_SIZE,
+                    create_missing: bool = True) -> Dict[str, Any]:
+        """Insert a stream of ``(line, row)`` pairs (see read_import_rows) into ``entity``.
+
+        Rows are validated and inserted ``chunk_size`` at a time, each chunk in
+        one transaction with one INSERT ... SELECT; the per-row triggers listed
+        as ``deferred`` stand down behind import_guard and one set-based
+        catch-up per chunk does their work. Companies and recruiters named by
+        applications are looked up through a name cache and, with
+        ``create_missing``, created by name when unknown, in the same savepoint
+        as the row that names them. Bad rows are reported by line and the rest
+        still go in; absent fields get the column default.
+        """
+        spec = IMPORT_ENTITIES.get(entity)
+        if spec is None:
+            raise ValueError(f"Unknown import entity: {entity}. Use one of: {', '.join(IMPORT_ENTITIES)}")
+
+        with self.get_connection() as conn:
+            info = [row for row in conn.execute(f"PRAGMA table_info({spec['table']})") if row['name'] != 'id']
+        columns = [row['name'] for row in info]
+        position = {name: index for index, name in enumerate(columns)}
+        converters = [_import_converter(row['type']) for row in info]
+        references = {name: (position[column], table) for name, (column, table) in spec.get('references', {}).items()}
+        fields = {name: (index, converters[index]) for name, index in position.items()}
+        fields.update((alias, fields[column]) for alias, column in spec.get('aliases', {}).items())
+        defaults = [(position[name], make()) for name, make in spec.get('defaults', {}).items()]
+        referenced = {index for index, _ in references.values()}
+        required = [(position[row['name']], row['name']) for row in info
+                    if row['notnull'] and row['dflt_value'] is None and position[row['name']] not in referenced]
+        unique = position.get(spec.get('unique'))
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(spec['table'], ', '.join(columns), ', '.join(
+            '?' if row['dflt_value'] is None else f"COALESCE(?, {row['dflt_value']})" for row in info))
+        # A chunk goes in as one statement over a JSON array of rows: with
+        # triggers on the table each statement needs its own statement
+        # journal, and one per row is very slow after the same savepoint
+        # has created companies or recruiters
+        chunk_sql = "INSERT INTO {} ({}) SELECT {} FROM json_each(?) ORDER BY key".format(
+            spec['table'], ', '.join(columns), ', '.join(
+                f"json_extract(value, '$[{index}]')" if row['dflt_value'] is None
+                else f"COALESCE(json_extract(value, '$[{index}]'), {row['dflt_value']})"
+                for index, row in enumerate(info)))
+
+        summary = {'entity': entity, 'rows': 0, 'inserted': 0, 'skipped': 0, 'failed': 0,
+                   'created': {'companies': 0, 'recruiters': 0}, 'errors': []}
+        names: Dict[str, Dict[str, int]] = {}  # table -> lowercased name -> id
+
+        def fail(line: int, error: str):
+            summary['failed'] += 1
+            if len(summary['errors']) < IMPORT_MAX_ERRORS:
+                summary['errors'].append({'line': line, 'error': error})
+
+        def load_names(conn: sqlite3.Connection, table: str) -> Dict[str, int]:
+            if table not in names:
+                # Oldest first wins for duplicate (recruiter) names
+                names[table] = {}
+                for row_id, name in conn.execute(f"SELECT id, name FROM {table} ORDER BY id DESC"):
+                    names[table][name.lower()] = row_id
+            return names[table]
+
+        def prepare(line: int, row) -> Optional[tuple]:
+            if isinstance(row, Exception):
+                fail(line, str(row))
+                return None
+            values = [None] * len(columns)
+            refs = []
+            unknown = []
+            for key, value in row.items():
+                if value is None or value == '':
+                    continue
+                field = fields.get(key)
+                if field is None:
+                    if key in references:
+                        refs.append((*references[key], str(value).strip()))
+                    else:
+                        unknown.append(key)
+                    continue
+                try:
+                    values[field[0]] = field[1](value)
+                except (TypeError, ValueError) as e:
+                    fail(line, f"{key}: {e}")
+                    return None
+            if unknown:
+                fail(line, f"Unknown field(s): {', '.join(unknown)}")
+                return None
+            for index, value in defaults:
+                if values[index] is None:
+                    values[index] = value
+            missing = [name for index, name in required if values[index] is None]
+            if missing:
+                fail(line, f"{', '.join(missing)} is required")
+                return None
+            return line, values, refs
+
+        def resolve(conn: sqlite3.Connection, values: list, missing: List[tuple], created: Dict[tuple, int]):
+            # Names another row created since this one was prepared are reused
+            for index, table, name in missing:
+                key = name.lower()
+                if key in names[table]:
+                    values[index] = names[table][key]
+                    continue
+                if (table, key) not in created:
+                    created[(table, key)] = conn.execute(
+                        f"INSERT INTO {table} (name) VALUES (?)", (name,)).lastrowid
+                values[index] = created[(table, key)]
+
+        def remember(created: Dict[tuple, int]):
+            # Only names whose rows went in are cached and counted
+            for (table, key), row_id in created.items():
+                names[table][key] = row_id
+                summary['created'][table] += 1
+
+        def import_chunk(chunk: List[tuple]):
+            with self.get_connection() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+
+                # Resolve names that exist; the missing ones are created
+                # only alongside the row that needs them
+                pending = []
+                for line, values, refs in (item for item in (prepare(line, row) for line, row in chunk) if item):
+                    missing = []
+                    for index, table, name in refs:
+                        if values[index] is not None:
+                            continue
+                        row_id = load_names(conn, table).get(name.lower())
+                        if row_id is not None:
+                            values[index] = row_id
+                        elif create_missing:
+                            missing.append((index, table, name))
+                        else:
+                            fail(line, f"Unknown {columns[index][:-len('_id')]}: {name}")
+                            break
+                    else:
+                        pending.append((line, values, missing))
+                if not pending:
+                    return
+                existing = load_names(conn, spec['table']) if unique is not None else {}
+
+                # The deferred triggers skip rows while the guard is set; it
+                # is cleared again before this transaction commits
+                deferred = spec.get('deferred', {})
+                if deferred:
+                    conn.execute("INSERT INTO import_guard (table_name) VALUES (?)", (spec['table'],))
+                after = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {spec['table']}").fetchone()[0]
+
+                conn.execute("SAVEPOINT bulk_import")
+                try:
+                    created: Dict[tuple, int] = {}
+                    batch, seen = [], {}
+                    for line, values, missing in pending:
+                        if unique is not None:
+                            key = str(values[unique]).lower()
+                            if key in existing or key in seen:
+                                continue
+                            seen[key] = None
+                        resolve(conn, values, missing, created)
+                        batch.append(values)
+                    conn.execute(chunk_sql, (json.dumps(batch),))
+                    conn.execute("RELEASE bulk_import")
+                    remember(created)
+                    existing.update(seen)
+                    summary['inserted'] += len(batch)
+                    summary['skipped'] += len(pending) - len(batch)
+                except sqlite3.Error:
+                    # Something in the chunk broke a constraint: redo it row by
+                    # row to find it, undoing each failed row's new names with it
+                    conn.execute("ROLLBACK TO bulk_import")
+                    conn.execute("RELEASE bulk_import")
+                    for line, values, missing in pending:
+                        key = str(values[unique]).lower() if unique is not None else None
+                        if key is not None and key in existing:
+                            summary['skipped'] += 1
+                            continue
+                        created = {}
+                        conn.execute("SAVEPOINT bulk_import_row")
+                        try:
+                            resolve(conn, values, missing, created)
+                            conn.execute(sql, values)
+                        except sqlite3.Error as e:
+                            conn.execute("ROLLBACK TO bulk_import_row")
+                            conn.execute("RELEASE bulk_import_row")
+                            fail(line, str(e))
+                            continue
+                        conn.execute("RELEASE bulk_import_row")
+                        remember(created)
+                        if key is not None:
+                            existing[key] = None
+                        summary['inserted'] += 1
+
+                if deferred:
+                    for statements in deferred.values():
+                        for statement in statements:
+                            conn.execute(statement, {'after': after})
+                    conn.execute("DELETE FROM import_guard WHERE table_name = ?", (spec['table'],))
+
+        chunk = []
+        for item in rows:
+            summary['rows'] += 1
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                import_chunk(chunk)
+                chunk = []
+        if chunk:
+            import_chunk(chunk)
+        return summary
+
+    def export_entities(self) -> List[str]:
+        """The EXPORT_ENTITIES tables this database has"""
+        with self.get_connection() as conn:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        return [name for name in EXPORT_ENTITIES if name in tables]
+
+    def export_rows(self, entity: str, filters: Optional[Dict[str, Any]] = None) -> tuple:
+        """Stream every row of ``entity``, optionally only those matching column = value ``filters``.
+
+        Returns ``(columns, rows)`` where ``rows`` lazily yields tuples in
+        ``columns`` order. Rows come off the cursor EXPORT_BATCH_SIZE at a time
+        inside one read transaction, which holds a pooled connection until the
+        iterator is exhausted or closed.
+        """
+        if entity not in self.export_entities():
+            raise ValueError(f"Unknown export entity: {entity}. Use one of: {', '.join(self.export_entities())}")
+        with self.get_connection() as conn:
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({entity})")]
+        filters = filters or {}
+        unknown = [name for name in filters if name not in columns]
+        if unknown:
+            raise ValueError(f"Unknown filter field(s): {', '.join(unknown)}")
+        where = ' AND '.join(f"{name} = ?" for name in filters)
+        sql = f"SELECT {', '.join(columns)} FROM {entity} {'WHERE ' + where if where else ''} ORDER BY rowid"
+
+        def rows():
+            with self.get_connection() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                cursor = conn.execute(sql, list(filters.values()))
+                while True:
+                    batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
+                    if not batch:
+                        return
+                    for row in batch:
+                        yield tuple(row)
+
+        return columns, rows()
+
+    def list_job_postings(self) -> List[Dict]:
+        """List all job postings with their company name"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT jp.*, c.name as company_name
+                FROM job_postings jp
+                JOIN companies c ON jp.company_id = c.id
+                ORDER BY jp.date_posted DESC
+            """)
+            return [dict(row) for row in cursor.fetchall()]
+
+    # Keyset pagination
+    @staticmethod
+    def _list_conditions(entity: str, search: Optional[str] = None, **filters) -> Tuple[List[str], List[Any]]:
+        """WHERE terms and parameters selecting the rows of a paginated list"""
+        spec = PAGINATED_LISTS.get(entity)
+        if spec is None:
+            raise ValueError(f"Unknown list: {entity}")
+
+        where = [spec['where']] if spec.get('where') else []
+        params: List[Any] = []
+
+        for field, value in filters.items():
+            if field not in spec.get('filters', ()):
+                raise ValueError(f"Cannot filter {entity} by {field}")
+            if value is not None:
+                where.append(f"{field} = ?")
+                params.append(value)
+
+        if search:
+            if 'search' not in spec:
+                raise ValueError(f"{entity} does not support search")
+            escaped = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            where.append(spec['search'])
+            params.extend([f"%{escaped}%"] * spec['search'].count('?'))
+
+        return where, params
+
+    def list_page(self, entity: str, limit: Optional[int] = None, after: Optional[str] = None,
+                  fields: Optional[List[str]] = None, search: Optional[str] = None,
+                  **filters) -> Dict[str, Any]:
+        """Fetch one page of a list using an opaque ``after`` cursor"""
+        where, params = self._list_conditions(entity, search, **filters)
+        spec = PAGINATED_LISTS[entity]
+        if fields is not None and 'fieldset' not in spec:
+            raise ValueError(f"{entity} does not support field selection")
+
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        sort_key = spec['sort_key']
+
+        if after:
+            key_value, last_id = decode_cursor(entity, after)
+            op = '<' if spec['descending'] else '>'
+            # The leading range term lets SQLite seek straight to the cursor
+            where.append(f"{sort_key} {op}= ? AND ({sort_key} {op} ? OR id {op} ?)")
+            params.extend([key_value, key_value, last_id])
+
+        direction = 'DESC' if spec['descending'] else 'ASC'
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ''
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT id, {sort_key} FROM {spec['table']}
+                {where_sql}
+                ORDER BY {sort_key} {direction}, id {direction}
+                LIMIT ?
+            """, params + [limit + 1])
+            keys = cursor.fetchall()
+            has_more = len(keys) > limit
+            keys = keys[:limit]
+
+            rows = {}
+            if keys:
+                if 'fieldset' in spec:
+                    fieldset = FIELDSETS[spec['fieldset']]
+                    source = f"SELECT {self.select_fields(conn, spec['fieldset'], fields)} FROM {fieldset['table']}"
+                else:
+                    source = spec['source']
+                placeholders = ', '.join('?' for _ in keys)
+                cursor.execute(
+                    f"SELECT * FROM ({source}) WHERE id IN ({placeholders})",
+                    [key[0] for key in keys]
+                )
+                for row in cursor.fetchall():
+                    result = dict(row)
+                    for field in spec.get('json_fields', ()):
+                        if result.get(field):
+                            result[field] = json.loads(result[field])
+                    rows[result['id']] = result
+
+        items = [rows[key[0]] for key in keys if key[0] in rows]
+        next_cursor = encode_cursor(entity, [keys[-1][1], keys[-1][0]]) if has_more else None
+        return {'items': items, 'next_cursor': next_cursor, 'limit': limit}
+
+    # Full-text search
+    def search(self, query: str, kinds: Optional[List[str]] = None,
+               limit: Optional[int] = None, after: Optional[str] = None) -> Dict[str, Any]:
+        """Search resumes, applications, job postings, companies, recruiters and events.
+
+        Results are ranked by bm25 (title matches weigh more than body
+        matches) and carry an HTML ``snippet`` of the best matching passage.
+        Pages are chained with the opaque ``after`` cursor like list_page.
+        """
+        match = build_match_query(query)
+        unknown = sorted(set(kinds or ()) - set(SEARCH_KINDS))
+        if unknown:
+            raise ValueError(f"Unknown search kind(s): {', '.join(unknown)}")
+
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        where = ["search_index MATCH ?"]
+        params: List[Any] = [match]
+        if kinds:
+            where.append(f"kind IN ({', '.join('?' for _ in kinds)})")
+            params.extend(kinds)
+        if after:
+            last_rank, last_rowid = decode_cursor('search', after)
+            where.append("(rank > ? OR (rank = ? AND rowid > ?))")
+            params.extend([last_rank, last_rank, last_rowid])
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT rowid, rank, kind, entity_id, parent_id,
+                       highlight(search_index, 3, ?, ?) AS title,
+                       snippet(search_index, 4, ?, ?, '…', 24) AS snippet
+                FROM search_index
+                WHERE {' AND '.join(where)}
+                ORDER BY rank, rowid
+                LIMIT ?
+            """, [_MATCH_START, _MATCH_END, _MATCH_START, _MATCH_END, *params, limit + 1])
+            rows = cursor.fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items = [{
+            'kind': row['kind'],
+            'id': row['entity_id'],
+            'parent_id': row['parent_id'],
+            'title': _marked(row['title']),
+            'snippet': _marked(row['snippet']),
+            'score': -row['rank'],
+        } for row in rows]
+        next_cursor = encode_cursor('search', [rows[-1]['rank'], rows[-1]['rowid']]) if has_more else None
+        return {'items': items, 'next_cursor': next_cursor, 'limit': limit}
+
+    def match_names(self, query: str, kinds: Optional[List[str]] = None,
+                    limit: int = 10, fuzzy: bool = True) -> List[Dict]:
+        """Find companies, recruiters and managers by name, best match first.
+
+        Names containing ``query`` (case-insensitive) are ranked exact match
+        first, then prefixes, then other substrings, shorter names first. When
+        no name contains it and ``fuzzy`` is set, the most similar names (by
+        trigram similarity) are returned instead, so typos still find their
+        target.
+        """
+        text = (query or '').strip()
+        if not text:
+            raise ValueError("Name query is empty")
+        unknown = sorted(set(kinds or ()) - set(NAME_KINDS))
+        if unknown:
+            raise ValueError(f"Unknown name kind(s): {', '.join(unknown)}")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        kind_sql = f" AND kind IN ({', '.join('?' for _ in kinds)})" if kinds else ''
+        kind_params = list(kinds or ())
+        escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        folded = text.lower()
+        trigrams = _trigrams(text)
+
+        with self.get_connection() as conn:
+            # How many names contain each trigram of the query
+            counts = dict(conn.execute(
+                f"SELECT trigram, names FROM name_trigram_counts WHERE trigram IN ({', '.join('?' for _ in trigrams)})",
+                list(trigrams)
+            ).fetchall()) if trigrams else {}
+
+            if len(text) < 3:
+                # Too short for a trigram; scan the (small) name column instead
+                where, params = "name LIKE ? ESCAPE '\\'", [f"%{escaped}%"]
+            elif len(counts) == len(trigrams):
+                # Narrow to names with the two rarest trigrams, then check the substring
+                rarest = sorted(counts, key=counts.get)[:2]
+                where = "name_index MATCH ? AND name LIKE ? ESCAPE '\\'"
+                params = [' AND '.join(_fts_string(t) for t in rarest), f"%{escaped}%"]
+            else:
+                # Some trigram of the query is in no name, so no name contains it
+                where, params = None, []
+
+            matches = []
+            if where:
+                rows = conn.execute(f"""
+                    SELECT kind, entity_id, name FROM name_index
+                    WHERE {where}{kind_sql}
+                    ORDER BY lower(name) = lower(?) DESC, name LIKE ? ESCAPE '\\' DESC, length(name), name
+                    LIMIT ?
+                """, params + kind_params + [text, escaped + '%', limit]).fetchall()
+                for row in rows:
+                    name = row['name'].lower()
+                    match = 'exact' if name == folded else 'prefix' if name.startswith(folded) else 'substring'
+                    matches.append({'kind': row['kind'], 'id': row['entity_id'], 'name': row['name'],
+                                    'score': 1.0 if match == 'exact' else _similarity(trigrams, row['name']),
+                                    'match': match})
+
+            if matches or not fuzzy or not counts:
+                return matches
+
+            probe, covered = [], 0
+            for term, docs in sorted(counts.items(), key=lambda count: count[1]):
+                if probe and covered + docs > FUZZY_CANDIDATE_BUDGET:
+                    break
+                probe.append(_fts_string(term))
+                covered += docs
+
+            candidates = []
+            for row in conn.execute(f"""
+                SELECT kind, entity_id, name FROM name_index
+                WHERE name_index MATCH ?{kind_sql}
+                LIMIT ?
+            """, [' OR '.join(probe)] + kind_params + [FUZZY_CANDIDATE_BUDGET]):
+                score = _similarity(trigrams, row['name'])
+                if score >= FUZZY_MIN_SIMILARITY:
+                    candidates.append({'kind': row['kind'], 'id': row['entity_id'], 'name': row['name'],
+                                       'score': score, 'match': 'fuzzy'})
+
+        candidates.sort(key=lambda m: (-m['score'], len(m['name']), m['name']))
+        return candidates[:limit]
+
+    # Dropdown options
+    def get_options(self, name: str, prefix: Optional[str] = None,
+                    limit: Optional[int] = None) -> List[Dict]:
+        """List ``{id, label, ...}`` options for a dropdown, optionally just labels starting with ``prefix``.
+
+        The prefix match is case-insensitive and runs as a range scan of the
+        list's label index. At most ``limit`` options come back (default
+        OPTION_LIST_SIZE, capped at OPTION_LIST_MAX_SIZE).
+        """
+        spec = OPTION_LISTS.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown option list: {name}")
+        label = spec['label']
+        columns = ', '.join(['id', f"{label} AS label", *spec.get('extra', [])])
+
+        where, params = '', []
+        if prefix:
+            where = f"WHERE {label} >= ? COLLATE NOCASE AND {label} < ? COLLATE NOCASE"
+            params = [prefix, prefix + PREFIX_END]
+        limit = OPTION_LIST_SIZE if limit is None else max(1, min(int(limit), OPTION_LIST_MAX_SIZE))
+        query = f"SELECT {columns} FROM {spec['table']} {where} ORDER BY {label} COLLATE NOCASE LIMIT ?"
+        params.append(limit)
+
+        with self.get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    # Change log
+    def get_changes(self, since: Optional[int] = None, limit: Optional[int] = None,
+                    entities: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Read the change log after sequence number ``since``.
+
+        Returns the changes in seq order, ``next_since`` to pass next time,
+        ``has_more`` when the page filled up, and ``latest`` (the newest seq).
+        With no ``since`` there are no changes, only the cursor to start
+        from. ``reset`` is set when ``since`` predates the retained history,
+        in which case the client has to reload in full and resume from
+        ``next_since``. Writers commit one at a time, so a seq is never
+        committed after a higher one has been read.
+        """
+        limit = CHANGE_LOG_PAGE_SIZE if limit is None else max(1, min(int(limit), CHANGE_LOG_MAX_PAGE_SIZE))
+        with self.snapshot() as conn:
+            latest = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+            floor = conn.execute("SELECT floor FROM change_log_state WHERE id = 1").fetchone()[0]
+            latest = max(latest, floor)
+            result = {'changes': [], 'next_since': latest, 'has_more': False, 'latest': latest, 'reset': False}
+            if since is None:
+                return result
+            if since < floor:
+                result['reset'] = True
+                return result
+
+            where, params = "seq > ?", [since]
+            if entities:
+                where += f" AND entity IN ({', '.join('?' * len(entities))})"
+                params.extend(entities)
+            rows = conn.execute(f"""
+                SELECT seq, entity, entity_id AS id, operation, changed_at FROM change_log
+                WHERE {where} ORDER BY seq LIMIT ?
+            """, params + [limit + 1]).fetchall()
+
+        result['has_more'] = len(rows) > limit
+        result['changes'] = [dict(row) for row in rows[:limit]]
+        if result['has_more']:
+            result['next_since'] = result['changes'][-1]['seq']
+        return result
+
+    def compact_change_log(self, retention_days: Optional[int] = CHANGE_LOG_RETENTION_DAYS) -> Dict[str, int]:
+        """Shrink the change log without losing anything a syncing client needs.
+
+        Compaction keeps only the newest change per entity row (a client
+        applies inserts and updates as upserts, so the newest tells it all).
+        Retention then drops history older than ``retention_days`` and raises
+        the floor below which clients are told to reload in full.
+        """
+        with self.get_connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            compacted = conn.execute("""
+                DELETE FROM change_log
+                WHERE seq NOT IN (SELECT MAX(seq) FROM change_log GROUP BY entity, entity_id)
+            """).rowcount
+
+            expired = 0
+            if retention_days is not None:
+                cutoff = conn.execute(
+                    "SELECT MAX(seq) FROM change_log WHERE changed_at < datetime('now', ?)",
+                    (f"-{int(retention_days)} days",)
+                ).fetchone()[0]
+                if cutoff is not None:
+                    expired = conn.execute("DELETE FROM change_log WHERE seq <= ?", (cutoff,)).rowcount
+                    conn.execute("UPDATE change_log_state SET floor = MAX(floor, ?) WHERE id = 1", (cutoff,))
+
+            floor = conn.execute("SELECT floor FROM change_log_state WHERE id = 1").fetchone()[0]
+            remaining = conn.execute("SELECT COUNT(*) FROM change_log").fetchone()[0]
+        return {'compacted': compacted, 'expired': expired, 'floor': floor, 'remaining': remaining}
+
     # Utility views
-    def get_active_applications(self) -> List[Dict]:
-        """Get all active applications with company and resume info"""
+    def get_active_applications(self, fields: Optional[List[str]] = None) -> List[Dict]:
+        """Get all active applications with company and resume info.
+
+        The full job_posting_text is only included when requested; the default
+        shape carries a 500 character job_posting_excerpt instead.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM active_applications")
+            columns = self.select_fields(conn, 'applications', fields)
+            cursor.execute(f"SELECT {columns} FROM active_applications ORDER BY application_date DESC")
             return [dict(row) for row in cursor.fetchall()]
 
     def get_resume_success_metrics(self) -> List[Dict]:
@@ -1078,38 +3339,151 @@ class ResumeRunnerDB:
 
             return stats
 
+    def get_dashboard_stats(self) -> Dict:
+        """Get overview statistics for the dashboard.
+
+        All counts come from one read snapshot and are cached until the
+        database changes. Each count stays its own statement: SQLite answers
+        them from b-tree page counts and status index ranges, which measured
+        several times faster than folding them into a single scan.
+        """
+        def compute(conn: sqlite3.Connection) -> Dict:
+            def count(sql: str) -> int:
+                return conn.execute(sql).fetchone()[0]
+
+            stats = {
+                'total_applications': count("SELECT COUNT(*) FROM applications"),
+                'interviews': count("SELECT COUNT(*) FROM applications "
+                                    "WHERE status IN ('phone_screen', 'interview', 'offer')"),
+                'offers': count("SELECT COUNT(*) FROM applications WHERE status = 'offer'"),
+                'companies_tracked': count("SELECT COUNT(*) FROM companies"),
+                'resume_versions': count("SELECT COUNT(*) FROM resume_versions"),
+            }
+            total = stats['total_applications']
+            stats['interview_rate'] = round(stats['interviews'] / total * 100, 1) if total else 0
+            stats['offer_rate'] = round(stats['offers'] / total * 100, 1) if total else 0
+            return stats
+
+        return dict(self._cached('dashboard_stats', compute))
+
+    def get_application_stats(self, search: Optional[str] = None, status: Optional[str] = None) -> Dict:
+        """Count the active applications matching the ``applications`` list filters.
+
+        Takes the same ``search``/``status`` as ``list_page('applications')``,
+        so the totals cover every matching row, not just the loaded pages.
+        """
+        where, params = self._list_conditions('applications', search, status=status)
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ''
+        with self.get_connection() as conn:
+            row = conn.execute(f"""
+                SELECT COUNT(*),
+                       COALESCE(SUM(status IN ('phone_screen', 'interview', 'offer')), 0),
+                       COALESCE(SUM(status = 'offer'), 0)
+                FROM applications
+                {where_sql}
+            """, params).fetchone()
+        total, interviews, offers = row
+        return {
+            'total_applications': total,
+            'interviews': interviews,
+            'offers': offers,
+            'interview_rate': round(interviews / total * 100, 1) if total else 0,
+            'offer_rate': round(offers / total * 100, 1) if total else 0,
+        }
+
+    # Event summaries
+    def get_event_summaries(self, entity: str, ids: Optional[List[int]] = None,
+                            recent: int = 3) -> List[Dict]:
+        """Summarize the event timelines of every company or recruiter (or just ``ids``).
+
+        One windowed pass over the events, in timeline order, gives each entity
+        its event count, next follow-up on or after today, and ``recent``
+        latest events. Entities without events are left out.
+        """
+        spec = EVENT_SUMMARIES.get(entity)
+        if spec is None:
+            raise ValueError(f"No event summaries for {entity}")
+        recent = max(1, min(int(recent), MAX_RECENT_EVENTS))
+        parent = spec['parent']
+
+        where, params = '', [date.today().isoformat()]
+        if ids is not None:
+            if not ids:
+                return []
+            where = f"WHERE {parent} IN ({', '.join('?' * len(ids))})"
+            params.extend(ids)
+        params.append(recent)
+
+        summaries: Dict[int, Dict] = {}
+        with self.get_connection() as conn:
+            # The window pass ranks ids only; just the kept events are read in full
+            rows = conn.execute(f"""
+                SELECT r._parent, r.event_count, r.next_follow_up,
+                       e.id, e.event_type, e.title, e.event_date,
+                       e.follow_up_required, e.follow_up_date, e.created_at
+                FROM (
+                    SELECT {parent} AS _parent, id,
+                           ROW_NUMBER() OVER timeline AS position,
+                           COUNT(*) OVER whole AS event_count,
+                           MIN(CASE WHEN follow_up_required AND follow_up_date >= ?
+                                    THEN follow_up_date END) OVER whole AS next_follow_up
+                    FROM {spec['table']}
+                    {where}
+                    WINDOW timeline AS (PARTITION BY {parent} ORDER BY event_date DESC, created_at DESC),
+                           whole AS (timeline ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING)
+                ) r
+                JOIN {spec['table']} e ON e.id = r.id
+                WHERE r.position <= ?
+                ORDER BY r._parent, r.position
+            """, params)
+            for row in rows:
+                event = dict(row)
+                entity_id = event.pop('_parent')
+                summary = summaries.get(entity_id)
+                if summary is None:
+                    summary = summaries[entity_id] = {
+                        parent: entity_id,
+                        'event_count': event['event_count'],
+                        'next_follow_up': event['next_follow_up'],
+                        'latest_event': None,
+                        'recent_events': [],
+                    }
+                del event['event_count'], event['next_follow_up']
+                summary['recent_events'].append(event)
+        for summary in summaries.values():
+            summary['latest_event'] = summary['recent_events'][0]
+        return list(summaries.values())
+
     # Search functions
     def search_applications_by_company(self, company_name: str) -> List[Dict]:
-        """Search applications by company name"""
+        """Search applications by company name (case-insensitive substring)"""
+        if len(company_name) >= 3:
+            # Trigram index lookup instead of a LIKE scan of every company
+            company_ids = "SELECT entity_id FROM name_index WHERE name_index MATCH ? AND kind = 'company'"
+            params = [_fts_string(company_name)]
+        else:
+            company_ids = "SELECT id FROM companies WHERE LOWER(name) LIKE LOWER(?)"
+            params = [f"%{company_name}%"]
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT a.*, c.name as company_name, rv.version_name as resume_version
                 FROM applications a
                 JOIN companies c ON a.company_id = c.id
                 LEFT JOIN resume_versions rv ON a.resume_version_id = rv.id
-                WHERE LOWER(c.name) LIKE LOWER(?)
+                WHERE a.company_id IN ({company_ids})
                 ORDER BY a.application_date DESC
-            """, (f"%{company_name}%",))
+            """, params)
             return [dict(row) for row in cursor.fetchall()]
 
-    def get_application_details(self, application_id: int) -> Optional[Dict]:
-        """Get full application details for interview prep"""
+    def get_application_details(self, application_id: int,
+                                fields: Optional[List[str]] = None) -> Optional[Dict]:
+        """Get full application details for interview prep, optionally narrowed to ``fields``"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    a.*,
-                    c.name as company_name,
-                    c.website as company_website,
-                    rv.version_name as resume_version,
-                    rv.content_text as resume_content,
-                    rv.skills_emphasized as resume_skills,
-                    jp.description as job_description,
-                    COALESCE(a.salary_min, jp.salary_min) as salary_min,
-                    COALESCE(a.salary_max, jp.salary_max) as salary_max,
-                    COALESCE(a.is_remote, jp.is_remote) as is_remote,
-                    r.name as recruiter_name, r.email as recruiter_email
+            columns = self.select_fields(conn, 'application_details', fields, detail=True)
+            cursor.execute(f"""
+                SELECT {columns}
                 FROM applications a
                 JOIN companies c ON a.company_id = c.id
                 LEFT JOIN resume_versions rv ON a.resume_version_id = rv.id
@@ -1120,7 +3494,7 @@ class ResumeRunnerDB:
             row = cursor.fetchone()
             if row:
                 result = dict(row)
-                if result['resume_skills']:
+                if result.get('resume_skills'):
                     result['resume_skills'] = json.loads(result['resume_skills'])
                 return result
             return None
@@ -1281,30 +3655,36 @@ class ResumeRunnerDB:
 
     def delete_tag(self, tag_id: int) -> bool:
         """Delete a tag (also removes all resume associations)"""
-        with self.get_connection() as conn:
+        with self._tag_index_write() as (conn, index):
             cursor = conn.cursor()
             cursor.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
+            if index:
+                index.drop_tag(tag_id)
             return cursor.rowcount > 0
 
     # Resume tag operations
     def add_resume_tag(self, resume_version_id: int, tag_id: int) -> int:
         """Associate a tag with a resume version"""
-        with self.get_connection() as conn:
+        with self._tag_index_write() as (conn, index):
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR IGNORE INTO resume_tags (resume_version_id, tag_id)
                 VALUES (?, ?)
             """, (resume_version_id, tag_id))
+            if index:
+                index.tag(resume_version_id, tag_id)
             return cursor.lastrowid
 
     def remove_resume_tag(self, resume_version_id: int, tag_id: int) -> bool:
         """Remove a tag from a resume version"""
-        with self.get_connection() as conn:
+        with self._tag_index_write() as (conn, index):
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM resume_tags
                 WHERE resume_version_id = ? AND tag_id = ?
             """, (resume_version_id, tag_id))
+            if index:
+                index.untag(resume_version_id, tag_id)
             return cursor.rowcount > 0
 
     def get_resume_tags(self, resume_version_id: int) -> List[Dict]:
@@ -1321,11 +3701,14 @@ class ResumeRunnerDB:
 
     def set_resume_tags(self, resume_version_id: int, tag_ids: List[int]):
         """Set tags for a resume version (replaces existing tags)"""
-        with self.get_connection() as conn:
+        with self._tag_index_write() as (conn, index):
             cursor = conn.cursor()
 
             # Remove existing tags
             cursor.execute("DELETE FROM resume_tags WHERE resume_version_id = ?", (resume_version_id,))
+            if index:
+                for existing in list(index.tag_bits):
+                    index.untag(resume_version_id, existing)
 
             # Add new tags
             for tag_id in tag_ids:
@@ -1333,109 +3716,80 @@ class ResumeRunnerDB:
                     INSERT INTO resume_tags (resume_version_id, tag_id)
                     VALUES (?, ?)
                 """, (resume_version_id, tag_id))
+                if index:
+                    index.tag(resume_version_id, tag_id)
 
     def search_resumes_by_tags(self, tag_names: List[str], match_all: bool = False) -> List[Dict]:
         """Search resumes by tag names"""
         if not tag_names:
             return []
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            placeholders = ', '.join(['?' for _ in tag_names])
-
-            if match_all:
-                # Must have ALL specified tags
-                query = """
-                    SELECT DISTINCT rv.* FROM resume_versions rv
-                    JOIN resume_tags rt ON rv.id = rt.resume_version_id
-                    JOIN tags t ON rt.tag_id = t.id
-                    WHERE LOWER(t.name) IN ({})
-                    GROUP BY rv.id
-                    HAVING COUNT(DISTINCT t.id) = ?
-                    ORDER BY rv.created_at DESC
-                """.format(placeholders)
-                params = [name.lower() for name in tag_names] + [len(tag_names)]
-            else:
-                # Must have ANY of the specified tags
-                query = """
-                    SELECT DISTINCT rv.* FROM resume_versions rv
-                    JOIN resume_tags rt ON rv.id = rt.resume_version_id
-                    JOIN tags t ON rt.tag_id = t.id
-                    WHERE LOWER(t.name) IN ({})
-                    ORDER BY rv.created_at DESC
-                """.format(placeholders)
-                params = [name.lower() for name in tag_names]
+        index = self._current_tag_index()
+        with index.lock:
+            matches = [index.resumes_tagged(name) for name in tag_names]
+            bits = matches[0]
+            for other in matches[1:]:
+                bits = bits & other if match_all else bits | other
+            resume_ids = index.resume_ids_in(bits)
+        return self._load_resumes(resume_ids)
+
+    def search_resumes_by_tag_query(self, query: str) -> List[Dict]:
+        """Search resumes with a tag expression, e.g. ``python AND (aws OR gcp) AND NOT junior``.
+
+        The expression is evaluated against the in-process tag index; results
+        come back newest first. Raises ValueError for a malformed query.
+        """
+        index = self._current_tag_index()
+        with index.lock:
+            resume_ids = index.resume_ids_in(index.evaluate(query))
+        return self._load_resumes(resume_ids)
+
+    def _load_resumes(self, resume_ids: List[int]) -> List[Dict]:
+        """Fetch resume version rows by id, keeping the order of ``resume_ids``"""
+        if not resume_ids:
+            return []
 
-            cursor.execute(query, params)
-            results = []
-            for row in cursor.fetchall():
-                result = dict(row)
-                if result['skills_emphasized']:
-                    result['skills_emphasized'] = json.loads(result['skills_emphasized'])
-                results.append(result)
-            return results
+        rows = {}
+        with self.get_connection() as conn:
+            for start in range(0, len(resume_ids), 500):
+                chunk = resume_ids[start:start + 500]
+                placeholders = ', '.join('?' for _ in chunk)
+                for row in conn.execute(f"SELECT * FROM resume_versions WHERE id IN ({placeholders})", chunk):
+                    result = dict(row)
+                    if result['skills_emphasized']:
+                        result['skills_emphasized'] = json.loads(result['skills_emphasized'])
+                    rows[result['id']] = result
+        return [rows[resume_id] for resume_id in resume_ids if resume_id in rows]
 
-    def get_resume_versions_with_tags(self) -> List[Dict]:
-        """Get all resume versions along with their tags"""
+    def get_resume_versions_with_tags(self, fields: Optional[List[str]] = None) -> List[Dict]:
+        """Get all resume versions along with their tags (content_text only when requested)"""
         try:
             print(f"🔍 [DEBUG] DB: Starting get_resume_versions_with_tags query...")
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                columns = self.select_fields(conn, 'resume_versions_with_tags', fields)
                 print(f"🔍 [DEBUG] DB: Executing SQL query...")
                 cursor.execute(
-                """
-                SELECT
-                    rv.id,
-                    rv.filename,
-                    rv.version_name,
-                    rv.content_text,
-                    rv.s3_key,
-                    rv.editable_s3_key,
-                    rv.editable_filename,
-                    rv.skills_emphasized,
-                    rv.target_roles,
-                    rv.is_master,
-                    rv.description,
-                    rv.success_rate,
-                    rv.word_count,
-                    rv.created_at,
-                    rv.updated_at,
-                    GROUP_CONCAT(t.name, ', ') AS tags,
-                    COUNT(t.id) AS tag_count
-                FROM resume_versions rv
-                LEFT JOIN resume_tags rt ON rv.id = rt.resume_version_id
-                LEFT JOIN tags t ON rt.tag_id = t.id
-                GROUP BY rv.id
-                ORDER BY rv.created_at DESC
-                """
-            )
+                    f"""
+                    SELECT {columns}
+                    FROM resume_versions rv
+                    LEFT JOIN resume_tags rt ON rv.id = rt.resume_version_id
+                    LEFT JOIN tags t ON rt.tag_id = t.id
+                    GROUP BY rv.id
+                    ORDER BY rv.created_at DESC
+                    """
+                )
 
-            print(f"🔍 [DEBUG] DB: Query executed, processing results...")
-            results = []
-            for row in cursor.fetchall():
-                result = {
-                    'id': row[0],
-                    'filename': row[1],
-                    'version_name': row[2],
-                    'content_text': row[3],
-                    's3_key': row[4],
-                    'editable_s3_key': row[5],
-                    'editable_filename': row[6],
-                    'skills_emphasized': json.loads(row[7]) if row[7] else None,
-                    'target_roles': row[8],
-                    'is_master': row[9],
-                    'description': row[10],
-                    'success_rate': row[11],
-                    'word_count': row[12],
-                    'created_at': row[13],
-                    'updated_at': row[14],
-                    'tags': row[15],
-                    'tag_count': row[16]
-                }
-                results.append(result)
-            print(f"🔍 [DEBUG] DB: Processed {len(results)} results")
-            return results
+                print(f"🔍 [DEBUG] DB: Query executed, processing results...")
+                results = []
+                for row in cursor.fetchall():
+                    result = dict(row)
+                    if 'skills_emphasized' in result:
+                        result['skills_emphasized'] = (json.loads(result['skills_emphasized'])
+                                                       if result['skills_emphasized'] else None)
+                    results.append(result)
+                print(f"🔍 [DEBUG] DB: Processed {len(results)} results")
+                return results
         except Exception as e:
             print(f"❌ [ERROR] DB: Error in get_resume_versions_with_tags: {str(e)}")
             import traceback
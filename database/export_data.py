@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Resume Runner Export
+Streams tables out as JSON Lines or CSV with flat memory use, to stdout or
+a file, or every table into a directory from one consistent snapshot.
+
+Usage:
+    python database/export_data.py applications > applications.jsonl
+    python database/export_data.py applications --format csv --where status=applied -o applied.csv
+    python database/export_data.py --all -o backup/ --gzip
+"""
+
+import argparse
+import os
+import sys
+
+from db_helper import EXPORT_ENTITIES, EXPORT_FORMATS, ResumeRunnerDB, encode_export
+
+
+def export(db: ResumeRunnerDB, entity: str, fmt: str, compress: bool, out, filters=None) -> int:
+    """Write one table to the binary stream ``out``; returns the row count"""
+    count = 0
+    columns, rows = db.export_rows(entity, filters)
+
+    def counted():
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    for piece in encode_export(columns, counted(), fmt, compress=compress):
+        out.write(piece)
+    return count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('entity', nargs='?', metavar='table', help=f"one of: {', '.join(EXPORT_ENTITIES)}")
+    parser.add_argument('--all', action='store_true', help='export every table into the -o directory')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='jsonl')
+    parser.add_argument('--where', action='append', default=[], metavar='COLUMN=VALUE',
+                        help='only rows with this column value (repeatable)')
+    parser.add_argument('--gzip', action='store_true', help='gzip the output')
+    parser.add_argument('-o', '--output', help='output file (directory with --all); defaults to stdout')
+    parser.add_argument('--db', help='database path (defaults to DATABASE_PATH)')
+    args = parser.parse_args()
+    if args.all == bool(args.entity):
+        parser.error('give a table or --all')
+    if args.all and not args.output:
+        parser.error('--all needs -o DIRECTORY')
+    if args.all and args.where:
+        parser.error('--where filters a single table')
+    filters = dict(item.split('=', 1) for item in args.where if '=' in item)
+    if len(filters) != len(args.where):
+        parser.error('--where takes COLUMN=VALUE')
+
+    db = ResumeRunnerDB(args.db)
+    try:
+        if not args.all:
+            if args.output:
+                with open(args.output, 'wb') as out:
+                    count = export(db, args.entity, args.format, args.gzip, out, filters)
+            else:
+                count = export(db, args.entity, args.format, args.gzip, sys.stdout.buffer, filters)
+            print(f"📤 {args.entity}: {count:,} row(s)", file=sys.stderr)
+            return 0
+
+        os.makedirs(args.output, exist_ok=True)
+        suffix = f".{args.format}{'.gz' if args.gzip else ''}"
+        # One read transaction for every table, so the files agree with each other
+        with db.get_connection() as conn:
+            conn.execute("BEGIN")
+            for entity in db.export_entities():
+                with open(os.path.join(args.output, entity + suffix), 'wb') as out:
+                    count = export(db, entity, args.format, args.gzip, out, filters)
+                print(f"📤 {entity}: {count:,} row(s)", file=sys.stderr)
+        return 0
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
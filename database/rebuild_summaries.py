@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Resume Runner Summary Tables
+Rebuilds the trigger-maintained summary tables from the base tables, or
+checks them for drift without changing anything.
+
+Usage:
+    python database/rebuild_summaries.py              # rebuild every summary table
+    python database/rebuild_summaries.py --check      # report drift, exit 1 if any
+    python database/rebuild_summaries.py company_activity_summary
+"""
+
+import argparse
+import sys
+
+from db_helper import SUMMARY_TABLES, ResumeRunnerDB
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('tables', nargs='*', metavar='table',
+                        help=f"summary tables to process (default: all of {', '.join(SUMMARY_TABLES)})")
+    parser.add_argument('--check', action='store_true', help='only report drift, do not rebuild')
+    parser.add_argument('--db', help='database path (defaults to DATABASE_PATH)')
+    args = parser.parse_args()
+    unknown = set(args.tables) - set(SUMMARY_TABLES)
+    if unknown:
+        parser.error(f"unknown summary table(s): {', '.join(sorted(unknown))}")
+
+    db = ResumeRunnerDB(args.db)
+    try:
+        if args.check:
+            drift = db.check_summaries(args.tables or None)
+            for name, keys in drift.items():
+                if keys:
+                    print(f"❌ {name}: {len(keys)} row(s) out of date, e.g. {keys[:10]}")
+                else:
+                    print(f"✅ {name}: consistent")
+            return 1 if any(drift.values()) else 0
+
+        for name, rows in db.rebuild_summaries(args.tables or None).items():
+            print(f"🔄 {name}: rebuilt {rows} row(s)")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,6 +10,7 @@ import CompanyDetail from './pages/CompanyDetail';
 import Recruiters from './pages/Recruiters';
 import RecruiterDetail from './pages/RecruiterDetail';
 import ApplicationDetail from './pages/ApplicationDetail';
+import useChangeSync from './hooks/useChangeSync';
 
 const queryClient = new QueryClient({
   defaultOptions: {
@@ -20,9 +21,16 @@ const queryClient = new QueryClient({
   },
 });
 
+// Keeps the query cache in step with changes made outside this tab
+const ChangeSync = () => {
+  useChangeSync();
+  return null;
+};
+
 function App() {
   return (
     <QueryClientProvider client={queryClient}>
+      <ChangeSync />
       <Router>
         <div className="App">
           <Navigation />
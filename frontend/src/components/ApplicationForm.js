@@ -13,6 +13,7 @@ import {
   User
 } from 'lucide-react';
 import SearchableDropdown from './SearchableDropdown';
+import { batchedGet } from '../utils/batch';
 
 const ApplicationForm = ({ isOpen, onClose, onSubmit, application = null, onDelete = null }) => {
   const [jobPostingText, setJobPostingText] = useState(application?.job_posting_text || '');
@@ -40,10 +41,10 @@ const ApplicationForm = ({ isOpen, onClose, onSubmit, application = null, onDele
   register('application_source', { required: 'Application source is required' });
   register('resume_version_id');
 
-  // Fetch companies and resume versions for dropdowns
+  // Fetch dropdown options (id + label only) for companies, resume versions and recruiters
   const { data: companies } = useQuery(
-    'companies',
-    () => fetch('/api/companies').then(res => res.json()),
+    'company-options',
+    () => batchedGet('/api/options/companies'),
     { enabled: isOpen }
   );
 
@@ -73,43 +74,45 @@ const ApplicationForm = ({ isOpen, onClose, onSubmit, application = null, onDele
           return;
         }
 
-        queryClient.setQueryData('companies', (old) => {
+        const newOption = { id: newCompany.id, label: newCompany.name };
+        queryClient.setQueryData('company-options', (old) => {
           if (!old) {
-            return { companies: [newCompany] };
+            return { options: [newOption] };
           }
 
-          const existing = old.companies || [];
-          if (existing.some((company) => company.id === newCompany.id)) {
+          const existing = old.options || [];
+          if (existing.some((option) => option.id === newOption.id)) {
             return old;
           }
 
           return {
             ...old,
-            companies: [...existing, newCompany]
+            options: [...existing, newOption]
           };
         });
+        queryClient.invalidateQueries('companies');
       }
     }
   );
 
   const { data: resumeVersions } = useQuery(
-    'resume-versions',
-    () => fetch('/api/resume-versions').then(res => res.json()),
+    'resume-version-options',
+    () => batchedGet('/api/options/resume-versions'),
     { enabled: isOpen }
   );
 
   const { data: recruiters } = useQuery(
-    'recruiters',
-    () => fetch('/api/recruiters').then(res => res.json()),
+    'recruiter-options',
+    () => batchedGet('/api/options/recruiters'),
     { enabled: isOpen }
   );
 
   const watchedCompanyId = watch('company_id');
   const watchedIsRemote = watch('is_remote');
 
-  const companyOptions = companies?.companies?.map(company => ({
+  const companyOptions = companies?.options?.map(company => ({
     value: company.id.toString(),
-    label: company.name
+    label: company.label
   })) || [];
 
   const handleCreateCompany = async (name) => {
@@ -231,7 +234,7 @@ const ApplicationForm = ({ isOpen, onClose, onSubmit, application = null, onDele
             body: JSON.stringify({
               resume_version_id: applicationData.resume_version_id,
               sharing_context: 'job_application',
-              notes: `Shared for job application: ${applicationData.position_title} at ${companies?.companies?.find(c => c.id == applicationData.company_id)?.name}`
+              notes: `Shared for job application: ${applicationData.position_title} at ${companies?.options?.find(c => c.id == applicationData.company_id)?.label}`
             }),
           });
         } catch (error) {
@@ -583,9 +586,9 @@ Tip: Raw text is fine - use 'Format Text' to clean it up!"
                 Resume Version Used
               </label>
               <SearchableDropdown
-                options={resumeVersions?.resume_versions?.map(version => ({
+                options={resumeVersions?.options?.map(version => ({
                   value: version.id.toString(),
-                  label: `${version.version_name}${version.is_master ? ' (Master)' : ''}`
+                  label: `${version.label}${version.is_master ? ' (Master)' : ''}`
                 })) || []}
                 value={watch('resume_version_id') || ''}
                 onChange={(value) => {
@@ -602,32 +605,13 @@ Tip: Raw text is fine - use 'Format Text' to clean it up!"
                 <div className="form-group">
                   <label className="form-label">Recruiter Contact (Optional)</label>
                   <SearchableDropdown
-                    options={recruiters?.recruiters?.map(recruiter => ({
+                    options={recruiters?.options?.map(recruiter => ({
                       value: recruiter.id.toString(),
-                      label: `${recruiter.name} - ${recruiter.company || 'Independent'}`,
-                      details: recruiter.specialties ? `Specializes in: ${recruiter.specialties}` : null,
-                      contact: recruiter.email || recruiter.phone
+                      label: `${recruiter.label} - ${recruiter.company || 'Independent'}`
                     })) || []}
                     value={watch('recruiter_id') || ''}
                     onChange={(value) => setValue('recruiter_id', value)}
                     placeholder="Select recruiter contact..."
-                    renderOption={(option) => (
-                      <div style={{ padding: '8px 0' }}>
-                        <div style={{ fontWeight: '500', color: '#1f2937' }}>
-                          {option.label}
-                        </div>
-                        {option.details && (
-                          <div style={{ fontSize: '12px', color: '#6b7280', marginTop: '2px' }}>
-                            {option.details}
-                          </div>
-                        )}
-                        {option.contact && (
-                          <div style={{ fontSize: '12px', color: '#3b82f6', marginTop: '2px' }}>
-                            📧 {option.contact}
-                          </div>
-                        )}
-                      </div>
-                    )}
                   />
                   <div style={{
                     marginTop: '8px',
@@ -55,6 +55,7 @@ const CompanyEventsModal = ({ company, onClose }) => {
     {
       onSuccess: () => {
         queryClient.invalidateQueries(['company-events', company.id]);
+        queryClient.invalidateQueries('company-event-summaries');
         queryClient.invalidateQueries('companies');
         setFormData({
           title: '',
@@ -84,6 +85,7 @@ const CompanyEventsModal = ({ company, onClose }) => {
     {
       onSuccess: () => {
         queryClient.invalidateQueries(['company-events', company.id]);
+        queryClient.invalidateQueries('company-event-summaries');
         queryClient.invalidateQueries('companies');
       },
       onError: (error) => {
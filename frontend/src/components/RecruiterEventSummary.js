@@ -1,22 +1,12 @@
 import React from 'react';
-import { useQuery } from 'react-query';
 import { format } from 'date-fns';
 import { MessageCircle } from 'lucide-react';
 
-const RecruiterEventSummary = ({ recruiterId }) => {
-  const { data, isLoading } = useQuery(
-    ['recruiter-events', recruiterId],
-    () => fetch(`/api/recruiters/${recruiterId}/events`).then(res => res.json()),
-    {
-      enabled: !!recruiterId,
-      staleTime: 1000 * 60 * 5
-    }
-  );
-
-  if (!recruiterId) return null;
-
-  const events = data?.events || [];
-  const recentEvents = events.slice(0, 3);
+// Renders one entry of /api/recruiters/event-summaries, which the list page
+// loads once for every card.
+const RecruiterEventSummary = ({ summary, isLoading }) => {
+  const recentEvents = summary?.recent_events || [];
+  const eventCount = summary?.event_count || 0;
 
   return (
     <div style={{
@@ -36,6 +26,11 @@ const RecruiterEventSummary = ({ recruiterId }) => {
         <span style={{ fontSize: '13px', fontWeight: 600, color: '#1f2937' }}>
           Recent Events
         </span>
+        {eventCount > recentEvents.length && (
+          <span style={{ fontSize: '12px', color: '#6b7280' }}>
+            {eventCount} total
+          </span>
+        )}
       </div>
       {isLoading ? (
         <div style={{ fontSize: '12px', color: '#6b7280' }}>Loading timeline…</div>
@@ -56,6 +51,11 @@ const RecruiterEventSummary = ({ recruiterId }) => {
           ))}
         </div>
       )}
+      {summary?.next_follow_up && (
+        <div style={{ fontSize: '12px', color: '#b45309', marginTop: '8px' }}>
+          Next follow-up: {format(new Date(summary.next_follow_up), 'MMM d, yyyy')}
+        </div>
+      )}
     </div>
   );
 };
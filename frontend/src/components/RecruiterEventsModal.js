@@ -53,6 +53,7 @@ const RecruiterEventsModal = ({ recruiter, onClose }) => {
     {
       onSuccess: () => {
         queryClient.invalidateQueries(['recruiter-events', recruiter.id]);
+        queryClient.invalidateQueries('recruiter-event-summaries');
         queryClient.invalidateQueries('recruiter-dashboard');
         setFormData({
           title: '',
@@ -82,6 +83,7 @@ const RecruiterEventsModal = ({ recruiter, onClose }) => {
     {
       onSuccess: () => {
         queryClient.invalidateQueries(['recruiter-events', recruiter.id]);
+        queryClient.invalidateQueries('recruiter-event-summaries');
         queryClient.invalidateQueries('recruiter-dashboard');
       },
       onError: (error) => {
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useMutation, useQueryClient, useQuery } from 'react-query';
 import { X, User, Building2, Mail, Phone, Linkedin, MapPin, Users, Shield, Clock, Plus, Trash2, Edit3 } from 'lucide-react';
+import { batch, batchedGet } from '../utils/batch';
 
 const RecruiterForm = ({ recruiter, onClose }) => {
   const [formData, setFormData] = useState({
@@ -46,22 +47,24 @@ const RecruiterForm = ({ recruiter, onClose }) => {
 
   // Fetch available companies for dropdowns
   const { data: availableCompanies } = useQuery(
-    'companies',
-    () => fetch('/api/companies').then(res => res.json())
+    'company-options',
+    () => batchedGet('/api/options/companies')
   );
 
   // Fetch available managers
   const { data: availableManagers } = useQuery(
-    'managers',
-    () => fetch('/api/managers').then(res => res.json())
+    'manager-options',
+    () => batchedGet('/api/options/managers')
+  );
+  const companyNames = Object.fromEntries(
+    (availableCompanies?.options || []).map(company => [company.id, company.label])
   );
 
   // Fetch recruiter's current managers and companies if editing
   useEffect(() => {
     if (recruiter?.id) {
       // Fetch current managers
-      fetch(`/api/recruiters/${recruiter.id}/managers`)
-        .then(res => res.json())
+      batchedGet(`/api/recruiters/${recruiter.id}/managers`)
         .then(data => {
           if (data.managers) {
             setManagers(data.managers);
@@ -70,8 +73,7 @@ const RecruiterForm = ({ recruiter, onClose }) => {
         .catch(console.error);
 
       // Fetch current companies
-      fetch(`/api/recruiters/${recruiter.id}/companies`)
-        .then(res => res.json())
+      batchedGet(`/api/recruiters/${recruiter.id}/companies`)
         .then(data => {
           if (data.companies) {
             setCompanies(data.companies);
@@ -157,24 +159,23 @@ const RecruiterForm = ({ recruiter, onClose }) => {
         newManagerData.manager_id = managerResult.manager.id;
       }
 
-      // Create relationship
-      const relationshipResponse = await fetch(`/api/recruiters/${recruiter.id}/managers`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          manager_id: newManagerData.manager_id,
-          relationship_type: newManagerData.relationship_type,
-          relationship_notes: newManagerData.relationship_notes,
-          is_primary_contact: newManagerData.is_primary_contact
-        })
-      });
-
-      if (!relationshipResponse.ok) throw new Error('Failed to create relationship');
+      // Create relationship and refresh managers list in one round trip
+      const [relationship, refreshed] = await batch([
+        {
+          method: 'POST',
+          path: `/api/recruiters/${recruiter.id}/managers`,
+          body: {
+            manager_id: newManagerData.manager_id,
+            relationship_type: newManagerData.relationship_type,
+            relationship_notes: newManagerData.relationship_notes,
+            is_primary_contact: newManagerData.is_primary_contact
+          }
+        },
+        { method: 'GET', path: `/api/recruiters/${recruiter.id}/managers` }
+      ]);
 
-      // Refresh managers list
-      const managersResponse = await fetch(`/api/recruiters/${recruiter.id}/managers`);
-      const managersData = await managersResponse.json();
-      setManagers(managersData.managers || []);
+      if (relationship.status >= 400) throw new Error('Failed to create relationship');
+      setManagers(refreshed.body.managers || []);
 
       // Reset form
       setNewManagerData({
@@ -195,23 +196,23 @@ const RecruiterForm = ({ recruiter, onClose }) => {
     }
 
     try {
-      const response = await fetch(`/api/companies/${newCompanyData.company_id}/recruiters`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          recruiter_id: recruiter.id,
-          association_type: newCompanyData.association_type,
-          specialization: newCompanyData.specialization,
-          notes: newCompanyData.notes
-        })
-      });
-
-      if (!response.ok) throw new Error('Failed to create company association');
+      // Create association and refresh companies list in one round trip
+      const [association, refreshed] = await batch([
+        {
+          method: 'POST',
+          path: `/api/companies/${newCompanyData.company_id}/recruiters`,
+          body: {
+            recruiter_id: recruiter.id,
+            association_type: newCompanyData.association_type,
+            specialization: newCompanyData.specialization,
+            notes: newCompanyData.notes
+          }
+        },
+        { method: 'GET', path: `/api/recruiters/${recruiter.id}/companies` }
+      ]);
 
-      // Refresh companies list
-      const companiesResponse = await fetch(`/api/recruiters/${recruiter.id}/companies`);
-      const companiesData = await companiesResponse.json();
-      setCompanies(companiesData.companies || []);
+      if (association.status >= 400) throw new Error('Failed to create company association');
+      setCompanies(refreshed.body.companies || []);
 
       // Reset form
       setNewCompanyData({
@@ -228,16 +229,14 @@ const RecruiterForm = ({ recruiter, onClose }) => {
     if (!recruiter?.id) return;
 
     try {
-      const response = await fetch(`/api/recruiters/${recruiter.id}/managers/${managerId}`, {
-        method: 'DELETE'
-      });
-
-      if (!response.ok) throw new Error('Failed to remove manager relationship');
+      // Remove and refresh managers list in one round trip
+      const [removed, refreshed] = await batch([
+        { method: 'DELETE', path: `/api/recruiters/${recruiter.id}/managers/${managerId}` },
+        { method: 'GET', path: `/api/recruiters/${recruiter.id}/managers` }
+      ]);
 
-      // Refresh managers list
-      const managersResponse = await fetch(`/api/recruiters/${recruiter.id}/managers`);
-      const managersData = await managersResponse.json();
-      setManagers(managersData.managers || []);
+      if (removed.status >= 400) throw new Error('Failed to remove manager relationship');
+      setManagers(refreshed.body.managers || []);
     } catch (error) {
       console.error('Error removing manager:', error);
       alert('Failed to remove manager relationship: ' + error.message);
@@ -248,16 +247,14 @@ const RecruiterForm = ({ recruiter, onClose }) => {
     if (!recruiter?.id) return;
 
     try {
-      const response = await fetch(`/api/companies/${companyId}/recruiters/${recruiter.id}`, {
-        method: 'DELETE'
-      });
-
-      if (!response.ok) throw new Error('Failed to remove company association');
+      // Remove and refresh companies list in one round trip
+      const [removed, refreshed] = await batch([
+        { method: 'DELETE', path: `/api/companies/${companyId}/recruiters/${recruiter.id}` },
+        { method: 'GET', path: `/api/recruiters/${recruiter.id}/companies` }
+      ]);
 
-      // Refresh companies list
-      const companiesResponse = await fetch(`/api/recruiters/${recruiter.id}/companies`);
-      const companiesData = await companiesResponse.json();
-      setCompanies(companiesData.companies || []);
+      if (removed.status >= 400) throw new Error('Failed to remove company association');
+      setCompanies(refreshed.body.companies || []);
     } catch (error) {
       console.error('Error removing company:', error);
       alert('Failed to remove company association: ' + error.message);
@@ -1011,9 +1008,9 @@ const RecruiterForm = ({ recruiter, onClose }) => {
                         style={{ fontSize: '13px' }}
                       >
                         <option value="">Select a manager...</option>
-                        {availableManagers?.managers?.map(mgr => (
+                        {availableManagers?.options?.map(mgr => (
                           <option key={mgr.id} value={mgr.id}>
-                            {mgr.name} - {mgr.position_title} ({mgr.company_name})
+                            {mgr.label} - {mgr.position_title} ({companyNames[mgr.company_id]})
                           </option>
                         ))}
                       </select>
@@ -1239,9 +1236,9 @@ const RecruiterForm = ({ recruiter, onClose }) => {
                         style={{ fontSize: '13px' }}
                       >
                         <option value="">Select a company...</option>
-                        {availableCompanies?.companies?.map(comp => (
+                        {availableCompanies?.options?.map(comp => (
                           <option key={comp.id} value={comp.id}>
-                            {comp.name}
+                            {comp.label}
                           </option>
                         ))}
                       </select>
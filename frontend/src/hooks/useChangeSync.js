@@ -0,0 +1,44 @@
+import { useEffect } from 'react';
+import { useQueryClient } from 'react-query';
+
+// Query keys whose cached data is derived from each change-log entity.
+const ENTITY_QUERIES = {
+  companies: ['companies', 'company-options', 'company-details', 'company-stats', 'applications',
+    'dashboard-stats', 'recent-activity'],
+  company_events: ['company-events', 'company-event-summaries', 'recent-activity'],
+  recruiters: ['recruiter-dashboard', 'recruiter-options', 'recruiter', 'applications'],
+  recruiter_events: ['recruiter-events', 'recruiter-event-summaries', 'recruiter-dashboard'],
+  communications: ['recruiter-communications', 'recruiter-dashboard'],
+  applications: ['applications', 'application', 'company-details', 'company-stats', 'dashboard-stats',
+    'recent-activity', 'resume-metrics', 'recruiter-dashboard'],
+  application_events: ['application-timeline', 'application', 'recent-activity'],
+  resume_versions: ['resume-versions', 'resume-version-options', 'resume-metrics', 'recruiter-resume-history'],
+  tags: ['tags', 'resume-tags', 'resume-versions'],
+  resume_tags: ['resume-tags', 'resume-versions'],
+  managers: ['manager-options'],
+  job_postings: ['company-details', 'company-stats'],
+};
+
+// Listens on the /api/events/stream Server-Sent Events channel and
+// invalidates the cached queries affected by each committed write, whether
+// it came from this tab, another tab or the bulk importer. EventSource
+// reconnects on its own and resumes from the last event id it saw.
+const useChangeSync = () => {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const source = new EventSource('/api/events/stream');
+
+    source.addEventListener('invalidate', (event) => {
+      const { changes } = JSON.parse(event.data);
+      const keys = new Set(Object.keys(changes).flatMap(entity => ENTITY_QUERIES[entity] || []));
+      keys.forEach(key => queryClient.invalidateQueries(key));
+    });
+    // Missed more than the server buffers (or history was compacted away)
+    source.addEventListener('reset', () => queryClient.invalidateQueries());
+
+    return () => source.close();
+  }, [queryClient]);
+};
+
+export default useChangeSync;
@@ -0,0 +1,29 @@
+import { useInfiniteQuery } from 'react-query';
+
+// Loads a keyset-paginated list endpoint one page at a time.
+// The backend returns `next_cursor` until the last page; pass it back as `after`.
+const usePaginatedList = (queryKey, url, itemsKey, { pageSize = 50, ...options } = {}) => {
+  const query = useInfiniteQuery(
+    queryKey,
+    ({ pageParam }) => {
+      const params = new URLSearchParams({ limit: pageSize });
+      if (pageParam) {
+        params.set('after', pageParam);
+      }
+      const separator = url.includes('?') ? '&' : '?';
+      return fetch(`${url}${separator}${params}`).then(res => res.json());
+    },
+    {
+      getNextPageParam: (lastPage) => lastPage.next_cursor || undefined,
+      ...options,
+    }
+  );
+
+  const items = query.data
+    ? query.data.pages.flatMap(page => page[itemsKey] || [])
+    : [];
+
+  return { ...query, items };
+};
+
+export default usePaginatedList;
@@ -252,18 +252,24 @@ const ApplicationDetail = () => {
   const navigate = useNavigate();
   const queryClient = useQueryClient();
 
+  // The timeline and attached resume come embedded, so the page renders from one request
   const { data, isLoading, error } = useQuery(
     ['application', id],
-    () => fetch(`/api/applications/${id}`).then(res => res.json())
+    () => fetch(`/api/applications/${id}?expand=timeline,resume`).then(res => res.json()),
+    {
+      onSuccess: (payload) => {
+        if (payload?.application?.timeline) {
+          queryClient.setQueryData(['application-timeline', id], { timeline: payload.application.timeline });
+        }
+      }
+    }
   );
 
   const { data: resumeData } = useQuery(
-    'resume-versions-select',
-    () => fetch('/api/resume-versions').then(res => res.json())
+    'resume-version-options',
+    () => fetch('/api/options/resume-versions').then(res => res.json())
   );
 
-  const resumeVersions = resumeData?.resume_versions || [];
-
   const updateResumeMutation = useMutation(
     async (payload) => {
       const response = await fetch(`/api/applications/${id}/resume`, {
@@ -406,9 +412,7 @@ const ApplicationDetail = () => {
       return [];
     };
 
-    let matchedVersion = resumeVersions.find((version) =>
-      String(version.id) === String(app.resume_version_id)
-    );
+    let matchedVersion = app.resume;
 
     if (!matchedVersion && app.resume_version_id) {
       try {
@@ -1080,9 +1084,9 @@ const ApplicationDetail = () => {
                 disabled={updateResumeMutation.isLoading || removeResumeMutation.isLoading}
               >
                 <option value="">Choose a resume version...</option>
-                {resumeData?.resume_versions?.map((version) => (
+                {resumeData?.options?.map((version) => (
                   <option key={version.id} value={version.id}>
-                    {version.version_name}{version.is_master ? ' (Master)' : ''}
+                    {version.label}{version.is_master ? ' (Master)' : ''}
                   </option>
                 ))}
               </select>
@@ -1,23 +1,51 @@
-import React, { useState } from 'react';
-import { useQuery, useMutation, useQueryClient } from 'react-query';
+import React, { useEffect, useState } from 'react';
+import { useMutation, useQuery, useQueryClient } from 'react-query';
 import { useNavigate } from 'react-router-dom';
 import { Plus, Search, Filter, Briefcase } from 'lucide-react';
 import { format } from 'date-fns';
 import ApplicationForm from '../components/ApplicationForm';
+import usePaginatedList from '../hooks/usePaginatedList';
 
 const Applications = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
   const [showApplicationForm, setShowApplicationForm] = useState(false);
+  const [debouncedSearch, setDebouncedSearch] = useState('');
 
   const navigate = useNavigate();
 
   const queryClient = useQueryClient();
 
-  const { data, isLoading, error } = useQuery(
+  // Filter on the server so search, status and the counters cover every
+  // application, not only the pages loaded so far
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  const filters = { q: debouncedSearch, status: statusFilter === 'all' ? '' : statusFilter };
+  const filterParams = new URLSearchParams(filters).toString();
+
+  const {
+    items: filteredApplications,
+    isLoading,
+    error,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage
+  } = usePaginatedList(
+    ['applications', 'pages', filters],
+    `/api/applications?${filterParams}`,
     'applications',
-    () => fetch('/api/applications').then(res => res.json())
+    { keepPreviousData: true }
+  );
+
+  const { data: statsData } = useQuery(
+    ['applications', 'stats', filters],
+    () => fetch(`/api/applications/stats?${filterParams}`).then(res => res.json()),
+    { keepPreviousData: true }
   );
+  const stats = statsData?.stats;
 
   const createApplicationMutation = useMutation(
     async (applicationData) => {
@@ -50,8 +78,6 @@ const Applications = () => {
   if (isLoading) return <div>Loading applications...</div>;
   if (error) return <div>Error loading applications</div>;
 
-  const applications = data?.applications || [];
-
   const getStatusBadge = (status) => {
     const statusClass = `status-badge status-${status}`;
     return <span className={statusClass}>{status.replace('_', ' ')}</span>;
@@ -63,14 +89,6 @@ const Applications = () => {
     return diffDays;
   };
 
-  const filteredApplications = applications.filter(app => {
-    const matchesSearch =
-      app.company_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      app.position_title.toLowerCase().includes(searchTerm.toLowerCase());
-    const matchesStatus = statusFilter === 'all' || app.status === statusFilter;
-    return matchesSearch && matchesStatus;
-  });
-
   const statuses = ['all', 'applied', 'phone_screen', 'interview', 'offer', 'rejected'];
 
   return (
@@ -202,7 +220,7 @@ const Applications = () => {
                         <div style={{ fontWeight: '500', color: '#1f2937' }}>
                           {app.position_title}
                         </div>
-                      {app.job_posting_text && (
+                      {app.job_posting_excerpt && (
                         <div style={{
                           fontSize: '12px',
                           color: '#6b7280',
@@ -213,9 +231,9 @@ const Applications = () => {
                           whiteSpace: 'nowrap',
                           cursor: 'pointer'
                         }}
-                        title={app.job_posting_text.substring(0, 500) + '...'}
+                        title={app.job_posting_excerpt + '...'}
                         >
-                          📄 {app.job_posting_text.substring(0, 80)}...
+                          📄 {app.job_posting_excerpt.substring(0, 80)}...
                         </div>
                       )}
                       {app.salary_min && app.salary_max && (
@@ -254,6 +272,17 @@ const Applications = () => {
                 })}
               </tbody>
             </table>
+            {hasNextPage && (
+              <div style={{ textAlign: 'center', padding: '16px' }}>
+                <button
+                  className="btn btn-secondary"
+                  onClick={() => fetchNextPage()}
+                  disabled={isFetchingNextPage}
+                >
+                  {isFetchingNextPage ? 'Loading...' : 'Load more applications'}
+                </button>
+              </div>
+            )}
           </div>
         ) : (
           <div style={{
@@ -286,12 +315,12 @@ const Applications = () => {
       </div>
 
       {/* Summary Stats */}
-      {filteredApplications.length > 0 && (
+      {stats && stats.total_applications > 0 && (
         <div className="card" style={{ marginTop: '24px' }}>
           <div className="grid grid-4">
             <div style={{ textAlign: 'center' }}>
               <div style={{ fontSize: '24px', fontWeight: '700', color: '#1f2937' }}>
-                {filteredApplications.length}
+                {stats.total_applications}
               </div>
               <div style={{ fontSize: '14px', color: '#6b7280' }}>
                 Total Applications
@@ -299,9 +328,7 @@ const Applications = () => {
             </div>
             <div style={{ textAlign: 'center' }}>
               <div style={{ fontSize: '24px', fontWeight: '700', color: '#10b981' }}>
-                {filteredApplications.filter(app =>
-                  ['phone_screen', 'interview', 'offer'].includes(app.status)
-                ).length}
+                {stats.interviews}
               </div>
               <div style={{ fontSize: '14px', color: '#6b7280' }}>
                 Interviews
@@ -309,7 +336,7 @@ const Applications = () => {
             </div>
             <div style={{ textAlign: 'center' }}>
               <div style={{ fontSize: '24px', fontWeight: '700', color: '#f59e0b' }}>
-                {filteredApplications.filter(app => app.status === 'offer').length}
+                {stats.offers}
               </div>
               <div style={{ fontSize: '14px', color: '#6b7280' }}>
                 Offers
@@ -317,11 +344,7 @@ const Applications = () => {
             </div>
             <div style={{ textAlign: 'center' }}>
               <div style={{ fontSize: '24px', fontWeight: '700', color: '#3b82f6' }}>
-                {Math.round(
-                  (filteredApplications.filter(app =>
-                    ['phone_screen', 'interview', 'offer'].includes(app.status)
-                  ).length / filteredApplications.length) * 100
-                ) || 0}%
+                {Math.round(stats.interview_rate)}%
               </div>
               <div style={{ fontSize: '14px', color: '#6b7280' }}>
                 Success Rate
@@ -36,6 +36,16 @@ const Companies = () => {
 
   const queryClient = useQueryClient();
 
+  // Event summaries for every card, in one request
+  const { data: eventSummaryData, isLoading: eventSummariesLoading } = useQuery(
+    'company-event-summaries',
+    () => fetch('/api/companies/event-summaries').then(res => res.json()),
+    { staleTime: 1000 * 60 * 5 }
+  );
+  const eventSummaries = Object.fromEntries(
+    (eventSummaryData?.summaries || []).map(summary => [summary.company_id, summary])
+  );
+
   const { data, isLoading, error } = useQuery(
     'companies',
     () => fetch('/api/companies').then(res => res.json())
@@ -409,7 +419,10 @@ const Companies = () => {
                 </div>
               </div>
 
-              <CompanyEventSummary companyId={company.id} />
+              <CompanyEventSummary
+                summary={eventSummaries[company.id]}
+                isLoading={eventSummariesLoading}
+              />
 
               {company.notes && (
                 <div style={{
@@ -28,24 +28,10 @@ const CompanyDetail = () => {
   const { id } = useParams();
   const [activeTab, setActiveTab] = useState('overview');
 
-  // Fetch company details
+  // Fetch company details with its job postings and applications embedded
   const { data: companyData, isLoading: companyLoading } = useQuery(
     ['company-details', id],
-    () => fetch(`/api/companies/${id}/details`).then(res => res.json())
-  );
-
-  // Fetch company job postings
-  const { data: jobsData } = useQuery(
-    ['company-jobs', id],
-    () => fetch(`/api/companies/${id}/jobs`).then(res => res.json()),
-    { enabled: !!id }
-  );
-
-  // Fetch company applications
-  const { data: applicationsData } = useQuery(
-    ['company-applications', id],
-    () => fetch(`/api/companies/${id}/applications`).then(res => res.json()),
-    { enabled: !!id }
+    () => fetch(`/api/companies/${id}/details?expand=job_postings,applications`).then(res => res.json())
   );
 
   // Fetch company stats
@@ -58,8 +44,8 @@ const CompanyDetail = () => {
   if (companyLoading) return <div>Loading company details...</div>;
 
   const company = companyData?.company;
-  const jobs = jobsData?.job_postings || [];
-  const applications = applicationsData?.applications || [];
+  const jobs = company?.job_postings || [];
+  const applications = company?.applications || [];
   const stats = statsData?.stats || {};
 
   if (!company) return <div>Company not found</div>;
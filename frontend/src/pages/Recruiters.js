@@ -32,6 +32,16 @@ const Recruiters = () => {
 
   const queryClient = useQueryClient();
 
+  // Event summaries for every card, in one request
+  const { data: eventSummaryData, isLoading: eventSummariesLoading } = useQuery(
+    'recruiter-event-summaries',
+    () => fetch('/api/recruiters/event-summaries').then(res => res.json()),
+    { staleTime: 1000 * 60 * 5 }
+  );
+  const eventSummaries = Object.fromEntries(
+    (eventSummaryData?.summaries || []).map(summary => [summary.recruiter_id, summary])
+  );
+
   const { data, isLoading, error } = useQuery(
     'recruiter-dashboard',
     () => fetch('/api/recruiters/dashboard').then(res => res.json())
@@ -413,7 +423,10 @@ const Recruiters = () => {
                 </div>
               </div>
 
-              <RecruiterEventSummary recruiterId={recruiter.id} />
+              <RecruiterEventSummary
+                summary={eventSummaries[recruiter.id]}
+                isLoading={eventSummariesLoading}
+              />
 
               {/* Contact Information */}
               <div style={{
@@ -545,7 +558,7 @@ const Recruiters = () => {
               )}
 
               {/* Recent Applications */}
-              {recruiter.recent_applications && recruiter.recent_applications.trim() && (
+              {recruiter.recent_applications && recruiter.recent_applications.length > 0 && (
                 <div style={{
                   background: '#f0fdf4',
                   padding: '12px',
@@ -569,11 +582,17 @@ const Recruiters = () => {
                     </span>
                   </div>
                   <div style={{ fontSize: '14px', color: '#166534', lineHeight: '1.4' }}>
-                    {recruiter.recent_applications.split('; ').filter(app => app.trim()).map((application, index) => {
-                      const [company, position, date, status] = application.split('|');
+                    {recruiter.recent_applications.map((application) => {
+                      const {
+                        id,
+                        company_name: company,
+                        position_title: position,
+                        application_date: date,
+                        status
+                      } = application;
                       if (!company || !position) return null;
                       return (
-                        <div key={index} style={{ marginBottom: '4px' }}>
+                        <div key={id} style={{ marginBottom: '4px' }}>
                           <strong>{position}</strong> at <strong>{company}</strong>
                           {date && (
                             <span style={{ color: '#6b7280', marginLeft: '8px' }}>
@@ -0,0 +1,45 @@
+// Client for POST /api/batch, which runs several API requests in one round
+// trip against a single database snapshot.
+
+// Runs `requests` ([{ method, path, body }]) and resolves to their
+// [{ status, body }] responses, in order.
+export const batch = async (requests) => {
+  const response = await fetch('/api/batch', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ requests }),
+  });
+  if (!response.ok) {
+    throw new Error('Batch request failed');
+  }
+  const data = await response.json();
+  return data.responses;
+};
+
+let pending = [];
+
+const flush = async () => {
+  const queued = pending;
+  pending = [];
+  if (queued.length === 1) {
+    const [{ path, resolve, reject }] = queued;
+    fetch(path).then(res => res.json()).then(resolve, reject);
+    return;
+  }
+  try {
+    const responses = await batch(queued.map(({ path }) => ({ method: 'GET', path })));
+    responses.forEach((response, index) => queued[index].resolve(response.body));
+  } catch (error) {
+    queued.forEach(({ reject }) => reject(error));
+  }
+};
+
+// GETs `path` and resolves to its JSON body. GETs issued in the same tick
+// (e.g. by the queries a form runs on mount) go out as a single batch.
+export const batchedGet = (path) =>
+  new Promise((resolve, reject) => {
+    if (pending.length === 0) {
+      setTimeout(flush, 0);
+    }
+    pending.push({ path, resolve, reject });
+  });
@@ -6,12 +6,7 @@ Currently stubbed with test data - will use real S3 when bucket is configured
 """
 
 import os
-import boto3
-from botocore.exceptions import (
-    ClientError,
-    EndpointConnectionError,
-    NoCredentialsError,
-)
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
@@ -21,35 +16,59 @@ from datetime import datetime
 load_dotenv()
 
 class S3Helper:
-    def __init__(self):
-        """Initialize S3 client with configuration from environment"""
+    def __init__(self, verify: bool = True):
+        """Read S3 configuration from the environment.
+
+        boto3 is imported and the client built on first use. With ``verify``
+        the bucket is checked right away (a blocking network call); the
+        server passes ``verify=False`` and calls ``start_background_check()``
+        so an unreachable endpoint can't hold up startup.
+        """
         self.bucket_name = os.getenv('S3_BUCKET_NAME', 'your-resume-runner-bucket')
         self.aws_region = os.getenv('AWS_REGION', 'us-east-1')
         self.environment = os.getenv('ENVIRONMENT', 'dev')  # dev, test, production
         self.is_stubbed = self.bucket_name == 'your-resume-runner-bucket'
+        self.checked = self.is_stubbed
+        self._client = None
+        self._client_lock = threading.Lock()
 
         # Set S3 path prefix based on environment
         self.s3_prefix = f"{self.environment}/"
 
-        if not self.is_stubbed:
-            try:
-                self.s3_client = boto3.client(
+        if self.is_stubbed:
+            print("📝 S3Helper running in stubbed mode - update .env with real bucket name")
+            print(f"ℹ️  S3Helper active in STUB mode [{self.environment}] – uploads will be simulated locally")
+        elif verify:
+            self.verify()
+
+    @property
+    def s3_client(self):
+        """The boto3 S3 client, built (and boto3 imported) on first use"""
+        with self._client_lock:
+            if self._client is None:
+                import boto3
+                self._client = boto3.client(
                     's3',
                     region_name=self.aws_region,
                     aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
                     aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
                 )
-                self._verify_bucket_access()
-            except (NoCredentialsError, ClientError, EndpointConnectionError) as e:
-                print(f"⚠️  S3 configuration issue detected: {e}")
-                print("   Falling back to stubbed S3 mode for development")
-                self.is_stubbed = True
-            except Exception as e:
-                print(f"❌ Unexpected error while configuring S3: {e}")
-                print("   Falling back to stubbed S3 mode for development")
-                self.is_stubbed = True
-        else:
-            print("📝 S3Helper running in stubbed mode - update .env with real bucket name")
+            return self._client
+
+    def verify(self):
+        """Check the bucket is reachable, falling back to stub mode when it isn't"""
+        from botocore.exceptions import ClientError, EndpointConnectionError, NoCredentialsError
+        try:
+            self._verify_bucket_access()
+        except (NoCredentialsError, ClientError, EndpointConnectionError) as e:
+            print(f"⚠️  S3 configuration issue detected: {e}")
+            print("   Falling back to stubbed S3 mode for development")
+            self.is_stubbed = True
+        except Exception as e:
+            print(f"❌ Unexpected error while configuring S3: {e}")
+            print("   Falling back to stubbed S3 mode for development")
+            self.is_stubbed = True
+        self.checked = True
 
         # Surface final operating mode for clarity in logs
         if self.is_stubbed:
@@ -57,8 +76,25 @@ class S3Helper:
         else:
             print(f"ℹ️  S3Helper connected to bucket '{self.bucket_name}' in region '{self.aws_region}' [{self.environment}]")
 
+    def start_background_check(self) -> Optional[threading.Thread]:
+        """Run ``verify()`` on a daemon thread unless it has already run"""
+        if self.checked:
+            return None
+        thread = threading.Thread(target=self.verify, name='s3-bucket-check', daemon=True)
+        thread.start()
+        return thread
+
+    def after_fork(self):
+        """Drop the client in a forked worker process; boto3 clients and their
+        connection pools must not be shared across processes"""
+        self._client = None
+        self._client_lock = threading.Lock()
+        # A check still running in the parent never finishes here
+        self.start_background_check()
+
     def _verify_bucket_access(self):
         """Verify we can access the S3 bucket"""
+        from botocore.exceptions import ClientError, EndpointConnectionError
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
             print(f"✅ S3 bucket '{self.bucket_name}' is accessible")
@@ -330,5 +366,5 @@ class S3Helper:
             'bucket_name': self.bucket_name,
             'region': self.aws_region,
             'is_stubbed': self.is_stubbed,
-            'status': 'stubbed' if self.is_stubbed else 'active'
+            'status': 'stubbed' if self.is_stubbed else 'active' if self.checked else 'checking'
         }
@@ -0,0 +1,238 @@
+-- Change data capture. Triggers on the base tables append a row to
+-- change_log for every insert, update and delete, so a client (or another
+-- process) can ask what changed after the last sequence number it saw and
+-- apply just those rows. seq is AUTOINCREMENT, so it only ever grows, even
+-- after old rows are deleted. Compaction keeps only the newest row per
+-- entity; retention drops rows older than a cutoff and raises
+-- change_log_state.floor, the lowest seq a client can still resume from.
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    operation TEXT NOT NULL CHECK (operation IN ('insert', 'update', 'delete')),
+    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_change_log_entity ON change_log(entity, entity_id, seq);
+CREATE INDEX IF NOT EXISTS idx_change_log_changed_at ON change_log(changed_at);
+
+CREATE TABLE IF NOT EXISTS change_log_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    floor INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO change_log_state (id, floor) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_companies_change_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('companies', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_companies_change_update
+AFTER UPDATE ON companies
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('companies', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_companies_change_delete
+AFTER DELETE ON companies
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('companies', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_versions_change_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_versions', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_versions_change_update
+AFTER UPDATE ON resume_versions
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_versions', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_versions_change_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_versions', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiters_change_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiters', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiters_change_update
+AFTER UPDATE ON recruiters
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiters', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiters_change_delete
+AFTER DELETE ON recruiters
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiters', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_postings_change_insert
+AFTER INSERT ON job_postings
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('job_postings', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_postings_change_update
+AFTER UPDATE ON job_postings
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('job_postings', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_postings_change_delete
+AFTER DELETE ON job_postings
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('job_postings', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_applications_change_insert
+AFTER INSERT ON applications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('applications', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_applications_change_update
+AFTER UPDATE ON applications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('applications', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_applications_change_delete
+AFTER DELETE ON applications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('applications', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_communications_change_insert
+AFTER INSERT ON communications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('communications', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_communications_change_update
+AFTER UPDATE ON communications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('communications', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_communications_change_delete
+AFTER DELETE ON communications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('communications', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_application_events_change_insert
+AFTER INSERT ON application_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('application_events', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_application_events_change_update
+AFTER UPDATE ON application_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('application_events', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_application_events_change_delete
+AFTER DELETE ON application_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('application_events', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_change_insert
+AFTER INSERT ON tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('tags', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_change_update
+AFTER UPDATE ON tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('tags', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_change_delete
+AFTER DELETE ON tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('tags', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_tags_change_insert
+AFTER INSERT ON resume_tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_tags', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_tags_change_update
+AFTER UPDATE ON resume_tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_tags', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_tags_change_delete
+AFTER DELETE ON resume_tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_tags', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_managers_change_insert
+AFTER INSERT ON managers
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('managers', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_managers_change_update
+AFTER UPDATE ON managers
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('managers', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_managers_change_delete
+AFTER DELETE ON managers
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('managers', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_events_change_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiter_events', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_events_change_update
+AFTER UPDATE ON recruiter_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiter_events', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_events_change_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiter_events', OLD.id, 'delete');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_events_change_insert
+AFTER INSERT ON company_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('company_events', NEW.id, 'insert');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_events_change_update
+AFTER UPDATE ON company_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('company_events', NEW.id, 'update');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_events_change_delete
+AFTER DELETE ON company_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('company_events', OLD.id, 'delete');
+END;
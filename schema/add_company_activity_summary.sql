@@ -0,0 +1,169 @@
+-- Per-company hiring activity, kept current by triggers.
+-- Replaces the company_activity aggregate, which joined job_postings and
+-- applications onto companies together and so counted their cross product.
+-- Averages are stored as total/count pairs so they can be maintained by deltas.
+CREATE TABLE IF NOT EXISTS company_activity_summary (
+    company_id INTEGER PRIMARY KEY,
+    total_jobs_posted INTEGER NOT NULL DEFAULT 0,
+    applications_sent INTEGER NOT NULL DEFAULT 0,
+    last_job_posted DATE,
+    salary_min_total INTEGER NOT NULL DEFAULT 0,
+    salary_min_count INTEGER NOT NULL DEFAULT 0,
+    salary_max_total INTEGER NOT NULL DEFAULT 0,
+    salary_max_count INTEGER NOT NULL DEFAULT 0,
+    remote_jobs INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_company_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_company_delete
+AFTER DELETE ON companies
+BEGIN
+    DELETE FROM company_activity_summary WHERE company_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_job_insert
+AFTER INSERT ON job_postings
+BEGIN
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.company_id);
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted + 1,
+        last_job_posted = CASE
+            WHEN last_job_posted IS NULL OR NEW.date_posted > last_job_posted THEN NEW.date_posted
+            ELSE last_job_posted END,
+        salary_min_total = salary_min_total + COALESCE(NEW.salary_min, 0),
+        salary_min_count = salary_min_count + (NEW.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total + COALESCE(NEW.salary_max, 0),
+        salary_max_count = salary_max_count + (NEW.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs + (NEW.is_remote = 1)
+    WHERE company_id = NEW.company_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_job_delete
+AFTER DELETE ON job_postings
+BEGIN
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted - 1,
+        last_job_posted = (SELECT MAX(date_posted) FROM job_postings WHERE company_id = OLD.company_id),
+        salary_min_total = salary_min_total - COALESCE(OLD.salary_min, 0),
+        salary_min_count = salary_min_count - (OLD.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total - COALESCE(OLD.salary_max, 0),
+        salary_max_count = salary_max_count - (OLD.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs - (OLD.is_remote = 1)
+    WHERE company_id = OLD.company_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_job_update
+AFTER UPDATE OF company_id, date_posted, salary_min, salary_max, is_remote ON job_postings
+BEGIN
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted - 1,
+        salary_min_total = salary_min_total - COALESCE(OLD.salary_min, 0),
+        salary_min_count = salary_min_count - (OLD.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total - COALESCE(OLD.salary_max, 0),
+        salary_max_count = salary_max_count - (OLD.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs - (OLD.is_remote = 1)
+    WHERE company_id = OLD.company_id;
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.company_id);
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted + 1,
+        salary_min_total = salary_min_total + COALESCE(NEW.salary_min, 0),
+        salary_min_count = salary_min_count + (NEW.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total + COALESCE(NEW.salary_max, 0),
+        salary_max_count = salary_max_count + (NEW.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs + (NEW.is_remote = 1)
+    WHERE company_id = NEW.company_id;
+    UPDATE company_activity_summary
+    SET last_job_posted = (SELECT MAX(date_posted) FROM job_postings WHERE company_id = company_activity_summary.company_id)
+    WHERE company_id IN (OLD.company_id, NEW.company_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_application_insert
+AFTER INSERT ON applications
+WHEN NEW.company_id IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.company_id);
+    UPDATE company_activity_summary SET applications_sent = applications_sent + 1
+    WHERE company_id = NEW.company_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_application_delete
+AFTER DELETE ON applications
+WHEN OLD.company_id IS NOT NULL
+BEGIN
+    UPDATE company_activity_summary SET applications_sent = applications_sent - 1
+    WHERE company_id = OLD.company_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_activity_application_update
+AFTER UPDATE OF company_id ON applications
+WHEN OLD.company_id IS NOT NEW.company_id
+BEGIN
+    UPDATE company_activity_summary SET applications_sent = applications_sent - 1
+    WHERE company_id = OLD.company_id;
+    INSERT OR IGNORE INTO company_activity_summary (company_id)
+    SELECT NEW.company_id WHERE NEW.company_id IS NOT NULL;
+    UPDATE company_activity_summary SET applications_sent = applications_sent + 1
+    WHERE company_id = NEW.company_id;
+END;
+
+-- Backfill (and repair) from the base tables
+DELETE FROM company_activity_summary;
+INSERT INTO company_activity_summary (
+    company_id, total_jobs_posted, applications_sent, last_job_posted,
+    salary_min_total, salary_min_count, salary_max_total, salary_max_count, remote_jobs
+)
+SELECT
+    c.id,
+    COALESCE(jp.total_jobs_posted, 0),
+    COALESCE(a.applications_sent, 0),
+    jp.last_job_posted,
+    COALESCE(jp.salary_min_total, 0),
+    COALESCE(jp.salary_min_count, 0),
+    COALESCE(jp.salary_max_total, 0),
+    COALESCE(jp.salary_max_count, 0),
+    COALESCE(jp.remote_jobs, 0)
+FROM companies c
+LEFT JOIN (
+    SELECT company_id,
+           COUNT(*) AS total_jobs_posted,
+           MAX(date_posted) AS last_job_posted,
+           TOTAL(salary_min) AS salary_min_total,
+           COUNT(salary_min) AS salary_min_count,
+           TOTAL(salary_max) AS salary_max_total,
+           COUNT(salary_max) AS salary_max_count,
+           SUM(is_remote = 1) AS remote_jobs
+    FROM job_postings
+    GROUP BY company_id
+) jp ON jp.company_id = c.id
+LEFT JOIN (
+    SELECT company_id, COUNT(*) AS applications_sent
+    FROM applications
+    GROUP BY company_id
+) a ON a.company_id = c.id;
+
+DROP VIEW IF EXISTS company_activity;
+CREATE VIEW company_activity AS
+SELECT
+    c.id,
+    c.name,
+    c.website,
+    c.industry,
+    c.company_size,
+    c.headquarters,
+    c.is_remote_friendly,
+    c.updated_at,
+    c.notes,
+    c.linkedin_url,
+    COALESCE(s.total_jobs_posted, 0) as total_jobs_posted,
+    COALESCE(s.applications_sent, 0) as applications_sent,
+    s.last_job_posted,
+    CAST(s.salary_min_total AS REAL) / NULLIF(s.salary_min_count, 0) as avg_salary_min,
+    CAST(s.salary_max_total AS REAL) / NULLIF(s.salary_max_count, 0) as avg_salary_max,
+    COALESCE(s.remote_jobs, 0) as remote_jobs
+FROM companies c
+LEFT JOIN company_activity_summary s ON s.company_id = c.id;
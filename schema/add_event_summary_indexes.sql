@@ -0,0 +1,7 @@
+-- Timeline order for company and recruiter events, per entity.
+-- Event summaries rank each entity's events in this order with a window
+-- function; with the index SQLite walks it instead of sorting the events.
+CREATE INDEX IF NOT EXISTS idx_company_events_company_recent
+    ON company_events(company_id, event_date DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_recruiter_events_recruiter_recent
+    ON recruiter_events(recruiter_id, event_date DESC, created_at DESC);
@@ -0,0 +1,91 @@
+-- Bulk import guard. While ResumeRunnerDB.bulk_import() inserts a chunk of
+-- applications it holds the write lock and puts 'applications' in
+-- import_guard; the per-row AFTER INSERT triggers on applications skip
+-- themselves while it is there, and the import applies the same changes to
+-- the whole chunk in one set-based pass (IMPORT_ENTITIES['applications']
+-- ['deferred'] in database/db_helper.py) before clearing the guard in the
+-- same transaction. No other connection ever sees a guard row.
+CREATE TABLE IF NOT EXISTS import_guard (
+    table_name TEXT PRIMARY KEY
+);
+
+DROP TRIGGER IF EXISTS trg_applications_version_insert;
+CREATE TRIGGER trg_applications_version_insert
+AFTER INSERT ON applications
+WHEN NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications';
+END;
+
+DROP TRIGGER IF EXISTS trg_applications_change_insert;
+CREATE TRIGGER trg_applications_change_insert
+AFTER INSERT ON applications
+WHEN NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('applications', NEW.id, 'insert');
+END;
+
+DROP TRIGGER IF EXISTS trg_search_application_insert;
+CREATE TRIGGER trg_search_application_insert
+AFTER INSERT ON applications
+WHEN NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application' AND entity_id = NEW.id;
+END;
+
+DROP TRIGGER IF EXISTS trg_company_activity_application_insert;
+CREATE TRIGGER trg_company_activity_application_insert
+AFTER INSERT ON applications
+WHEN NEW.company_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.company_id);
+    UPDATE company_activity_summary SET applications_sent = applications_sent + 1
+    WHERE company_id = NEW.company_id;
+END;
+
+DROP TRIGGER IF EXISTS trg_resume_success_application_insert;
+CREATE TRIGGER trg_resume_success_application_insert
+AFTER INSERT ON applications
+WHEN NEW.resume_version_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR IGNORE INTO resume_success_summary (resume_version_id) VALUES (NEW.resume_version_id);
+    UPDATE resume_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer')
+    WHERE resume_version_id = NEW.resume_version_id;
+    UPDATE resume_versions SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM resume_success_summary WHERE resume_version_id = NEW.resume_version_id
+    ) WHERE id = NEW.resume_version_id;
+END;
+
+DROP TRIGGER IF EXISTS trg_recruiter_success_application_insert;
+CREATE TRIGGER trg_recruiter_success_application_insert
+AFTER INSERT ON applications
+WHEN NEW.recruiter_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR IGNORE INTO recruiter_success_summary (recruiter_id) VALUES (NEW.recruiter_id);
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer'),
+        last_application_date = CASE
+            WHEN last_application_date IS NULL OR NEW.application_date > last_application_date
+            THEN NEW.application_date ELSE last_application_date END
+    WHERE recruiter_id = NEW.recruiter_id;
+    UPDATE recruiters SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM recruiter_success_summary WHERE recruiter_id = NEW.recruiter_id
+    ) WHERE id = NEW.recruiter_id;
+END;
+
+DROP TRIGGER IF EXISTS trg_recruiter_dashboard_application_insert;
+CREATE TRIGGER trg_recruiter_dashboard_application_insert
+AFTER INSERT ON applications
+WHEN NEW.recruiter_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.recruiter_id;
+END;
@@ -0,0 +1,156 @@
+-- Trigram index over company, recruiter and manager names.
+-- name_index is an FTS5 trigram table, so MATCHing a few trigrams of a query
+-- narrows lookups to a handful of names. name_trigram_counts records how many
+-- names contain each (lowercased) trigram, which tells a lookup which of its
+-- trigrams are rarest, and that a trigram no name has rules out a substring
+-- match without touching the index. name_documents renders every indexed
+-- name; doc_id packs the row id and a per-kind code (id * 4 + code) so
+-- triggers can find a name by rowid.
+DROP VIEW IF EXISTS name_documents;
+CREATE VIEW name_documents AS
+SELECT id * 4 + 1 AS doc_id, 'company' AS kind, id AS entity_id, name
+FROM companies
+UNION ALL
+SELECT id * 4 + 2, 'recruiter', id, name
+FROM recruiters
+UNION ALL
+SELECT id * 4 + 3, 'manager', id, name
+FROM managers;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS name_index USING fts5(
+    kind UNINDEXED,
+    entity_id UNINDEXED,
+    name,
+    tokenize = 'trigram'
+);
+
+CREATE TABLE IF NOT EXISTS name_trigram_counts (
+    trigram TEXT PRIMARY KEY,
+    names INTEGER NOT NULL
+) WITHOUT ROWID;
+
+-- Character offsets for splitting a name into trigrams inside triggers
+CREATE TABLE IF NOT EXISTS name_trigram_offsets (n INTEGER PRIMARY KEY);
+INSERT OR IGNORE INTO name_trigram_offsets (n)
+WITH RECURSIVE offsets(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM offsets WHERE n < 500)
+SELECT n FROM offsets;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_company_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 1, 'company', NEW.id, NEW.name);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_company_update
+AFTER UPDATE OF name ON companies
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 1;
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 1, 'company', NEW.id, NEW.name);
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_company_delete
+AFTER DELETE ON companies
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 1;
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 2, 'recruiter', NEW.id, NEW.name);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_recruiter_update
+AFTER UPDATE OF name ON recruiters
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 2;
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 2, 'recruiter', NEW.id, NEW.name);
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 2;
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_manager_insert
+AFTER INSERT ON managers
+BEGIN
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 3, 'manager', NEW.id, NEW.name);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_manager_update
+AFTER UPDATE OF name ON managers
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 3;
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 3, 'manager', NEW.id, NEW.name);
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_name_manager_delete
+AFTER DELETE ON managers
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 3;
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+END;
+
+-- Backfill (and repair)
+DELETE FROM name_index;
+INSERT INTO name_index (rowid, kind, entity_id, name)
+SELECT * FROM name_documents;
+
+DELETE FROM name_trigram_counts;
+INSERT INTO name_trigram_counts (trigram, names)
+SELECT substr(lower(d.name), o.n, 3), COUNT(DISTINCT d.doc_id)
+FROM name_documents d
+JOIN name_trigram_offsets o ON o.n <= length(d.name) - 2
+GROUP BY 1;
@@ -0,0 +1,11 @@
+-- Covering indexes for the dropdown option lists (/api/options/*).
+-- Each holds the label in case-insensitive order followed by the few columns
+-- an option carries, so a list (or a prefix range of it) is read from the
+-- index alone, already sorted.
+CREATE INDEX IF NOT EXISTS idx_companies_name_options ON companies(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_recruiters_name_options ON recruiters(name COLLATE NOCASE, company);
+CREATE INDEX IF NOT EXISTS idx_resume_versions_name_options
+    ON resume_versions(version_name COLLATE NOCASE, is_master, created_at);
+CREATE INDEX IF NOT EXISTS idx_managers_name_options
+    ON managers(name COLLATE NOCASE, position_title, company_id);
+CREATE INDEX IF NOT EXISTS idx_tags_name_options ON tags(name COLLATE NOCASE, color);
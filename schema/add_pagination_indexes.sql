@@ -0,0 +1,10 @@
+-- Keyset pagination sort keys for the list endpoints.
+-- Every index already carries the rowid, which breaks ties between equal keys.
+CREATE INDEX IF NOT EXISTS idx_applications_active_date ON applications(application_date)
+    WHERE status NOT IN ('rejected', 'withdrawn', 'offer');
+CREATE INDEX IF NOT EXISTS idx_recruiters_contact_order ON recruiters(COALESCE(last_contact_date, ''));
+CREATE INDEX IF NOT EXISTS idx_job_postings_date_order ON job_postings(COALESCE(date_posted, ''));
+CREATE INDEX IF NOT EXISTS idx_job_postings_company_date_order ON job_postings(company_id, COALESCE(date_posted, ''));
+CREATE INDEX IF NOT EXISTS idx_resume_versions_created_order ON resume_versions(COALESCE(created_at, ''));
+CREATE INDEX IF NOT EXISTS idx_managers_name ON managers(name);
+CREATE INDEX IF NOT EXISTS idx_managers_company_name ON managers(company_id, name);
@@ -0,0 +1,153 @@
+-- Materialized recruiter dashboard.
+-- recruiter_dashboard_source computes the per-recruiter dashboard fields:
+-- the 5 most recent applications as a JSON array, the latest timeline event,
+-- and last_communication (the later of last_contact_date and that event).
+-- recruiter_dashboard_summary stores it. Triggers refresh one recruiter's row
+-- whenever its applications, events or contact date change. Every lookup goes
+-- through an index, so a refresh costs the same however long the history is.
+CREATE INDEX IF NOT EXISTS idx_recruiter_events_recruiter_date ON recruiter_events(recruiter_id, event_date);
+
+DROP VIEW IF EXISTS recruiter_dashboard_source;
+CREATE VIEW recruiter_dashboard_source AS
+SELECT
+    r.id AS recruiter_id,
+    (
+        SELECT json_group_array(json_object(
+            'id', recent.id,
+            'company_id', recent.company_id,
+            'company_name', recent.company_name,
+            'position_title', recent.position_title,
+            'application_date', recent.application_date,
+            'status', recent.status
+        ))
+        FROM (
+            SELECT a.id, a.company_id, c.name AS company_name, a.position_title,
+                   a.application_date, a.status
+            FROM applications a
+            LEFT JOIN companies c ON c.id = a.company_id
+            WHERE a.recruiter_id = r.id
+            ORDER BY a.application_date DESC, a.id DESC
+            LIMIT 5
+        ) recent
+    ) AS recent_applications,
+    (SELECT MAX(event_date) FROM recruiter_events WHERE recruiter_id = r.id) AS last_event_date,
+    NULLIF(MAX(
+        COALESCE(r.last_contact_date, ''),
+        COALESCE((SELECT MAX(event_date) FROM recruiter_events WHERE recruiter_id = r.id), '')
+    ), '') AS last_communication
+FROM recruiters r;
+
+CREATE TABLE IF NOT EXISTS recruiter_dashboard_summary (
+    recruiter_id INTEGER PRIMARY KEY,
+    recent_applications TEXT NOT NULL DEFAULT '[]',
+    last_event_date DATE,
+    last_communication DATE
+);
+
+CREATE INDEX IF NOT EXISTS idx_recruiter_dashboard_summary_communication
+    ON recruiter_dashboard_summary(last_communication);
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_recruiter_update
+AFTER UPDATE OF last_contact_date ON recruiters
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM recruiter_dashboard_summary WHERE recruiter_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_application_insert
+AFTER INSERT ON applications
+WHEN NEW.recruiter_id IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.recruiter_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_application_delete
+AFTER DELETE ON applications
+WHEN OLD.recruiter_id IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = OLD.recruiter_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_application_update
+AFTER UPDATE OF recruiter_id, company_id, position_title, application_date, status ON applications
+WHEN OLD.recruiter_id IS NOT NULL OR NEW.recruiter_id IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id IN (OLD.recruiter_id, NEW.recruiter_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_company_update
+AFTER UPDATE OF name ON companies
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source
+    WHERE recruiter_id IN (SELECT recruiter_id FROM applications WHERE company_id = NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_event_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.recruiter_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_event_update
+AFTER UPDATE OF recruiter_id, event_date ON recruiter_events
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id IN (OLD.recruiter_id, NEW.recruiter_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_dashboard_event_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = OLD.recruiter_id;
+END;
+
+-- Backfill (and repair)
+DELETE FROM recruiter_dashboard_summary;
+INSERT INTO recruiter_dashboard_summary SELECT * FROM recruiter_dashboard_source;
+
+DROP VIEW IF EXISTS recruiter_dashboard;
+CREATE VIEW recruiter_dashboard AS
+SELECT
+    r.id,
+    r.name,
+    r.primary_contact_name,
+    r.email,
+    r.phone,
+    r.company,
+    r.linkedin_url,
+    r.specialties,
+    r.current_resume_version_id,
+    r.last_contact_date,
+    r.relationship_status,
+    r.success_rate,
+    r.notes,
+    r.is_starred,
+    r.created_at,
+    r.updated_at,
+    COALESCE(s.total_applications, 0) as total_applications,
+    COALESCE(s.interviews, 0) as successful_applications,
+    s.last_application_date,
+    d.last_communication,
+    d.recent_applications
+FROM recruiter_dashboard_summary d
+JOIN recruiters r ON r.id = d.recruiter_id
+LEFT JOIN recruiter_success_summary s ON s.recruiter_id = r.id;
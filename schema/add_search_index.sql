@@ -0,0 +1,219 @@
+-- Full-text search over resumes, applications, job postings and notes.
+-- search_documents renders every searchable row as (doc_id, kind, entity_id,
+-- parent_id, title, body); search_index is an FTS5 index over it, kept
+-- current by triggers on the base tables. doc_id packs the row id and a
+-- per-kind code (id * 16 + code) so a trigger can find its document by rowid.
+-- parent_id is the company, recruiter or application a document belongs to.
+DROP VIEW IF EXISTS search_documents;
+CREATE VIEW search_documents AS
+SELECT id * 16 + 1 AS doc_id, 'resume' AS kind, id AS entity_id, NULL AS parent_id,
+       version_name AS title, content_text AS body
+FROM resume_versions
+UNION ALL
+SELECT id * 16 + 2, 'application', id, company_id,
+       position_title, trim(COALESCE(job_posting_text, '') || char(10) || COALESCE(outcome_notes, ''), char(10))
+FROM applications
+UNION ALL
+SELECT id * 16 + 3, 'job_posting', id, company_id, title, description
+FROM job_postings
+UNION ALL
+SELECT id * 16 + 4, 'company', id, NULL, name, notes
+FROM companies
+UNION ALL
+SELECT id * 16 + 5, 'recruiter', id, NULL, name, notes
+FROM recruiters
+UNION ALL
+SELECT id * 16 + 6, 'company_event', id, company_id, title, description
+FROM company_events
+UNION ALL
+SELECT id * 16 + 7, 'recruiter_event', id, recruiter_id, title, description
+FROM recruiter_events
+UNION ALL
+SELECT id * 16 + 8, 'application_event', id, application_id,
+       title, trim(COALESCE(description, '') || char(10) || COALESCE(outcome, ''), char(10))
+FROM application_events;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+    kind UNINDEXED,
+    entity_id UNINDEXED,
+    parent_id UNINDEXED,
+    title,
+    body,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+
+-- Title matches count for more than body matches
+INSERT INTO search_index (search_index, rank) VALUES ('rank', 'bm25(0, 0, 0, 4.0, 1.0)');
+
+CREATE TRIGGER IF NOT EXISTS trg_search_resume_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'resume' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_resume_update
+AFTER UPDATE OF version_name, content_text ON resume_versions
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 1;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'resume' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_resume_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_application_insert
+AFTER INSERT ON applications
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_application_update
+AFTER UPDATE OF company_id, position_title, job_posting_text, outcome_notes ON applications
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 2;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_application_delete
+AFTER DELETE ON applications
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 2;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_job_posting_insert
+AFTER INSERT ON job_postings
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'job_posting' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_job_posting_update
+AFTER UPDATE OF company_id, title, description ON job_postings
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 3;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'job_posting' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_job_posting_delete
+AFTER DELETE ON job_postings
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 3;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_company_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_company_update
+AFTER UPDATE OF name, notes ON companies
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 4;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_company_delete
+AFTER DELETE ON companies
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 4;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_recruiter_update
+AFTER UPDATE OF name, notes ON recruiters
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 5;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 5;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_company_event_insert
+AFTER INSERT ON company_events
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_company_event_update
+AFTER UPDATE OF company_id, title, description ON company_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 6;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_company_event_delete
+AFTER DELETE ON company_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 6;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_recruiter_event_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_recruiter_event_update
+AFTER UPDATE OF recruiter_id, title, description ON recruiter_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 7;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_recruiter_event_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 7;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_application_event_insert
+AFTER INSERT ON application_events
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_application_event_update
+AFTER UPDATE OF application_id, title, description, outcome ON application_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 8;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_application_event_delete
+AFTER DELETE ON application_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 8;
+END;
+
+-- Backfill (and repair)
+DELETE FROM search_index;
+INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+SELECT * FROM search_documents;
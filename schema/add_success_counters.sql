@@ -0,0 +1,241 @@
+-- Per-resume and per-recruiter application outcome counters, kept current by
+-- triggers on applications. An "interview" is any application that reached
+-- phone_screen, interview or offer. The success_rate columns on
+-- resume_versions and recruiters are refreshed from these counters.
+CREATE TABLE IF NOT EXISTS resume_success_summary (
+    resume_version_id INTEGER PRIMARY KEY,
+    total_applications INTEGER NOT NULL DEFAULT 0,
+    interviews INTEGER NOT NULL DEFAULT 0,
+    offers INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS recruiter_success_summary (
+    recruiter_id INTEGER PRIMARY KEY,
+    total_applications INTEGER NOT NULL DEFAULT 0,
+    interviews INTEGER NOT NULL DEFAULT 0,
+    offers INTEGER NOT NULL DEFAULT 0,
+    last_application_date DATE
+);
+
+CREATE INDEX IF NOT EXISTS idx_applications_resume_version ON applications(resume_version_id);
+CREATE INDEX IF NOT EXISTS idx_applications_recruiter_date ON applications(recruiter_id, application_date);
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_success_resume_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    INSERT OR IGNORE INTO resume_success_summary (resume_version_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_success_resume_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    DELETE FROM resume_success_summary WHERE resume_version_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_success_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT OR IGNORE INTO recruiter_success_summary (recruiter_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_success_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM recruiter_success_summary WHERE recruiter_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_success_application_insert
+AFTER INSERT ON applications
+WHEN NEW.resume_version_id IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO resume_success_summary (resume_version_id) VALUES (NEW.resume_version_id);
+    UPDATE resume_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer')
+    WHERE resume_version_id = NEW.resume_version_id;
+    UPDATE resume_versions SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM resume_success_summary WHERE resume_version_id = NEW.resume_version_id
+    ) WHERE id = NEW.resume_version_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_success_application_delete
+AFTER DELETE ON applications
+WHEN OLD.resume_version_id IS NOT NULL
+BEGIN
+    UPDATE resume_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer')
+    WHERE resume_version_id = OLD.resume_version_id;
+    UPDATE resume_versions SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM resume_success_summary WHERE resume_version_id = OLD.resume_version_id
+    ) WHERE id = OLD.resume_version_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_success_application_update
+AFTER UPDATE OF status, resume_version_id ON applications
+WHEN OLD.status IS NOT NEW.status OR OLD.resume_version_id IS NOT NEW.resume_version_id
+BEGIN
+    UPDATE resume_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer')
+    WHERE resume_version_id = OLD.resume_version_id;
+    INSERT OR IGNORE INTO resume_success_summary (resume_version_id)
+    SELECT NEW.resume_version_id WHERE NEW.resume_version_id IS NOT NULL;
+    UPDATE resume_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer')
+    WHERE resume_version_id = NEW.resume_version_id;
+    UPDATE resume_versions SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM resume_success_summary WHERE resume_version_id = resume_versions.id
+    ) WHERE id IN (OLD.resume_version_id, NEW.resume_version_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_success_application_insert
+AFTER INSERT ON applications
+WHEN NEW.recruiter_id IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO recruiter_success_summary (recruiter_id) VALUES (NEW.recruiter_id);
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer'),
+        last_application_date = CASE
+            WHEN last_application_date IS NULL OR NEW.application_date > last_application_date
+            THEN NEW.application_date ELSE last_application_date END
+    WHERE recruiter_id = NEW.recruiter_id;
+    UPDATE recruiters SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM recruiter_success_summary WHERE recruiter_id = NEW.recruiter_id
+    ) WHERE id = NEW.recruiter_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_success_application_delete
+AFTER DELETE ON applications
+WHEN OLD.recruiter_id IS NOT NULL
+BEGIN
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer'),
+        last_application_date = (SELECT MAX(application_date) FROM applications WHERE recruiter_id = OLD.recruiter_id)
+    WHERE recruiter_id = OLD.recruiter_id;
+    UPDATE recruiters SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM recruiter_success_summary WHERE recruiter_id = OLD.recruiter_id
+    ) WHERE id = OLD.recruiter_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_success_application_update
+AFTER UPDATE OF status, recruiter_id, application_date ON applications
+WHEN OLD.status IS NOT NEW.status OR OLD.recruiter_id IS NOT NEW.recruiter_id
+    OR OLD.application_date IS NOT NEW.application_date
+BEGIN
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer')
+    WHERE recruiter_id = OLD.recruiter_id;
+    INSERT OR IGNORE INTO recruiter_success_summary (recruiter_id)
+    SELECT NEW.recruiter_id WHERE NEW.recruiter_id IS NOT NULL;
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer')
+    WHERE recruiter_id = NEW.recruiter_id;
+    UPDATE recruiter_success_summary
+    SET last_application_date = (
+        SELECT MAX(application_date) FROM applications
+        WHERE recruiter_id = recruiter_success_summary.recruiter_id
+    )
+    WHERE recruiter_id IN (OLD.recruiter_id, NEW.recruiter_id)
+      AND (OLD.recruiter_id IS NOT NEW.recruiter_id OR OLD.application_date IS NOT NEW.application_date);
+    UPDATE recruiters SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM recruiter_success_summary WHERE recruiter_id = recruiters.id
+    ) WHERE id IN (OLD.recruiter_id, NEW.recruiter_id);
+END;
+
+-- Backfill (and repair) from applications
+DELETE FROM resume_success_summary;
+INSERT INTO resume_success_summary (resume_version_id, total_applications, interviews, offers)
+SELECT
+    rv.id,
+    COUNT(a.id),
+    COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END),
+    COUNT(CASE WHEN a.status = 'offer' THEN 1 END)
+FROM resume_versions rv
+LEFT JOIN applications a ON a.resume_version_id = rv.id
+GROUP BY rv.id;
+
+DELETE FROM recruiter_success_summary;
+INSERT INTO recruiter_success_summary (recruiter_id, total_applications, interviews, offers, last_application_date)
+SELECT
+    r.id,
+    COUNT(a.id),
+    COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END),
+    COUNT(CASE WHEN a.status = 'offer' THEN 1 END),
+    MAX(a.application_date)
+FROM recruiters r
+LEFT JOIN applications a ON a.recruiter_id = r.id
+GROUP BY r.id;
+
+UPDATE resume_versions SET success_rate = COALESCE((
+    SELECT ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2)
+    FROM resume_success_summary WHERE resume_version_id = resume_versions.id
+), 0);
+UPDATE recruiters SET success_rate = COALESCE((
+    SELECT ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2)
+    FROM recruiter_success_summary WHERE recruiter_id = recruiters.id
+), 0);
+
+DROP VIEW IF EXISTS resume_success_metrics;
+CREATE VIEW resume_success_metrics AS
+SELECT
+    rv.id,
+    rv.version_name,
+    rv.skills_emphasized,
+    COALESCE(s.total_applications, 0) as total_applications,
+    COALESCE(s.interviews, 0) as interviews,
+    COALESCE(s.offers, 0) as offers,
+    ROUND(s.interviews * 100.0 / NULLIF(s.total_applications, 0), 2) as interview_rate
+FROM resume_versions rv
+LEFT JOIN resume_success_summary s ON s.resume_version_id = rv.id;
+
+DROP VIEW IF EXISTS recruiter_dashboard;
+CREATE VIEW recruiter_dashboard AS
+SELECT
+    r.id,
+    r.name,
+    r.primary_contact_name,
+    r.email,
+    r.phone,
+    r.company,
+    r.linkedin_url,
+    r.specialties,
+    r.current_resume_version_id,
+    r.last_contact_date,
+    r.relationship_status,
+    r.success_rate,
+    r.notes,
+    r.is_starred,
+    r.created_at,
+    r.updated_at,
+    COALESCE(s.total_applications, 0) as total_applications,
+    COALESCE(s.interviews, 0) as successful_applications,
+    s.last_application_date,
+    r.last_contact_date as last_communication,
+    (
+        SELECT GROUP_CONCAT(c.name || '|' || a.position_title || '|' || a.application_date || '|' || a.status, '; ')
+        FROM applications a
+        LEFT JOIN companies c ON a.company_id = c.id
+        WHERE a.recruiter_id = r.id AND a.application_date IS NOT NULL
+    ) as recent_applications
+FROM recruiters r
+LEFT JOIN recruiter_success_summary s ON s.recruiter_id = r.id;
@@ -0,0 +1,239 @@
+-- Per-table change counters for HTTP ETags.
+-- Every insert, update or delete on a base table bumps its row here, so a
+-- response's ETag can be derived from the versions of the tables it reads
+-- without running its query. Counters start at random values so two
+-- separately created databases do not hand out the same ETags.
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES
+    ('companies', abs(random() % 1000000000)),
+    ('resume_versions', abs(random() % 1000000000)),
+    ('recruiters', abs(random() % 1000000000)),
+    ('job_postings', abs(random() % 1000000000)),
+    ('applications', abs(random() % 1000000000)),
+    ('communications', abs(random() % 1000000000)),
+    ('application_events', abs(random() % 1000000000)),
+    ('tags', abs(random() % 1000000000)),
+    ('resume_tags', abs(random() % 1000000000)),
+    ('managers', abs(random() % 1000000000)),
+    ('recruiter_events', abs(random() % 1000000000)),
+    ('company_events', abs(random() % 1000000000));
+
+CREATE TRIGGER IF NOT EXISTS trg_companies_version_insert
+AFTER INSERT ON companies
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'companies';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_companies_version_update
+AFTER UPDATE ON companies
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'companies';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_companies_version_delete
+AFTER DELETE ON companies
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'companies';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_versions_version_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_versions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_versions_version_update
+AFTER UPDATE ON resume_versions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_versions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_versions_version_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_versions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiters_version_insert
+AFTER INSERT ON recruiters
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiters';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiters_version_update
+AFTER UPDATE ON recruiters
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiters';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiters_version_delete
+AFTER DELETE ON recruiters
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiters';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_postings_version_insert
+AFTER INSERT ON job_postings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_postings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_postings_version_update
+AFTER UPDATE ON job_postings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_postings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_job_postings_version_delete
+AFTER DELETE ON job_postings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_postings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_applications_version_insert
+AFTER INSERT ON applications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_applications_version_update
+AFTER UPDATE ON applications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_applications_version_delete
+AFTER DELETE ON applications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_communications_version_insert
+AFTER INSERT ON communications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'communications';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_communications_version_update
+AFTER UPDATE ON communications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'communications';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_communications_version_delete
+AFTER DELETE ON communications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'communications';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_application_events_version_insert
+AFTER INSERT ON application_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'application_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_application_events_version_update
+AFTER UPDATE ON application_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'application_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_application_events_version_delete
+AFTER DELETE ON application_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'application_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_version_insert
+AFTER INSERT ON tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'tags';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_version_update
+AFTER UPDATE ON tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'tags';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_version_delete
+AFTER DELETE ON tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'tags';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_tags_version_insert
+AFTER INSERT ON resume_tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_tags';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_tags_version_update
+AFTER UPDATE ON resume_tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_tags';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_resume_tags_version_delete
+AFTER DELETE ON resume_tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_tags';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_managers_version_insert
+AFTER INSERT ON managers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'managers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_managers_version_update
+AFTER UPDATE ON managers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'managers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_managers_version_delete
+AFTER DELETE ON managers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'managers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_events_version_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiter_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_events_version_update
+AFTER UPDATE ON recruiter_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiter_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_recruiter_events_version_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiter_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_events_version_insert
+AFTER INSERT ON company_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'company_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_events_version_update
+AFTER UPDATE ON company_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'company_events';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_company_events_version_delete
+AFTER DELETE ON company_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'company_events';
+END;
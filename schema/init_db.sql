@@ -141,46 +141,6 @@ CREATE INDEX idx_communications_application ON communications(application_id);
 CREATE INDEX idx_recruiters_status ON recruiters(relationship_status);
 CREATE INDEX idx_application_events_application ON application_events(application_id);
 CREATE INDEX idx_application_events_event_date ON application_events(event_date);
-CREATE VIEW resume_success_metrics AS
-SELECT
-    rv.id,
-    rv.version_name,
-    rv.skills_emphasized,
-    COUNT(a.id) as total_applications,
-    COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END) as interviews,
-    COUNT(CASE WHEN a.status = 'offer' THEN 1 END) as offers,
-    ROUND(
-        COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END) * 100.0 /
-        NULLIF(COUNT(a.id), 0), 2
-    ) as interview_rate
-FROM resume_versions rv
-LEFT JOIN applications a ON rv.id = a.resume_version_id
-GROUP BY rv.id, rv.version_name, rv.skills_emphasized
-/* resume_success_metrics(id,version_name,skills_emphasized,total_applications,interviews,offers,interview_rate) */;
-CREATE VIEW company_activity AS
-SELECT
-    c.id,
-    c.name,
-    c.website,
-    c.industry,
-    c.company_size,
-    c.headquarters,
-    c.is_remote_friendly,
-    c.updated_at,
-    c.notes,
-    c.linkedin_url,
-    COUNT(jp.id) as total_jobs_posted,
-    COUNT(a.id) as applications_sent,
-    MAX(jp.date_posted) as last_job_posted,
-    AVG(jp.salary_min) as avg_salary_min,
-    AVG(jp.salary_max) as avg_salary_max,
-    COUNT(CASE WHEN jp.is_remote = 1 THEN 1 END) as remote_jobs
-FROM companies c
-LEFT JOIN job_postings jp ON c.id = jp.company_id
-LEFT JOIN applications a ON c.id = a.company_id
-GROUP BY c.id, c.name, c.website, c.industry, c.company_size, c.headquarters,
-         c.is_remote_friendly, c.updated_at, c.notes, c.linkedin_url
-/* company_activity(id,name,website,industry,company_size,headquarters,is_remote_friendly,updated_at,notes,linkedin_url,total_jobs_posted,applications_sent,last_job_posted,avg_salary_min,avg_salary_max,remote_jobs) */;
 CREATE TABLE tags (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL UNIQUE,
@@ -256,6 +216,7 @@ CREATE TABLE recruiter_events (
 );
 CREATE INDEX idx_recruiter_events_recruiter ON recruiter_events(recruiter_id);
 CREATE INDEX idx_recruiter_events_date ON recruiter_events(event_date);
+CREATE INDEX idx_recruiter_events_recruiter_recent ON recruiter_events(recruiter_id, event_date DESC, created_at DESC);
 CREATE TABLE company_events (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     company_id INTEGER NOT NULL,
@@ -271,41 +232,8 @@ CREATE TABLE company_events (
 );
 CREATE INDEX idx_company_events_company ON company_events(company_id);
 CREATE INDEX idx_company_events_date ON company_events(event_date);
+CREATE INDEX idx_company_events_company_recent ON company_events(company_id, event_date DESC, created_at DESC);
 CREATE INDEX idx_resume_versions_files ON resume_versions(s3_key, editable_s3_key);
-CREATE VIEW recruiter_dashboard AS
-SELECT
-    r.id,
-    r.name,
-    r.primary_contact_name,
-    r.email,
-    r.phone,
-    r.company,
-    r.linkedin_url,
-    r.specialties,
-    r.current_resume_version_id,
-    r.last_contact_date,
-    r.relationship_status,
-    r.success_rate,
-    r.notes,
-    r.is_starred,
-    r.created_at,
-    r.updated_at,
-    COUNT(DISTINCT a.id) as total_applications,
-    COUNT(CASE WHEN a.status IN ('phone_screen', 'interview', 'offer') THEN 1 END) as successful_applications,
-    MAX(a.application_date) as last_application_date,
-    r.last_contact_date as last_communication,
-    GROUP_CONCAT(
-        CASE WHEN a.application_date IS NOT NULL
-        THEN c.name || '|' || a.position_title || '|' || a.application_date || '|' || a.status
-        END, '; '
-    ) as recent_applications
-FROM recruiters r
-LEFT JOIN applications a ON r.id = a.recruiter_id
-LEFT JOIN companies c ON a.company_id = c.id
-GROUP BY r.id, r.name, r.primary_contact_name, r.email, r.phone, r.company, r.linkedin_url, r.specialties,
-         r.current_resume_version_id, r.last_contact_date, r.relationship_status,
-         r.success_rate, r.notes, r.is_starred, r.created_at, r.updated_at
-/* recruiter_dashboard(id,name,primary_contact_name,email,phone,company,linkedin_url,specialties,current_resume_version_id,last_contact_date,relationship_status,success_rate,notes,is_starred,created_at,updated_at,total_applications,successful_applications,last_application_date,last_communication,recent_applications) */;
 CREATE TABLE applications (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     company_id INTEGER NOT NULL,
@@ -366,3 +294,1252 @@ LEFT JOIN job_postings jp ON a.job_posting_id = jp.id
 WHERE a.status NOT IN ('rejected', 'withdrawn', 'offer')
 ORDER BY a.application_date DESC
 /* active_applications(id,company_name,position_title,application_date,status,resume_used,recruiter_name,recruiter_primary_contact,salary_min,salary_max,is_remote,job_posting_text,job_location,job_url,days_since_application) */;
+CREATE TABLE schema_extensions (
+    name TEXT PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE import_guard (
+    table_name TEXT PRIMARY KEY
+);
+CREATE INDEX idx_applications_active_date ON applications(application_date)
+    WHERE status NOT IN ('rejected', 'withdrawn', 'offer');
+CREATE INDEX idx_recruiters_contact_order ON recruiters(COALESCE(last_contact_date, ''));
+CREATE INDEX idx_job_postings_date_order ON job_postings(COALESCE(date_posted, ''));
+CREATE INDEX idx_job_postings_company_date_order ON job_postings(company_id, COALESCE(date_posted, ''));
+CREATE INDEX idx_resume_versions_created_order ON resume_versions(COALESCE(created_at, ''));
+CREATE INDEX idx_managers_name ON managers(name);
+CREATE INDEX idx_managers_company_name ON managers(company_id, name);
+CREATE TABLE company_activity_summary (
+    company_id INTEGER PRIMARY KEY,
+    total_jobs_posted INTEGER NOT NULL DEFAULT 0,
+    applications_sent INTEGER NOT NULL DEFAULT 0,
+    last_job_posted DATE,
+    salary_min_total INTEGER NOT NULL DEFAULT 0,
+    salary_min_count INTEGER NOT NULL DEFAULT 0,
+    salary_max_total INTEGER NOT NULL DEFAULT 0,
+    salary_max_count INTEGER NOT NULL DEFAULT 0,
+    remote_jobs INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER trg_company_activity_company_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER trg_company_activity_company_delete
+AFTER DELETE ON companies
+BEGIN
+    DELETE FROM company_activity_summary WHERE company_id = OLD.id;
+END;
+
+CREATE TRIGGER trg_company_activity_job_insert
+AFTER INSERT ON job_postings
+BEGIN
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.company_id);
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted + 1,
+        last_job_posted = CASE
+            WHEN last_job_posted IS NULL OR NEW.date_posted > last_job_posted THEN NEW.date_posted
+            ELSE last_job_posted END,
+        salary_min_total = salary_min_total + COALESCE(NEW.salary_min, 0),
+        salary_min_count = salary_min_count + (NEW.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total + COALESCE(NEW.salary_max, 0),
+        salary_max_count = salary_max_count + (NEW.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs + (NEW.is_remote = 1)
+    WHERE company_id = NEW.company_id;
+END;
+
+CREATE TRIGGER trg_company_activity_job_delete
+AFTER DELETE ON job_postings
+BEGIN
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted - 1,
+        last_job_posted = (SELECT MAX(date_posted) FROM job_postings WHERE company_id = OLD.company_id),
+        salary_min_total = salary_min_total - COALESCE(OLD.salary_min, 0),
+        salary_min_count = salary_min_count - (OLD.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total - COALESCE(OLD.salary_max, 0),
+        salary_max_count = salary_max_count - (OLD.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs - (OLD.is_remote = 1)
+    WHERE company_id = OLD.company_id;
+END;
+
+CREATE TRIGGER trg_company_activity_job_update
+AFTER UPDATE OF company_id, date_posted, salary_min, salary_max, is_remote ON job_postings
+BEGIN
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted - 1,
+        salary_min_total = salary_min_total - COALESCE(OLD.salary_min, 0),
+        salary_min_count = salary_min_count - (OLD.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total - COALESCE(OLD.salary_max, 0),
+        salary_max_count = salary_max_count - (OLD.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs - (OLD.is_remote = 1)
+    WHERE company_id = OLD.company_id;
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.company_id);
+    UPDATE company_activity_summary SET
+        total_jobs_posted = total_jobs_posted + 1,
+        salary_min_total = salary_min_total + COALESCE(NEW.salary_min, 0),
+        salary_min_count = salary_min_count + (NEW.salary_min IS NOT NULL),
+        salary_max_total = salary_max_total + COALESCE(NEW.salary_max, 0),
+        salary_max_count = salary_max_count + (NEW.salary_max IS NOT NULL),
+        remote_jobs = remote_jobs + (NEW.is_remote = 1)
+    WHERE company_id = NEW.company_id;
+    UPDATE company_activity_summary
+    SET last_job_posted = (SELECT MAX(date_posted) FROM job_postings WHERE company_id = company_activity_summary.company_id)
+    WHERE company_id IN (OLD.company_id, NEW.company_id);
+END;
+
+CREATE TRIGGER trg_company_activity_application_insert
+AFTER INSERT ON applications
+WHEN NEW.company_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR IGNORE INTO company_activity_summary (company_id) VALUES (NEW.company_id);
+    UPDATE company_activity_summary SET applications_sent = applications_sent + 1
+    WHERE company_id = NEW.company_id;
+END;
+
+CREATE TRIGGER trg_company_activity_application_delete
+AFTER DELETE ON applications
+WHEN OLD.company_id IS NOT NULL
+BEGIN
+    UPDATE company_activity_summary SET applications_sent = applications_sent - 1
+    WHERE company_id = OLD.company_id;
+END;
+
+CREATE TRIGGER trg_company_activity_application_update
+AFTER UPDATE OF company_id ON applications
+WHEN OLD.company_id IS NOT NEW.company_id
+BEGIN
+    UPDATE company_activity_summary SET applications_sent = applications_sent - 1
+    WHERE company_id = OLD.company_id;
+    INSERT OR IGNORE INTO company_activity_summary (company_id)
+    SELECT NEW.company_id WHERE NEW.company_id IS NOT NULL;
+    UPDATE company_activity_summary SET applications_sent = applications_sent + 1
+    WHERE company_id = NEW.company_id;
+END;
+
+CREATE VIEW company_activity AS
+SELECT
+    c.id,
+    c.name,
+    c.website,
+    c.industry,
+    c.company_size,
+    c.headquarters,
+    c.is_remote_friendly,
+    c.updated_at,
+    c.notes,
+    c.linkedin_url,
+    COALESCE(s.total_jobs_posted, 0) as total_jobs_posted,
+    COALESCE(s.applications_sent, 0) as applications_sent,
+    s.last_job_posted,
+    CAST(s.salary_min_total AS REAL) / NULLIF(s.salary_min_count, 0) as avg_salary_min,
+    CAST(s.salary_max_total AS REAL) / NULLIF(s.salary_max_count, 0) as avg_salary_max,
+    COALESCE(s.remote_jobs, 0) as remote_jobs
+FROM companies c
+LEFT JOIN company_activity_summary s ON s.company_id = c.id;
+CREATE TABLE resume_success_summary (
+    resume_version_id INTEGER PRIMARY KEY,
+    total_applications INTEGER NOT NULL DEFAULT 0,
+    interviews INTEGER NOT NULL DEFAULT 0,
+    offers INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE recruiter_success_summary (
+    recruiter_id INTEGER PRIMARY KEY,
+    total_applications INTEGER NOT NULL DEFAULT 0,
+    interviews INTEGER NOT NULL DEFAULT 0,
+    offers INTEGER NOT NULL DEFAULT 0,
+    last_application_date DATE
+);
+
+CREATE INDEX idx_applications_resume_version ON applications(resume_version_id);
+CREATE INDEX idx_applications_recruiter_date ON applications(recruiter_id, application_date);
+
+CREATE TRIGGER trg_resume_success_resume_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    INSERT OR IGNORE INTO resume_success_summary (resume_version_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER trg_resume_success_resume_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    DELETE FROM resume_success_summary WHERE resume_version_id = OLD.id;
+END;
+
+CREATE TRIGGER trg_recruiter_success_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT OR IGNORE INTO recruiter_success_summary (recruiter_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER trg_recruiter_success_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM recruiter_success_summary WHERE recruiter_id = OLD.id;
+END;
+
+CREATE TRIGGER trg_resume_success_application_insert
+AFTER INSERT ON applications
+WHEN NEW.resume_version_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR IGNORE INTO resume_success_summary (resume_version_id) VALUES (NEW.resume_version_id);
+    UPDATE resume_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer')
+    WHERE resume_version_id = NEW.resume_version_id;
+    UPDATE resume_versions SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM resume_success_summary WHERE resume_version_id = NEW.resume_version_id
+    ) WHERE id = NEW.resume_version_id;
+END;
+
+CREATE TRIGGER trg_resume_success_application_delete
+AFTER DELETE ON applications
+WHEN OLD.resume_version_id IS NOT NULL
+BEGIN
+    UPDATE resume_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer')
+    WHERE resume_version_id = OLD.resume_version_id;
+    UPDATE resume_versions SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM resume_success_summary WHERE resume_version_id = OLD.resume_version_id
+    ) WHERE id = OLD.resume_version_id;
+END;
+
+CREATE TRIGGER trg_resume_success_application_update
+AFTER UPDATE OF status, resume_version_id ON applications
+WHEN OLD.status IS NOT NEW.status OR OLD.resume_version_id IS NOT NEW.resume_version_id
+BEGIN
+    UPDATE resume_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer')
+    WHERE resume_version_id = OLD.resume_version_id;
+    INSERT OR IGNORE INTO resume_success_summary (resume_version_id)
+    SELECT NEW.resume_version_id WHERE NEW.resume_version_id IS NOT NULL;
+    UPDATE resume_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer')
+    WHERE resume_version_id = NEW.resume_version_id;
+    UPDATE resume_versions SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM resume_success_summary WHERE resume_version_id = resume_versions.id
+    ) WHERE id IN (OLD.resume_version_id, NEW.resume_version_id);
+END;
+
+CREATE TRIGGER trg_recruiter_success_application_insert
+AFTER INSERT ON applications
+WHEN NEW.recruiter_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR IGNORE INTO recruiter_success_summary (recruiter_id) VALUES (NEW.recruiter_id);
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer'),
+        last_application_date = CASE
+            WHEN last_application_date IS NULL OR NEW.application_date > last_application_date
+            THEN NEW.application_date ELSE last_application_date END
+    WHERE recruiter_id = NEW.recruiter_id;
+    UPDATE recruiters SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM recruiter_success_summary WHERE recruiter_id = NEW.recruiter_id
+    ) WHERE id = NEW.recruiter_id;
+END;
+
+CREATE TRIGGER trg_recruiter_success_application_delete
+AFTER DELETE ON applications
+WHEN OLD.recruiter_id IS NOT NULL
+BEGIN
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer'),
+        last_application_date = (SELECT MAX(application_date) FROM applications WHERE recruiter_id = OLD.recruiter_id)
+    WHERE recruiter_id = OLD.recruiter_id;
+    UPDATE recruiters SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM recruiter_success_summary WHERE recruiter_id = OLD.recruiter_id
+    ) WHERE id = OLD.recruiter_id;
+END;
+
+CREATE TRIGGER trg_recruiter_success_application_update
+AFTER UPDATE OF status, recruiter_id, application_date ON applications
+WHEN OLD.status IS NOT NEW.status OR OLD.recruiter_id IS NOT NEW.recruiter_id
+    OR OLD.application_date IS NOT NEW.application_date
+BEGIN
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications - 1,
+        interviews = interviews - (OLD.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers - (OLD.status = 'offer')
+    WHERE recruiter_id = OLD.recruiter_id;
+    INSERT OR IGNORE INTO recruiter_success_summary (recruiter_id)
+    SELECT NEW.recruiter_id WHERE NEW.recruiter_id IS NOT NULL;
+    UPDATE recruiter_success_summary SET
+        total_applications = total_applications + 1,
+        interviews = interviews + (NEW.status IN ('phone_screen', 'interview', 'offer')),
+        offers = offers + (NEW.status = 'offer')
+    WHERE recruiter_id = NEW.recruiter_id;
+    UPDATE recruiter_success_summary
+    SET last_application_date = (
+        SELECT MAX(application_date) FROM applications
+        WHERE recruiter_id = recruiter_success_summary.recruiter_id
+    )
+    WHERE recruiter_id IN (OLD.recruiter_id, NEW.recruiter_id)
+      AND (OLD.recruiter_id IS NOT NEW.recruiter_id OR OLD.application_date IS NOT NEW.application_date);
+    UPDATE recruiters SET success_rate = (
+        SELECT COALESCE(ROUND(interviews * 100.0 / NULLIF(total_applications, 0), 2), 0)
+        FROM recruiter_success_summary WHERE recruiter_id = recruiters.id
+    ) WHERE id IN (OLD.recruiter_id, NEW.recruiter_id);
+END;
+
+CREATE VIEW resume_success_metrics AS
+SELECT
+    rv.id,
+    rv.version_name,
+    rv.skills_emphasized,
+    COALESCE(s.total_applications, 0) as total_applications,
+    COALESCE(s.interviews, 0) as interviews,
+    COALESCE(s.offers, 0) as offers,
+    ROUND(s.interviews * 100.0 / NULLIF(s.total_applications, 0), 2) as interview_rate
+FROM resume_versions rv
+LEFT JOIN resume_success_summary s ON s.resume_version_id = rv.id;
+CREATE INDEX idx_recruiter_events_recruiter_date ON recruiter_events(recruiter_id, event_date);
+
+CREATE VIEW recruiter_dashboard_source AS
+SELECT
+    r.id AS recruiter_id,
+    (
+        SELECT json_group_array(json_object(
+            'id', recent.id,
+            'company_id', recent.company_id,
+            'company_name', recent.company_name,
+            'position_title', recent.position_title,
+            'application_date', recent.application_date,
+            'status', recent.status
+        ))
+        FROM (
+            SELECT a.id, a.company_id, c.name AS company_name, a.position_title,
+                   a.application_date, a.status
+            FROM applications a
+            LEFT JOIN companies c ON c.id = a.company_id
+            WHERE a.recruiter_id = r.id
+            ORDER BY a.application_date DESC, a.id DESC
+            LIMIT 5
+        ) recent
+    ) AS recent_applications,
+    (SELECT MAX(event_date) FROM recruiter_events WHERE recruiter_id = r.id) AS last_event_date,
+    NULLIF(MAX(
+        COALESCE(r.last_contact_date, ''),
+        COALESCE((SELECT MAX(event_date) FROM recruiter_events WHERE recruiter_id = r.id), '')
+    ), '') AS last_communication
+FROM recruiters r;
+
+CREATE TABLE recruiter_dashboard_summary (
+    recruiter_id INTEGER PRIMARY KEY,
+    recent_applications TEXT NOT NULL DEFAULT '[]',
+    last_event_date DATE,
+    last_communication DATE
+);
+
+CREATE INDEX idx_recruiter_dashboard_summary_communication
+    ON recruiter_dashboard_summary(last_communication);
+
+CREATE TRIGGER trg_recruiter_dashboard_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_recruiter_update
+AFTER UPDATE OF last_contact_date ON recruiters
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM recruiter_dashboard_summary WHERE recruiter_id = OLD.id;
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_application_insert
+AFTER INSERT ON applications
+WHEN NEW.recruiter_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.recruiter_id;
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_application_delete
+AFTER DELETE ON applications
+WHEN OLD.recruiter_id IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = OLD.recruiter_id;
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_application_update
+AFTER UPDATE OF recruiter_id, company_id, position_title, application_date, status ON applications
+WHEN OLD.recruiter_id IS NOT NULL OR NEW.recruiter_id IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id IN (OLD.recruiter_id, NEW.recruiter_id);
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_company_update
+AFTER UPDATE OF name ON companies
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source
+    WHERE recruiter_id IN (SELECT recruiter_id FROM applications WHERE company_id = NEW.id);
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_event_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = NEW.recruiter_id;
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_event_update
+AFTER UPDATE OF recruiter_id, event_date ON recruiter_events
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id IN (OLD.recruiter_id, NEW.recruiter_id);
+END;
+
+CREATE TRIGGER trg_recruiter_dashboard_event_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    INSERT OR REPLACE INTO recruiter_dashboard_summary
+    SELECT * FROM recruiter_dashboard_source WHERE recruiter_id = OLD.recruiter_id;
+END;
+
+CREATE VIEW recruiter_dashboard AS
+SELECT
+    r.id,
+    r.name,
+    r.primary_contact_name,
+    r.email,
+    r.phone,
+    r.company,
+    r.linkedin_url,
+    r.specialties,
+    r.current_resume_version_id,
+    r.last_contact_date,
+    r.relationship_status,
+    r.success_rate,
+    r.notes,
+    r.is_starred,
+    r.created_at,
+    r.updated_at,
+    COALESCE(s.total_applications, 0) as total_applications,
+    COALESCE(s.interviews, 0) as successful_applications,
+    s.last_application_date,
+    d.last_communication,
+    d.recent_applications
+FROM recruiter_dashboard_summary d
+JOIN recruiters r ON r.id = d.recruiter_id
+LEFT JOIN recruiter_success_summary s ON s.recruiter_id = r.id;
+CREATE TABLE table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES
+    ('companies', abs(random() % 1000000000)),
+    ('resume_versions', abs(random() % 1000000000)),
+    ('recruiters', abs(random() % 1000000000)),
+    ('job_postings', abs(random() % 1000000000)),
+    ('applications', abs(random() % 1000000000)),
+    ('communications', abs(random() % 1000000000)),
+    ('application_events', abs(random() % 1000000000)),
+    ('tags', abs(random() % 1000000000)),
+    ('resume_tags', abs(random() % 1000000000)),
+    ('managers', abs(random() % 1000000000)),
+    ('recruiter_events', abs(random() % 1000000000)),
+    ('company_events', abs(random() % 1000000000));
+
+CREATE TRIGGER trg_companies_version_insert
+AFTER INSERT ON companies
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'companies';
+END;
+
+CREATE TRIGGER trg_companies_version_update
+AFTER UPDATE ON companies
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'companies';
+END;
+
+CREATE TRIGGER trg_companies_version_delete
+AFTER DELETE ON companies
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'companies';
+END;
+
+CREATE TRIGGER trg_resume_versions_version_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_versions';
+END;
+
+CREATE TRIGGER trg_resume_versions_version_update
+AFTER UPDATE ON resume_versions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_versions';
+END;
+
+CREATE TRIGGER trg_resume_versions_version_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_versions';
+END;
+
+CREATE TRIGGER trg_recruiters_version_insert
+AFTER INSERT ON recruiters
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiters';
+END;
+
+CREATE TRIGGER trg_recruiters_version_update
+AFTER UPDATE ON recruiters
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiters';
+END;
+
+CREATE TRIGGER trg_recruiters_version_delete
+AFTER DELETE ON recruiters
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiters';
+END;
+
+CREATE TRIGGER trg_job_postings_version_insert
+AFTER INSERT ON job_postings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_postings';
+END;
+
+CREATE TRIGGER trg_job_postings_version_update
+AFTER UPDATE ON job_postings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_postings';
+END;
+
+CREATE TRIGGER trg_job_postings_version_delete
+AFTER DELETE ON job_postings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'job_postings';
+END;
+
+CREATE TRIGGER trg_applications_version_insert
+AFTER INSERT ON applications
+WHEN NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications';
+END;
+
+CREATE TRIGGER trg_applications_version_update
+AFTER UPDATE ON applications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications';
+END;
+
+CREATE TRIGGER trg_applications_version_delete
+AFTER DELETE ON applications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'applications';
+END;
+
+CREATE TRIGGER trg_communications_version_insert
+AFTER INSERT ON communications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'communications';
+END;
+
+CREATE TRIGGER trg_communications_version_update
+AFTER UPDATE ON communications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'communications';
+END;
+
+CREATE TRIGGER trg_communications_version_delete
+AFTER DELETE ON communications
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'communications';
+END;
+
+CREATE TRIGGER trg_application_events_version_insert
+AFTER INSERT ON application_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'application_events';
+END;
+
+CREATE TRIGGER trg_application_events_version_update
+AFTER UPDATE ON application_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'application_events';
+END;
+
+CREATE TRIGGER trg_application_events_version_delete
+AFTER DELETE ON application_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'application_events';
+END;
+
+CREATE TRIGGER trg_tags_version_insert
+AFTER INSERT ON tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'tags';
+END;
+
+CREATE TRIGGER trg_tags_version_update
+AFTER UPDATE ON tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'tags';
+END;
+
+CREATE TRIGGER trg_tags_version_delete
+AFTER DELETE ON tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'tags';
+END;
+
+CREATE TRIGGER trg_resume_tags_version_insert
+AFTER INSERT ON resume_tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_tags';
+END;
+
+CREATE TRIGGER trg_resume_tags_version_update
+AFTER UPDATE ON resume_tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_tags';
+END;
+
+CREATE TRIGGER trg_resume_tags_version_delete
+AFTER DELETE ON resume_tags
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'resume_tags';
+END;
+
+CREATE TRIGGER trg_managers_version_insert
+AFTER INSERT ON managers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'managers';
+END;
+
+CREATE TRIGGER trg_managers_version_update
+AFTER UPDATE ON managers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'managers';
+END;
+
+CREATE TRIGGER trg_managers_version_delete
+AFTER DELETE ON managers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'managers';
+END;
+
+CREATE TRIGGER trg_recruiter_events_version_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiter_events';
+END;
+
+CREATE TRIGGER trg_recruiter_events_version_update
+AFTER UPDATE ON recruiter_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiter_events';
+END;
+
+CREATE TRIGGER trg_recruiter_events_version_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'recruiter_events';
+END;
+
+CREATE TRIGGER trg_company_events_version_insert
+AFTER INSERT ON company_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'company_events';
+END;
+
+CREATE TRIGGER trg_company_events_version_update
+AFTER UPDATE ON company_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'company_events';
+END;
+
+CREATE TRIGGER trg_company_events_version_delete
+AFTER DELETE ON company_events
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'company_events';
+END;
+
+-- Full-text search over resumes, applications, job postings and notes.
+-- search_documents renders every searchable row as (doc_id, kind, entity_id,
+-- parent_id, title, body); search_index is an FTS5 index over it, kept
+-- current by triggers on the base tables. doc_id packs the row id and a
+-- per-kind code (id * 16 + code) so a trigger can find its document by rowid.
+-- parent_id is the company, recruiter or application a document belongs to.
+CREATE VIEW search_documents AS
+SELECT id * 16 + 1 AS doc_id, 'resume' AS kind, id AS entity_id, NULL AS parent_id,
+       version_name AS title, content_text AS body
+FROM resume_versions
+UNION ALL
+SELECT id * 16 + 2, 'application', id, company_id,
+       position_title, trim(COALESCE(job_posting_text, '') || char(10) || COALESCE(outcome_notes, ''), char(10))
+FROM applications
+UNION ALL
+SELECT id * 16 + 3, 'job_posting', id, company_id, title, description
+FROM job_postings
+UNION ALL
+SELECT id * 16 + 4, 'company', id, NULL, name, notes
+FROM companies
+UNION ALL
+SELECT id * 16 + 5, 'recruiter', id, NULL, name, notes
+FROM recruiters
+UNION ALL
+SELECT id * 16 + 6, 'company_event', id, company_id, title, description
+FROM company_events
+UNION ALL
+SELECT id * 16 + 7, 'recruiter_event', id, recruiter_id, title, description
+FROM recruiter_events
+UNION ALL
+SELECT id * 16 + 8, 'application_event', id, application_id,
+       title, trim(COALESCE(description, '') || char(10) || COALESCE(outcome, ''), char(10))
+FROM application_events;
+
+CREATE VIRTUAL TABLE search_index USING fts5(
+    kind UNINDEXED,
+    entity_id UNINDEXED,
+    parent_id UNINDEXED,
+    title,
+    body,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+
+-- Title matches count for more than body matches
+INSERT INTO search_index (search_index, rank) VALUES ('rank', 'bm25(0, 0, 0, 4.0, 1.0)');
+
+CREATE TRIGGER trg_search_resume_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'resume' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_resume_update
+AFTER UPDATE OF version_name, content_text ON resume_versions
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 1;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'resume' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_resume_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 1;
+END;
+
+CREATE TRIGGER trg_search_application_insert
+AFTER INSERT ON applications
+WHEN NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_application_update
+AFTER UPDATE OF company_id, position_title, job_posting_text, outcome_notes ON applications
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 2;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_application_delete
+AFTER DELETE ON applications
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 2;
+END;
+
+CREATE TRIGGER trg_search_job_posting_insert
+AFTER INSERT ON job_postings
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'job_posting' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_job_posting_update
+AFTER UPDATE OF company_id, title, description ON job_postings
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 3;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'job_posting' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_job_posting_delete
+AFTER DELETE ON job_postings
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 3;
+END;
+
+CREATE TRIGGER trg_search_company_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_company_update
+AFTER UPDATE OF name, notes ON companies
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 4;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_company_delete
+AFTER DELETE ON companies
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 4;
+END;
+
+CREATE TRIGGER trg_search_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_recruiter_update
+AFTER UPDATE OF name, notes ON recruiters
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 5;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 5;
+END;
+
+CREATE TRIGGER trg_search_company_event_insert
+AFTER INSERT ON company_events
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_company_event_update
+AFTER UPDATE OF company_id, title, description ON company_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 6;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'company_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_company_event_delete
+AFTER DELETE ON company_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 6;
+END;
+
+CREATE TRIGGER trg_search_recruiter_event_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_recruiter_event_update
+AFTER UPDATE OF recruiter_id, title, description ON recruiter_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 7;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'recruiter_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_recruiter_event_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 7;
+END;
+
+CREATE TRIGGER trg_search_application_event_insert
+AFTER INSERT ON application_events
+BEGIN
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_application_event_update
+AFTER UPDATE OF application_id, title, description, outcome ON application_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 8;
+    INSERT INTO search_index (rowid, kind, entity_id, parent_id, title, body)
+    SELECT * FROM search_documents WHERE kind = 'application_event' AND entity_id = NEW.id;
+END;
+
+CREATE TRIGGER trg_search_application_event_delete
+AFTER DELETE ON application_events
+BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 16 + 8;
+END;
+
+-- Trigram index over company, recruiter and manager names.
+-- name_index is an FTS5 trigram table, so MATCHing a few trigrams of a query
+-- narrows lookups to a handful of names. name_trigram_counts records how many
+-- names contain each (lowercased) trigram, which tells a lookup which of its
+-- trigrams are rarest, and that a trigram no name has rules out a substring
+-- match without touching the index. name_documents renders every indexed
+-- name; doc_id packs the row id and a per-kind code (id * 4 + code) so
+-- triggers can find a name by rowid.
+CREATE VIEW name_documents AS
+SELECT id * 4 + 1 AS doc_id, 'company' AS kind, id AS entity_id, name
+FROM companies
+UNION ALL
+SELECT id * 4 + 2, 'recruiter', id, name
+FROM recruiters
+UNION ALL
+SELECT id * 4 + 3, 'manager', id, name
+FROM managers;
+
+CREATE VIRTUAL TABLE name_index USING fts5(
+    kind UNINDEXED,
+    entity_id UNINDEXED,
+    name,
+    tokenize = 'trigram'
+);
+
+CREATE TABLE name_trigram_counts (
+    trigram TEXT PRIMARY KEY,
+    names INTEGER NOT NULL
+) WITHOUT ROWID;
+
+-- Character offsets for splitting a name into trigrams inside triggers
+CREATE TABLE name_trigram_offsets (n INTEGER PRIMARY KEY);
+INSERT INTO name_trigram_offsets (n)
+WITH RECURSIVE offsets(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM offsets WHERE n < 500)
+SELECT n FROM offsets;
+
+CREATE TRIGGER trg_name_company_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 1, 'company', NEW.id, NEW.name);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER trg_name_company_update
+AFTER UPDATE OF name ON companies
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 1;
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 1, 'company', NEW.id, NEW.name);
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER trg_name_company_delete
+AFTER DELETE ON companies
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 1;
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+END;
+
+CREATE TRIGGER trg_name_recruiter_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 2, 'recruiter', NEW.id, NEW.name);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER trg_name_recruiter_update
+AFTER UPDATE OF name ON recruiters
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 2;
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 2, 'recruiter', NEW.id, NEW.name);
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER trg_name_recruiter_delete
+AFTER DELETE ON recruiters
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 2;
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+END;
+
+CREATE TRIGGER trg_name_manager_insert
+AFTER INSERT ON managers
+BEGIN
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 3, 'manager', NEW.id, NEW.name);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER trg_name_manager_update
+AFTER UPDATE OF name ON managers
+WHEN OLD.name IS NOT NEW.name
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 3;
+    INSERT INTO name_index (rowid, kind, entity_id, name) VALUES (NEW.id * 4 + 3, 'manager', NEW.id, NEW.name);
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    INSERT INTO name_trigram_counts (trigram, names)
+    SELECT DISTINCT substr(lower(NEW.name), n, 3), 1 FROM name_trigram_offsets WHERE n <= length(NEW.name) - 2
+    ON CONFLICT (trigram) DO UPDATE SET names = names + 1;
+END;
+
+CREATE TRIGGER trg_name_manager_delete
+AFTER DELETE ON managers
+BEGIN
+    DELETE FROM name_index WHERE rowid = OLD.id * 4 + 3;
+    UPDATE name_trigram_counts SET names = names - 1
+    WHERE trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+    DELETE FROM name_trigram_counts
+    WHERE names = 0
+      AND trigram IN (SELECT substr(lower(OLD.name), n, 3) FROM name_trigram_offsets WHERE n <= length(OLD.name) - 2);
+END;
+CREATE INDEX idx_companies_name_options ON companies(name COLLATE NOCASE);
+CREATE INDEX idx_recruiters_name_options ON recruiters(name COLLATE NOCASE, company);
+CREATE INDEX idx_resume_versions_name_options ON resume_versions(version_name COLLATE NOCASE, is_master, created_at);
+CREATE INDEX idx_managers_name_options ON managers(name COLLATE NOCASE, position_title, company_id);
+CREATE INDEX idx_tags_name_options ON tags(name COLLATE NOCASE, color);
+CREATE TABLE change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    operation TEXT NOT NULL CHECK (operation IN ('insert', 'update', 'delete')),
+    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX idx_change_log_entity ON change_log(entity, entity_id, seq);
+CREATE INDEX idx_change_log_changed_at ON change_log(changed_at);
+CREATE TABLE change_log_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    floor INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO change_log_state (id, floor) VALUES (1, 0);
+CREATE TRIGGER trg_companies_change_insert
+AFTER INSERT ON companies
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('companies', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_companies_change_update
+AFTER UPDATE ON companies
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('companies', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_companies_change_delete
+AFTER DELETE ON companies
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('companies', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_resume_versions_change_insert
+AFTER INSERT ON resume_versions
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_versions', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_resume_versions_change_update
+AFTER UPDATE ON resume_versions
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_versions', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_resume_versions_change_delete
+AFTER DELETE ON resume_versions
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_versions', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_recruiters_change_insert
+AFTER INSERT ON recruiters
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiters', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_recruiters_change_update
+AFTER UPDATE ON recruiters
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiters', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_recruiters_change_delete
+AFTER DELETE ON recruiters
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiters', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_job_postings_change_insert
+AFTER INSERT ON job_postings
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('job_postings', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_job_postings_change_update
+AFTER UPDATE ON job_postings
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('job_postings', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_job_postings_change_delete
+AFTER DELETE ON job_postings
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('job_postings', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_applications_change_insert
+AFTER INSERT ON applications
+WHEN NOT EXISTS (SELECT 1 FROM import_guard WHERE table_name = 'applications')
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('applications', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_applications_change_update
+AFTER UPDATE ON applications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('applications', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_applications_change_delete
+AFTER DELETE ON applications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('applications', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_communications_change_insert
+AFTER INSERT ON communications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('communications', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_communications_change_update
+AFTER UPDATE ON communications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('communications', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_communications_change_delete
+AFTER DELETE ON communications
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('communications', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_application_events_change_insert
+AFTER INSERT ON application_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('application_events', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_application_events_change_update
+AFTER UPDATE ON application_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('application_events', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_application_events_change_delete
+AFTER DELETE ON application_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('application_events', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_tags_change_insert
+AFTER INSERT ON tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('tags', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_tags_change_update
+AFTER UPDATE ON tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('tags', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_tags_change_delete
+AFTER DELETE ON tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('tags', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_resume_tags_change_insert
+AFTER INSERT ON resume_tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_tags', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_resume_tags_change_update
+AFTER UPDATE ON resume_tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_tags', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_resume_tags_change_delete
+AFTER DELETE ON resume_tags
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('resume_tags', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_managers_change_insert
+AFTER INSERT ON managers
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('managers', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_managers_change_update
+AFTER UPDATE ON managers
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('managers', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_managers_change_delete
+AFTER DELETE ON managers
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('managers', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_recruiter_events_change_insert
+AFTER INSERT ON recruiter_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiter_events', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_recruiter_events_change_update
+AFTER UPDATE ON recruiter_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiter_events', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_recruiter_events_change_delete
+AFTER DELETE ON recruiter_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('recruiter_events', OLD.id, 'delete');
+END;
+CREATE TRIGGER trg_company_events_change_insert
+AFTER INSERT ON company_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('company_events', NEW.id, 'insert');
+END;
+CREATE TRIGGER trg_company_events_change_update
+AFTER UPDATE ON company_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('company_events', NEW.id, 'update');
+END;
+CREATE TRIGGER trg_company_events_change_delete
+AFTER DELETE ON company_events
+BEGIN
+    INSERT INTO change_log (entity, entity_id, operation) VALUES ('company_events', OLD.id, 'delete');
+END;
@@ -13,8 +13,9 @@ if [[ ! -f "$BASE_DB" ]]; then
 fi
 
 echo "🧪 Creating fresh test database copy..."
-rm -f "$TEST_DB"
-cp "$BASE_DB" "$TEST_DB"
+rm -f "$TEST_DB" "$TEST_DB-wal" "$TEST_DB-shm"
+# Use SQLite's backup API so pages still sitting in a WAL file are included
+python3 -c "import sqlite3, sys; src = sqlite3.connect(sys.argv[1]); dst = sqlite3.connect(sys.argv[2]); src.backup(dst); dst.close(); src.close()" "$BASE_DB" "$TEST_DB"
 
 export DATABASE_PATH="$TEST_DB"
 export BACKEND_PORT="${BACKEND_PORT:-5002}"
@@ -23,4 +24,8 @@ export FLASK_ENV="test"
 echo "📂 Source database: $BASE_DB"
 echo "🚀 Starting test backend on port $BACKEND_PORT using $TEST_DB"
 cd "$REPO_ROOT"
-python3 backend/server.py
+if python3 -c "import gunicorn" 2>/dev/null; then
+  exec python3 -m gunicorn --config backend/gunicorn.conf.py
+fi
+echo "⚠️  gunicorn not installed; falling back to the single-process development server"
+FLASK_DEBUG=0 python3 backend/server.py